@@ -22,41 +22,56 @@ validation/generation support.
 
 """
 from .api import (
-    dump, dumps, single_load, multi_load, load, loads,
+    dump, dumps, single_load, multi_load, load, loads, iterload, load_all,
+    aload, amulti_load, aloads, adump,
     open, version,
+    Cache, DiskCache, cache_info, cache_clear,
     UnknownFileTypeError, UnknownParserTypeError,
     UnknownProcessorTypeError, ValidationError,
     MS_REPLACE, MS_NO_REPLACE, MS_DICTS, MS_DICTS_AND_LISTS, MERGE_STRATEGIES,
-    merge, get, set_,
-    load_plugins, list_types, list_by_cid, list_by_type, list_by_extension,
+    LayeredConfig, MergeRules, Provenance, merge, get, set_,
+    compile_path, get_many, set_many,
+    FrozenConfig, freeze, thaw,
+    Interner, memory_report, diff, apply_patch,
+    load_plugins, reload_plugins,
+    list_types, list_by_cid, list_by_type, list_by_extension,
     findall, find,
-    try_query,
-    validate, is_valid, gen_schema
+    try_query, query_many,
+    validate, validate_many, is_valid, gen_schema
 )
 
 
 __all__ = [
     'dump', 'dumps',
-    'single_load', 'multi_load', 'load', 'loads',
+    'single_load', 'multi_load', 'load', 'loads', 'iterload', 'load_all',
+    'aload', 'amulti_load', 'aloads', 'adump',
     'open', 'version',
 
+    # anyconfig.cache
+    'Cache', 'DiskCache', 'cache_info', 'cache_clear',
+
     # anyconfig.common
     'UnknownParserTypeError', 'UnknownProcessorTypeError',
     'UnknownFileTypeError', 'ValidationError',
 
     # anyconfig.dicsts
     'MS_REPLACE', 'MS_NO_REPLACE', 'MS_DICTS', 'MS_DICTS_AND_LISTS',
-    'MERGE_STRATEGIES', 'merge', 'get', 'set_',
+    'MERGE_STRATEGIES', 'LayeredConfig', 'MergeRules', 'Provenance',
+    'merge', 'get', 'set_',
+    'compile_path', 'get_many', 'set_many',
+    'FrozenConfig', 'freeze', 'thaw',
+    'Interner', 'memory_report', 'diff', 'apply_patch',
 
     # anyconfig.parsers
-    'load_plugins', 'list_types', 'list_by_cid', 'list_by_type',
-    'list_by_extension', 'findall', 'find',
+    'load_plugins', 'reload_plugins',
+    'list_types', 'list_by_cid', 'list_by_type', 'list_by_extension',
+    'findall', 'find',
 
     # anyconfig.query
-    'try_query',
+    'try_query', 'query_many',
 
     # anyconfig.validate
-    'validate', 'is_valid', 'gen_schema'
+    'validate', 'validate_many', 'is_valid', 'gen_schema'
 ]
 
 # vim:sw=4:ts=4:et:
@@ -5,6 +5,26 @@
 # pylint: disable=unused-import,import-error,invalid-name
 r"""Public APIs of anyconfig module.
 
+.. versionadded:: 0.14.1
+
+   - Added new API :func:`reload_plugins` to re-build the registry of parsers
+     which is now built only once per process
+   - Added ac_cache keyword option to load APIs to cache the data loaded from
+     files, and export :class:`Cache` and APIs :func:`cache_info` and
+     :func:`cache_clear` to get the statistics and clear the default cache.
+   - Export :class:`DiskCache`, persistent on-disk cache can be passed as
+     ac_cache.
+   - Added asyncio APIs, :func:`aload`, :func:`amulti_load`, :func:`aloads`
+     and :func:`adump` run the blocking ones in executors.
+   - Added new API :func:`validate_many` to validate multiple objects with a
+     schema object compiled only once.
+   - Added new API :func:`query_many` to query data with multiple JMESPath
+     expressions compiled and cached.
+   - Added new API :func:`iterload` to load items from huge inputs
+     incrementally.
+   - Added new API :func:`load_all` to load multiple documents in an input
+     one by one.
+
 .. versionchanged:: 0.10.2
 
    - Re-structured APIs and split into sub modules
@@ -86,9 +106,13 @@ r"""Public APIs of anyconfig module.
 import typing
 
 from .datatypes import MaybeDataT
+from ._async import (
+    aload, amulti_load, aloads, adump
+)
 from ._dump import (
     dump, dumps
 )
+from ._iterload import iterload, load_all
 from ._load import (
     single_load, multi_load, load, loads
 )
@@ -96,6 +120,10 @@ from ._open import open  # pylint: disable=redefined-builtin
 
 # Export some more APIs originally from other sub modules.
 from ..backend import ParserT
+from ..cache import (
+    Cache, CacheInfo, DiskCache,
+    info as cache_info, clear as cache_clear
+)
 from ..common import (
     InDataT, InDataExT,
     UnknownFileTypeError, UnknownParserTypeError,
@@ -103,18 +131,22 @@ from ..common import (
 )
 from ..dicts import (
     MS_REPLACE, MS_NO_REPLACE, MS_DICTS, MS_DICTS_AND_LISTS, MERGE_STRATEGIES,
-    merge, get, set_,
+    LayeredConfig, MergeRules, Provenance, merge, get, set_,
+    compile_path, get_many, set_many,
+    FrozenConfig, freeze, thaw,
+    Interner, memory_report, diff, apply_patch,
 )
 from ..ioinfo import (
     IOInfo, make as ioinfo_make, makes as ioinfo_makes,
 )
 from ..parsers import (
-    load_plugins, list_types, list_by_cid, list_by_type, list_by_extension,
+    load_plugins, reload_plugins,
+    list_types, list_by_cid, list_by_type, list_by_extension,
     findall, find, MaybeParserT
 )
-from ..query import try_query
+from ..query import try_query, query_many
 from ..schema import (
-    validate, is_valid, gen_schema
+    validate, validate_many, is_valid, gen_schema
 )
 
 
@@ -132,12 +164,16 @@ def version() -> typing.List[str]:
 __all__ = [
     'MaybeDataT',
     'dump', 'dumps',
-    'single_load', 'multi_load', 'load', 'loads',
+    'single_load', 'multi_load', 'load', 'loads', 'iterload', 'load_all',
+    'aload', 'amulti_load', 'aloads', 'adump',
     'open', 'version',
 
     # anyconfig.backend
     'ParserT',
 
+    # anyconfig.cache
+    'Cache', 'CacheInfo', 'DiskCache', 'cache_info', 'cache_clear',
+
     # anyconfig.common
     'InDataT', 'InDataExT',
     'UnknownFileTypeError', 'UnknownParserTypeError',
@@ -145,22 +181,25 @@ __all__ = [
 
     # anyconfig.dicsts
     'MS_REPLACE', 'MS_NO_REPLACE', 'MS_DICTS', 'MS_DICTS_AND_LISTS',
-    'MERGE_STRATEGIES',
-    'merge', 'get', 'set_',
+    'MERGE_STRATEGIES', 'LayeredConfig', 'MergeRules', 'Provenance',
+    'merge', 'get', 'set_', 'compile_path', 'get_many', 'set_many',
+    'FrozenConfig', 'freeze', 'thaw',
+    'Interner', 'memory_report', 'diff', 'apply_patch',
 
     # anyconfig.ioinfo
     'IOInfo', 'ioinfo_make', 'ioinfo_makes',
 
     # anyconfig.parsers
-    'load_plugins', 'list_types', 'list_by_cid', 'list_by_type',
-    'list_by_extension', 'findall', 'find',
+    'load_plugins', 'reload_plugins',
+    'list_types', 'list_by_cid', 'list_by_type', 'list_by_extension',
+    'findall', 'find',
     'MaybeParserT',
 
     # anyconfig.query
-    'try_query',
+    'try_query', 'query_many',
 
     # anyconfig.validate
-    'validate', 'is_valid', 'gen_schema'
+    'validate', 'validate_many', 'is_valid', 'gen_schema'
 ]
 
 # vim:sw=4:ts=4:et:
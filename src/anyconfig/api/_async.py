@@ -0,0 +1,164 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=import-outside-toplevel
+"""Provides the asyncio APIs to load and dump objects.
+
+These coroutines run the blocking APIs in :mod:`._load` and :mod:`._dump` in
+an executor given as ``ac_executor`` or the default executor of the running
+event loop so that they do not block the event loop.
+
+.. versionadded:: 0.14.1
+"""
+import functools
+import typing
+
+from .. import ioinfo
+from ..common import InDataExT
+from . import _dump, _load
+from ._load import (
+    _single_load, finish_multi_load, prepare_multi_load
+)
+
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+
+
+MaybeExecutorT = typing.Optional['concurrent.futures.Executor']
+
+
+async def _run(executor: MaybeExecutorT, func: typing.Callable,
+               *args, **kwargs) -> typing.Any:
+    """Run ``func`` in ``executor`` and wait for the result."""
+    import asyncio  # It must be imported already as the loop is running.
+
+    return await asyncio.get_running_loop().run_in_executor(
+        executor, functools.partial(func, *args, **kwargs)
+    )
+
+
+@typing.overload
+async def amulti_load(
+    inputs: _load.InputsT,
+    ac_parser: _load.MaybeParserOrIdOrTypeT = None,
+    ac_template: bool = False,
+    ac_context: typing.Optional[_load.MappingT] = None,
+    ac_executor: MaybeExecutorT = None, *,
+    ac_provenance: typing.Literal[True],
+    **options
+) -> _load.ProvenanceResultT:
+    ...
+
+
+@typing.overload
+async def amulti_load(
+    inputs: _load.InputsT,
+    ac_parser: _load.MaybeParserOrIdOrTypeT = None,
+    ac_template: bool = False,
+    ac_context: typing.Optional[_load.MappingT] = None,
+    ac_executor: MaybeExecutorT = None, *,
+    ac_provenance: typing.Union[None, typing.Literal[False],
+                                _load.Provenance] = None,
+    **options
+) -> InDataExT:
+    ...
+
+
+async def amulti_load(
+    inputs: _load.InputsT,
+    ac_parser: _load.MaybeParserOrIdOrTypeT = None,
+    ac_template: bool = False,
+    ac_context: typing.Optional[_load.MappingT] = None,
+    ac_executor: MaybeExecutorT = None, *,
+    ac_provenance: _load.MaybeProvenanceT = None,
+    **options
+) -> typing.Union[InDataExT, _load.ProvenanceResultT]:
+    r"""Coroutine version of :func:`anyconfig.api.multi_load`.
+
+    Inputs are loaded concurrently in the executor, and the results are merged
+    in the order of inputs in the executor also so that it's same as the one
+    loaded by :func:`anyconfig.api.multi_load`. But inputs are loaded
+    sequentially if ``ac_template`` is True as the context to render
+    templates is updated with the data loaded from each input in order.
+
+    Please note that :class:`anyconfig.dicts.Provenance` objects given as
+    ``ac_provenance`` are not updated if the executor runs in other
+    processes. Give True instead to get the one made in them in that case.
+
+    :param ac_executor:
+        An executor object such as
+        :class:`concurrent.futures.ProcessPoolExecutor` to load inputs or None
+        to use the default executor of the running event loop
+    :param options: See the description of :func:`anyconfig.api.multi_load`
+    """
+    if ac_template:
+        return await _run(ac_executor, _load.multi_load, inputs,
+                          ac_parser=ac_parser, ac_template=ac_template,
+                          ac_context=ac_context, ac_provenance=ac_provenance,
+                          **options)
+
+    import asyncio
+
+    schema = await _run(ac_executor, _load.try_to_load_schema, **options)
+    (iois, ac_parser, options, fopts) = prepare_multi_load(
+        inputs, ac_parser, **options
+    )
+    cupss = await asyncio.gather(
+        *(_run(ac_executor, _single_load, ioi, ac_parser=ac_parser,
+               **options)
+          for ioi in iois)
+    )
+    return await _run(ac_executor, finish_multi_load,
+                      list(zip(iois, cupss)), len(iois) > 1, None, schema,
+                      ac_provenance=ac_provenance, **options, **fopts)
+
+
+async def aload(path_specs, ac_parser=None, ac_dict=None, ac_template=False,
+                ac_context=None, ac_executor: MaybeExecutorT = None,
+                **options) -> InDataExT:
+    r"""Coroutine version of :func:`anyconfig.api.load`.
+
+    :param ac_executor: See the description of :func:`amulti_load`
+    :param options: See the description of :func:`anyconfig.api.load`
+    """
+    iois = await _run(None, ioinfo.makes, path_specs)
+    if not iois:
+        raise ValueError(f'Maybe invalid input: {path_specs!r}')
+
+    if len(iois) == 1 and not options.get('ac_provenance'):
+        return await _run(ac_executor, _load.single_load, iois[0],
+                          ac_parser=ac_parser, ac_dict=ac_dict,
+                          ac_template=ac_template, ac_context=ac_context,
+                          **options)
+
+    return await amulti_load(iois, ac_parser=ac_parser, ac_dict=ac_dict,
+                             ac_template=ac_template, ac_context=ac_context,
+                             ac_executor=ac_executor, **options)
+
+
+async def aloads(content, ac_parser=None, ac_dict=None, ac_template=False,
+                 ac_context=None, ac_executor: MaybeExecutorT = None,
+                 **options) -> InDataExT:
+    """Coroutine version of :func:`anyconfig.api.loads`.
+
+    :param ac_executor: See the description of :func:`amulti_load`
+    :param options: See the description of :func:`anyconfig.api.loads`
+    """
+    return await _run(ac_executor, _load.loads, content, ac_parser=ac_parser,
+                      ac_dict=ac_dict, ac_template=ac_template,
+                      ac_context=ac_context, **options)
+
+
+async def adump(data: InDataExT, out: ioinfo.PathOrIOInfoT,
+                ac_parser=None, ac_executor: MaybeExecutorT = None,
+                **options) -> None:
+    """Coroutine version of :func:`anyconfig.api.dump`.
+
+    :param ac_executor: See the description of :func:`amulti_load`
+    :param options: See the description of :func:`anyconfig.api.dump`
+    """
+    await _run(ac_executor, _dump.dump, data, out, ac_parser=ac_parser,
+               **options)
+
+# vim:sw=4:ts=4:et:
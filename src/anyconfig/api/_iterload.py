@@ -0,0 +1,97 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Provides the APIs to load objects incrementally from huge inputs.
+
+.. versionadded:: 0.14.1
+"""
+import typing
+
+from .. import ioinfo
+from ..backend.base.events import ItemT, PrefixT
+from ..common import InDataExT
+from ..parsers import find as parsers_find
+from ._load import MaybeParserOrIdOrTypeT
+from .datatypes import ParserT
+
+
+def iterload(input_: ioinfo.PathOrIOInfoT, prefix: PrefixT = None,
+             ac_parser: MaybeParserOrIdOrTypeT = None,
+             **options) -> typing.Iterator[ItemT]:
+    r"""Load data from single input ``input\_`` incrementally.
+
+    Items are generated from the data parsed incrementally and the whole data
+    is never loaded at once by the backends which support it such as JSON,
+    XML and YAML (PyYAML) backends. Other backends load the whole data and
+    generate items from it.
+
+    - Items are (path, value) of each leaf, primitive values or empty
+      containers, if ``prefix`` is None.
+    - Items are (path, obj) of each object in the object at ``prefix`` if it's
+      given, and only the object yielded is built in memory. '*' in
+      ``prefix`` matches any keys and indexes.
+
+    Paths are tuples of keys and indexes of arrays. See the docs of backends
+    for paths of XML data.
+
+    >>> import io
+    >>> strm = io.StringIO('{"items": [{"a": 1}, {"a": 2}]}')
+    >>> list(iterload(strm, prefix='/items', ac_parser='json'))
+    [(('items', 0), {'a': 1}), (('items', 1), {'a': 2})]
+
+    :param input\_:
+        File path or file or file-like object or pathlib.Path object represents
+        the file or a namedtuple 'anyconfig.ioinfo.IOInfo' object represents
+        some input to load some data from
+    :param prefix:
+        A path expression such as '/a/b' or a tuple of keys and indexes to
+        select the object to generate items in it, or None
+    :param ac_parser: Forced parser type or parser object itself
+    :param options:
+        Optional keyword arguments passed to the backend such as ac_dict
+
+    :return: An iterator yields items of (path, value)
+    :raises: ValueError, UnknownProcessorTypeError, UnknownFileTypeError
+    """
+    ioi = ioinfo.make(input_)
+    psr: ParserT = parsers_find(ioi, forced_type=ac_parser)
+
+    return psr.iterload(ioi, prefix=prefix, **options)
+
+
+def load_all(input_: ioinfo.PathOrIOInfoT,
+             ac_parser: MaybeParserOrIdOrTypeT = None,
+             **options) -> typing.Iterator[InDataExT]:
+    r"""Load documents from single input ``input\_`` one by one.
+
+    Documents are loaded lazily one at a time by the backends which support
+    multiple documents in an input such as YAML backends. Other backends
+    yield the only document.
+
+    >>> import io
+    >>> strm = io.StringIO('a: 1\n---\na: 2\n')
+    >>> list(load_all(strm, ac_parser='yaml'))
+    [{'a': 1}, {'a': 2}]
+
+    .. seealso:: ac_multi_docs option of :func:`anyconfig.api.load` to merge
+       these documents
+
+    :param input\_:
+        File path or file or file-like object or pathlib.Path object represents
+        the file or a namedtuple 'anyconfig.ioinfo.IOInfo' object represents
+        some input to load some data from
+    :param ac_parser: Forced parser type or parser object itself
+    :param options:
+        Optional keyword arguments passed to the backend such as ac_dict,
+        ac_frozen and ac_intern
+
+    :return: An iterator yields documents
+    :raises: ValueError, UnknownProcessorTypeError, UnknownFileTypeError
+    """
+    ioi = ioinfo.make(input_)
+    psr: ParserT = parsers_find(ioi, forced_type=ac_parser)
+
+    return psr.load_all(ioi, **options)
+
+# vim:sw=4:ts=4:et:
@@ -3,16 +3,39 @@
 # SPDX-License-Identifier: MIT
 #
 # pylint: disable=unused-import,import-error,invalid-name
-"""Provides the API to load objects from given files."""
+"""Provides the API to load objects from given files.
+
+.. versionchanged:: 0.14.1
+
+   - :func:`multi_load` can load inputs in parallel with ac_parallel option.
+   - Schema files given as ac_schema are cached and not re-loaded unless
+     they're modified.
+   - :func:`multi_load` can return a view of data loaded, merged lazily on
+     access, with ac_layered option.
+   - Added ac_frozen option to load data as immutable and hashable
+     :class:`anyconfig.dicts.FrozenConfig` objects.
+   - Added ac_intern and ac_intern_values options to share keys and scalar
+     values among data loaded.
+   - ac_merge option of :func:`multi_load` accepts merge rules to use
+     different strategies per path.
+   - Added ac_provenance option to :func:`multi_load` to record the sources
+     of values merged.
+   - Added ac_mmap option to load large files from memory-mapped buffers.
+   - Added ac_multi_docs option to load and merge multiple documents in an
+     input.
+"""
+import functools
 import typing
 import warnings
 
-from .. import ioinfo
+from .. import cache, ioinfo
 from ..common import (
     InDataT, InDataExT
 )
 from ..dicts import (
+    LayeredConfig, MergeRules, Provenance, MS_DICTS,
     convert_to as dicts_convert_to,
+    freeze as dicts_freeze,
     merge as dicts_merge
 )
 from ..parsers import find as parsers_find
@@ -26,8 +49,20 @@ from .datatypes import (
 from .utils import are_same_file_types
 
 
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+
+
 MappingT = typing.Dict[str, typing.Any]
 MaybeParserOrIdOrTypeT = typing.Optional[typing.Union[str, ParserT]]
+InputsT = typing.Union[typing.Iterable[ioinfo.PathOrIOInfoT],
+                       ioinfo.PathOrIOInfoT]
+MaybeProvenanceT = typing.Union[None, bool, Provenance]
+ProvenanceResultT = typing.Tuple[InDataExT, Provenance]
+ParallelT = typing.Union[None, bool, int, 'concurrent.futures.Executor']
+
+# Cache of schema objects loaded from files.
+SCHEMA_CACHE: cache.Cache = cache.Cache(maxsize=32)
 
 
 def try_to_load_schema(**options) -> typing.Optional[InDataT]:
@@ -48,11 +83,38 @@ def try_to_load_schema(**options) -> typing.Optional[InDataT]:
         # may be different from the original config file's format, perhaps.
         options["ac_parser"] = None
         options["ac_schema"] = None  # Avoid infinite loop.
+        # Schema objects are frozen so that validators compiled from them
+        # are cached and re-used as the copies from the cache keep identity.
+        options["ac_frozen"] = True
+
+        # Schema files are cached and not re-loaded unless they're modified.
+        if not options.get("ac_cache"):
+            options["ac_cache"] = SCHEMA_CACHE
+
         return load(ac_schema, **options)
 
     return None
 
 
+def _load_with_cache(ioi: ioinfo.IOInfo, psr: ParserT,
+                     ac_cache: cache.MaybeCacheT = None,
+                     **options) -> InDataExT:
+    """Load data from a given ``ioi`` with ``psr`` using cache if possible.
+
+    :param ac_cache: True to use the default cache or a cache object
+    """
+    cobj = cache.find(ac_cache)
+    if cobj is None:
+        return psr.load(ioi, **options)
+
+    key_and_stamp = cache.make_key(ioi, psr, **options)
+    if key_and_stamp is None:
+        return psr.load(ioi, **options)
+
+    (key, stamp) = key_and_stamp
+    return cobj.get_or_load(key, stamp, lambda: psr.load(ioi, **options))
+
+
 def _single_load(ioi: ioinfo.IOInfo,
                  ac_parser: MaybeParserOrIdOrTypeT = None,
                  ac_template: bool = False,
@@ -80,11 +142,12 @@ def _single_load(ioi: ioinfo.IOInfo,
     filepath = ioi.path
 
     if ac_template and filepath:
+        options.pop('ac_cache', None)  # Rendered results are not cached.
         content = try_render(filepath=filepath, ctx=ac_context, **options)
         if content is not None:
             return psr.loads(content, **options)
 
-    return psr.load(ioi, **options)
+    return _load_with_cache(ioi, psr, **options)
 
 
 def single_load(input_: ioinfo.PathOrIOInfoT,
@@ -130,6 +193,31 @@ def single_load(input_: ioinfo.PathOrIOInfoT,
 
           - ac_schema: JSON schema file path to validate given config file
           - ac_query: JMESPath expression to query data
+          - ac_frozen: Load data as immutable and hashable
+            :class:`anyconfig.dicts.FrozenConfig` objects if True. Lists are
+            loaded as tuples and sets as frozensets.
+          - ac_intern: True to intern keys of mapping objects in the data
+            loaded with a new :class:`anyconfig.dicts.Interner` object, or an
+            :class:`anyconfig.dicts.Interner` object to intern them with and
+            share them among data loaded with the same object. Data loaded
+            share equal keys instead of holding their own copies of them.
+            See also :func:`anyconfig.memory_report`.
+          - ac_intern_values: Intern scalar values such as strings and
+            numbers also if True and ac_intern is given.
+          - ac_mmap: True to load data from files mapped on memory always,
+            False not to do so, or None (default) to do so only for large
+            files. Backends can load data from bytes directly such as JSON,
+            TOML (tomllib), pickle and XML backends use it and the others
+            ignore it.
+          - ac_multi_docs: True to load all documents in the input, e.g.
+            '---' separated YAML documents, and merge them in order with
+            ac_merge strategy. See also :func:`anyconfig.api.load_all`.
+          - ac_cache: True to cache the data loaded from files in the default
+            in-memory cache or a :class:`anyconfig.cache.Cache` object to
+            cache them. Cached data are validated with the stat of files and
+            copies of them are returned. Templates are not cached. A
+            :class:`anyconfig.cache.DiskCache` object may be given also to
+            cache them persistently in the cache dir.
 
         - Common backend options:
 
@@ -154,12 +242,92 @@ def single_load(input_: ioinfo.PathOrIOInfoT,
     return try_query(cnf, options.get('ac_query', False), **options)
 
 
-def multi_load(inputs: typing.Union[typing.Iterable[ioinfo.PathOrIOInfoT],
-                                    ioinfo.PathOrIOInfoT],
+def _load_in_parallel(iois: typing.List[ioinfo.IOInfo],
+                      ac_parallel: ParallelT = None,
+                      **options) -> typing.List[InDataExT]:
+    """Load data from ``iois`` in parallel and return them in the same order.
+
+    :param ac_parallel:
+        An executor object such as
+        :class:`concurrent.futures.ProcessPoolExecutor` or max number of
+        threads to load data or True to use the default number of threads
+    :param options: Keyword options passed to :func:`_single_load`
+    """
+    # It's imported here as it takes a while to import it.
+    import concurrent.futures  # pylint: disable=import-outside-toplevel
+
+    load_fn = functools.partial(_single_load, **options)
+
+    if isinstance(ac_parallel, concurrent.futures.Executor):
+        return list(ac_parallel.map(load_fn, iois))
+
+    if isinstance(ac_parallel, bool) or not isinstance(ac_parallel, int):
+        if ac_parallel is not True:
+            raise ValueError(f'Wrong ac_parallel: {ac_parallel!r}')
+        max_workers = None
+    else:
+        max_workers = ac_parallel
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        return list(executor.map(load_fn, iois))
+
+
+def _load_itr(iois: typing.List[ioinfo.IOInfo],
+              ac_parser: MaybeParserOrIdOrTypeT = None,
+              ac_template: bool = False,
+              ac_context: typing.Optional[MappingT] = None,
+              ac_parallel: ParallelT = None,
+              **options
+              ) -> typing.Iterator[typing.Tuple[ioinfo.IOInfo, InDataExT]]:
+    """Load data from ``iois`` and yield pairs of ioinfo and data in order.
+
+    Inputs are loaded in parallel if ``ac_parallel`` was given. But they are
+    loaded sequentially if ``ac_template`` is True as the context to render
+    templates, ``ac_context``, is updated with the data loaded on each
+    iteration.
+    """
+    if ac_parallel and not ac_template and len(iois) > 1:
+        yield from zip(
+            iois,
+            _load_in_parallel(iois, ac_parallel=ac_parallel,
+                              ac_parser=ac_parser, **options)
+        )
+        return
+
+    for ioi in iois:
+        yield (ioi, _single_load(ioi, ac_parser=ac_parser,
+                                 ac_template=ac_template,
+                                 ac_context=ac_context, **options))
+
+
+@typing.overload
+def multi_load(inputs: InputsT,
+               ac_parser: MaybeParserOrIdOrTypeT = None,
+               ac_template: bool = False,
+               ac_context: typing.Optional[MappingT] = None, *,
+               ac_provenance: typing.Literal[True],
+               **options) -> ProvenanceResultT:
+    ...
+
+
+@typing.overload
+def multi_load(inputs: InputsT,
                ac_parser: MaybeParserOrIdOrTypeT = None,
                ac_template: bool = False,
-               ac_context: typing.Optional[MappingT] = None,
+               ac_context: typing.Optional[MappingT] = None, *,
+               ac_provenance: typing.Union[None, typing.Literal[False],
+                                           Provenance] = None,
                **options) -> InDataExT:
+    ...
+
+
+def multi_load(inputs: InputsT,
+               ac_parser: MaybeParserOrIdOrTypeT = None,
+               ac_template: bool = False,
+               ac_context: typing.Optional[MappingT] = None, *,
+               ac_provenance: MaybeProvenanceT = None,
+               **options
+               ) -> typing.Union[InDataExT, ProvenanceResultT]:
     r"""Load data from multiple inputs ``inputs``.
 
     .. note::
@@ -189,18 +357,50 @@ def multi_load(inputs: typing.Union[typing.Iterable[ioinfo.PathOrIOInfoT],
     :param ac_template: Assume configuration file may be a template file and
         try to compile it AAR if True
     :param ac_context: Mapping object presents context to instantiate template
+    :param ac_provenance:
+        True or a :class:`anyconfig.dicts.Provenance` object to record which
+        input supplied each value merged. A tuple of the result and a
+        :class:`anyconfig.dicts.Provenance` object is returned if it's True.
+        The position of the input in inputs and the IOInfo object of it are
+        recorded for each value; call :meth:`anyconfig.dicts.Provenance.get`
+        with the path to get them. It cannot be used with ac_layered.
     :param options: Optional keyword arguments:
 
-        - ac_dict, ac_ordered, ac_schema and ac_query are the options common in
-          :func:`single_load`, :func:`multi_load`, :func:`load`: and
-          :func:`loads`. See the descriptions of them in :func:`single_load`.
+        - ac_dict, ac_ordered, ac_schema, ac_query and ac_cache are the
+          options common in :func:`single_load`, :func:`multi_load`,
+          :func:`load`: and :func:`loads`. See the descriptions of them in
+          :func:`single_load`.
 
         - Options specific to this function and :func:`load`:
 
           - ac_merge (merge): Specify strategy of how to merge results loaded
             from multiple configuration files. See the doc of
             :mod:`dicts` for more details of strategies. The default
-            is dicts.MS_DICTS.
+            is dicts.MS_DICTS. Merge rules, a mapping object of path patterns
+            and strategies such as {'secrets/*': 'replace'}, may be given
+            also to use different strategies per path. See
+            :class:`anyconfig.dicts.MergeRules` for more details.
+
+          - merge_lists_by: Key of mapping objects in lists to merge them by
+            if lists are merged, e.g. with dicts.MS_DICTS_AND_LISTS. Mapping
+            objects have the same value of the key are merged instead of
+            appended.
+
+          - ac_parallel: Load inputs in parallel if it's given. It's max
+            number of threads to load inputs, True to use the default
+            number of threads, or an executor object such as
+            :class:`concurrent.futures.ProcessPoolExecutor` to load CPU-bound
+            inputs in multiple processes. Results are merged in the order of
+            inputs in any cases so that they are same as the ones loaded
+            sequentially. Inputs are loaded sequentially if ac_template is
+            True as the context to render templates is updated with the data
+            loaded from each input in order.
+
+          - ac_layered: Return a :class:`anyconfig.dicts.LayeredConfig`
+            object, a view of the data loaded from inputs merged lazily on
+            access, instead of merging them in advance if it's True. The
+            data are merged on validation or query if ac_schema or ac_query
+            is given, and the query result is returned in the latter case.
 
         - Common backend options:
 
@@ -209,53 +409,206 @@ def multi_load(inputs: typing.Union[typing.Iterable[ioinfo.PathOrIOInfoT],
 
         - Backend specific options such as {"indent": 2} for JSON backend
 
-    :return: Mapping object or any query result might be primitive objects
+    :return:
+        Mapping object or any query result might be primitive objects, or a
+        tuple of it and a :class:`anyconfig.dicts.Provenance` object if
+        ``ac_provenance`` is True
     :raises: ValueError, UnknownProcessorTypeError, UnknownFileTypeError
     """
     schema = try_to_load_schema(
         ac_template=ac_template, ac_context=ac_context, **options
     )
+    (iois, ac_parser, options, fopts) = prepare_multi_load(
+        inputs, ac_parser, **options
+    )
+    ctx = _make_context(ac_context, **options)
+    return finish_multi_load(
+        _load_itr(iois, ac_parser=ac_parser, ac_template=ac_template,
+                  ac_context=ctx, **options),
+        len(iois) > 1, ctx if ac_template else None, schema,
+        ac_provenance=ac_provenance, **options, **fopts
+    )
+
+
+def prepare_multi_load(
+    inputs: InputsT,
+    ac_parser: MaybeParserOrIdOrTypeT = None,
+    **options
+) -> typing.Tuple[typing.List[ioinfo.IOInfo], MaybeParserOrIdOrTypeT,
+                  MappingT, MappingT]:
+    """Prepare to load data from ``inputs`` in :func:`multi_load`.
+
+    It's shared with :func:`anyconfig.api.amulti_load`.
+
+    :return:
+        A tuple of IOInfo objects of ``inputs``, the parser found or
+        ``ac_parser``, options to load data and options to pass to
+        :func:`finish_multi_load`
+    """
     options['ac_schema'] = None  # Avoid to load schema more than twice.
+    fopts = {'ac_frozen': options.pop('ac_frozen', False)}  # After merges.
 
     iois = ioinfo.makes(inputs)
     if are_same_file_types(iois):
         ac_parser = parsers_find(iois[0], forced_type=ac_parser)
 
-    cnf = None
-    ctx = dicts_convert_to({}, **options)
+    return (iois, ac_parser, options, fopts)
+
+
+def finish_multi_load(
+    itr: typing.Iterable[typing.Tuple[ioinfo.IOInfo, InDataExT]],
+    multi: bool, ctx: typing.Optional[MappingT],
+    schema: typing.Optional[InDataT] = None,
+    ac_provenance: MaybeProvenanceT = None,
+    **options
+) -> typing.Union[InDataExT, ProvenanceResultT]:
+    """Merge data loaded in :func:`multi_load` and finish the result.
+
+    It's shared with :func:`anyconfig.api.amulti_load`. See
+    :func:`_merge_and_finish` for the parameters.
+
+    :return:
+        The result, or a tuple of it and a Provenance object if
+        ``ac_provenance`` is True
+    """
+    if ac_provenance is True:
+        prov = Provenance()
+        return (_merge_and_finish(itr, multi, ctx, schema,
+                                  ac_provenance=prov, **options), prov)
+
+    return _merge_and_finish(
+        itr, multi, ctx, schema,
+        ac_provenance=(ac_provenance if isinstance(ac_provenance, Provenance)
+                       else None),
+        **options
+    )
+
+
+def _make_context(ac_context: typing.Optional[MappingT] = None,
+                  **options) -> MappingT:
+    """Make the context to render templates in :func:`multi_load`."""
     if ac_context:
-        ctx = ac_context.copy()
+        return ac_context.copy()
 
-    for ioi in iois:
-        cups = _single_load(
-            ioi, ac_parser=ac_parser, ac_template=ac_template,
-            ac_context=ctx, **options
+    return dicts_convert_to({}, **options)
+
+
+def _compile_merge_rules(ac_provenance: typing.Optional[Provenance] = None,
+                         **options) -> MappingT:
+    """Compile merge rules given as ac_merge in ``options`` only once."""
+    ac_merge = options.get('ac_merge')
+    if is_dict_like(ac_merge):
+        options['ac_merge'] = MergeRules(
+            typing.cast(typing.Mapping[str, str], ac_merge)
         )
-        if cups:
-            if cnf is None:
-                cnf = cups  # type: ignore
-
-            if is_dict_like(cups):
-                dicts_merge(
-                    typing.cast(MappingT, cnf),
-                    typing.cast(MappingT, cups),
-                    **options
-                )
-                dicts_merge(ctx, typing.cast(MappingT, cups), **options)
-            elif len(iois) > 1:
-                raise ValueError(
-                    f'Object loaded from {ioi!r} is not a mapping object and '
-                    'cannot be merged with later ones will be loaded from '
-                    'other inputs.'
-                )
+    elif ac_provenance is not None and not isinstance(ac_merge, MergeRules):
+        options['ac_merge'] = MergeRules({'': ac_merge})
 
-    if cnf is None:
-        return dicts_convert_to({}, **options)
+    return options
 
-    if schema and not is_valid(cnf, schema, **options):
+
+def _merge_one(cnf: typing.Any, ioi: ioinfo.IOInfo, cups: InDataExT,
+               multi: bool, ac_layered: bool = False,
+               ac_provenance: typing.Optional[Provenance] = None,
+               **options) -> typing.Any:
+    """Merge the data ``cups`` loaded from ``ioi`` into ``cnf``.
+
+    :return: The data merged
+    :raises: ValueError if ``cups`` is not a mapping object to merge
+    """
+    if not is_dict_like(cups):
+        if multi:
+            raise ValueError(
+                f'Object loaded from {ioi!r} is not a mapping object and '
+                'cannot be merged with later ones will be loaded from '
+                'other inputs.'
+            )
+        return cups if cnf is None else cnf
+
+    if ac_layered:
+        if cnf is None:
+            cnf = _make_layered_config(**options)
+        cnf.add_layer(cups)
+    elif cnf is None:
+        cnf = cups  # Nothing to merge it with.
+    else:
+        dicts_merge(cnf, typing.cast(MappingT, cups),
+                    ac_provenance=ac_provenance, **options)
+
+    return cnf
+
+
+def _validate_and_query(cnf: typing.Any,
+                        schema: typing.Optional[InDataT] = None,
+                        **options) -> InDataExT:
+    """Validate and query the data merged ``cnf``."""
+    data = cnf
+    if isinstance(cnf, LayeredConfig) and (schema or options.get('ac_query')):
+        data = cnf.materialize()
+
+    if schema and not is_valid(data, schema, **options):
         return None
 
-    return try_query(cnf, options.get('ac_query', False), **options)
+    if options.get('ac_query'):
+        return try_query(data, options['ac_query'], **options)
+
+    return cnf
+
+
+def _merge_and_finish(
+    itr: typing.Iterable[typing.Tuple[ioinfo.IOInfo, InDataExT]],
+    multi: bool, ctx: typing.Optional[MappingT],
+    schema: typing.Optional[InDataT] = None,
+    ac_layered: bool = False, ac_frozen: bool = False,
+    ac_provenance: typing.Optional[Provenance] = None, **options
+) -> InDataExT:
+    """Merge data loaded in order, and validate and query the result.
+
+    :param itr: An iterable yields pairs of ioinfo and data loaded
+    :param multi: True if the data were loaded from multiple inputs
+    :param ctx:
+        The context to render templates updated with data loaded, or None if
+        it's not needed
+    :param schema: Schema object to validate the result
+    :param ac_layered: Make a view of the data merged lazily if True
+    :param ac_frozen: Freeze the result if True
+    :param ac_provenance: A table to record the sources of values or None
+    """
+    if ac_layered and ac_provenance is not None:
+        raise ValueError('ac_provenance cannot be used with ac_layered')
+
+    options = _compile_merge_rules(ac_provenance, **options)
+
+    cnf: typing.Any = None
+    for pos, (ioi, cups) in enumerate(itr):
+        if not cups:
+            continue
+
+        if ac_provenance is not None and is_dict_like(cups):
+            ac_provenance.add_source(ioi, pos)
+
+        cnf = _merge_one(cnf, ioi, cups, multi, ac_layered=ac_layered,
+                         ac_provenance=ac_provenance, **options)
+
+        if ctx is not None and is_dict_like(cups):
+            dicts_merge(ctx, typing.cast(MappingT, cups), **options)
+
+    if cnf is None:
+        cnf = dicts_convert_to({}, **options)
+    else:
+        cnf = _validate_and_query(cnf, schema, **options)
+
+    return dicts_freeze(cnf) if ac_frozen else cnf
+
+
+def _make_layered_config(ac_merge: typing.Optional[str] = MS_DICTS,
+                         **options) -> LayeredConfig:
+    """Make an empty LayeredConfig object with the options to merge."""
+    return LayeredConfig(
+        ac_merge=ac_merge,
+        **{key: options[key] for key in ('merge_lists', 'merge_lists_by')
+           if key in options}
+    )
 
 
 def load(path_specs, ac_parser=None, ac_dict=None, ac_template=False,
@@ -293,7 +646,7 @@ def load(path_specs, ac_parser=None, ac_dict=None, ac_template=False,
     if not iois:
         raise ValueError(f'Maybe invalid input: {path_specs!r}')
 
-    if len(iois) == 1:
+    if len(iois) == 1 and not options.get('ac_provenance'):
         return single_load(iois[0], ac_parser=ac_parser, ac_dict=ac_dict,
                            ac_template=ac_template, ac_context=ac_context,
                            **options)
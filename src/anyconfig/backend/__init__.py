@@ -4,31 +4,91 @@
 #
 # Suppress import positions after some global variables are defined
 # pylint: disable=wrong-import-position
-"""A collection of backend modules available by default."""
+"""A collection of backend modules available by default.
+
+.. versionchanged:: 0.14.1
+
+   - Backend modules are not imported here any more. LAZY_PARSERS is a list
+     of :class:`anyconfig.models.processor.LazyProcessor` objects hold only
+     metadata of parser classes, and backend modules are imported on demand.
+     PARSERS, a list of parser classes, is still available but it imports
+     all of the backend modules available on the first access.
+   - Added JSON Lines (NDJSON) backend, json.lines.
+"""
+import typing
 import warnings
 
-from . import (
-    ini,
-    json,
-    pickle,
-    properties,
-    python,
-    sh,
-    toml,
-    yaml,
-    xml
-)
+from ..models.processor import LazyProcessor
 from .base import (
     ParserT, ParsersT, ParserClssT
 )
 
 
-PARSERS: ParserClssT = [
-    *ini.PARSERS, *json.PARSERS, *pickle.PARSERS, *properties.PARSERS,
-    *python.PARSERS, *sh.PARSERS, *xml.PARSERS,
+def _lazy(cid: str, type_: str, extensions: typing.List[str],
+          priority: int = 0,
+          requires: typing.Iterable[typing.Iterable[str]] = ()
+          ) -> LazyProcessor:
+    """Make a LazyProcessor object of the backend module named by ``cid``."""
+    return LazyProcessor(cid, type_, extensions, f'{__name__}.{cid}',
+                         priority=priority, requires=requires)
+
+
+_JSON_EXTS: typing.List[str] = ['json', 'jsn', 'js']
+_YAML_EXTS: typing.List[str] = ['yaml', 'yml']
+
+# .. note::
+#    The metadata must be kept consistent with the parser classes.
+BUILTIN_PARSERS: typing.List[LazyProcessor] = [
+    _lazy('ini.configparser', 'ini', ['ini']),
+    _lazy('json.stdlib', 'json', _JSON_EXTS, priority=30),
+    _lazy('json.simplejson', 'json', _JSON_EXTS,
+          requires=[('simplejson', )]),
+    _lazy('json.lines', 'jsonl', ['jsonl', 'ndjson']),
+    _lazy('pickle.stdlib', 'pickle', ['pkl', 'pickle']),
+    _lazy('properties.builtin', 'properties', ['properties']),
+    _lazy('python.builtin', 'python', ['py']),
+    _lazy('sh.variables', 'shellvars', ['sh']),
+    _lazy('xml.etree', 'xml', ['xml']),
+    _lazy('yaml.pyyaml', 'yaml', _YAML_EXTS, priority=30,
+          requires=[('yaml', )]),
+    _lazy('yaml.ruamel', 'yaml', _YAML_EXTS, requires=[('ruamel.yaml', )]),
+    _lazy('toml.tomllib', 'toml', ['toml'],
+          requires=[('tomllib', 'tomli'), ('tomli_w', )]),
+    _lazy('toml.toml', 'toml', ['toml'], requires=[('toml', )]),
+    _lazy('toml.tomlkit', 'toml', ['toml'], requires=[('tomlkit', )]),
+]
+
+LAZY_PARSERS: typing.List[LazyProcessor] = [
+    psr for psr in BUILTIN_PARSERS if psr.available()
 ]
 
 
+def _load_parser_classes() -> ParserClssT:
+    """Import the backend modules and get the parser classes from them.
+
+    Modules failed to import are just skipped as
+    :func:`anyconfig.backend.base.load_parser_classes` does.
+    """
+    pclss: ParserClssT = []
+    for lazy in LAZY_PARSERS:
+        try:
+            pclss.append(lazy.load())  # type: ignore
+        except ImportError:
+            pass
+
+    return pclss
+
+
+def __getattr__(name: str) -> typing.Any:
+    """Make PARSERS on demand not to import backend modules until needed."""
+    if name == 'PARSERS':
+        parsers = _load_parser_classes()
+        globals()[name] = parsers
+        return parsers
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
 def warn(name: str, feature: str):
     """Wraper for warnings.warn."""
     warnings.warn(
@@ -37,20 +97,21 @@ def warn(name: str, feature: str):
     )
 
 
-if yaml.PARSERS:
-    PARSERS.extend(yaml.PARSERS)
-else:
+def _has_type(type_: str) -> bool:
+    """Test if any parsers of the type ``type_`` are available."""
+    return any(psr.type() == type_ for psr in LAZY_PARSERS)
+
+
+if not _has_type('yaml'):
     warn('yaml', 'YAML')
 
-if toml.PARSERS:
-    PARSERS.extend(toml.PARSERS)
-else:
+if not _has_type('toml'):
     warn('toml', 'TOML')
 
 
 __all__ = [
     'ParserT', 'ParsersT', 'ParserClssT',
-    'PARSERS',
+    'BUILTIN_PARSERS', 'LAZY_PARSERS', 'PARSERS',
 ]
 
 # vim:sw=4:ts=4:et:
@@ -17,7 +17,7 @@ from .loaders import (
     BinaryLoaderMixin
 )
 from .utils import (
-    ensure_outdir_exists, to_method
+    ensure_outdir_exists, to_method, load_parser_classes
 )
 from .parsers import (
     Parser,
@@ -36,7 +36,7 @@ __all__ = [
     'ToStringDumperMixin', 'ToStreamDumperMixin', 'BinaryDumperMixin',
     'LoaderMixin',
     'FromStringLoaderMixin', 'FromStreamLoaderMixin', 'BinaryLoaderMixin',
-    'ensure_outdir_exists', 'to_method',
+    'ensure_outdir_exists', 'to_method', 'load_parser_classes',
     'Parser',
     'StringParser', 'StreamParser', 'StringStreamFnParser',
     'ParserT', 'ParsersT', 'ParserClssT',
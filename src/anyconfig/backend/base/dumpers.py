@@ -8,6 +8,7 @@ import io
 import typing
 
 from ... import ioinfo, utils
+from ...dicts import FrozenConfig
 from .datatypes import (
     InDataExT, IoiT
 )
@@ -32,6 +33,10 @@ class DumperMixin:
 
     - _dump_opts: Backend specific options on dump
     - _open_write_mode: Backend option to specify write mode passed to open()
+
+    .. versionchanged:: 0.14.1
+
+       - :class:`anyconfig.dicts.FrozenConfig` objects are thawed on dump.
     """
 
     _dump_opts: typing.List[str] = []
@@ -87,6 +92,9 @@ class DumperMixin:
         :return: string represents the configuration
         """
         kwargs = utils.filter_options(self._dump_opts, kwargs)
+        if isinstance(cnf, FrozenConfig):
+            cnf = cnf.thaw()
+
         return self.dump_to_string(cnf, **kwargs)
 
     def dump(self, cnf: InDataExT, ioi: IoiT, **kwargs):
@@ -101,6 +109,8 @@ class DumperMixin:
         :raises IOError, OSError, AttributeError: When dump failed.
         """
         kwargs = utils.filter_options(self._dump_opts, kwargs)
+        if isinstance(cnf, FrozenConfig):
+            cnf = cnf.thaw()
 
         if ioinfo.is_stream(ioi):
             self.dump_to_stream(cnf, typing.cast(typing.IO, ioi.src), **kwargs)
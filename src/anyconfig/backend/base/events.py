@@ -0,0 +1,245 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Parse events and utility functions to process them incrementally.
+
+Backends which can parse data incrementally generate parse events of the
+following forms, and :func:`iter_items` converts them to items yielded by
+:func:`anyconfig.api.iterload`.
+
+- (START_MAP, None): Start of a mapping object
+- (MAP_KEY, key): Key of the next item in a mapping object
+- (END_MAP, None): End of a mapping object
+- (START_SEQ, None): Start of a list-like object
+- (END_SEQ, None): End of a list-like object
+- (VALUE, value): Primitive value such as str, int and None
+
+.. versionadded:: 0.14.1
+"""
+import typing
+
+from ...dicts import PATH_SEPS, RULE_WILDCARD, compile_path
+from ...utils import is_dict_like, is_list_like
+from .datatypes import GenContainerT
+
+
+START_MAP: str = 'start_map'
+MAP_KEY: str = 'map_key'
+END_MAP: str = 'end_map'
+START_SEQ: str = 'start_array'
+END_SEQ: str = 'end_array'
+VALUE: str = 'value'
+
+EventT = typing.Tuple[str, typing.Any]
+PathT = typing.Tuple[typing.Any, ...]
+PrefixT = typing.Optional[typing.Union[str, typing.Iterable[typing.Any]]]
+ItemT = typing.Tuple[PathT, typing.Any]
+
+_STARTS: typing.FrozenSet[str] = frozenset((START_MAP, START_SEQ))
+_ENDS: typing.FrozenSet[str] = frozenset((END_MAP, END_SEQ))
+
+
+def to_prefix(prefix: PrefixT) -> typing.Optional[PathT]:
+    """Normalize a prefix given as a path expression or keys to a tuple.
+
+    >>> to_prefix('/a/b'), to_prefix('a.b'), to_prefix(['a', 0])
+    (('a', 'b'), ('a', 'b'), ('a', 0))
+    >>> to_prefix('/'), to_prefix('')
+    ((), ())
+    >>> to_prefix(None) is None
+    True
+    """
+    if prefix is None:
+        return None
+
+    if isinstance(prefix, str):
+        if not prefix.strip(''.join(PATH_SEPS)):  # e.g. '/'
+            return ()
+
+        return compile_path(prefix).keys
+
+    return tuple(prefix)
+
+
+def match_prefix(path: typing.List[typing.Any], prefix: PathT) -> bool:
+    """Test if the keys in ``path`` match with ``prefix``.
+
+    An array index in ``path`` matches with the str represents it, and
+    RULE_WILDCARD in ``prefix`` matches with any key and index.
+    """
+    for key, pkey in zip(path, prefix):
+        if key == pkey or pkey == RULE_WILDCARD:
+            continue
+        if isinstance(key, int) and str(key) == pkey:
+            continue
+        return False
+
+    return True
+
+
+def build(event: EventT, events: typing.Iterator[EventT],
+          container: GenContainerT = dict) -> typing.Any:
+    """Build an object from ``event`` and the rest of ``events`` consumed.
+
+    :param event: The first event which starts the object
+    :param events: An iterator yields the rest of events
+    :param container: callble to make a container object
+    :return: The object built
+    """
+    (kind, val) = event
+    if kind == VALUE:
+        return val
+
+    root: typing.Any = container() if kind == START_MAP else []
+    stack: typing.List[typing.List[typing.Any]] = [[root, None]]
+    for kind, val in events:
+        frame = stack[-1]
+        if kind == MAP_KEY:
+            frame[1] = val
+            continue
+
+        if kind in _ENDS:
+            stack.pop()
+            if not stack:
+                return root
+            continue
+
+        if kind == VALUE:
+            obj = val
+        else:
+            obj = container() if kind == START_MAP else []
+            stack.append([obj, None])
+
+        if isinstance(frame[0], list):
+            frame[0].append(obj)
+        else:
+            frame[0][frame[1]] = obj
+
+    raise ValueError('Unexpected end of events')
+
+
+def _next_index(path: typing.List[typing.Any],
+                sizes: typing.List[int]) -> None:
+    """Update the index at the end of ``path`` if it's in a list."""
+    if sizes and sizes[-1] >= 0:
+        path[-1] = sizes[-1]
+        sizes[-1] += 1
+
+
+def _iter_leaves(events: typing.Iterator[EventT],
+                 container: GenContainerT = dict) -> typing.Iterator[ItemT]:
+    """Convert parse events to items of leaves, see :func:`iter_items`."""
+    path: typing.List[typing.Any] = []  # Keys and indexes of the position.
+    sizes: typing.List[int] = []  # Number of items, or -1 in mapping objects.
+
+    for kind, val in events:
+        if kind == MAP_KEY:
+            (path[-1], sizes[-1]) = (val, -1)
+            continue
+
+        if kind in _ENDS:
+            path.pop()
+            if not sizes.pop():  # Empty one.
+                yield (tuple(path), container() if kind == END_MAP else [])
+            continue
+
+        _next_index(path, sizes)
+        if kind == VALUE:
+            yield (tuple(path), val)
+        else:
+            path.append(None)
+            sizes.append(0)
+
+
+def _iter_items_at(events: typing.Iterator[EventT], prefix: PathT,
+                   container: GenContainerT = dict
+                   ) -> typing.Iterator[ItemT]:
+    """Convert parse events to items at ``prefix``, see :func:`iter_items`."""
+    depth = len(prefix)
+    path: typing.List[typing.Any] = []
+    sizes: typing.List[int] = []
+
+    for event in events:
+        (kind, val) = event
+        if kind == MAP_KEY:
+            (path[-1], sizes[-1]) = (val, -1)
+            continue
+
+        if kind in _ENDS:
+            path.pop()
+            sizes.pop()
+            continue
+
+        _next_index(path, sizes)
+        if len(path) == depth + 1 and match_prefix(path, prefix):
+            yield (tuple(path), build(event, events, container))
+            continue
+
+        if len(path) == depth and kind == VALUE and \
+                match_prefix(path, prefix):
+            yield (tuple(path), val)  # The object at prefix is primitive.
+
+        if kind in _STARTS:
+            path.append(None)
+            sizes.append(0)
+
+
+def iter_items(events: typing.Iterable[EventT],
+               prefix: typing.Optional[PathT] = None,
+               container: GenContainerT = dict) -> typing.Iterator[ItemT]:
+    """Convert parse events to items of (path, value).
+
+    Items are (path of a leaf, the primitive value or an empty container at
+    that path) if ``prefix`` is None, or (path of an item, the item) of each
+    item in the object at ``prefix``. Only the item yielded is built in
+    memory in the latter case.
+
+    :param events: An iterable yields parse events
+    :param prefix: A tuple of keys and indexes or None
+    :param container: callble to make a container object
+    """
+    if prefix is None:
+        return _iter_leaves(iter(events), container)
+
+    return _iter_items_at(iter(events), prefix, container)
+
+
+def iter_events(obj: typing.Any) -> typing.Iterator[EventT]:
+    """Generate parse events from an object loaded already.
+
+    >>> list(iter_events({'a': [1]}))  # doctest: +NORMALIZE_WHITESPACE
+    [('start_map', None), ('map_key', 'a'), ('start_array', None),
+     ('value', 1), ('end_array', None), ('end_map', None)]
+    """
+    stack: typing.List[typing.Tuple[str, typing.Iterator]] = []
+
+    while True:
+        if is_dict_like(obj):
+            yield (START_MAP, None)
+            stack.append((END_MAP, iter(obj.items())))
+        elif is_list_like(obj):
+            yield (START_SEQ, None)
+            stack.append((END_SEQ, iter(obj)))
+        else:
+            yield (VALUE, obj)
+
+        while stack:
+            (end, items) = stack[-1]
+            try:
+                item = next(items)
+            except StopIteration:
+                stack.pop()
+                yield (end, None)
+                continue
+
+            if end == END_MAP:
+                yield (MAP_KEY, item[0])
+                obj = item[1]
+            else:
+                obj = item
+            break
+        else:
+            return
+
+# vim:sw=4:ts=4:et:
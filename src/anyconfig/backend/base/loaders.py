@@ -6,10 +6,16 @@
 """Abstract and basic loaders."""
 import collections
 import io
+import mmap
+import os
 import pathlib
 import typing
 
 from ... import ioinfo, utils
+from ...dicts import (
+    MS_DICTS, FrozenConfig, Interner, freeze, intern, merge
+)
+from . import events
 from .datatypes import (
     InDataExT, IoiT, GenContainerT, OptionsT
 )
@@ -20,6 +26,33 @@ DATA_DEFAULT: InDataExT = {}
 
 _ENCODING: str = ioinfo.get_encoding()
 
+# Files larger than this [bytes] are loaded from memory-mapped buffers by the
+# parsers can load data from buffers.
+MMAP_THRESHOLD: int = 1024 * 1024
+
+
+def merge_docs(docs: typing.Iterable[InDataExT], container: GenContainerT,
+               ac_merge: typing.Any = MS_DICTS, **_options) -> InDataExT:
+    """Merge documents ``docs`` into the first one in order.
+
+    Non-mapping documents replace the previous ones.
+
+    :param docs: An iterable yields documents
+    :param container: callble to make a container object
+    :param ac_merge: Merge strategy or merge rules passed to
+        :func:`anyconfig.dicts.merge`
+    :return: The document merged
+    """
+    cnf: InDataExT = None
+    for doc in docs:
+        if cnf is not None and utils.is_dict_like(cnf) and \
+                utils.is_dict_like(doc):
+            merge(cnf, doc, ac_merge=ac_merge)  # type: ignore
+        else:
+            cnf = doc
+
+    return container() if cnf is None else cnf
+
 
 class LoaderMixin:
     """Mixin class to load data.
@@ -38,6 +71,25 @@ class LoaderMixin:
       primitive data types other than mapping types such like JSON parser
     - _dict_opts: Backend options to customize dict class to make results
     - _open_read_mode: Backend option to specify read mode passed to open()
+    - _frozen_container: True if the parser can make
+      :class:`anyconfig.dicts.FrozenConfig` objects directly, that is, it
+      makes any mapping objects by calling the container factory with items
+    - _allow_buffer: True if the parser implements :meth:`load_from_buffer`
+      to load data from bytes-like objects directly
+
+    .. versionchanged:: 0.14.1
+
+       - Added ac_frozen option to load data as
+         :class:`anyconfig.dicts.FrozenConfig` objects.
+       - Added ac_intern and ac_intern_values options to share keys and scalar
+         values among loaded data with :class:`anyconfig.dicts.Interner`.
+       - Added :meth:`load_from_buffer` and ac_mmap option to load data from
+         memory-mapped files without decoding them into str in advance.
+       - Added :meth:`iterload` and :meth:`iterload_from_stream` to generate
+         items from data incrementally.
+       - Added :meth:`load_all` and ac_multi_docs option to load multiple
+         documents in a stream.
+       - Added :meth:`make_empty` to make the data of empty inputs.
     """
 
     _load_opts: typing.List[str] = []
@@ -45,6 +97,8 @@ class LoaderMixin:
     _allow_primitives: bool = False
     _dict_opts: typing.List[str] = []
     _open_read_mode: str = 'r'
+    _frozen_container: bool = False
+    _allow_buffer: bool = False
 
     @classmethod
     def ordered(cls) -> bool:
@@ -61,6 +115,11 @@ class LoaderMixin:
         """
         return cls._allow_primitives
 
+    @classmethod
+    def allow_buffer(cls) -> bool:
+        """Test if the parser can load data from bytes-like objects."""
+        return cls._allow_buffer
+
     @classmethod
     def dict_options(cls) -> typing.List[str]:
         """Get the list of dict factory options."""
@@ -78,12 +137,17 @@ class LoaderMixin:
     def _container_factory(self, **options) -> GenContainerT:
         """Get the factory to make container objects.
 
-        The order of prirorities are ac_dict, backend specific dict class
-        option, ac_ordered.
+        The order of prirorities are ac_frozen if the parser supports it and
+        ac_intern is not given, ac_dict, backend specific dict class option,
+        ac_ordered.
 
         :param options: Keyword options may contain 'ac_ordered'.
         :return: Factory (class or function) to make an container.
         """
+        if self._frozen_container and options.get('ac_frozen', False) and \
+                not options.get('ac_intern', False):
+            return FrozenConfig  # Data will be frozen after interned.
+
         ac_dict = options.get("ac_dict", False)
         _dicts = [x for x in (options.get(o) for o in self.dict_options())
                   if x]
@@ -107,6 +171,27 @@ class LoaderMixin:
 
         return utils.filter_options(self._load_opts, options)
 
+    def make_empty(self, container: GenContainerT) -> InDataExT:
+        """Make the data of empty or missing inputs.
+
+        Parsers to load objects other than mapping objects such as lists
+        should override this.
+
+        :param container: callable to make a container object
+        :return: An empty container object by default
+        """
+        return container()
+
+    def _finish(self, cnf: InDataExT, ac_frozen: bool = False,
+                ac_intern: typing.Union[bool, Interner] = False,
+                ac_intern_values: bool = False, **_options) -> InDataExT:
+        """Intern and freeze the data ``cnf`` loaded if requested."""
+        if ac_intern:
+            interner = ac_intern if isinstance(ac_intern, Interner) else None
+            cnf = intern(cnf, interner, values=ac_intern_values)
+
+        return freeze(cnf) if ac_frozen else cnf
+
     def load_from_string(self, content: str, container: GenContainerT,
                          **kwargs) -> InDataExT:
         """Load config from given string 'content'.
@@ -146,6 +231,112 @@ class LoaderMixin:
         not_implemented(self, stream, container, **kwargs)
         return DATA_DEFAULT
 
+    def load_all_from_string(self, content: str, container: GenContainerT,
+                             **kwargs) -> typing.Iterator[InDataExT]:
+        """Load documents from given string 'content' one by one.
+
+        Parsers support multiple documents should override this. It yields
+        the only document loaded by :meth:`load_from_string` by default.
+
+        :param content: Config content string
+        :param container: callble to make a container object later
+        :param kwargs: optional keyword parameters to be sanitized :: dict
+
+        :return: An iterator yields documents
+        """
+        yield self.load_from_string(content, container, **kwargs)
+
+    def load_all_from_stream(self, stream: typing.IO,
+                             container: GenContainerT,
+                             **kwargs) -> typing.Iterator[InDataExT]:
+        """Load documents from given file like object 'stream' one by one.
+
+        Parsers support multiple documents should override this. It yields
+        the only document loaded by :meth:`load_from_stream` by default.
+
+        :param stream: Config file or file like object
+        :param container: callble to make a container object later
+        :param kwargs: optional keyword parameters to be sanitized :: dict
+
+        :return: An iterator yields documents
+        """
+        yield self.load_from_stream(stream, container, **kwargs)
+
+    def load_from_buffer(self, buf: memoryview, container: GenContainerT,
+                         **kwargs) -> InDataExT:
+        """Load config from given buffer 'buf'.
+
+        Parsers set _allow_buffer to True must override this.
+
+        :param buf: A memoryview object of the content in bytes
+        :param container: callble to make a container object later
+        :param kwargs: optional keyword parameters to be sanitized :: dict
+
+        :return: Dict-like object holding config parameters
+        """
+        not_implemented(self, buf, container, **kwargs)
+        return DATA_DEFAULT
+
+    def decode_buffer(self, buf: memoryview) -> str:
+        """Decode a buffer 'buf' into a str as files opened by :meth:`ropen`.
+
+        Parsers load data from buffers in str should use this so that the
+        results are same as the ones loaded from files opened in text mode.
+        """
+        return str(buf, _ENCODING)
+
+    def load_from_mmap(self, filepath: str, container: GenContainerT,
+                       **kwargs) -> InDataExT:
+        """Load config from given file path 'filepath' mapped on memory.
+
+        Empty files cannot be mapped on memory and they are loaded by
+        :meth:`load_from_path` so that the results are same in any cases.
+
+        :param filepath: Config file path
+        :param container: callble to make a container object later
+        :param kwargs: optional keyword parameters to be sanitized :: dict
+
+        :return: Dict-like object holding config parameters
+        """
+        with open(filepath, 'rb') as inp:
+            if not os.fstat(inp.fileno()).st_size:
+                return self.load_from_path(filepath, container, **kwargs)
+
+            with mmap.mmap(inp.fileno(), 0, access=mmap.ACCESS_READ) as mmo:
+                with memoryview(mmo) as buf:
+                    return self.load_from_buffer(buf, container, **kwargs)
+
+    def iterload_from_stream(self, stream: typing.IO,
+                             container: GenContainerT,
+                             prefix: typing.Optional[events.PathT] = None,
+                             **kwargs) -> typing.Iterator[events.ItemT]:
+        """Generate items from given file like object 'stream'.
+
+        Parsers can parse data incrementally should override this to generate
+        items without loading the whole data. This default implementation
+        loads the whole data and generates items from it.
+
+        :param stream: Config file or file like object
+        :param container: callble to make a container object later
+        :param prefix: A tuple of keys and indexes or None
+        :param kwargs: optional keyword parameters to be sanitized :: dict
+
+        :return:
+            An iterator yields items, see :func:`events.iter_items` for more
+            details
+        """
+        cnf = self.load_from_stream(stream, container, **kwargs)
+        return events.iter_items(events.iter_events(cnf), prefix, container)
+
+    def _use_mmap(self, filepath: str,
+                  ac_mmap: typing.Optional[bool] = None) -> bool:
+        """Test if the file at 'filepath' should be loaded with mmap."""
+        if not self.allow_buffer() or ac_mmap is False:
+            return False
+
+        return bool(ac_mmap) or \
+            os.path.getsize(filepath) >= MMAP_THRESHOLD
+
     def loads(self, content: str, **options) -> InDataExT:
         """Load config from given string 'content' after some checks.
 
@@ -160,12 +351,19 @@ class LoaderMixin:
         """
         container = self._container_factory(**options)
         if not content or content is None:
-            return container()
+            return self._finish(self.make_empty(container), **options)
+
+        lopts = self._load_options(container, **options)
+        if options.get('ac_multi_docs', False):
+            docs = self.load_all_from_string(content, container, **lopts)
+            cnf = merge_docs(docs, container, **options)
+        else:
+            cnf = self.load_from_string(content, container, **lopts)
 
-        options = self._load_options(container, **options)
-        return self.load_from_string(content, container, **options)
+        return self._finish(cnf, **options)
 
     def load(self, ioi: IoiT, ac_ignore_missing: bool = False,
+             ac_mmap: typing.Optional[bool] = None,
              **options) -> InDataExT:
         """Load config from ``ioi``.
 
@@ -176,31 +374,108 @@ class LoaderMixin:
         :param ac_ignore_missing:
             Ignore and just return empty result if given `ioi` object does not
             exist in actual.
+        :param ac_mmap:
+            True to load data from the file mapped on memory always, False not
+            to do so, or None to do so only if the file is larger than
+            MMAP_THRESHOLD. It's ignored if the parser does not support it.
         :param options:
             options will be passed to backend specific loading functions.
-            please note that options have to be sanitized w/
-            :func:`anyconfig.utils.filter_options` later to filter out options
-            not in _load_opts.
+            Documents in ``ioi`` are loaded and merged with ac_merge strategy
+            if ac_multi_docs is True. Please note that options have to be
+            sanitized w/ :func:`anyconfig.utils.filter_options` later to
+            filter out options not in _load_opts.
 
         :return: dict or dict-like object holding configurations
         """
         container = self._container_factory(**options)
-        options = self._load_options(container, **options)
+        lopts = self._load_options(container, **options)
+
+        if options.get('ac_multi_docs', False):
+            docs = self._load_all(ioi, container, ac_ignore_missing, **lopts)
+            return self._finish(merge_docs(docs, container, **options),
+                                **options)
 
         if not ioi:
-            return container()
+            cnf = self.make_empty(container)
+        elif ioinfo.is_stream(ioi):
+            cnf = self.load_from_stream(
+                typing.cast(typing.IO, ioi.src), container, **lopts
+            )
+        elif ac_ignore_missing and not pathlib.Path(ioi.path).exists():
+            cnf = self.make_empty(container)
+        elif self._use_mmap(ioi.path, ac_mmap):
+            cnf = self.load_from_mmap(ioi.path, container, **lopts)
+        else:
+            cnf = self.load_from_path(ioi.path, container, **lopts)
+
+        return self._finish(cnf, **options)
+
+    def iterload(self, ioi: IoiT, prefix: events.PrefixT = None,
+                 **options) -> typing.Iterator[events.ItemT]:
+        """Generate items from ``ioi`` incrementally.
+
+        :param ioi:
+            'anyconfig.ioinfo.IOInfo' namedtuple object provides various info
+            of input object to load data from
+        :param prefix:
+            A path expression such as '/a/b' or a tuple of keys and indexes to
+            select the object to generate items in it, or None to generate
+            leaf values
+        :param options:
+            options will be passed to backend specific loading functions
+
+        :return: An iterator yields items of (path, value)
+        """
+        options.pop('ac_frozen', None)  # Items are not frozen.
+        container = self._container_factory(**options)
+        lopts = self._load_options(container, **options)
+        path = events.to_prefix(prefix)
 
         if ioinfo.is_stream(ioi):
-            cnf = self.load_from_stream(
-                typing.cast(typing.IO, ioi.src), container, **options
+            yield from self.iterload_from_stream(
+                typing.cast(typing.IO, ioi.src), container, path, **lopts
             )
         else:
-            if ac_ignore_missing and not pathlib.Path(ioi.path).exists():
-                return container()
+            with self.ropen(ioi.path) as inp:
+                yield from self.iterload_from_stream(inp, container, path,
+                                                     **lopts)
+
+    def _load_all(self, ioi: IoiT, container: GenContainerT,
+                  ac_ignore_missing: bool = False,
+                  **kwargs) -> typing.Iterator[InDataExT]:
+        """Load documents from ``ioi`` one by one."""
+        if not ioi:
+            return
 
-            cnf = self.load_from_path(ioi.path, container, **options)
+        if ioinfo.is_stream(ioi):
+            yield from self.load_all_from_stream(
+                typing.cast(typing.IO, ioi.src), container, **kwargs
+            )
+        elif not ac_ignore_missing or pathlib.Path(ioi.path).exists():
+            with self.ropen(ioi.path) as inp:
+                yield from self.load_all_from_stream(inp, container,
+                                                     **kwargs)
+
+    def load_all(self, ioi: IoiT, ac_ignore_missing: bool = False,
+                 **options) -> typing.Iterator[InDataExT]:
+        """Load documents from ``ioi`` one by one.
+
+        :param ioi:
+            'anyconfig.ioinfo.IOInfo' namedtuple object provides various info
+            of input object to load data from
+        :param ac_ignore_missing:
+            Ignore and just yield nothing if given `ioi` object does not exist
+            in actual.
+        :param options:
+            options will be passed to backend specific loading functions
+
+        :return: An iterator yields dict or dict-like objects
+        """
+        container = self._container_factory(**options)
+        lopts = self._load_options(container, **options)
 
-        return cnf
+        for doc in self._load_all(ioi, container, ac_ignore_missing, **lopts):
+            yield self._finish(doc, **options)
 
 
 class BinaryLoaderMixin(LoaderMixin):
@@ -85,11 +85,20 @@ def load_with_fn(load_fn: typing.Optional[LoadFnT],
     :param options: keyword options passed to 'load_fn'
 
     :return: container object holding data
+
+    .. versionchanged:: 0.14.1
+
+       The result is returned as it is without re-wrapping it if it is
+       already an instance of 'container' exactly, that is, the backend
+       constructed it in place with its dict factory options.
     """
     if load_fn is None:
         raise TypeError('The first argument "load_fn" must be a callable!')
 
     ret = load_fn(content_or_strm, **options)
+    if type(ret) is container:  # pylint: disable=unidiomatic-typecheck
+        return ret
+
     if is_dict_like(ret):
         return container() if (ret is None or not ret) else container(ret)
 
@@ -4,6 +4,7 @@
 #
 """Provides utility functions in anyconfig.backend.base."""
 import functools
+import importlib
 import pathlib
 import typing
 
@@ -36,4 +37,28 @@ def to_method(func: typing.Callable[..., typing.Any]
 
     return wrapper
 
+
+def load_parser_classes(package: str, modules: typing.Iterable[str],
+                        name: str = 'Parser'
+                        ) -> typing.List[typing.Type[typing.Any]]:
+    """Import ``modules`` in ``package`` and get parser classes from them.
+
+    Modules failed to import, e.g. the library it depends on is missing, are
+    just skipped.
+
+    :param package: Package name, e.g. 'anyconfig.backend.yaml'
+    :param modules: A list of the names of modules in ``package``
+    :param name: Name of the parser class in modules
+    """
+    classes = []
+    for mod in modules:
+        try:
+            classes.append(
+                getattr(importlib.import_module(f'{package}.{mod}'), name)
+            )
+        except ImportError:
+            pass
+
+    return classes
+
 # vim:sw=4:ts=4:et:
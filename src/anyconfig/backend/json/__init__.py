@@ -6,24 +6,38 @@
 
 - std.json: python standard JSON support library [default]
 - simplejson: https://github.com/simplejson/simplejson
+- lines: JSON Lines (NDJSON) support using python standard JSON library
 
 Changelog:
 
+.. versionchanged:: 0.14.1
+
+   - PARSERS is made on demand and simplejson is not imported until then.
+   - Added lines module to support JSON Lines. Its parser is not in PARSERS
+     as the type of the parser is not 'json' but 'jsonl'.
+
 .. versionchanged:: 0.9.8
 
    - Started to split JSON support modules
 """
+import typing
+
 from . import stdlib
-from ..base import ParserClssT
+from ..base import ParserClssT, load_parser_classes
 
 
 Parser = stdlib.Parser  # To keep backward compatibility.
-PARSERS: ParserClssT = [Parser]
 
-try:
-    from .simplejson import Parser as SimpleJsonParser
-    PARSERS.append(SimpleJsonParser)
-except ImportError:
-    pass
+_MODULES: typing.List[str] = ['stdlib', 'simplejson']
+
+
+def __getattr__(name: str) -> typing.Any:
+    """Make PARSERS on demand not to import optional libraries until needed."""
+    if name == 'PARSERS':
+        parsers: ParserClssT = load_parser_classes(__name__, _MODULES)
+        globals()[name] = parsers
+        return parsers
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 # vim:sw=4:ts=4:et:
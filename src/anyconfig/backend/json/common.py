@@ -6,9 +6,21 @@
 
 Changelog:
 
+.. versionchanged:: 0.14.1
+
+   - The dict factory options are not passed to json.load{s,} if the
+     container is dict as the decoder makes dict objects natively and faster.
+   - Load data from memory-mapped buffers of large files.
+   - Generate items from JSON data parsed incrementally with
+     :func:`anyconfig.backend.json.events.iterparse`.
+
 .. versionadded:: 0.9.8
 """
+
+from ... import utils
 from .. import base
+from ..base.events import iter_items
+from .events import iterparse
 
 
 JSON_LOAD_OPTS = ['cls', 'object_hook', 'parse_float', 'parse_int',
@@ -33,5 +45,44 @@ class Parser(base.StringStreamFnParser):
     _load_opts = JSON_LOAD_OPTS
     _dump_opts = JSON_DUMP_OPTS
     _dict_opts = JSON_DICT_OPTS
+    _frozen_container = True
+    _allow_buffer = True
+
+    def _load_options(self, container, **options):
+        """Select backend specific loading options.
+
+        The decoder makes dict objects in place and much faster than the one
+        calling a hook with pairs, so that hooks are not set if not needed.
+        """
+        if container is dict:
+            for opt in self.dict_options():
+                if options.get(opt) is dict:
+                    del options[opt]
+
+            return utils.filter_options(self._load_opts, options)
+
+        return super()._load_options(container, **options)
+
+    def load_from_buffer(self, buf, container, **kwargs):
+        """Load data from a buffer 'buf' decoded into a str directly.
+
+        It's decoded in the same way as files opened by :meth:`ropen` are.
+
+        :param buf: A memoryview object of the content in bytes
+        :param container: callble to make a container object
+        :param kwargs: optional keyword parameters passed to load function
+
+        :return: container object holding the configuration data
+        """
+        return self.load_from_string(self.decode_buffer(buf), container,
+                                     **kwargs)
+
+    def iterload_from_stream(self, stream, container, prefix=None,
+                             **_kwargs):
+        """Generate items from JSON data in 'stream' parsed incrementally.
+
+        .. note:: Backend specific options such as parse_float are ignored.
+        """
+        return iter_items(iterparse(stream), prefix, container)
 
 # vim:sw=4:ts=4:et:
@@ -0,0 +1,302 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""An incremental JSON parser generates parse events.
+
+It reads JSON data from streams in chunks and generates parse events defined
+in :mod:`anyconfig.backend.base.events` so that memory usage is bounded by the
+size of chunks and tokens but not by the size of the whole data.
+
+.. versionadded:: 0.14.1
+"""
+import codecs
+import json
+import json.decoder
+import re
+import typing
+
+from ..base import events
+
+
+CHUNK_SIZE: int = 64 * 1024
+
+_WS_RE: typing.Pattern = re.compile(r'[ \t\n\r]*')
+_ATOM_RE: typing.Pattern = re.compile(r'[^ \t\n\r,:\[\]{}"]+')
+_NUMBER_RE: typing.Pattern = re.compile(
+    r'-?(?:0|[1-9]\d*)(\.\d+)?([eE][-+]?\d+)?'
+)
+_LITERALS: typing.Dict[str, typing.Any] = {
+    'true': True, 'false': False, 'null': None,
+    'NaN': float('nan'), 'Infinity': float('inf'),
+    '-Infinity': float('-inf'),
+}
+_PUNCTS: str = '{}[]:,'
+_STR: str = 's'
+_ATOM: str = 'v'
+
+# States of the parser, what is expected next:
+_VALUE = 0  # A value.
+_VALUE_OR_END = 1  # A value or ']' just after '['.
+_KEY = 2  # A key after ','.
+_KEY_OR_END = 3  # A key or '}' just after '{'.
+_COLON = 4
+_NEXT = 5  # ',' or ']' or '}' after a value in arrays or objects.
+_DONE = 6
+
+# (type, value, offset in the whole data)
+TokenT = typing.Tuple[str, typing.Any, int]
+# (event or None, the next state or None after a value)
+StepT = typing.Tuple[typing.Optional[events.EventT], typing.Optional[int]]
+
+# It's not in the type stubs of json.decoder.
+_scanstring: typing.Callable[..., typing.Tuple[str, int]] = getattr(
+    json.decoder, 'scanstring'
+)
+
+
+class _Reader:
+    """Read chunks of str from streams of str or bytes."""
+
+    def __init__(self, stream: typing.IO, chunk_size: int = CHUNK_SIZE
+                 ) -> None:
+        """Initialize with a stream ``stream``."""
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder: typing.Optional[codecs.IncrementalDecoder] = None
+        self.eof = False
+        self.nchars = 0  # The number of chars read so far.
+
+    def read(self, size: int = 0) -> str:
+        """Read and return a chunk of str, at least ``size`` if possible."""
+        if self.eof:
+            return ''
+
+        while True:
+            chunk = self.stream.read(max(size, self.chunk_size))
+            if not isinstance(chunk, (bytes, bytearray)):
+                break
+
+            if self.decoder is None:  # Detect it from the first 4 bytes.
+                chunk += self.stream.read(max(4 - len(chunk), 0))
+                enc = json.detect_encoding(bytes(chunk[:4]))
+                self.decoder = codecs.getincrementaldecoder(enc)(
+                    'surrogatepass'
+                )
+            text = self.decoder.decode(chunk, final=not chunk)
+            if text or not chunk:  # It may need more bytes to decode.
+                chunk = text
+                break
+
+        if not chunk:
+            self.eof = True
+
+        self.nchars += len(chunk)
+        return chunk
+
+
+def _decode_error(msg: str, offset: int) -> json.JSONDecodeError:
+    """Make an error object at ``offset`` in the whole data.
+
+    The doc of it is empty as the whole data is not kept in memory.
+    """
+    return json.JSONDecodeError(msg, '', offset)
+
+
+def _parse_atom(atom: str, buf: str, pos: int) -> typing.Any:
+    """Parse a number or a literal such as true and null."""
+    if atom in _LITERALS:
+        return _LITERALS[atom]
+
+    match = _NUMBER_RE.fullmatch(atom)
+    if match is None:
+        raise json.JSONDecodeError('Expecting value', buf, pos)
+
+    (frac, exp) = match.groups()
+    return float(atom) if frac or exp else int(atom)
+
+
+def _scan_token(buf: str, pos: int, eof: bool
+                ) -> typing.Optional[typing.Tuple[str, typing.Any, int]]:
+    """Scan a token starts at ``pos`` in ``buf``.
+
+    :param eof: True if there is no more data after ``buf``
+    :return:
+        A tuple of the type and the value of the token and the end of it, or
+        None if the token may continue in the next chunk
+    :raises: json.JSONDecodeError with the position in ``buf``
+    """
+    char = buf[pos]
+    if char in _PUNCTS:
+        return (char, None, pos + 1)
+
+    if char == '"':
+        try:
+            (val, end) = _scanstring(buf, pos + 1, True)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            return None
+
+        return (_STR, val, end)
+
+    match = _ATOM_RE.match(buf, pos)
+    if match is None:
+        raise json.JSONDecodeError('Expecting value', buf, pos)
+
+    end = match.end()
+    if end == len(buf) and not eof:
+        return None  # The number or the literal may continue.
+
+    return (_ATOM, _parse_atom(match.group(), buf, pos), end)
+
+
+def _tokenize(reader: _Reader) -> typing.Iterator[TokenT]:
+    """Generate tokens from JSON data read from ``reader``."""
+    (buf, pos, base) = (reader.read(), 0, 0)
+
+    while True:
+        pos = _WS_RE.match(buf, pos).end()  # type: ignore
+        if pos == len(buf):
+            (buf, pos, base) = (reader.read(), 0, base + len(buf))
+            if not buf:
+                return
+            continue
+
+        try:
+            res = _scan_token(buf, pos, reader.eof)
+        except json.JSONDecodeError as exc:
+            raise _decode_error(exc.msg, base + exc.pos) from exc
+
+        if res is None:  # Read more and scan it again.
+            (buf, pos, base) = (buf[pos:] + reader.read(len(buf) - pos), 0,
+                                base + pos)
+            continue
+
+        yield (res[0], res[1], base + pos)
+        pos = res[2]
+
+
+def tokenize(stream: typing.IO, chunk_size: int = CHUNK_SIZE
+             ) -> typing.Iterator[TokenT]:
+    """Generate tokens from JSON data in ``stream`` read in chunks.
+
+    :param stream: A file or file-like object of str or bytes
+    :param chunk_size: The size of chunks to read
+    :return:
+        An iterator yields tokens, (type, value, offset in chars in the whole
+        data)
+    """
+    return _tokenize(_Reader(stream, chunk_size))
+
+
+def _error(state: int, tok: str, offset: int) -> json.JSONDecodeError:
+    """Make an error object for unexpected tokens."""
+    expected = {_VALUE: 'value', _VALUE_OR_END: "value or ']'",
+                _KEY: 'property name', _KEY_OR_END: "property name or '}'",
+                _COLON: "':' delimiter", _NEXT: "',' delimiter",
+                _DONE: 'end of data'}[state]
+    return _decode_error(f'Expecting {expected} but found {tok!r}', offset)
+
+
+def _on_value(state: int, tok: str, val: typing.Any,
+              in_maps: typing.List[bool]) -> typing.Optional[StepT]:
+    """Process a token ``tok`` if a value is expected."""
+    if tok in (_STR, _ATOM):
+        return ((events.VALUE, val), None)
+
+    if tok == '{':
+        in_maps.append(True)
+        return ((events.START_MAP, None), _KEY_OR_END)
+
+    if tok == '[':
+        in_maps.append(False)
+        return ((events.START_SEQ, None), _VALUE_OR_END)
+
+    if tok == ']' and state == _VALUE_OR_END:
+        in_maps.pop()
+        return ((events.END_SEQ, None), None)
+
+    return None
+
+
+def _on_key(state: int, tok: str, val: typing.Any,
+            in_maps: typing.List[bool]) -> typing.Optional[StepT]:
+    """Process a token ``tok`` if a key is expected."""
+    if tok == _STR:
+        return ((events.MAP_KEY, val), _COLON)
+
+    if tok == '}' and state == _KEY_OR_END:
+        in_maps.pop()
+        return ((events.END_MAP, None), None)
+
+    return None
+
+
+def _on_colon(_state: int, tok: str, _val: typing.Any,
+              _in_maps: typing.List[bool]) -> typing.Optional[StepT]:
+    """Process a token ``tok`` if ':' is expected."""
+    return (None, _VALUE) if tok == ':' else None
+
+
+def _on_next(_state: int, tok: str, _val: typing.Any,
+             in_maps: typing.List[bool]) -> typing.Optional[StepT]:
+    """Process a token ``tok`` after a value in arrays or objects."""
+    if tok == ',':
+        return (None, _KEY if in_maps[-1] else _VALUE)
+
+    if tok == ('}' if in_maps[-1] else ']'):
+        in_maps.pop()
+        return ((events.END_MAP if tok == '}' else events.END_SEQ, None),
+                None)
+
+    return None
+
+
+_HANDLERS: typing.Dict[int, typing.Callable[..., typing.Optional[StepT]]] = {
+    _VALUE: _on_value, _VALUE_OR_END: _on_value,
+    _KEY: _on_key, _KEY_OR_END: _on_key,
+    _COLON: _on_colon, _NEXT: _on_next,
+}
+
+
+def iterparse(stream: typing.IO, chunk_size: int = CHUNK_SIZE
+              ) -> typing.Iterator[events.EventT]:
+    """Parse JSON data in ``stream`` incrementally and generate events.
+
+    >>> import io
+    >>> list(iterparse(io.StringIO('{"a": [1, null]}')))
+    ... # doctest: +NORMALIZE_WHITESPACE
+    [('start_map', None), ('map_key', 'a'), ('start_array', None),
+     ('value', 1), ('value', None), ('end_array', None), ('end_map', None)]
+
+    :param stream: A file or file-like object of str or bytes
+    :param chunk_size: The size of chunks to read
+    :return: An iterator yields parse events
+    :raises:
+        json.JSONDecodeError, of which pos is the offset in chars in the whole
+        data
+    """
+    reader = _Reader(stream, chunk_size)
+    in_maps: typing.List[bool] = []
+    state = _VALUE
+
+    for tok, val, offset in _tokenize(reader):
+        handler = _HANDLERS.get(state)
+        step = None if handler is None else handler(state, tok, val, in_maps)
+        if step is None:
+            raise _error(state, tok, offset)
+
+        (event, nstate) = step
+        if event is not None:
+            yield event
+
+        if nstate is None:  # After a value.
+            state = _NEXT if in_maps else _DONE
+        else:
+            state = nstate
+
+    if state != _DONE:
+        raise _decode_error('Unexpected end of data', reader.nchars)
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,273 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""A backend module to load and dump JSON Lines (NDJSON) data.
+
+- Format to support: JSON Lines, https://jsonlines.org
+- Requirements: json in python standard library
+- Development Status :: 4 - Beta
+- Limitations:
+
+  - Data loaded is a list of records, JSON values in each line. Blank lines
+    are ignored, and data loaded from empty or missing inputs are empty
+    lists.
+  - Data to dump must be an iterable of records such as a list and a
+    generator, or a mapping object dumped as the only record. Records are
+    written one by one and the whole output is not built in memory.
+
+- Special options:
+
+  - All options of json.load{s,} and json.dump{s,} except for indent should
+    work.
+
+  - ac_jsonl_workers: Files are split into chunks on newline boundaries and
+    they are parsed in a process pool if this is given. It's the max number
+    of processes, True to use processes as many as CPUs, or an executor
+    object such as :class:`concurrent.futures.ProcessPoolExecutor`. Files are
+    parsed in the current process by default, and also if the files are
+    small, there is only one CPU or the options cannot be passed to other
+    processes, e.g. ac_dict is a lambda function. Please note that parsing
+    in processes may be slower than in the current process because of the
+    cost to start them and pass the records.
+
+  - :func:`anyconfig.api.iterload` generates ((index, ), record) of each
+    record parsed lazily if the prefix is '' or an empty tuple.
+
+.. versionadded:: 0.14.1
+"""
+import io
+import itertools
+import json
+import os
+import typing
+
+from ... import utils
+from ..base import events
+from .common import JSON_LOAD_OPTS, JSON_DUMP_OPTS, Parser as BaseParser
+
+
+MIN_CHUNK_SIZE: int = 1024 * 1024
+
+_NL: str = '\n'
+_ENCODING: str = 'utf-8'
+
+
+def _iter_records(lines: typing.Iterable[typing.AnyStr], **options
+                  ) -> typing.Iterator[typing.Any]:
+    """Parse each line in ``lines`` and generate records.
+
+    :param lines: An iterable yields lines of str or bytes
+    :param options: Keyword options passed to json.loads
+    """
+    loads = json.loads
+    for line in lines:
+        if line and not line.isspace():
+            yield loads(line, **options)
+
+
+def _load_chunk(filepath: str, start: int, end: int, **options
+                ) -> typing.List[typing.Any]:
+    """Load records in the range from ``start`` to ``end`` of the file.
+
+    It's called in other processes so that it must be a module level function.
+    """
+    with open(filepath, 'rb') as inp:
+        inp.seek(start)
+        content = str(inp.read(end - start), _ENCODING)
+
+    return list(_iter_records(content.split(_NL), **options))
+
+
+def split_file(filepath: str, chunk_size: int
+               ) -> typing.List[typing.Tuple[int, int]]:
+    """Split the file into chunks on newline boundaries.
+
+    :param filepath: Path to the file
+    :param chunk_size: The least size of chunks unless it's the last one
+    :return: A list of ranges, (start, end) of each chunk
+    """
+    ranges: typing.List[typing.Tuple[int, int]] = []
+    size = os.path.getsize(filepath)
+
+    with open(filepath, 'rb') as inp:
+        start = 0
+        while start < size:
+            inp.seek(min(start + chunk_size, size))
+            inp.readline()  # Move to the end of the line.
+            end = min(inp.tell(), size)
+            ranges.append((start, end))
+            start = end
+
+    return ranges
+
+
+def _load_in_parallel(filepath: str, workers: typing.Any,
+                      **options) -> typing.Optional[typing.List[typing.Any]]:
+    """Load records from the file in chunks in parallel.
+
+    :param workers: See the description of ac_jsonl_workers option
+    :return: A list of records, or None if it cannot load them in parallel
+    """
+    # These are imported here as it takes a while to import them.
+    # pylint: disable=import-outside-toplevel
+    import concurrent.futures
+    import functools
+    import pickle
+
+    if isinstance(workers, concurrent.futures.Executor):
+        (executor, max_workers) = (workers, os.cpu_count() or 1)
+    elif isinstance(workers, int) and not isinstance(workers, bool):
+        (executor, max_workers) = (None, workers)
+    else:
+        (executor, max_workers) = (None, os.cpu_count() or 1)
+
+    if max_workers < 2 and executor is None:
+        return None
+
+    try:
+        pickle.dumps(options)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return None  # e.g. object_pairs_hook is a lambda function.
+
+    chunk_size = max(os.path.getsize(filepath) // (max_workers * 4),
+                     MIN_CHUNK_SIZE)
+    ranges = split_file(filepath, chunk_size)
+    if len(ranges) < 2:
+        return None
+
+    (starts, ends) = zip(*ranges)
+    load_fn = functools.partial(_load_chunk, filepath, **options)
+
+    if executor is not None:
+        chunks = executor.map(load_fn, starts, ends)
+        return list(itertools.chain.from_iterable(chunks))
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        chunks = executor.map(load_fn, starts, ends)
+        return list(itertools.chain.from_iterable(chunks))
+
+
+def _is_records(cnf: typing.Any) -> bool:
+    """Test if ``cnf`` is an iterable of records but not a record."""
+    return utils.is_list_like(cnf) and not isinstance(cnf, (bytes, bytearray))
+
+
+class Parser(BaseParser):
+    """Parser for JSON Lines files."""
+
+    _cid = 'json.lines'
+    _type = 'jsonl'
+    _extensions = ['jsonl', 'ndjson']
+
+    _load_opts = [*JSON_LOAD_OPTS, 'ac_jsonl_workers']
+    _dump_opts = [o for o in JSON_DUMP_OPTS if o != 'indent']
+    _allow_buffer = False
+
+    def make_empty(self, container):
+        """Make the data of empty or missing inputs, an empty list."""
+        return []
+
+    def load_from_string(self, content, container, **kwargs):
+        """Load records from given string 'content'.
+
+        :param content: JSON Lines string
+        :param container: callble to make a container object
+        :param kwargs: optional keyword parameters passed to json.loads
+
+        :return: A list of records
+        """
+        opts = utils.filter_options(JSON_LOAD_OPTS, kwargs)
+        return list(_iter_records(content.split(_NL), **opts))
+
+    def load_from_stream(self, stream, container, **kwargs):
+        """Load records from given file or file-like object 'stream'.
+
+        :param stream: File or file-like object of str or bytes
+        :param container: callble to make a container object
+        :param kwargs: optional keyword parameters passed to json.loads
+
+        :return: A list of records
+        """
+        opts = utils.filter_options(JSON_LOAD_OPTS, kwargs)
+        return list(_iter_records(stream, **opts))
+
+    def load_from_path(self, filepath, container, **kwargs):
+        """Load records from the file 'filepath', in parallel if requested.
+
+        :param filepath: Path to the JSON Lines file
+        :param container: callble to make a container object
+        :param kwargs:
+            optional keyword parameters passed to json.loads and
+            ac_jsonl_workers
+
+        :return: A list of records
+        """
+        workers = kwargs.pop('ac_jsonl_workers', None)
+        if workers:
+            ret = _load_in_parallel(filepath, workers, **kwargs)
+            if ret is not None:
+                return ret
+
+        with self.ropen(filepath) as inp:
+            return self.load_from_stream(inp, container, **kwargs)
+
+    def iterload_from_stream(self, stream, container, prefix=None,
+                             **kwargs):
+        """Generate items from records in 'stream' parsed one by one.
+
+        Only a record is parsed and kept in memory at once, and items of
+        ((index, ), record) are generated as they are if ``prefix`` is an
+        empty tuple.
+        """
+        opts = utils.filter_options(JSON_LOAD_OPTS, kwargs)
+        records = enumerate(_iter_records(stream, **opts))
+
+        if prefix == ():
+            for idx, rec in records:
+                yield ((idx, ), rec)
+            return
+
+        (head, rest) = (None, None) if prefix is None else \
+            (prefix[:1], prefix[1:])
+        nrecs = 0
+        for idx, rec in records:
+            nrecs += 1
+            if head is not None and not events.match_prefix([idx], head):
+                continue
+            for path, val in events.iter_items(events.iter_events(rec),
+                                               rest, container):
+                yield ((idx, *path), val)
+
+        if not nrecs and prefix is None:
+            yield ((), [])
+
+    def dump_to_stream(self, cnf, stream, **kwargs):
+        """Dump records in 'cnf' to a file or file-like object 'stream'.
+
+        Records are written one by one as they are generated from 'cnf' and
+        the whole output is not built in memory.
+
+        :param cnf: An iterable of records, or a record
+        :param stream: File or file-like object to write to
+        :param kwargs: optional keyword parameters passed to json.dumps
+        """
+        records = cnf if _is_records(cnf) else (cnf, )
+        (dumps, write) = (json.dumps, stream.write)
+        for rec in records:
+            write(dumps(rec, **kwargs))
+            write(_NL)
+
+    def dump_to_string(self, cnf, **kwargs):
+        """Dump records in 'cnf' to a string.
+
+        :param cnf: An iterable of records, or a record
+        :param kwargs: optional keyword parameters passed to json.dumps
+
+        :return: JSON Lines string
+        """
+        stream = io.StringIO()
+        self.dump_to_stream(cnf, stream, **kwargs)
+        return stream.getvalue()
+
+# vim:sw=4:ts=4:et:
@@ -21,6 +21,10 @@ r"""A backend module to load and dump pickle files.
 
 Changelog:
 
+.. versionchanged:: 0.14.1
+
+   - Load data from memory-mapped buffers of large files without copies.
+
 .. versionchanged:: 0.9.7
 
    - Add support of loading primitives other than mapping objects.
@@ -47,8 +51,20 @@ class Parser(base.StringStreamFnParser):
     _load_opts = LOAD_OPTS
     _dump_opts = DUMP_OPTS
     _allow_primitives = True
+    _allow_buffer = True
 
     _load_from_string_fn = base.to_method(pickle.loads)
     _load_from_stream_fn = base.to_method(pickle.load)
     _dump_to_string_fn = base.to_method(pickle.dumps)
     _dump_to_stream_fn = base.to_method(pickle.dump)
+
+    def load_from_buffer(self, buf, container, **kwargs):
+        """Load data from a buffer 'buf' as pickle.loads accepts it as it is.
+
+        :param buf: A memoryview object of the content in bytes
+        :param container: callble to make a container object
+        :param kwargs: optional keyword parameters passed to load function
+
+        :return: container object holding the configuration data
+        """
+        return self.load_from_string(buf, container, **kwargs)
@@ -80,7 +80,9 @@ class Loader(LoaderMixin):
 
         return utils.load_literal_data_from_string(content)
 
+    # pylint: disable=unused-argument
     def load(self, ioi: IoiT, ac_ignore_missing: bool = False,
+             ac_mmap: typing.Optional[bool] = None,
              **options) -> InDataExT:
         """Load config from ``ioi``.
 
@@ -91,6 +93,7 @@ class Loader(LoaderMixin):
         :param ac_ignore_missing:
             Ignore and just return empty result if given `ioi` object does not
             exist in actual.
+        :param ac_mmap: Ignored as this parser does not support it
         :param options:
             options will be passed to backend specific loading functions.
             please note that options have to be sanitized w/
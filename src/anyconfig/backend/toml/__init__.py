@@ -13,28 +13,29 @@
 
 Changelog:
 
+.. versionchanged:: 0.14.1
+
+   - PARSERS is made on demand and TOML libraries are not imported until then.
+
 .. versionchanged:: 0.9.8
 
    - Added tomli, tomllib and tomli-w, and tomlkit support
 """
-from ..base import ParserClssT
-
-PARSERS: ParserClssT = []  # type: ignore
-
-try:
-    from . import tomllib
-    PARSERS.append(tomllib.Parser)
-except ImportError:
-    pass
-
-try:
-    from . import toml
-    PARSERS.append(toml.Parser)
-except ImportError:
-    pass
-
-try:
-    from . import tomlkit
-    PARSERS.append(tomlkit.Parser)
-except ImportError:
-    pass
+import typing
+
+from ..base import ParserClssT, load_parser_classes
+
+
+_MODULES: typing.List[str] = ['tomllib', 'toml', 'tomlkit']
+
+
+def __getattr__(name: str) -> typing.Any:
+    """Make PARSERS on demand not to import optional libraries until needed."""
+    if name == 'PARSERS':
+        parsers: ParserClssT = load_parser_classes(__name__, _MODULES)
+        globals()[name] = parsers
+        return parsers
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+# vim:sw=4:ts=4:et:
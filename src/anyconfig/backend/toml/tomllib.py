@@ -18,6 +18,10 @@ r"""A backend module to load and dump TOML files.
 
 Changelog:
 
+    .. versionchanged:: 0.14.1
+
+       - Load data from memory-mapped buffers of large files.
+
     .. versionadded:: 0.13.1
 """
 try:
@@ -40,8 +44,20 @@ class Parser(base.StringStreamFnParser):
     _load_opts = ['parse_float']
     _open_read_mode: str = 'rb'
     _open_write_mode: str = 'wb'
+    _allow_buffer = True
 
     _load_from_string_fn = base.to_method(tomllib.loads)
     _load_from_stream_fn = base.to_method(tomllib.load)
     _dump_to_string_fn = base.to_method(tomli_w.dumps)
     _dump_to_stream_fn = base.to_method(tomli_w.dump)
+
+    def load_from_buffer(self, buf, container, **kwargs):
+        """Load data from a buffer 'buf' decoded into a str directly.
+
+        :param buf: A memoryview object of the content in bytes
+        :param container: callble to make a container object
+        :param kwargs: optional keyword parameters passed to load function
+
+        :return: container object holding the configuration data
+        """
+        return self.load_from_string(str(buf, 'utf-8'), container, **kwargs)
@@ -42,6 +42,12 @@ r"""A backend module to load and dump XML files.
 
 Changelog:
 
+.. versionchanged:: 0.14.1
+
+   - Load data from memory-mapped buffers of large files in one pass.
+   - Generate items from XML data parsed incrementally with
+     ET.iterparse, and elements are cleared as soon as processed.
+
 .. versionchanged:: 0.8.2
 
    - Add special options, tags, merge_attrs and ac_parse_value
@@ -65,6 +71,7 @@ import re
 import xml.etree.ElementTree as ET
 
 from .. import base
+from ..base import events
 from ...parser import parse_single
 from ...utils import (
     get_path_from_stream, is_dict_like, is_iterable, noop
@@ -73,6 +80,7 @@ from ...utils import (
 
 _TAGS = {"attrs": '@attrs', "text": '@text', "children": '@children'}
 _ET_NS_RE = re.compile(r"^{(\S+)}(\S+)$")
+_CHUNK_SIZE = 1024 * 1024
 
 
 def _iterparse(xmlfile):
@@ -106,6 +114,34 @@ def _namespaces_from_file(xmlfile):
     return dict(flip(t) for _, t in _iterparse(xmlfile))
 
 
+def _parse_buffer(buf, chunk_size=_CHUNK_SIZE):
+    """Parse XML data in the buffer and get the root and namespaces of it.
+
+    :param buf: A memoryview object of XML data in bytes
+    :param chunk_size: The size of chunks of 'buf' to feed to the parser
+    :return: A tuple of the root element and {namespace_uri: prefix}
+    """
+    (root, nspaces) = (None, {})
+    psr = ET.XMLPullParser(events=('start', 'start-ns'))
+
+    def _process_events():
+        nonlocal root
+        for event, obj in psr.read_events():
+            if event == 'start-ns':
+                nspaces[obj[1]] = obj[0]
+            elif root is None:
+                root = obj
+
+    for pos in range(0, len(buf), chunk_size):
+        psr.feed(buf[pos:pos + chunk_size])
+        _process_events()
+
+    psr.close()
+    _process_events()
+
+    return (root, nspaces)
+
+
 def _tweak_ns(tag, **options):
     """Tweak the namespace.
 
@@ -356,6 +392,74 @@ def root_to_container(root, container=dict, nspaces=None, **options):
                              **_complement_tag_options(options))
 
 
+def _elem_leaves(elem, path, nchildren, **options):
+    """Get leaves of (path, value) from the element ``elem`` processed.
+
+    :param elem: ET Element object of which children were removed already
+    :param path: A tuple of tags of the element and its ancestors
+    :param nchildren: The number of children ``elem`` had
+    :param options: Keyword options same as :func:`elem_to_container`
+    """
+    text = elem.text.strip() if elem.text else None
+    for key, val in elem.attrib.items():
+        yield (path + (options['attrs'], _tweak_ns(key, **options)),
+               _parse_text(val, **options))
+
+    if text:
+        yield (path + (options['text'], ) if nchildren or elem.attrib
+               else path, _parse_text(text, **options))
+    elif not nchildren and not elem.attrib:
+        yield (path, None)  # ex. <tag/>.
+
+
+def iterload(stream, container=dict, prefix=None, **options):
+    """Parse XML data in ``stream`` incrementally and generate items.
+
+    Paths of items are tuples of tags of elements from the root element. Each
+    element is converted to a container object and yielded if it's an item
+    in the element at ``prefix``. Otherwise, attributes and text of elements
+    are yielded with paths of special nodes like :func:`elem_to_container`
+    does if ``prefix`` is None.
+
+    :param stream: XML file or file-like object
+    :param container: callble to make a container object
+    :param prefix: A tuple of tags or None
+    :param options: Keyword options same as :func:`elem_to_container`
+    """
+    options = _complement_tag_options(options)
+    nspaces = options['nspaces'] = {}
+    depth = None if prefix is None else len(prefix)
+    stack = []  # [elem, path, the number of children]
+
+    for event, elem in ET.iterparse(stream, events=('start-ns', 'start',
+                                                    'end')):
+        if event == 'start-ns':
+            nspaces[elem[1]] = elem[0]
+            continue
+
+        if event == 'start':
+            path = (stack[-1][1] if stack else ()) + \
+                (_tweak_ns(elem.tag, **options), )
+            if stack:
+                stack[-1][2] += 1
+            stack.append([elem, path, 0])
+            continue
+
+        (_, path, nchildren) = stack.pop()
+        if depth is None:
+            yield from _elem_leaves(elem, path, nchildren, **options)
+        elif len(path) > depth + 1 and \
+                events.match_prefix(path[:depth], prefix):
+            continue  # Keep it as a part of an item.
+        elif len(path) == depth + 1 and events.match_prefix(path, prefix):
+            yield (path, elem_to_container(elem, container=container,
+                                           **options))
+
+        elem.clear()
+        if stack:
+            stack[-1][0].remove(elem)
+
+
 def _to_str_fn(**options):
     """Convert any objects to a str.
 
@@ -477,6 +581,7 @@ class Parser(base.Parser, base.ToStreamDumperMixin):
     _dict_opts = ['ac_dict']
     _open_read_mode: str = 'rb'
     _open_write_mode: str = 'wb'
+    _allow_buffer = True
 
     def load_from_string(self, content, container, **opts):
         """Load config from XML snippet (a string 'content').
@@ -523,6 +628,31 @@ class Parser(base.Parser, base.ToStreamDumperMixin):
         return root_to_container(root, container=container,
                                  nspaces=nspaces, **opts)
 
+    def load_from_buffer(self, buf, container, **opts):
+        """Load data from a buffer 'buf' of XML data.
+
+        :param buf: A memoryview object of XML data in bytes
+        :param container: callble to make a container object
+        :param opts: optional keyword parameters to be sanitized
+
+        :return: Dict-like object holding config parameters
+        """
+        (root, nspaces) = _parse_buffer(buf)
+        return root_to_container(root, container=container,
+                                 nspaces=nspaces, **opts)
+
+    def iterload_from_stream(self, stream, container, prefix=None, **opts):
+        """Generate items from XML data in 'stream' parsed incrementally.
+
+        :param stream: XML file or file-like object
+        :param container: callble to make a container object
+        :param prefix: A tuple of tags or None
+        :param opts: optional keyword parameters to be sanitized
+
+        :return: An iterator yields items of (path, value)
+        """
+        return iterload(stream, container=container, prefix=prefix, **opts)
+
     def dump_to_string(self, cnf, **opts):
         """Dump data ``cnf`` as a str.
 
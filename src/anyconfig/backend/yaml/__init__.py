@@ -9,24 +9,30 @@
 
 Changelog:
 
+.. versionchanged:: 0.14.1
+
+   - PARSERS is made on demand and YAML libraries are not imported until then.
+
 .. versionchanged:: 0.9.8
 
    - Split PyYaml-based and ruamel.yaml based backend modules
    - Add support of some of ruamel.yaml specific features.
 """
-from ..base import ParserClssT
+import typing
+
+from ..base import ParserClssT, load_parser_classes
+
+
+_MODULES: typing.List[str] = ['pyyaml', 'ruamel']
 
 
-try:
-    from . import pyyaml
-    PARSERS: ParserClssT = [pyyaml.Parser]
-except ImportError:
-    PARSERS: ParserClssT = []  # type: ignore
+def __getattr__(name: str) -> typing.Any:
+    """Make PARSERS on demand not to import optional libraries until needed."""
+    if name == 'PARSERS':
+        parsers: ParserClssT = load_parser_classes(__name__, _MODULES)
+        globals()[name] = parsers
+        return parsers
 
-try:
-    from . import ruamel
-    PARSERS.append(ruamel.Parser)
-except ImportError:
-    pass
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 # vim:sw=4:ts=4:et:
@@ -28,6 +28,12 @@
 
 Changelog:
 
+.. versionchanged:: 0.14.1
+
+   - Generate items from the first YAML document parsed incrementally with
+     the event API of PyYAML.
+   - Load multiple YAML documents in a stream one by one with yaml.load_all.
+
 .. versionchanged:: 0.14.0
 
    - change CID.
@@ -50,6 +56,7 @@ except ImportError:
 from ...dicts import convert_to
 from ...utils import is_dict_like
 from .. import base
+from ..base import events
 from . import common
 
 
@@ -154,14 +161,8 @@ def yml_fnc_(fname, *args, **options):
     return fnc(*args, **common.filter_from_options('ac_safe', options))
 
 
-def yml_load(stream, container, yml_fnc=yml_fnc_, **options):
-    """Call yaml.safe_load and yaml.load.
-
-    :param stream: a file or file-like object to load YAML content
-    :param container: callble to make a container object
-
-    :return: Mapping object
-    """
+def _load_options(container, **options):
+    """Get the container and options to call yaml.*load*."""
     if options.get('ac_safe', False):
         # .. note:: yaml.safe_load does not support any keyword options.
         options = {"ac_safe": True}
@@ -173,14 +174,42 @@ def yml_load(stream, container, yml_fnc=yml_fnc_, **options):
 
         options['Loader'] = _customized_loader(container)
 
-    ret = yml_fnc('load', stream,
-                  **common.filter_from_options('ac_dict', options))
+    return (container, common.filter_from_options('ac_dict', options))
+
+
+def yml_load(stream, container, yml_fnc=yml_fnc_, **options):
+    """Call yaml.safe_load and yaml.load.
+
+    :param stream: a file or file-like object to load YAML content
+    :param container: callble to make a container object
+
+    :return: Mapping object
+    """
+    (container, options) = _load_options(container, **options)
+    ret = yml_fnc('load', stream, **options)
     if ret is None:
         return container()
 
     return ret
 
 
+def yml_load_all(stream, container, yml_fnc=yml_fnc_, **options):
+    """Call yaml.safe_load_all and yaml.load_all.
+
+    Documents are loaded one by one lazily, and empty documents such as the
+    one after the trailing '---' are skipped.
+
+    :param stream: a file or file-like object or a str of YAML content
+    :param container: callble to make a container object
+
+    :return: An iterator yields mapping objects
+    """
+    options = _load_options(container, **options)[1]
+    for ret in yml_fnc('load_all', stream, **options):
+        if ret is not None:
+            yield ret
+
+
 def yml_dump(data, stream, yml_fnc=yml_fnc_, **options):
     """Call yaml.safe_dump and yaml.dump.
 
@@ -205,6 +234,97 @@ def yml_dump(data, stream, yml_fnc=yml_fnc_, **options):
     return yml_fnc('dump', data, stream, **options)
 
 
+def _construct_scalar(loader, event):
+    """Construct a primitive value from a scalar event ``event``."""
+    tag = event.tag
+    if tag is None or tag == '!':
+        tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+
+    node = yaml.ScalarNode(tag, event.value, event.start_mark,
+                           event.end_mark, event.style)
+    constructor = loader.yaml_constructors.get(
+        tag, loader.yaml_constructors.get(None)
+    )
+    return constructor(loader, node)
+
+
+def _value_ended(expect_keys):
+    """Expect the key of the next item if the value of an item was ended."""
+    if expect_keys and expect_keys[-1] is False:
+        expect_keys[-1] = True
+
+
+def _on_scalar(loader, event, expect_keys):
+    """Make a parse event from a scalar event."""
+    if expect_keys and expect_keys[-1]:
+        expect_keys[-1] = False
+        return (events.MAP_KEY, _construct_scalar(loader, event))
+
+    val = _construct_scalar(loader, event)
+    _value_ended(expect_keys)
+    return (events.VALUE, val)
+
+
+def _on_start(_loader, event, expect_keys):
+    """Make a parse event from a mapping or sequence start event."""
+    if expect_keys and expect_keys[-1]:
+        raise ValueError(f'Non-scalar keys: {event.start_mark}')
+
+    if isinstance(event, yaml.MappingStartEvent):
+        expect_keys.append(True)
+        return (events.START_MAP, None)
+
+    expect_keys.append(None)
+    return (events.START_SEQ, None)
+
+
+def _on_end(_loader, event, expect_keys):
+    """Make a parse event from a mapping or sequence end event."""
+    expect_keys.pop()
+    _value_ended(expect_keys)
+    return (events.END_MAP if isinstance(event, yaml.MappingEndEvent)
+            else events.END_SEQ, None)
+
+
+def _on_alias(_loader, event, _expect_keys):
+    """Raise an error as aliases are not supported."""
+    raise ValueError(f'Aliases are not supported: {event.start_mark}')
+
+
+_EVENT_HANDLERS = {
+    yaml.ScalarEvent: _on_scalar,
+    yaml.MappingStartEvent: _on_start, yaml.SequenceStartEvent: _on_start,
+    yaml.MappingEndEvent: _on_end, yaml.SequenceEndEvent: _on_end,
+    yaml.AliasEvent: _on_alias,
+}
+
+
+def yml_iterparse(stream, loader_cls=Loader):
+    """Parse the first YAML document in ``stream`` and generate events.
+
+    Values are constructed from scalar events one by one, and the objects
+    made from the whole nodes are never built.
+
+    :param stream: a file or file-like object to load YAML content
+    :param loader_cls: Loader class to parse and construct values
+    :return: An iterator yields parse events
+    :raises: ValueError if there are aliases or non-scalar keys
+    """
+    loader = loader_cls(stream)
+    expect_keys = []  # True if the next scalar is a key of mapping objects.
+    try:
+        while loader.check_event():
+            event = loader.get_event()
+            if isinstance(event, yaml.DocumentEndEvent):
+                break
+
+            handler = _EVENT_HANDLERS.get(type(event))
+            if handler is not None:  # Skip stream and document start events.
+                yield handler(loader, event, expect_keys)
+    finally:
+        loader.dispose()
+
+
 class Parser(common.Parser):
     """Parser for YAML files."""
 
@@ -217,6 +337,18 @@ class Parser(common.Parser):
                   'explicit_end', 'version', 'tags']
 
     load_from_stream = base.to_method(yml_load)
+    load_all_from_stream = base.to_method(yml_load_all)
+    load_all_from_string = base.to_method(yml_load_all)
     dump_to_stream = base.to_method(yml_dump)
 
+    def iterload_from_stream(self, stream, container, prefix=None,
+                             **options):
+        """Generate items from YAML data in 'stream' parsed incrementally.
+
+        :param options: keyword options may contain 'Loader'
+        """
+        loader_cls = options.get('Loader') or Loader
+        return events.iter_items(yml_iterparse(stream, loader_cls), prefix,
+                                 container)
+
 # vim:sw=4:ts=4:et:
@@ -9,7 +9,7 @@
 - Development Status :: 4 - Beta
 - Limitations:
 
-  - Multi-documents YAML stream load and dump are not supported.
+  - Multi-documents YAML stream dump is not supported.
 
 - Special options:
 
@@ -30,6 +30,11 @@
 
 Changelog:
 
+.. versionchanged:: 0.14.1
+
+   - Load multiple YAML documents in a stream one by one with
+     ruamel.yaml.YAML.load_all.
+
 .. versionchanged:: 0.9.8
 
    - Split from the common yaml backend and start to support ruamel.yaml
@@ -100,6 +105,14 @@ def yml_load(stream, container, **options):
     return ret
 
 
+def yml_load_all(stream, container, **options):
+    """See :func:`anyconfig.backend.yaml.pyyaml.yml_load_all`."""
+    # pylint: disable=unused-argument
+    for ret in yml_fnc('load_all', stream, **options):
+        if ret is not None:
+            yield ret
+
+
 def yml_dump(data, stream, **options):
     """See :func:`anyconfig.backend.yaml.pyyaml.yml_dump`."""
     # .. todo:: Needed?
@@ -120,6 +133,8 @@ class Parser(common.Parser):
     _dump_opts = _YAML_OPTS
 
     load_from_stream = base.to_method(yml_load)
+    load_all_from_stream = base.to_method(yml_load_all)
+    load_all_from_string = base.to_method(yml_load_all)
     dump_to_stream = base.to_method(yml_dump)
 
 # vim:sw=4:ts=4:et:
@@ -0,0 +1,62 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Cache of the data loaded from files.
+
+.. versionadded:: 0.14.1
+
+   - Added the in-memory LRU cache validated with the stat of files, enabled
+     with the keyword option ``ac_cache`` of the load APIs.
+   - Added the persistent on-disk cache shared among processes.
+"""
+import typing
+
+from .base import BaseCache
+from .datatypes import CacheInfo, CacheKeyT, StampT
+from .disk import DiskCache, get_default_cache_dir
+from .memory import Cache
+from .utils import make_key
+
+
+DEFAULT: Cache = Cache()
+
+MaybeCacheT = typing.Optional[typing.Union[bool, BaseCache]]
+
+
+def find(ac_cache: MaybeCacheT = None) -> typing.Optional[BaseCache]:
+    """Find the cache object from the value of the option ``ac_cache``.
+
+    :param ac_cache: True to use the default cache or a cache object
+    :return: A cache object or None means the cache is disabled
+    """
+    if isinstance(ac_cache, BaseCache):
+        return ac_cache
+
+    if ac_cache is True:
+        return DEFAULT
+
+    if ac_cache:
+        raise ValueError(f'Wrong cache: {ac_cache!r}')
+
+    return None
+
+
+def info() -> CacheInfo:
+    """Get the statistics of the default cache."""
+    return DEFAULT.info()
+
+
+def clear() -> None:
+    """Clear the default cache."""
+    DEFAULT.clear()
+
+
+__all__ = [
+    'CacheInfo', 'CacheKeyT', 'StampT',
+    'BaseCache', 'Cache', 'DiskCache', 'get_default_cache_dir',
+    'make_key',
+    'DEFAULT', 'MaybeCacheT', 'find', 'info', 'clear',
+]
+
+# vim:sw=4:ts=4:et:
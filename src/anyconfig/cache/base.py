@@ -0,0 +1,106 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Base class of caches of the data loaded from files."""
+import threading
+import typing
+
+from ..common import InDataExT
+from .datatypes import CacheInfo, CacheKeyT, StampT
+
+
+class BaseCache:
+    """Base class of caches of the data loaded from files.
+
+    Inherited classes must implement the following methods.
+
+    - :meth:`_get`: Get the data cached or raise KeyError
+    - :meth:`_set`: Store the data
+    - :meth:`_clear`: Clear the entries
+    - :meth:`__len__`: Get the number of entries
+    """
+
+    _maxsize: typing.Optional[int] = None
+
+    def __init__(self) -> None:
+        """Initialize the statistics of the cache."""
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.RLock()
+
+    def __getstate__(self) -> typing.Dict[str, typing.Any]:
+        """Get the state to pickle, to pass it to other processes."""
+        state = self.__dict__.copy()
+        del state['_lock']  # It cannot be pickled.
+        return state
+
+    def __setstate__(self, state: typing.Dict[str, typing.Any]) -> None:
+        """Restore the state unpickled."""
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        """Get the number of entries."""
+        raise NotImplementedError()
+
+    def _get(self, key: CacheKeyT, stamp: StampT) -> InDataExT:
+        """Get the data cached or raise KeyError if it's not found."""
+        raise NotImplementedError()
+
+    def _set(self, key: CacheKeyT, stamp: StampT, data: InDataExT) -> None:
+        """Store the data ``data``."""
+        raise NotImplementedError()
+
+    def _clear(self) -> None:
+        """Clear the entries."""
+        raise NotImplementedError()
+
+    def info(self) -> CacheInfo:
+        """Get the statistics of the cache."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize,
+                             len(self))
+
+    def clear(self) -> None:
+        """Clear the entries and the statistics."""
+        with self._lock:
+            self._clear()
+            self._hits = self._misses = 0
+
+    def get(self, key: CacheKeyT, stamp: StampT,
+            default: typing.Any = None) -> InDataExT:
+        """Get the data cached if it's still valid.
+
+        :param key: Key of the data
+        :param stamp: Current stamp of the file the data was loaded from
+        :param default: The value to return if the data was not found
+        """
+        try:
+            data = self._get(key, stamp)
+        except KeyError:
+            with self._lock:
+                self._misses += 1
+            return default
+
+        with self._lock:
+            self._hits += 1
+
+        return data
+
+    def set(self, key: CacheKeyT, stamp: StampT, data: InDataExT) -> None:
+        """Store the data ``data``."""
+        self._set(key, stamp, data)
+
+    def get_or_load(self, key: CacheKeyT, stamp: StampT,
+                    load_fn: typing.Callable[[], InDataExT]) -> InDataExT:
+        """Get the data cached or load it with ``load_fn`` and cache it."""
+        marker = object()
+        data = self.get(key, stamp, default=marker)
+        if data is marker:
+            data = load_fn()
+            self.set(key, stamp, data)
+
+        return data
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,25 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=inherit-non-class,too-few-public-methods
+"""Common data types for anyconfig.cache."""
+import typing
+
+
+# (path, parser's cid, normalized options)
+CacheKeyT = typing.Tuple[str, str, typing.Tuple[typing.Any, ...]]
+
+# (mtime_ns, size, inode, device) of the file
+StampT = typing.Tuple[int, int, int, int]
+
+
+class CacheInfo(typing.NamedTuple):
+    """Statistics of caches similar to functools' one."""
+
+    hits: int
+    misses: int
+    maxsize: typing.Optional[int]
+    currsize: int
+
+# vim:sw=4:ts=4:et:
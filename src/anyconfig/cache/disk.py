@@ -0,0 +1,285 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Persistent on-disk cache of the data loaded from files.
+
+The data are serialized with pickle and stored in the cache dir like
+__pycache__, and shared among processes. Each entry is keyed on the hash of
+the content of the file, the parser's cid and the load options so that it's
+reused as long as the content of the file is not changed.
+
+.. note::
+   hashlib, pickle and tempfile are imported on demand to avoid slowing down
+   'import anyconfig'.
+"""
+# pylint: disable=import-outside-toplevel
+import os
+import pathlib
+import sys
+import time
+import typing
+
+from ..common import InDataExT
+from .base import BaseCache
+from .datatypes import CacheKeyT, StampT
+from .utils import get_stamp
+
+ErrorsT = typing.Tuple[typing.Type[Exception], ...]
+
+
+CACHE_DIR_ENV: str = 'ANYCONFIG_CACHE_DIR'
+ENTRY_EXT: str = '.pickle'
+
+# Bump it if the format of entries is changed.
+FORMAT_VERSION: int = 1
+
+
+def _pickle_errors() -> ErrorsT:
+    """Get the errors may be raised on [de]serialization with pickle."""
+    import pickle
+
+    return (pickle.PickleError, AttributeError, EOFError, ImportError,
+            IndexError, TypeError, ValueError)
+
+
+def get_default_cache_dir() -> pathlib.Path:
+    """Get the default cache dir.
+
+    It's $ANYCONFIG_CACHE_DIR if it's set or $XDG_CACHE_HOME/anyconfig
+    (~/.cache/anyconfig by default) otherwise.
+    """
+    cdir = os.environ.get(CACHE_DIR_ENV)
+    if cdir:
+        return pathlib.Path(cdir)
+
+    xdg_cdir = os.environ.get('XDG_CACHE_HOME')
+    if xdg_cdir:
+        return pathlib.Path(xdg_cdir) / 'anyconfig'
+
+    return pathlib.Path.home() / '.cache' / 'anyconfig'
+
+
+def _sha256(data: bytes = b''):
+    """Make a SHA-256 hash object."""
+    import hashlib
+
+    return hashlib.sha256(data)
+
+
+def content_hash(path: str) -> str:
+    """Compute the hash of the content of the file ``path``."""
+    hobj = _sha256()
+    with open(path, 'rb') as inp:
+        for chunk in iter(lambda: inp.read(1 << 16), b''):
+            hobj.update(chunk)
+
+    return hobj.hexdigest()
+
+
+class DiskCache(BaseCache):
+    """Persistent on-disk cache of the data loaded from files."""
+
+    def __init__(self,
+                 cache_dir: typing.Union[None, str, pathlib.Path] = None,
+                 max_age: typing.Optional[float] = None,
+                 max_size: typing.Optional[int] = None,
+                 protocol: typing.Optional[int] = None) -> None:
+        """Initialize the cache.
+
+        :param cache_dir: Cache dir or None to use the default one
+        :param max_age:
+            Entries not used in ``max_age`` seconds are regarded as expired
+        :param max_size: Max total size of entries in bytes
+        :param protocol:
+            Pickle protocol to serialize the data or None to use the highest
+            one
+        """
+        super().__init__()
+        self.cache_dir = pathlib.Path(
+            get_default_cache_dir() if cache_dir is None else cache_dir
+        )
+        self.max_age = max_age
+        self.max_size = max_size
+        self.protocol = protocol
+
+    def __len__(self) -> int:
+        """Get the number of entries."""
+        return len(self.list_entries())
+
+    def list_entries(self) -> typing.List[pathlib.Path]:
+        """List the paths of the entries."""
+        if not self.cache_dir.is_dir():
+            return []
+
+        return sorted(self.cache_dir.glob(f'*{ENTRY_EXT}'))
+
+    def entry_path(self, key: CacheKeyT) -> pathlib.Path:
+        """Get the path of the entry for ``key``.
+
+        :raises: OSError if the file of the data cannot be read
+        """
+        (path, cid, options) = key
+        digest = _sha256(
+            repr((FORMAT_VERSION, content_hash(path), cid, options)).encode()
+        ).hexdigest()
+
+        tag = sys.implementation.cache_tag or sys.implementation.name
+        return self.cache_dir / f'{digest}.{tag}{ENTRY_EXT}'
+
+    def _is_expired(self, path: pathlib.Path,
+                    now: typing.Optional[float] = None) -> bool:
+        """Test if the entry ``path`` is expired."""
+        if self.max_age is None:
+            return False
+
+        return path.stat().st_mtime < (now or time.time()) - self.max_age
+
+    def _get_entry(self, key: CacheKeyT, path: pathlib.Path) -> InDataExT:
+        """Get the data cached in the entry ``path`` or raise KeyError."""
+        import pickle
+
+        try:
+            if self._is_expired(path):
+                path.unlink()
+                raise KeyError(key)
+
+            with path.open('rb') as inp:
+                data = pickle.load(inp)
+
+            os.utime(path)  # Mark it as used recently.
+        except OSError as exc:
+            raise KeyError(key) from exc
+        except _pickle_errors() as exc:  # It looks broken.
+            path.unlink(missing_ok=True)
+            raise KeyError(key) from exc
+
+        return data
+
+    def _set_entry(self, path: pathlib.Path, data: InDataExT) -> None:
+        """Store the data ``data`` in the entry ``path`` atomically.
+
+        Errors are ignored as the cache is just an optimization.
+        """
+        import pickle
+        import tempfile
+
+        errors: ErrorsT = (OSError, *_pickle_errors())
+        protocol = (pickle.HIGHEST_PROTOCOL if self.protocol is None
+                    else self.protocol)
+        try:
+            content = pickle.dumps(data, protocol=protocol)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+            (fd, tmp) = tempfile.mkstemp(prefix=path.name, suffix='.tmp',
+                                         dir=self.cache_dir)
+            try:
+                with os.fdopen(fd, 'wb') as out:
+                    out.write(content)
+                os.replace(tmp, path)
+            except OSError:
+                os.unlink(tmp)
+                raise
+
+        except errors:
+            pass
+
+    def _get(self, key: CacheKeyT, stamp: StampT) -> InDataExT:
+        """Get the data cached or raise KeyError."""
+        try:
+            path = self.entry_path(key)
+        except OSError as exc:
+            raise KeyError(key) from exc
+
+        return self._get_entry(key, path)
+
+    def _set(self, key: CacheKeyT, stamp: StampT, data: InDataExT) -> None:
+        """Store the data ``data`` atomically."""
+        try:
+            path = self.entry_path(key)
+        except OSError:
+            return
+
+        self._set_entry(path, data)
+
+    def get_or_load(self, key: CacheKeyT, stamp: StampT,
+                    load_fn: typing.Callable[[], InDataExT]) -> InDataExT:
+        """Get the data cached or load it with ``load_fn`` and cache it.
+
+        The content of the file is hashed only once before loading, and the
+        data loaded is not cached if the file was modified since ``stamp``
+        was taken, because the data may have been loaded from the content
+        other than the one hashed.
+        """
+        try:
+            path = self.entry_path(key)
+        except OSError:
+            return super().get_or_load(key, stamp, load_fn)
+
+        try:
+            data = self._get_entry(key, path)
+        except KeyError:
+            with self._lock:
+                self._misses += 1
+        else:
+            with self._lock:
+                self._hits += 1
+            return data
+
+        data = load_fn()
+        if get_stamp(key[0]) == stamp:
+            self._set_entry(path, data)
+
+        return data
+
+    def _clear(self) -> None:
+        """Clear the entries."""
+        for path in self.list_entries():
+            path.unlink(missing_ok=True)
+
+    def prune(self, max_age: typing.Optional[float] = None,
+              max_size: typing.Optional[int] = None) -> int:
+        """Remove the entries expired or not used recently.
+
+        :param max_age:
+            Entries not used in ``max_age`` seconds will be removed. The
+            value given at initialization is used if it's None.
+        :param max_size:
+            Entries not used recently will be removed until the total size of
+            entries become less than or equal to ``max_size`` in bytes. The
+            value given at initialization is used if it's None.
+
+        :return: The number of entries removed
+        """
+        if max_age is None:
+            max_age = self.max_age
+        if max_size is None:
+            max_size = self.max_size
+
+        now = time.time()
+        entries = []
+        for path in self.list_entries():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        entries.sort(key=lambda entry: entry[0], reverse=True)  # Newer 1st.
+        total = 0
+        removes = []
+        for (mtime, size, path) in entries:
+            if max_age is not None and mtime < now - max_age:
+                removes.append(path)
+                continue
+
+            total += size
+            if max_size is not None and total > max_size:
+                removes.append(path)
+
+        for path in removes:
+            path.unlink(missing_ok=True)
+
+        return len(removes)
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,80 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""In-memory LRU cache of the data loaded from files."""
+import collections
+import copy
+import typing
+
+from ..common import InDataExT
+from .base import BaseCache
+from .datatypes import CacheKeyT, StampT
+
+
+DEFAULT_MAXSIZE: int = 128
+
+
+class Cache(BaseCache):
+    """In-memory LRU cache of the data loaded from files.
+
+    Each entry is validated with the stamp of the file, a tuple of (mtime_ns,
+    size, inode, device), and it is dropped if the file was modified. The data
+    is deep-copied on both of store and fetch so that the callers cannot
+    corrupt the cache.
+    """
+
+    def __init__(self, maxsize: typing.Optional[int] = DEFAULT_MAXSIZE
+                 ) -> None:
+        """Initialize the cache.
+
+        :param maxsize: Max number of entries or None means no limits
+        """
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f'Invalid maxsize: {maxsize!r}')
+
+        super().__init__()
+        self._maxsize = maxsize
+        self._entries: typing.Dict[
+            CacheKeyT, typing.Tuple[StampT, InDataExT]
+        ] = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        """Get the number of entries."""
+        return len(self._entries)
+
+    def __contains__(self, key: CacheKeyT) -> bool:
+        """Test if the cache has an entry of ``key``."""
+        return key in self._entries
+
+    def _get(self, key: CacheKeyT, stamp: StampT) -> InDataExT:
+        """Get the copy of the data cached or raise KeyError."""
+        with self._lock:
+            (stamp_0, data) = self._entries[key]
+            if stamp_0 != stamp:  # The file was modified.
+                del self._entries[key]
+                raise KeyError(key)
+
+            self._entries.move_to_end(key)  # type: ignore
+
+        return copy.deepcopy(data)
+
+    def _set(self, key: CacheKeyT, stamp: StampT, data: InDataExT) -> None:
+        """Store the copy of the data ``data``."""
+        if self._maxsize == 0:
+            return
+
+        data = copy.deepcopy(data)
+        with self._lock:
+            self._entries[key] = (stamp, data)
+            self._entries.move_to_end(key)  # type: ignore
+
+            if self._maxsize is not None:
+                while len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)  # type: ignore
+
+    def _clear(self) -> None:
+        """Clear the entries."""
+        self._entries.clear()
+
+# vim:sw=4:ts=4:et:
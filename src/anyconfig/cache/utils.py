@@ -0,0 +1,83 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Utility functions for anyconfig.cache."""
+import os
+import typing
+
+from .. import ioinfo
+from ..utils import is_dict_like, is_list_like
+from .datatypes import CacheKeyT, StampT
+
+if typing.TYPE_CHECKING:
+    from ..backend import ParserT
+
+
+# Options do not affect the results parsers load.
+IGNORED_OPTIONS: typing.FrozenSet[str] = frozenset(
+    ('ac_cache', 'ac_context', 'ac_jsonl_workers', 'ac_layered', 'ac_merge',
+     'ac_parallel', 'ac_query', 'ac_schema')
+)
+
+
+def freeze(obj: typing.Any) -> typing.Any:
+    """Make a hashable object from ``obj`` to compare with others."""
+    if is_dict_like(obj):
+        return tuple(sorted(((k, freeze(v)) for k, v in obj.items()),
+                            key=lambda item: str(item[0])))
+    if is_list_like(obj) or isinstance(obj, (set, frozenset)):
+        return tuple(freeze(x) for x in obj)
+    try:
+        hash(obj)
+    except TypeError:
+        return repr(obj)
+
+    return obj
+
+
+def normalize_options(**options) -> typing.Tuple[typing.Any, ...]:
+    """Normalize options passed to parsers to use them as a part of keys.
+
+    ac_merge is not ignored if ac_multi_docs is True as parsers merge
+    documents with it.
+    """
+    ignored = IGNORED_OPTIONS
+    if options.get('ac_multi_docs'):
+        ignored = ignored - {'ac_merge'}
+
+    return tuple(sorted((k, freeze(v)) for k, v in options.items()
+                        if k not in ignored))
+
+
+def get_stamp(path: str) -> typing.Optional[StampT]:
+    """Get the stamp of the file ``path`` to detect its modifications.
+
+    :return: A tuple of (mtime_ns, size, inode, device) or None
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino, stat.st_dev)
+
+
+def make_key(ioi: ioinfo.IOInfo, psr: 'ParserT', **options
+             ) -> typing.Optional[typing.Tuple[CacheKeyT, StampT]]:
+    """Make a key and a stamp to cache the data loaded from ``ioi``.
+
+    :return:
+        A tuple of key and stamp or None if the data from ``ioi`` cannot be
+        cached, e.g. ``ioi`` is a stream or a file does not exist.
+    """
+    if not ioi or ioinfo.is_stream(ioi) or not ioi.path:
+        return None
+
+    stamp = get_stamp(ioi.path)
+    if stamp is None:
+        return None
+
+    return ((ioi.path, psr.cid(), normalize_options(**options)), stamp)
+
+# vim:sw=4:ts=4:et:
@@ -48,6 +48,10 @@ def process_args_or_run_command(args: 'argparse.Namespace'
     Process ``args``, that is, validate and update it, and raise SystemExit if
     something goes wrong at once.
     """
+    args.cache = utils.make_cache(args)
+    if args.cache_clear:
+        actions.clear_cache(args)
+
     # Validate args:
     if args.inputs:
         if not args.itype:
@@ -60,6 +64,9 @@ def process_args_or_run_command(args: 'argparse.Namespace'
     else:
         try_special_command_if_no_inputs(args)
 
+    if args.diff and len(args.inputs) != 2:
+        utils.exit_with_output('--diff option requires just two inputs', 1)
+
     if args.validate and not args.schema:
         utils.exit_with_output(
             '--validate and --schema options must be used together',
@@ -114,7 +121,17 @@ def main(argv=None):
     if args.extra_opts:
         args.extra_opts = parser.parse(args.extra_opts)
 
+    if args.diff:
+        actions.try_output_result(
+            api.diff(*(utils.load_diff(args, args.extra_opts or {}, [inp])
+                       for inp in args.inputs)),
+            args
+        )
+        return
+
     diff = utils.load_diff(args, args.extra_opts or {})
+    if args.cache is not None:
+        actions.try_pruning_cache(args)
 
     if cnf:
         api.merge(cnf, diff)
@@ -12,6 +12,22 @@ def show_parsers_and_exit():
     utils.exit_with_output(utils.make_parsers_txt())
 
 
+def clear_cache(args):
+    """Clear the cache and exit if no inputs were given."""
+    args.cache.clear()
+    if not args.inputs:
+        utils.exit_with_output(f'Cleared the cache: {args.cache.cache_dir}')
+
+
+def try_pruning_cache(args):
+    """Try to prune the cache and exit if it's requested to prewarm it."""
+    if args.cache_max_age is not None or args.cache_max_size is not None:
+        args.cache.prune()
+
+    if args.cache_prewarm:
+        utils.exit_with_output(f'Prewarmed the cache: {args.cache.cache_dir}')
+
+
 def try_output_result(cnf, args):
     """Try to output result."""
     api.dump(
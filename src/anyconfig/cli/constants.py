@@ -23,9 +23,15 @@ Examples:
   %(prog)s '/etc/foo.d/*.json' --query 'locs[?state == 'T'].name | sort(@)'
   %(prog)s '/etc/foo.d/*.json' --get a.b.c
   %(prog)s '/etc/foo.d/*.json' --set a.b.c=1
+  # Make a patch (RFC 6902) between two configs and apply it:
+  %(prog)s --diff a.yml b.yml -O json -o a_to_b.json
+  %(prog)s --patch a_to_b.json a.yml -o b.yml
   # Validate with JSON schema or generate JSON schema:
   %(prog)s --validate -S foo.conf.schema.yml '/etc/foo.d/*.xml'
-  %(prog)s --gen-schema '/etc/foo.d/*.xml' -o foo.conf.schema.yml"""
+  %(prog)s --gen-schema '/etc/foo.d/*.xml' -o foo.conf.schema.yml
+  # Prewarm or clear the persistent cache of the data loaded:
+  %(prog)s --cache-prewarm --cache-dir /var/cache/foo '/etc/foo.d/*.yml'
+  %(prog)s --cache-clear --cache-dir /var/cache/foo"""
 
 ATYPE_HELP_FMT = """\
 Explicitly select type of argument to provide configs from %s.
@@ -50,6 +56,21 @@ GET_HELP = ("Specify key path to get part of config, for example, "
             "This option is not used with --query option at the same time. ")
 SET_HELP = ("Specify key path to set (update) part of config, for "
             "example, '--set a.b.c=1' to a config {'a': {'b': {'c': 0, "
-            "'d': 1}}} gives {'a': {'b': {'c': 1, 'd': 1}}}.")
+            "'d': 1}}} gives {'a': {'b': {'c': 1, 'd': 1}}}. This option "
+            "can be given multiple times to set some items at once.")
+DIFF_HELP = ("Output the patch in the format of JSON Patch "
+             "(http://tools.ietf.org/html/rfc6902) to make the first input "
+             "same as the second one instead of merged config. Just two "
+             "inputs must be given with this option. The patch is output "
+             "in JSON if neither -O/--otype option nor the output file "
+             "of a known type is given.")
+PATCH_HELP = ("Specify the file of a patch in the format of JSON Patch made "
+              "with --diff option for example to apply to (merged) config "
+              "before queries, --get and --set options are processed.")
+CACHE_DIR_HELP = ("Cache the data loaded from inputs persistently in the dir. "
+                  "If this option is not given but --cache-prewarm or "
+                  "--cache-clear was, the default cache dir, "
+                  "$ANYCONFIG_CACHE_DIR or $XDG_CACHE_HOME/anyconfig "
+                  "(~/.cache/anyconfig), is used.")
 
 # vim:sw=4:ts=4:et:
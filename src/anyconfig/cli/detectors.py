@@ -123,6 +123,11 @@ def try_detecting_output_type(args: 'argparse.Namespace'
         if otype:
             return otype
 
+    # The patch output with --diff option is a list and some backends such as
+    # TOML and INI ones cannot dump it.
+    if getattr(args, 'diff', False):
+        return 'json'
+
     # Lastly, try to detect the input type and use it as an output type also.
     itype = try_detecting_input_type(args)
     if not itype:
@@ -13,8 +13,30 @@ if typing.TYPE_CHECKING:
     import argparse
 
 
+def parse_set_items(items: typing.Iterable[str]
+                    ) -> typing.List[typing.Tuple[str, typing.Any]]:
+    """Parse the items of --set options in the form of path=value."""
+    pairs = []
+    for item in items:
+        (key, sep, val) = item.partition('=')
+        if not key or not sep:
+            utils.exit_with_output(
+                f'Invalid --set option: {item!r}, '
+                'it must be in the form of path=value', 1
+            )
+        pairs.append((key, parser.parse(val)))
+
+    return pairs
+
+
 def do_filter(cnf: typing.Dict[str, typing.Any], args: 'argparse.Namespace'):
-    """Filter ``cnf`` by query/get/set and return filtered result."""
+    """Filter ``cnf`` by patch/query/get/set and return filtered result."""
+    if args.patch:
+        try:
+            cnf = api.apply_patch(cnf, api.load(args.patch))
+        except Exception as exc:
+            utils.exit_with_output(f'Failed to patch: exc={exc!s}', 1)
+
     if args.query:
         try:
             return api.try_query(cnf, args.query)
@@ -22,15 +44,14 @@ def do_filter(cnf: typing.Dict[str, typing.Any], args: 'argparse.Namespace'):
             utils.exit_with_output(f'Failed to query: exc={exc!s}', 1)
 
     if args.get:
-        (cnf, err) = api.get(cnf, args.get)
+        (cnf, err) = api.compile_path(args.get).get(cnf)
         if cnf is None:
             utils.exit_with_output(f'Failed to get result: err={err!s}', 1)
 
         return cnf
 
     if args.set:
-        (key, val) = args.set.split('=')
-        api.set_(cnf, key, parser.parse(val))
+        api.set_many(cnf, parse_set_items(args.set))
 
     return cnf
 
@@ -14,7 +14,9 @@ DEFAULTS = {
     "loglevel": 0, "list": False, "output": None, "itype": None, "otype": None,
     "atype": None, "merge": api.MS_DICTS, "ignore_missing": False,
     "template": False, "env": False, "schema": None, "validate": False,
-    "gen_schema": False, "extra_opts": None
+    "gen_schema": False, "extra_opts": None, "diff": False, "patch": None,
+    "cache_dir": None, "cache_prewarm": False, "cache_clear": False,
+    "cache_max_age": None, "cache_max_size": None,
 }
 
 
@@ -76,7 +78,27 @@ def make_parser(defaults: typing.Optional[typing.Dict] = None,
     gspog = apsr.add_argument_group('Query/Get/set options')
     gspog.add_argument('-Q', '--query', help=constants.QUERY_HELP)
     gspog.add_argument('--get', help=constants.GET_HELP)
-    gspog.add_argument('--set', help=constants.SET_HELP)
+    gspog.add_argument('--set', action='append', help=constants.SET_HELP)
+
+    dpog = apsr.add_argument_group('Diff/patch options')
+    dpog.add_argument('--diff', action='store_true', help=constants.DIFF_HELP)
+    dpog.add_argument('--patch', help=constants.PATCH_HELP)
+
+    capog = apsr.add_argument_group('Cache options')
+    capog.add_argument('--cache-dir', help=constants.CACHE_DIR_HELP)
+    capog.add_argument('--cache-prewarm', action='store_true',
+                       help='Load inputs only to store the data into the '
+                            'cache and exit without any outputs')
+    capog.add_argument('--cache-clear', action='store_true',
+                       help='Clear the cache before loading inputs, and '
+                            'exit if no inputs were given')
+    capog.add_argument('--cache-max-age', type=float, metavar='SECONDS',
+                       help='Remove entries of the cache not used in given '
+                            'seconds after loading inputs')
+    capog.add_argument('--cache-max-size', type=int, metavar='BYTES',
+                       help='Remove entries of the cache not used recently '
+                            'to keep its total size less than given bytes '
+                            'after loading inputs')
 
     cpog = apsr.add_argument_group('Common options')
     cpog.add_argument('-x', '--ignore-missing', action='store_true',
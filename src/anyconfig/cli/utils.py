@@ -8,7 +8,7 @@ import os
 import sys
 import typing
 
-from .. import api
+from .. import api, cache
 
 
 @functools.lru_cache(None)
@@ -58,29 +58,45 @@ def exit_if_load_failure(cnf, msg):
         exit_with_output(msg, 1)
 
 
-def load_diff(args, extra_opts):
+def make_cache(args) -> typing.Optional[cache.DiskCache]:
+    """Make a persistent cache object if it's required.
+
+    :param args: :class:`argparse.Namespace` object
+    """
+    if not (args.cache_dir or args.cache_prewarm or args.cache_clear):
+        return None
+
+    return cache.DiskCache(args.cache_dir, max_age=args.cache_max_age,
+                           max_size=args.cache_max_size)
+
+
+def load_diff(args, extra_opts, inputs=None):
     """Load update data.
 
     :param args: :class:`argparse.Namespace` object
     :param extra_opts: Map object given to api.load as extra options
+    :param inputs: A list of inputs to load or None to load ``args.inputs``
     """
+    if inputs is None:
+        inputs = args.inputs
     try:
-        diff = api.load(args.inputs, args.itype,
+        diff = api.load(inputs, args.itype,
                         ac_ignore_missing=args.ignore_missing,
                         ac_merge=args.merge,
                         ac_template=args.template,
                         ac_schema=args.schema,
+                        ac_cache=getattr(args, 'cache', None),
                         **extra_opts)
     except api.UnknownProcessorTypeError:
         exit_with_output(f"Wrong input type '{args.itype}'", 1)
     except api.UnknownFileTypeError:
         exit_with_output(
             'No appropriate backend was found for given file '
-            f"type='{args.itype}', inputs={', '.join(args.inputs)}",
+            f"type='{args.itype}', inputs={', '.join(inputs)}",
             1
         )
     exit_if_load_failure(
-        diff, f'Failed to load: args={", ".join(args.inputs)}'
+        diff, f'Failed to load: args={", ".join(inputs)}'
     )
 
     return diff
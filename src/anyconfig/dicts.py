@@ -7,15 +7,33 @@
 #
 r"""Utility functions to operate on mapping objects such as get, set and merge.
 
+.. versionchanged:: 0.14.1
+   :func:`merge` walks both trees with an explicit stack instead of recursion,
+   resolves the strategy function only once, and does not rebuild the mapping
+   object from an iterable of pairs on each key.
+   Lists are merged with the index of items to test their membership, and
+   lists of mapping objects may be merged by a key field, ``merge_lists_by``.
+   Added :class:`Interner` to share keys and scalar values among loaded
+   objects.
+   Added :func:`diff` and :func:`apply_patch` to compute and apply patches
+   in the format of RFC 6902, JSON Patch.
+   :func:`merge` can use different strategies per path with merge rules,
+   :class:`MergeRules`, and record the sources of values merged in
+   :class:`Provenance`.
+
 .. versionadded: 0.8.3
    define _update_* and merge functions based on classes in
    :mod:`m9dicts.dicts`
 
 """
 import collections
+import collections.abc
+import copy
 import functools
-import operator
+import itertools
+import math
 import re
+import sys
 import typing
 
 from . import utils
@@ -83,42 +101,263 @@ def mk_nested_dic(path: str, val: typing.Any,
     return ret
 
 
+def _is_container(obj: typing.Any) -> bool:
+    """Test if ``obj`` is a mapping or a list-like object."""
+    return utils.is_dict_like(obj) or utils.is_list_like(obj)
+
+
+def _to_index(key: str, idx_reg: typing.Pattern
+              ) -> typing.Optional[int]:
+    """Convert ``key`` to an array index if it looks so or return None."""
+    if not idx_reg.match(key):
+        return None
+    try:
+        return int(key)
+    except ValueError:
+        return None
+
+
+class PathAccessor:
+    """Accessor to get and set an item in nested dicts pointed by a path.
+
+    The path expression is parsed and decoded only once on instantiation,
+    and array indexes are resolved at any level of the path by following
+    RFC 6901, JSON Pointer, e.g. '/a/0/b'. '-' means the end of arrays to
+    append an item on set.
+
+    Use :func:`compile_path` to make an object of this class.
+
+    .. versionadded:: 0.14.1
+    """
+
+    def __init__(self, path: str, seps: typing.Tuple[str, ...] = PATH_SEPS,
+                 idx_reg: typing.Pattern = _JSNP_GET_ARRAY_IDX_REG) -> None:
+        """Initialize with a path expression ``path``.
+
+        :param path: Path expression to point object wanted
+        :param seps: Separator char candidates
+        :param idx_reg: Regex pattern of array indexes
+        """
+        self.path = path
+        self.keys: typing.Tuple[str, ...] = tuple(
+            _jsnp_unescape(s) for s in _split_path(path, seps)
+        )
+        self._idxs: typing.Tuple[typing.Optional[int], ...] = tuple(
+            _to_index(key, idx_reg) for key in self.keys
+        )
+        self._steps = tuple(zip(self.keys, self._idxs))
+
+    def __repr__(self) -> str:
+        """Get the representation of this object."""
+        return f'{type(self).__name__}({self.path!r})'
+
+    @staticmethod
+    def _index(lst: typing.Any, key: str, idx: typing.Optional[int],
+               append: bool = False) -> int:
+        """Get the index of an item in a list-like object ``lst``.
+
+        :param append: Allow the index next to the last item or '-'
+        """
+        size = len(lst)
+        if append and key == '-':
+            return size
+        if idx is None:
+            raise TypeError(f'Not an array index: {key!r}')
+        if idx > size or (idx == size and not append):
+            raise IndexError(f'Array index out of range: {key!r}')
+
+        return idx
+
+    def get(self, obj: typing.Any) -> typing.Tuple[typing.Any, str]:
+        """Get the item in ``obj`` pointed by the path.
+
+        :param obj: a dict[-like] object
+        :return: A tuple of (result_object, error_message)
+        """
+        try:
+            for key, idx in self._steps:
+                if idx is None or isinstance(obj, dict) or \
+                        utils.is_dict_like(obj) or \
+                        not utils.is_list_like(obj):
+                    obj = obj[key]
+                else:
+                    obj = obj[idx]
+        except (TypeError, KeyError, IndexError) as exc:
+            return (None, str(exc))
+
+        return (obj, '')
+
+    def locate(self, obj: typing.Any, append: bool = False
+               ) -> typing.Tuple[typing.Any, typing.Any]:
+        """Locate the item in ``obj`` pointed by the path.
+
+        :param obj: a dict[-like] or list-like object
+        :param append: Allow the index next to the last item of arrays or '-'
+        :return: A tuple of the parent of the item and the key or the index
+        :raises:
+            ValueError if the path is empty, KeyError, TypeError or IndexError
+            if the path points to an invalid item
+        """
+        if not self.keys:
+            raise ValueError(f'Path points to the root: {self.path!r}')
+
+        for key, idx in self._steps[:-1]:
+            if idx is None or utils.is_dict_like(obj) or \
+                    not utils.is_list_like(obj):
+                obj = obj[key]
+            else:
+                obj = obj[idx]
+
+        (key, idx) = self._steps[-1]
+        if utils.is_dict_like(obj):
+            return (obj, key)
+        if utils.is_list_like(obj):
+            return (obj, self._index(obj, key, idx, append=append))
+
+        raise TypeError(f'Not a container: {obj!r}')
+
+    def set(self, obj: typing.Any, val: typing.Any) -> None:
+        """Set the item in ``obj`` pointed by the path to ``val``.
+
+        Mapping objects are created at the middle of the path if there are
+        no items or the items are not either mapping or list-like objects.
+
+        :param obj: a dict[-like] or list-like object
+        :param val: Value to set
+        :raises:
+            ValueError if the path is empty, TypeError or IndexError if
+            the path points to an invalid item in lists
+        """
+        if not self.keys:
+            raise ValueError(f'Path to set is empty: {self.path!r}')
+
+        for key, idx in zip(self.keys[:-1], self._idxs[:-1]):
+            if utils.is_dict_like(obj):
+                child = obj.get(key, None)
+                if not _is_container(child):
+                    child = obj[key] = {}
+            elif utils.is_list_like(obj):
+                pos = self._index(obj, key, idx, append=True)
+                if pos == len(obj):
+                    obj.append({})
+                child = obj[pos]
+                if not _is_container(child):
+                    child = obj[pos] = {}
+            else:
+                raise TypeError(f'Not a container: {obj!r}')
+
+            obj = child
+
+        (key, idx) = (self.keys[-1], self._idxs[-1])
+        if utils.is_dict_like(obj) or not utils.is_list_like(obj):
+            obj[key] = val
+            return
+
+        pos = self._index(obj, key, idx, append=True)
+        if pos == len(obj):
+            obj.append(val)
+        else:
+            obj[pos] = val
+
+
+# Max number of compiled paths cached.
+COMPILED_PATHS_MAXSIZE: int = 8192
+
+
+@functools.lru_cache(maxsize=COMPILED_PATHS_MAXSIZE)
+def compile_path(path: str, seps: typing.Tuple[str, ...] = PATH_SEPS,
+                 idx_reg: typing.Pattern = _JSNP_GET_ARRAY_IDX_REG
+                 ) -> PathAccessor:
+    """Compile a path expression to an accessor object can be reused.
+
+    :param path: Path expression to point object wanted
+    :param seps: Separator char candidates
+    :param idx_reg: Regex pattern of array indexes
+    :return: :class:`PathAccessor` object
+    """
+    return PathAccessor(path, seps, idx_reg)
+
+
 def get(dic: DictT, path: str, seps: typing.Tuple[str, ...] = PATH_SEPS,
         idx_reg: typing.Pattern = _JSNP_GET_ARRAY_IDX_REG
         ) -> typing.Tuple[typing.Any, str]:
     """Getter for nested dicts.
 
+    .. versionchanged:: 0.14.1
+       Array indexes are resolved at any level of the path.
+
     :param dic: a dict[-like] object
     :param path: Path expression to point object wanted
     :param seps: Separator char candidates
     :return: A tuple of (result_object, error_message)
     """
-    items = [_jsnp_unescape(s) for s in _split_path(path, seps)]  # : [str]
-    if not items:
-        return (dic, '')
-    try:
-        if len(items) == 1:
-            return (dic[items[0]], '')
+    return compile_path(path, seps, idx_reg).get(dic)
 
-        prnt: typing.Any = functools.reduce(operator.getitem, items[:-1], dic)
-        arr = (idx_reg.match(items[-1])
-               if utils.is_list_like(prnt) else False)  # type: ignore
 
-        return (prnt[int(items[-1])], '') if arr else (prnt[items[-1]], '')
+def get_many(dic: DictT, paths: typing.Iterable[str],
+             seps: typing.Tuple[str, ...] = PATH_SEPS
+             ) -> typing.List[typing.Tuple[typing.Any, str]]:
+    """Get items in nested dicts pointed by paths at once.
 
-    except (TypeError, KeyError, IndexError) as exc:
-        return (None, str(exc))
+    :param dic: a dict[-like] object
+    :param paths: An iterable yields path expressions
+    :param seps: Separator char candidates
+    :return: A list of tuples of (result_object, error_message) in order
+    """
+    return [compile_path(path, seps).get(dic) for path in paths]
 
 
 def set_(dic: DictT, path: str, val: typing.Any,
          seps: typing.Tuple[str, ...] = PATH_SEPS) -> None:
     """Setter for nested dicts.
 
+    .. versionchanged:: 0.14.1
+       The item is set directly without making a nested dict and merging it,
+       and array indexes are resolved at any level of the path.
+
     :param dic: a dict[-like] object support recursive merge operations
     :param path: Path expression to point object wanted
+    :param val:
+        Value to set. It's merged with the current value if both are mapping
+        objects.
     :param seps: Separator char candidates
     """
-    merge(dic, mk_nested_dic(path, val, seps), ac_merge=MS_DICTS)
+    acc = compile_path(path, seps)
+    if not acc.keys:
+        return
+
+    if utils.is_dict_like(val):
+        (cur, err) = acc.get(dic)
+        if not err and utils.is_dict_like(cur):
+            merge(cur, val, ac_merge=MS_DICTS)
+            return
+
+    acc.set(dic, val)
+
+
+def set_many(dic: DictT,
+             items: typing.Union[typing.Mapping[str, typing.Any],
+                                 typing.Iterable[typing.Tuple[str,
+                                                              typing.Any]]],
+             seps: typing.Tuple[str, ...] = PATH_SEPS) -> None:
+    """Set items in nested dicts pointed by paths at once, in order.
+
+    :param dic: a dict[-like] object support recursive merge operations
+    :param items:
+        A mapping object of path expressions and values or an iterable of
+        (path, value) tuples
+    :param seps: Separator char candidates
+    """
+    pairs: typing.Iterable[typing.Tuple[str, typing.Any]]
+    if utils.is_dict_like(items):
+        pairs = typing.cast(typing.Mapping[str, typing.Any], items).items()
+    else:
+        pairs = typing.cast(
+            typing.Iterable[typing.Tuple[str, typing.Any]], items
+        )
+
+    for path, val in pairs:
+        set_(dic, path, val, seps=seps)
 
 
 def _are_list_like(*objs: typing.Any) -> bool:
@@ -165,14 +404,120 @@ def _update_wo_replace(self: DictT, other: DictT, key: str,
         self[key] = other.get(key, val)
 
 
-def _merge_list(self: DictT, key: str,
-                lst: typing.Iterable[typing.Any]) -> None:
+# Tags to distinguish the canonical forms of unhashable objects.
+_MAP_TAG = object()
+_SEQ_TAG = object()
+_TUPLE_TAG = object()
+
+
+def _canonical(obj: typing.Any) -> typing.Hashable:
+    """Make a hashable canonical form of ``obj`` to test its membership.
+
+    Objects equal to each other have the same canonical form, e.g. {'a': 1}
+    and {'a': 1}. Hashable objects are their canonical forms.
+
+    :raises: TypeError if it cannot make the canonical form of ``obj``
+    """
+    try:
+        hash(obj)
+        return obj
+    except TypeError:
+        pass
+
+    if utils.is_dict_like(obj):
+        return (_MAP_TAG,
+                frozenset((k, _canonical(v)) for k, v in obj.items()))
+    if isinstance(obj, collections.abc.Set):
+        return frozenset(obj)
+    if utils.is_list_like(obj):
+        return (_TUPLE_TAG if isinstance(obj, tuple) else _SEQ_TAG,
+                tuple(_canonical(x) for x in obj))
+
+    raise TypeError(f'Cannot make the canonical form of {obj!r}')
+
+
+class _ListIndex:
+    """Index of the items of a list to test their membership in O(1).
+
+    Items its canonical form cannot be made are kept in a list and looked up
+    linearly as a fallback.
+    """
+
+    def __init__(self, items: typing.Iterable[typing.Any]) -> None:
+        """Initialize with ``items``."""
+        self._seen: typing.Set[typing.Hashable] = set()
+        self._rest: typing.List[typing.Any] = []
+        for item in items:
+            try:
+                self._seen.add(_canonical(item))
+            except TypeError:
+                self._rest.append(item)
+
+    def __contains__(self, item: typing.Any) -> bool:
+        """Test if ``item`` is in the index."""
+        try:
+            return _canonical(item) in self._seen
+        except TypeError:
+            return item in self._rest
+
+
+def _index_by(items: typing.Iterable[typing.Any], field: str
+              ) -> typing.Dict[typing.Hashable, typing.Any]:
+    """Make an index of mapping objects in ``items`` by the key ``field``.
+
+    The first one is indexed if there are objects have the same value.
+    """
+    index: typing.Dict[typing.Hashable, typing.Any] = {}
+    for item in items:
+        if utils.is_dict_like(item) and field in item:
+            try:
+                index.setdefault(_canonical(item[field]), item)
+            except TypeError:
+                pass
+
+    return index
+
+
+def _merge_list(self: DictT, key: str, lst: typing.Iterable[typing.Any],
+                merge_lists_by: typing.Optional[str] = None
+                ) -> typing.List[typing.Tuple[DictT, typing.Any]]:
     """Update a dict ``self`` using an iterable ``lst``.
 
+    Items in ``lst`` not in self[key] are appended to self[key] in order. If
+    ``merge_lists_by`` is given, mapping objects in ``lst`` have the same
+    value of the key ``merge_lists_by`` as the one in self[key] are not
+    appended but returned with it to merge them later.
+
     :param key: self[key] will be updated
     :param lst: Other list to merge
+    :param merge_lists_by: Key of mapping objects in lists to merge them by
+    :return: A list of pairs of mapping objects to merge
     """
-    self[key] += [x for x in lst if x not in self[key]]
+    orig = self[key]
+    if lst is orig:  # e.g. merge(self, self); nothing to merge.
+        return []
+
+    index = _ListIndex(orig)
+    keyed = _index_by(orig, merge_lists_by) if merge_lists_by else {}
+
+    news = []
+    pairs = []
+    for item in lst:
+        if keyed and utils.is_dict_like(item) and merge_lists_by in item:
+            try:
+                match = keyed.get(_canonical(item[merge_lists_by]))
+            except TypeError:
+                match = None
+
+            if match is not None:
+                pairs.append((match, item))
+                continue
+
+        if item not in index:
+            news.append(item)
+
+    self[key] += news
+    return pairs
 
 
 def _merge_other(self: DictT, key: str, val: typing.Any) -> None:
@@ -186,7 +531,9 @@ def _merge_other(self: DictT, key: str, val: typing.Any) -> None:
 
 def _update_with_merge(self: DictT, other: DictT, key: str,
                        val: typing.Any = None,
-                       merge_lists: bool = False, **options) -> None:
+                       merge_lists: bool = False,
+                       merge_lists_by: typing.Optional[str] = None,
+                       **options) -> None:
     """Update a dict ``self`` using ``other`` and optional arguments.
 
     Merge the value of self with other's recursively. Behavior of merge will be
@@ -204,6 +551,14 @@ def _update_with_merge(self: DictT, other: DictT, key: str,
         [1, 2, 3], [3, 4] ==> [1, 2, 3, 4]
         [1, 2, 2], [2, 4] ==> [1, 2, 2, 4]
 
+    :param merge_lists_by:
+        Key of mapping objects in lists to merge. Mapping objects have the
+        same value of the key are merged instead of appended if it's given
+        and lists are merged. For example, if it's 'name',
+
+        [{'name': 'a', 'x': 1}], [{'name': 'a', 'y': 2}, {'name': 'b'}]
+        ==> [{'name': 'a', 'x': 1, 'y': 2}, {'name': 'b'}]
+
     :return: None but 'self' will be updated
     """
     if val is None:
@@ -212,9 +567,12 @@ def _update_with_merge(self: DictT, other: DictT, key: str,
     if key in self:
         val0 = self[key]  # Original value
         if utils.is_dict_like(val0):  # It needs recursive updates.
-            merge(self[key], val, merge_lists=merge_lists, **options)
+            merge(self[key], val, merge_lists=merge_lists,
+                  merge_lists_by=merge_lists_by, **options)
         elif merge_lists and _are_list_like(val, val0):
-            _merge_list(self, key, val)
+            for dst, src in _merge_list(self, key, val, merge_lists_by):
+                merge(dst, src, merge_lists=merge_lists,
+                      merge_lists_by=merge_lists_by, **options)
         else:
             _merge_other(self, key, val)
     else:
@@ -264,76 +622,1205 @@ UpdatesT = typing.Union[
 ]
 
 
-def merge(self: DictT, other: UpdatesT, ac_merge: str = MS_DICTS,
+PairsT = typing.Iterable[typing.Tuple[str, typing.Any]]
+
+
+def _to_dict_and_pairs(other: UpdatesT) -> typing.Tuple[DictT, PairsT]:
+    """Make a mapping object and an iterable of pairs from ``other``.
+
+    Mapping objects are not copied and the view of their items is returned
+    as the pairs, and a list of pairs is made only from the other iterables.
+
+    :param other: a dict[-like] object or an iterable of (key, value) tuples
+    :raises: ValueError or TypeError if ``other`` is not either of them
+    """
+    if utils.is_dict_like(other):
+        dother = typing.cast(DictT, other)
+        return (dother, dother.items())
+
+    try:
+        pairs = list(typing.cast(
+            typing.Iterable[typing.Tuple[str, typing.Any]], other
+        ))
+        dother = dict(pairs)
+    except (ValueError, TypeError) as exc:  # Re-raise w/ info.
+        raise type(exc)(f'{exc!s} other={other!r}')
+
+    return (dother, pairs)
+
+
+def _to_dict(other: UpdatesT) -> DictT:
+    """Make a mapping object from ``other`` only if it's not."""
+    if utils.is_dict_like(other):
+        return typing.cast(DictT, other)
+
+    return _to_dict_and_pairs(other)[0]
+
+
+def _merge_dicts_iter(self: DictT, other: UpdatesT,
+                      merge_lists: bool = False,
+                      merge_lists_by: typing.Optional[str] = None) -> None:
+    """Merge ``other`` into ``self`` recursively without recursive calls.
+
+    This is an equivalent of :func:`_update_with_merge` applied to all of the
+    items of ``other`` and nested mapping objects recursively, but it walks
+    both trees with an explicit stack of iterators, in the same order as
+    recursive calls, to avoid the recursion limit and the overhead of calls.
+
+    :param self: mapping object to update with 'other'
+    :param other: a dict[-like] object or an iterable of (key, value) tuples
+    :param merge_lists: Merge not only dicts but also lists
+    :param merge_lists_by: Key of mapping objects in lists to merge them by
+    """
+    def _items(dst, src):
+        (dsrc, pairs) = _to_dict_and_pairs(src)
+        return (dst, iter(pairs), dsrc)
+
+    stack = [_items(self, other)]
+    while stack:
+        (dst, itr, dsrc) = stack[-1]
+        for key, val in itr:
+            if val is None:
+                val = dsrc[key]
+
+            if key not in dst:
+                dst[key] = val
+                continue
+
+            val0 = dst[key]  # Original value
+            if utils.is_dict_like(val0):  # It needs recursive updates.
+                stack.append(_items(val0, val))
+                break
+
+            if merge_lists and _are_list_like(val, val0):
+                pairs = _merge_list(dst, key, val, merge_lists_by)
+                if pairs:  # Merge mapping objects in lists in order.
+                    stack.extend(_items(*p) for p in reversed(pairs))
+                    break
+            else:
+                _merge_other(dst, key, val)
+        else:
+            stack.pop()
+
+
+class _RuleNode:
+    """A node of the trie of merge rules."""
+
+    __slots__ = ('children', 'wildcard', 'update_fn')
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.children: typing.Dict[str, _RuleNode] = {}
+        self.wildcard: typing.Optional[_RuleNode] = None
+        self.update_fn: typing.Optional[typing.Callable[..., None]] = None
+
+
+# Wildcard in path patterns of merge rules and the key to match only it.
+RULE_WILDCARD: str = '*'
+_ANY_KEY = object()
+
+
+class MergeRules:
+    """Merge strategies per path compiled into a trie.
+
+    Rules are a mapping object of path patterns and merge strategies, e.g.
+    {'secrets/*': 'replace', 'plugins': 'merge_dicts_and_lists'}. Patterns
+    are path expressions like :func:`get` takes, and '*' in them matches any
+    key. The strategy of the most specific pattern matches the path of a
+    value, or the one of the nearest ancestor if nothing matches, is used to
+    merge it. Literal keys take precedence over '*'. The pattern '' is for
+    the root and its default is MS_DICTS.
+
+    Pass an object of this class or rules as 'ac_merge' to :func:`merge`.
+    Rules are compiled only once by making an object of this class.
+
+    .. versionadded:: 0.14.1
+    """
+
+    def __init__(self, rules: typing.Mapping[str, typing.Any],
+                 seps: typing.Tuple[str, ...] = PATH_SEPS) -> None:
+        """Initialize with ``rules``.
+
+        :param rules: A mapping object of path patterns and merge strategies
+        :param seps: Separator char candidates
+        :raises: ValueError if some strategies are wrong
+        """
+        self.rules = dict(rules)
+        self.root = _RuleNode()
+        self.root.update_fn = _get_update_fn(MS_DICTS)
+
+        for pattern, strategy in self.rules.items():
+            node = self.root
+            for key in _split_path(pattern, seps):
+                if key == RULE_WILDCARD:
+                    if node.wildcard is None:
+                        node.wildcard = _RuleNode()
+                    node = node.wildcard
+                else:
+                    node = node.children.setdefault(_jsnp_unescape(key),
+                                                    _RuleNode())
+            node.update_fn = _get_update_fn(strategy)
+
+    def __repr__(self) -> str:
+        """Get the representation of this object."""
+        return f'{type(self).__name__}({self.rules!r})'
+
+    @staticmethod
+    def step(nodes: typing.List[_RuleNode], key: typing.Any,
+             update_fn: typing.Callable[..., None]
+             ) -> typing.Tuple[typing.List[_RuleNode],
+                               typing.Callable[..., None]]:
+        """Go down to the child ``key`` from ``nodes`` in the trie.
+
+        :param nodes: Nodes matched the path of the parent, ordered by
+            precedence
+        :param key: Key of the child or _ANY_KEY to match only '*'
+        :param update_fn: Function to update objects of the parent
+        :return: A tuple of the nodes matched and the function to update
+        """
+        res = []
+        for node in nodes:
+            if key is not _ANY_KEY:
+                try:
+                    child = node.children.get(key)
+                except TypeError:  # Unhashable keys.
+                    child = None
+                if child is not None:
+                    res.append(child)
+            if node.wildcard is not None:
+                res.append(node.wildcard)
+
+        for node in res:
+            if node.update_fn is not None:
+                return (res, node.update_fn)
+
+        return (res, update_fn)
+
+
+class _Inherit:
+    """The type of the key of the source inherited by children.
+
+    Its object is pickled by reference so that it's still the same object
+    in the tables of :class:`Provenance` objects passed to other processes.
+    """
+
+    def __reduce__(self) -> str:
+        """Pickle the object as the reference to the module global."""
+        return '_INHERIT'
+
+    def __repr__(self) -> str:
+        """Get the representation of this object."""
+        return '<inherit>'
+
+
+# The key of the source inherited by children in the tables of Provenance.
+_INHERIT = _Inherit()
+
+ProvNodeT = typing.Dict[typing.Any, typing.Any]
+
+
+def _prov_child(pnode: ProvNodeT, key: typing.Any) -> ProvNodeT:
+    """Get the node of the child ``key`` in the table of provenance.
+
+    The child is made from the index of the source of it or the parent if
+    it's not a node yet.
+    """
+    child = pnode.get(key)
+    if not isinstance(child, dict):
+        child = pnode[key] = {
+            _INHERIT: pnode[_INHERIT] if child is None else child
+        }
+    return child
+
+
+class Provenance:
+    """A side table records which sources supplied values merged.
+
+    Indexes of the sources are recorded in a tree of dicts mirrors only the
+    parts of the data updated by later sources, and a whole subtree supplied
+    by a source takes only an item, so that it's much smaller than the data
+    merged. Values are never wrapped.
+
+    Pass an object of this class as 'ac_provenance' to :func:`merge` after
+    :meth:`add_source` is called with the source of the data to merge.
+
+    .. versionadded:: 0.14.1
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self.sources: typing.List[typing.Tuple[int, typing.Any]] = []
+        self._root: typing.Any = None
+
+    def add_source(self, source: typing.Any,
+                   pos: typing.Optional[int] = None) -> int:
+        """Add a source of the data will be merged next.
+
+        The first source is the one of the data other sources are merged into.
+
+        :param source: An object represents the source, e.g. IOInfo
+        :param pos: The position of the source in the inputs or None
+        :return: The index of the source
+        """
+        idx = len(self.sources)
+        self.sources.append((idx if pos is None else pos, source))
+        if self._root is None:
+            self._root = idx
+
+        return idx
+
+    def _root_node(self) -> ProvNodeT:
+        """Get the root node of the table."""
+        if not isinstance(self._root, dict):
+            self._root = {_INHERIT: self._root}
+        return self._root
+
+    def get(self, path: str, seps: typing.Tuple[str, ...] = PATH_SEPS
+            ) -> typing.Optional[typing.Tuple[int, typing.Any]]:
+        """Get the source of the value at ``path``.
+
+        Values in lists and mapping objects not updated by later sources have
+        the source of the nearest ancestor recorded.
+
+        :param path: Path expression to the value
+        :param seps: Separator char candidates
+        :return: A tuple of the position and the source, or None
+        """
+        node = self._root
+        if node is None:
+            return None
+
+        for key in compile_path(path, seps).keys:
+            if not isinstance(node, dict):
+                break
+            node = node.get(key, node[_INHERIT])
+
+        return self.sources[node[_INHERIT] if isinstance(node, dict)
+                            else node]
+
+    def items(self) -> typing.Iterator[
+            typing.Tuple[typing.Tuple[typing.Any, ...],
+                         typing.Tuple[int, typing.Any]]]:
+        """Iterate the entries of the table in the compact form.
+
+        :return:
+            An iterator yields pairs of a tuple of keys and the source of the
+            value at the path, and values under it unless they have entries
+        """
+        if self._root is None:
+            return
+
+        stack: typing.List[typing.Tuple[typing.Tuple[typing.Any, ...],
+                                        typing.Any]] = [((), self._root)]
+        while stack:
+            (path, node) = stack.pop()
+            if not isinstance(node, dict):
+                yield (path, self.sources[node])
+                continue
+
+            yield (path, self.sources[node[_INHERIT]])
+            stack.extend(((*path, k), v) for k, v in node.items()
+                         if k is not _INHERIT)
+
+    def __len__(self) -> int:
+        """Get the number of the entries of the table."""
+        return sum(1 for _ in self.items())
+
+
+def _rules_frame(dst: DictT, src: UpdatesT, nodes: typing.List[typing.Any],
+                 update_fn: typing.Optional[typing.Callable],
+                 pnode: typing.Optional[typing.Dict[typing.Any, typing.Any]]
+                 ) -> typing.Tuple[typing.Any, ...]:
+    """Make a frame of the stack to walk in :func:`_merge_with_rules`.
+
+    :return: (dst, iterator of pairs, src as a dict, nodes, update_fn, pnode)
+    """
+    (dsrc, pairs) = _to_dict_and_pairs(src)
+    return (dst, iter(pairs), dsrc, nodes, update_fn, pnode)
+
+
+def _merge_lists_with_rules(dst: DictT, key: str, val: typing.Any,
+                            rules: MergeRules,
+                            step: typing.Tuple[typing.Any, typing.Callable],
+                            merge_lists_by: typing.Optional[str] = None
+                            ) -> typing.List[typing.Tuple[typing.Any, ...]]:
+    """Merge lists ``val`` into dst[key] with the rules of their items.
+
+    :param step: A tuple of the trie nodes and the update function of lists
+    :return: A list of frames to walk mapping objects in lists merged
+    """
+    pairs = _merge_list(dst, key, val, merge_lists_by)
+    if not pairs:
+        return []
+
+    (cnodes, update_fn) = step
+    (inodes, ifn) = (cnodes, update_fn) if not cnodes else \
+        rules.step(cnodes, _ANY_KEY, update_fn)  # Items match only '*'.
+
+    return [_rules_frame(d, s, inodes, ifn, None) for d, s in reversed(pairs)]
+
+
+def _merge_item_with_rules(frame: typing.Tuple[typing.Any, ...], key: str,
+                           val: typing.Any, rules: MergeRules,
+                           sidx: typing.Optional[int] = None, **options
+                           ) -> typing.List[typing.Tuple[typing.Any, ...]]:
+    """Merge an item (``key``, ``val``) in the source of ``frame``.
+
+    :param frame: A frame made by :func:`_rules_frame`
+    :param sidx: The index of the source to record as the one of values
+    :param options: Keyword options such as 'merge_lists'
+    :return: A list of frames to walk next
+    """
+    (dst, _itr, dsrc, nodes, pfn, pnode) = frame
+    (cnodes, update_fn) = (nodes, pfn) if not nodes else \
+        rules.step(nodes, key, pfn)
+
+    if update_fn not in (_update_with_merge, _update_with_merge_lists):
+        update_fn(dst, dsrc, key, val=val, **options)  # replace, etc.
+        if pnode is not None and dst.get(key, _MISSING) is val:
+            pnode[key] = sidx
+        return []
+
+    if val is None:
+        val = dsrc[key]
+
+    val0 = dst.get(key, _MISSING)  # Original value
+    if utils.is_dict_like(val0):
+        return [_rules_frame(val0, val, cnodes, update_fn,
+                             None if pnode is None
+                             else _prov_child(pnode, key))]
+
+    if pnode is not None:
+        pnode[key] = sidx  # Lists merged are from the last one.
+
+    if val0 is _MISSING:
+        dst[key] = val
+    elif (options.get('merge_lists') or update_fn is _update_with_merge_lists
+          ) and _are_list_like(val, val0):
+        return _merge_lists_with_rules(dst, key, val, rules,
+                                       (cnodes, update_fn),
+                                       options.get('merge_lists_by'))
+    else:
+        _merge_other(dst, key, val)
+
+    return []
+
+
+def _merge_with_rules(self: DictT, other: UpdatesT, rules: MergeRules,
+                      merge_lists: bool = False,
+                      merge_lists_by: typing.Optional[str] = None,
+                      provenance: typing.Optional[Provenance] = None,
+                      **options) -> None:
+    """Merge ``other`` into ``self`` with the strategies in ``rules``.
+
+    It walks both trees once in the same way as :func:`_merge_dicts_iter`
+    does, and looks up the strategy at each node from the trie of ``rules``
+    as it descends. Nodes not matched any patterns are merged with the
+    strategy of the parent without lookups.
+
+    :param rules: Merge rules compiled
+    :param merge_lists: Merge lists also with MS_DICTS if True
+    :param merge_lists_by: Key of mapping objects in lists to merge them by
+    :param provenance:
+        A table to record the last source added to it as the one of values
+        updated, or None
+    """
+    (pnode, sidx) = (None, None)
+    if provenance is not None:
+        # pylint: disable=protected-access
+        (pnode, sidx) = (provenance._root_node(),
+                         len(provenance.sources) - 1)
+
+    stack = [_rules_frame(self, other, [rules.root], rules.root.update_fn,
+                          pnode)]
+    while stack:
+        frame = stack[-1]
+        for key, val in frame[1]:
+            frames = _merge_item_with_rules(
+                frame, key, val, rules, sidx, merge_lists=merge_lists,
+                merge_lists_by=merge_lists_by, **options
+            )
+            if frames:
+                stack.extend(frames)
+                break
+        else:
+            stack.pop()
+
+
+def merge(self: DictT, other: UpdatesT,
+          ac_merge: typing.Union[str, typing.Mapping[str, str], MergeRules
+                                 ] = MS_DICTS,
+          ac_provenance: typing.Optional[Provenance] = None,
           **options) -> None:
     """Update (merge) a mapping object ``self`` with ``other``.
 
     ``other`` may be a mapping object or an iterable yields (key, value) tuples
     based on merge strategy 'ac_merge'.
 
+    .. versionchanged:: 0.14.1
+       'ac_merge' may be merge rules, a mapping object of path patterns and
+       strategies or a :class:`MergeRules` object, to use different
+       strategies per path. The sources of values are recorded if
+       'ac_provenance' is given.
+
     :param others: a list of dict[-like] objects or (key, value) tuples
     :param another: optional keyword arguments to update self more
-    :param ac_merge: Merge strategy to choose
+    :param ac_merge:
+        Merge strategy to choose, or merge rules. See :class:`MergeRules`
+    :param ac_provenance:
+        A :class:`Provenance` object to record the last source added to it
+        as the one of values updated, or None
+    :param options:
+        Optional keyword arguments such as 'merge_lists' and
+        'merge_lists_by'. See the doc of :func:`_update_with_merge` for them.
+    """
+    if ac_provenance is not None and not (isinstance(ac_merge, MergeRules)
+                                          or utils.is_dict_like(ac_merge)):
+        # Rules walker records the provenance.
+        ac_merge = {'': typing.cast(str, ac_merge)}
+
+    if isinstance(ac_merge, MergeRules) or utils.is_dict_like(ac_merge):
+        rules = ac_merge if isinstance(ac_merge, MergeRules) else \
+            MergeRules(typing.cast(typing.Mapping[str, str], ac_merge))
+        _merge_with_rules(self, other, rules, provenance=ac_provenance,
+                          **options)
+        return
+
+    _update_fn = _get_update_fn(typing.cast(str, ac_merge))
+
+    if _update_fn in (_update_with_merge, _update_with_merge_lists):
+        merge_lists = bool(options.get('merge_lists', False)
+                           or _update_fn is _update_with_merge_lists)
+        _merge_dicts_iter(self, other, merge_lists=merge_lists,
+                          merge_lists_by=options.get('merge_lists_by'))
+        return
+
+    (dother, pairs) = _to_dict_and_pairs(other)
+    if dother is other:
+        for key in dother.keys():
+            _update_fn(self, dother, key, **options)
+    else:
+        for key, val in pairs:
+            _update_fn(self, dother, key, val=val, **options)
+
+
+def _jsnp_escape(key: typing.Any) -> str:
+    """Encode ``key`` to use it as a part of JSON Pointer expressions.
+
+    It will convert ~ to ~0 and / to ~1 by following RFC 6901.
     """
-    _update_fn = _get_update_fn(ac_merge)
+    return str(key).replace('~', '~0').replace('/', '~1')
+
+
+def _jsnp_split(pointer: str) -> typing.List[str]:
+    """Parse a JSON Pointer expression strictly by following RFC 6901.
+
+    Empty reference tokens are kept unlike :func:`_split_path`, e.g. '//a'
+    points to the item 'a' of the item '' in the root.
+
+    :raises: ValueError if ``pointer`` is not empty and not starts with '/'
+    """
+    if not pointer:
+        return []
+    if not pointer.startswith('/'):
+        raise ValueError(f'Invalid JSON Pointer: {pointer!r}')
+
+    return [_jsnp_unescape(s) for s in pointer.split('/')[1:]]
+
+
+PatchT = typing.List[DictT]
+
+
+def _is_seq(obj: typing.Any) -> bool:
+    """Test if ``obj`` is a list-like object but not a set."""
+    return utils.is_list_like(obj) and \
+        not isinstance(obj, collections.abc.Set)
+
+
+# Kinds of objects to compare.
+(_LEAF, _MAP, _SEQ) = (0, 1, 2)
+
+
+def _kind(obj: typing.Any) -> int:
+    """Get the kind of ``obj``, a mapping, list-like object or others."""
+    otype = type(obj)
+    if otype in _SCALAR_TYPES:  # Fast paths.
+        return _LEAF
+    if otype is dict:
+        return _MAP
+    if otype in (list, tuple):
+        return _SEQ
+
+    if utils.is_dict_like(obj):
+        return _MAP
+
+    return _SEQ if _is_seq(obj) else _LEAF
 
-    if isinstance(other, dict):
-        for key in other.keys():
-            _update_fn(self, other, key, **options)
+
+def _leaf_digest(obj: typing.Any) -> int:
+    """Compute the digest of a scalar or set object ``obj``."""
+    try:
+        return hash((type(obj), obj))  # Distinguish 1, 1.0 and True.
+    except TypeError:
+        pass
+
+    try:
+        return hash((type(obj), frozenset(obj)))  # Sets.
+    except TypeError:
+        return hash((type(obj), repr(obj)))
+
+
+def _digest(obj: typing.Any, memo: typing.Dict[int, int]) -> int:
+    """Compute the structural digest of ``obj`` without recursion.
+
+    Digests of the containers in ``obj`` are stored in ``memo`` keyed by their
+    ids to look them up later in O(1).
+    """
+    if id(obj) in memo:
+        return memo[id(obj)]
+
+    kind = _kind(obj)
+    if kind == _LEAF:
+        return _leaf_digest(obj)
+
+    stack = [(obj, kind, False)]
+    while stack:
+        (cobj, kind, ready) = stack.pop()
+        if id(cobj) in memo:
+            continue
+
+        vals = cobj.values() if kind == _MAP else cobj
+        if not ready:
+            stack.append((cobj, kind, True))
+            for val in vals:
+                vkind = _kind(val)
+                if vkind != _LEAF and id(val) not in memo:
+                    stack.append((val, vkind, False))
+            continue
+
+        digests = [memo[id(v)] if id(v) in memo else _leaf_digest(v)
+                   for v in vals]
+        memo[id(cobj)] = hash(
+            (_MAP_TAG, frozenset(zip(cobj.keys(), digests))) if kind == _MAP
+            else (_SEQ_TAG, tuple(digests))
+        )
+
+    return memo[id(obj)]
+
+
+def _is_same(obj: typing.Any, other: typing.Any,
+             memo: typing.Dict[int, int]) -> bool:
+    """Test if ``obj`` and ``other`` are same with their digests first."""
+    if obj is other:
+        return True
+    if _digest(obj, memo) != _digest(other, memo):
+        return False
+
+    return obj == other  # Guard against collisions of digests.
+
+
+def _diff_lists(path: str, lst: typing.Sequence, other: typing.Sequence,
+                memo: typing.Dict[int, int], patch: PatchT,
+                stack: typing.List[typing.Tuple[str, typing.Any, typing.Any]]
+                ) -> None:
+    """Compute the patch to make ``lst`` same as ``other``.
+
+    Operations to add and remove items are appended to ``patch``, and pairs
+    of items to compare more are pushed to ``stack`` with the index of them
+    in ``other`` as they'll be there after the operations were applied.
+    """
+    (start, end, oend) = (0, len(lst), len(other))
+    while start < min(end, oend) and _is_same(lst[start], other[start], memo):
+        start += 1
+    while end > start and oend > start and \
+            _is_same(lst[end - 1], other[oend - 1], memo):
+        (end, oend) = (end - 1, oend - 1)
+
+    if end - start == oend - start:
+        opcodes = [('replace', start, end, start, oend)]
+    else:
+        # pylint: disable=import-outside-toplevel
+        import difflib
+
+        matcher = difflib.SequenceMatcher(
+            None, [_digest(x, memo) for x in lst[start:end]],
+            [_digest(x, memo) for x in other[start:oend]], autojunk=False
+        )
+        opcodes = [(tag, i1 + start, i2 + start, j1 + start, j2 + start)
+                   for tag, i1, i2, j1, j2 in matcher.get_opcodes()]
+
+    for tag, i1, i2, j1, j2 in opcodes:
+        npairs = min(i2 - i1, j2 - j1)
+        stack.extend((f'{path}/{j1 + k}', lst[i1 + k], other[j1 + k])
+                     for k in range(npairs) if tag != 'equal'
+                     or not _is_same(lst[i1 + k], other[j1 + k], memo))
+        patch.extend({'op': 'remove', 'path': f'{path}/{j1 + npairs}'}
+                     for _ in range(i2 - i1 - npairs))
+        patch.extend({'op': 'add', 'path': f'{path}/{idx}',
+                      'value': other[idx]}
+                     for idx in range(j1 + npairs, j2))
+
+
+def _has_ambiguous_keys(obj: typing.Any, other: typing.Any) -> bool:
+    """Test if keys of mapping objects cannot be pointed in patches.
+
+    Keys are converted to strings in paths, so keys not strings cannot be
+    added and the ones converted to the same string, e.g. 1 and '1', cannot
+    be distinguished with their paths.
+    """
+    if all(isinstance(k, str) for k in itertools.chain(obj, other)):
+        return False
+
+    keys = set(obj) | set(other)
+    return any(not isinstance(k, str) and k not in obj for k in other) or \
+        len({str(k) for k in keys}) != len(keys)
+
+
+def diff(obj: typing.Any, other: typing.Any) -> PatchT:
+    """Compute the patch to make ``obj`` same as ``other``.
+
+    The patch is a list of operations, 'add', 'remove' and 'replace', in the
+    format of RFC 6902, JSON Patch, and can be applied with
+    :func:`apply_patch`. Structural digests of subtrees are computed once to
+    skip identical subtrees quickly, and only the items differ are in the
+    patch. Lists are compared with the longest matching blocks of items.
+
+    Keys of mapping objects are converted to strings in the paths. Mapping
+    objects are replaced entirely if keys not strings are added to them or
+    their keys are same as others converted to strings.
+
+    .. versionadded:: 0.14.1
+
+    :param obj: A mapping or list-like object or other primitive object
+    :param other: An object to compare with ``obj``
+    :return: A list of mapping objects represent operations
+    """
+    memo: typing.Dict[int, int] = {}
+    patch: PatchT = []
+    stack = [('', obj, other)]
+    while stack:
+        (path, cur, new) = stack.pop()
+        if _is_same(cur, new, memo):
+            continue
+
+        kind = _kind(cur)
+        if kind == _MAP and kind == _kind(new) and \
+                not _has_ambiguous_keys(cur, new):
+            patch.extend({'op': 'remove', 'path': f'{path}/{_jsnp_escape(k)}'}
+                         for k in cur if k not in new)
+            for key, val in new.items():
+                kpath = f'{path}/{_jsnp_escape(key)}'
+                if key in cur:
+                    stack.append((kpath, cur[key], val))
+                else:
+                    patch.append({'op': 'add', 'path': kpath, 'value': val})
+        elif kind == _SEQ and kind == _kind(new):
+            _diff_lists(path, cur, new, memo, patch, stack)
+        else:
+            patch.append({'op': 'replace', 'path': path, 'value': new})
+
+    return patch
+
+
+def _resolve_key(obj: typing.Any, token: str) -> typing.Any:
+    """Resolve a reference token to the key of a mapping object ``obj``.
+
+    The key not a string, e.g. an int key of YAML data, converted to the
+    same string as ``token`` is used if there is no key ``token``.
+    """
+    if token in obj:
+        return token
+
+    keys = [k for k in obj if not isinstance(k, str) and str(k) == token]
+    return keys[0] if len(keys) == 1 else token
+
+
+def _resolve_step(obj: typing.Any, token: str, append: bool = False
+                  ) -> typing.Any:
+    """Resolve a reference token to the key or the index of ``obj``."""
+    if utils.is_dict_like(obj):
+        return _resolve_key(obj, token)
+    if _is_seq(obj):
+        return PathAccessor._index(  # pylint: disable=protected-access
+            obj, token, _to_index(token, _JSNP_GET_ARRAY_IDX_REG),
+            append=append
+        )
+
+    raise TypeError(f'Not a container: {obj!r}')
+
+
+def _locate(obj: typing.Any, path: str, append: bool = False
+            ) -> typing.Tuple[typing.Any, typing.Any]:
+    """Locate the parent of the node pointed by ``path`` and its key."""
+    tokens = _jsnp_split(path)
+    for token in tokens[:-1]:
+        obj = obj[_resolve_step(obj, token)]
+
+    return (obj, _resolve_step(obj, tokens[-1], append=append))
+
+
+def _get_at(obj: typing.Any, path: str) -> typing.Any:
+    """Get the value pointed by ``path``."""
+    for token in _jsnp_split(path):
+        obj = obj[_resolve_step(obj, token)]
+
+    return obj
+
+
+def _op_add(obj: typing.Any, oper: DictT) -> typing.Any:
+    """Apply an operation 'add' to ``obj``."""
+    val = copy.deepcopy(oper['value'])
+    if not oper['path']:  # The root.
+        return val
+
+    (parent, key) = _locate(obj, oper['path'], append=True)
+    if _is_seq(parent):
+        parent.insert(key, val)
     else:
+        parent[key] = val
+
+    return obj
+
+
+def _op_remove(obj: typing.Any, oper: DictT) -> typing.Any:
+    """Apply an operation 'remove' to ``obj``."""
+    if not oper['path']:  # The root.
+        return None
+
+    (parent, key) = _locate(obj, oper['path'])
+    del parent[key]
+    return obj
+
+
+def _op_replace(obj: typing.Any, oper: DictT) -> typing.Any:
+    """Apply an operation 'replace' to ``obj``."""
+    val = copy.deepcopy(oper['value'])
+    if not oper['path']:  # The root.
+        return val
+
+    (parent, key) = _locate(obj, oper['path'])
+    if key not in parent and utils.is_dict_like(parent):
+        raise KeyError(key)
+
+    parent[key] = val
+    return obj
+
+
+def _op_move(obj: typing.Any, oper: DictT) -> typing.Any:
+    """Apply an operation 'move' to ``obj``."""
+    val = _get_at(obj, oper['from'])
+    obj = _op_remove(obj, {'path': oper['from']})
+    return _op_add(obj, {'path': oper['path'], 'value': val})
+
+
+def _op_copy(obj: typing.Any, oper: DictT) -> typing.Any:
+    """Apply an operation 'copy' to ``obj``."""
+    return _op_add(obj, {'path': oper['path'],
+                         'value': _get_at(obj, oper['from'])})
+
+
+def _op_test(obj: typing.Any, oper: DictT) -> typing.Any:
+    """Apply an operation 'test' to ``obj``."""
+    try:
+        val = _get_at(obj, oper['path'])
+    except (KeyError, IndexError, TypeError) as exc:
+        raise ValueError(f'Test failed: {oper!r}') from exc
+
+    if val != oper['value']:
+        raise ValueError(f'Test failed: {oper!r}')
+
+    return obj
+
+
+_PATCH_OPS: typing.Dict[str, typing.Callable[[typing.Any, DictT],
+                                             typing.Any]] = {
+    'add': _op_add, 'remove': _op_remove, 'replace': _op_replace,
+    'move': _op_move, 'copy': _op_copy, 'test': _op_test,
+}
+
+
+def _apply_op(obj: typing.Any, oper: DictT) -> typing.Any:
+    """Apply an operation ``oper`` to ``obj`` and return the result."""
+    apply_fn = _PATCH_OPS.get(oper['op'])
+    if apply_fn is None:
+        raise ValueError(f"Unknown operation: {oper['op']!r}")
+
+    return apply_fn(obj, oper)
+
+
+def apply_patch(obj: typing.Any, patch: typing.Iterable[DictT]
+                ) -> typing.Any:
+    """Apply a patch in the format of RFC 6902, JSON Patch, to ``obj``.
+
+    ``obj`` is updated in place and all operations of RFC 6902, 'add',
+    'remove', 'replace', 'move', 'copy' and 'test' are supported. Please note
+    that ``obj`` may be updated partially if some operations failed.
+
+    Paths are parsed strictly as RFC 6901, JSON Pointer, and the reference
+    tokens are resolved to the existing keys not strings such as int keys of
+    YAML data if there are no keys same as them.
+
+    .. versionadded:: 0.14.1
+
+    :param obj: A mapping or list-like object
+    :param patch: A list of operations made by :func:`diff` for example
+    :return:
+        ``obj`` patched or a new object if the root was replaced with it
+    :raises: ValueError if some operations failed
+    """
+    for oper in patch:
         try:
-            iother = typing.cast(
-                typing.Iterable[typing.Tuple[str, typing.Any]],
-                other
-            )
-            for key, val in iother:
-                _update_fn(self, dict(other), key, val=val, **options)
-        except (ValueError, TypeError) as exc:  # Re-raise w/ info.
-            raise type(exc)(f'{exc!s} other={other!r}')
+            obj = _apply_op(obj, oper)
+        except (KeyError, IndexError, TypeError) as exc:
+            raise ValueError(f'Failed to apply {oper!r}: {exc!s}') from exc
 
+    return obj
 
-def _make_recur(obj: typing.Any, make_fn: typing.Callable,
-                ac_ordered: bool = False,
-                ac_dict: typing.Optional[typing.Callable] = None,
-                **options) -> DictT:
-    """Apply ``make_fn`` to ``obj`` recursively.
 
-    :param obj: A mapping objects or other primitive object
-    :param make_fn: Function to make/convert to
-    :param ac_ordered: Use OrderedDict instead of dict to keep order of items
-    :param ac_dict: Callable to convert 'obj' to mapping object
-    :param options: Optional keyword arguments.
+_MISSING = object()
+
+
+class LayeredConfig(collections.abc.MutableMapping):
+    """A view of mapping objects (layers) merged lazily on access.
+
+    It looks like the result of merging the layers in order with
+    :func:`merge`, but lookups are resolved across the layers only when
+    items are accessed, similar to :class:`collections.ChainMap` applied
+    recursively. The layers are never modified; updates of the view are
+    kept in the view itself (copy-on-write).
+
+    Nested mapping objects are returned as :class:`LayeredConfig` objects
+    too. Call :meth:`materialize` to get the merged data as a dict.
+
+    .. note::
+       Values other than mapping objects, e.g. lists, are returned as they
+       are and they may be the objects in the layers. Updates of nested views
+       are discarded if a layer is added.
 
-    :return: Mapping object
+    .. versionadded:: 0.14.1
     """
-    if ac_dict is None:
-        ac_dict = collections.OrderedDict if ac_ordered else dict
 
-    return ac_dict((k, None if v is None else make_fn(v, **options))
-                   for k, v in obj.items())
+    def __init__(self, layers: typing.Iterable[UpdatesT] = (),
+                 ac_merge: typing.Optional[str] = MS_DICTS,
+                 **options) -> None:
+        """Initialize with ``layers``.
+
+        :param layers:
+            An iterable of mapping objects or iterables of (key, value)
+            tuples; later ones are merged into earlier ones
+        :param ac_merge: Merge strategy in MERGE_STRATEGIES, MS_DICTS if None
+        :param options:
+            Optional keyword arguments such as 'merge_lists' and
+            'merge_lists_by'. See :func:`merge` also.
+        :raises: ValueError if ``ac_merge`` is not a valid strategy
+        """
+        if ac_merge is None:
+            ac_merge = MS_DICTS
+        if ac_merge not in MERGE_STRATEGIES:
+            raise ValueError(f'Wrong merge strategy: {ac_merge!r}')
+
+        self._layers: typing.List[DictT] = []
+        self._strategy = ac_merge
+        self._options = options
+        self._merges_lists = bool(options.get('merge_lists', False)
+                                  or ac_merge == MS_DICTS_AND_LISTS)
+        self._writes: DictT = {}  # Items updated in this view.
+        self._deleted: typing.Set[str] = set()
+        self._views: typing.Dict[str, LayeredConfig] = {}  # Nested views.
+
+        for layer in layers:
+            self.add_layer(layer)
+
+    @property
+    def layers(self) -> typing.Tuple[DictT, ...]:
+        """Get the layers of this view."""
+        return tuple(self._layers)
+
+    def add_layer(self, layer: UpdatesT) -> None:
+        """Add a mapping object ``layer`` on the top of the layers."""
+        self._layers.append(_to_dict(layer))
+        self._views.clear()  # Nested views are not valid any more.
+
+    def _make_view(self, layers: typing.List[DictT]) -> 'LayeredConfig':
+        """Make a nested view of ``layers``."""
+        return type(self)(layers, ac_merge=self._strategy, **self._options)
+
+    def _merge_lists(self, key: str, lst0: typing.Any, lst1: typing.Any
+                     ) -> typing.List[typing.Any]:
+        """Merge lists without modifying the original ones."""
+        if self._options.get('merge_lists_by'):  # Items may be modified.
+            lst0 = copy.deepcopy(lst0)
+
+        tmp = {key: list(lst0)}
+        merge(tmp, {key: lst1}, ac_merge=MS_DICTS_AND_LISTS,
+              merge_lists_by=self._options.get('merge_lists_by'))
+        return tmp[key]
+
+    def _resolve(self, key: str
+                 ) -> typing.Tuple[typing.Any,
+                                   typing.Optional[typing.List[DictT]]]:
+        """Resolve the value of ``key`` across the layers.
+
+        :return:
+            A tuple of the value (_MISSING if it's not found) and a list of
+            mapping objects to make a nested view of, or None
+        """
+        layers = self._layers
+        if self._strategy == MS_NO_REPLACE:
+            val = next((layer[key] for layer in layers if key in layer),
+                       _MISSING)
+        elif self._strategy == MS_REPLACE:
+            val = next((layer[key] for layer in reversed(layers[1:])
+                        if layer.get(key, None) is not None),
+                       layers[0].get(key, _MISSING) if layers else _MISSING)
+        else:  # MS_DICTS or MS_DICTS_AND_LISTS
+            (val, sublayers) = (_MISSING, None)
+            for layer in layers:
+                if key not in layer:
+                    continue
+
+                lval = layer[key]
+                if sublayers is not None:
+                    sublayers.append(_to_dict(lval))
+                elif self._merges_lists and val is not _MISSING and \
+                        _are_list_like(val, lval):
+                    val = self._merge_lists(key, val, lval)
+                elif utils.is_dict_like(lval):
+                    sublayers = [typing.cast(DictT, lval)]
+                else:
+                    val = lval
+
+            return (val, sublayers)
+
+        if utils.is_dict_like(val):
+            return (val, [typing.cast(DictT, val)])
+
+        return (val, None)
+
+    def _has(self, key: str) -> bool:
+        """Test if ``key`` is in this view."""
+        if key in self._deleted:
+            return False
+        if key in self._writes or key in self._views:
+            return True
+        if self._strategy == MS_REPLACE and self._layers:
+            return key in self._layers[0] or any(
+                layer.get(key, None) is not None
+                for layer in self._layers[1:]
+            )
 
+        return any(key in layer for layer in self._layers)
+
+    def __getitem__(self, key: str) -> typing.Any:
+        """Get the value of ``key`` resolved across the layers."""
+        if key in self._deleted:
+            raise KeyError(key)
+        if key in self._writes:
+            return self._writes[key]
+        if key in self._views:
+            return self._views[key]
+
+        (val, sublayers) = self._resolve(key)
+        if sublayers is not None:
+            view = self._views[key] = self._make_view(sublayers)
+            return view
+
+        if val is _MISSING:
+            raise KeyError(key)
+
+        return val
+
+    def __setitem__(self, key: str, val: typing.Any) -> None:
+        """Set the value of ``key`` in this view, not in the layers."""
+        self._writes[key] = val
+        self._views.pop(key, None)
+        self._deleted.discard(key)
+
+    def __delitem__(self, key: str) -> None:
+        """Delete ``key`` from this view, not from the layers."""
+        if not self._has(key):
+            raise KeyError(key)
+
+        self._writes.pop(key, None)
+        self._views.pop(key, None)
+        self._deleted.add(key)
+
+    def __contains__(self, key: typing.Any) -> bool:
+        """Test if ``key`` is in this view."""
+        return self._has(key)
+
+    def __iter__(self) -> typing.Iterator[str]:
+        """Iterate keys of this view in the order they appear in layers."""
+        keys = dict.fromkeys(key for layer in self._layers for key in layer)
+        keys.update(dict.fromkeys(self._writes))
+        return (key for key in keys if self._has(key))
+
+    def __len__(self) -> int:
+        """Get the number of keys in this view."""
+        return sum(1 for _key in self)
+
+    def __repr__(self) -> str:
+        """Get the representation of this view."""
+        return f'{type(self).__name__}({self._layers!r}, ' \
+               f'ac_merge={self._strategy!r})'
+
+    def materialize(self, ac_dict: typing.Optional[typing.Callable] = None
+                    ) -> DictT:
+        """Merge the layers and updates, and return the result.
+
+        The layers are not modified but the values other than mapping
+        objects in the result may be the objects in the layers.
+
+        :param ac_dict: Callable to make mapping objects, dict by default
+        :return: A mapping object of merged data
+        """
+        if ac_dict is None:
+            ac_dict = dict
+
+        ret: DictT = ac_dict()
+        stack = [(self, iter(self), ret)]
+        while stack:
+            (view, itr, dst) = stack[-1]
+            for key in itr:
+                val = view[key]
+                if isinstance(val, LayeredConfig):
+                    dst[key] = ac_dict()
+                    stack.append((val, iter(val), dst[key]))
+                    break
+
+                dst[key] = val
+            else:
+                stack.pop()
+
+        return ret
+
+
+_SCALAR_TYPES: typing.FrozenSet[type] = frozenset(
+    (str, bytes, bytearray, int, float, bool, type(None))
+)
 
-def _make_iter(obj: typing.Any, make_fn: typing.Callable, **options
-               ) -> DictT:
-    """Apply ``make_fn`` to ``obj`` iteratively.
 
-    :param obj: A mapping objects or other primitive object
-    :param make_fn: Function to make/convert to
-    :param options: Optional keyword arguments.
+def _is_leaf(obj: typing.Any) -> bool:
+    """Test if ``obj`` is not a container to convert."""
+    if type(obj) in _SCALAR_TYPES:  # Fast path.
+        return True
+
+    return isinstance(obj, (str, bytes, bytearray)) or not (
+        utils.is_dict_like(obj) or utils.is_list_like(obj)
+    )
+
+
+def _is_converted(obj: typing.Any,
+                  is_done: typing.Optional[typing.Callable] = None) -> bool:
+    """Test if ``obj`` is a leaf or was converted already."""
+    return _is_leaf(obj) or (is_done is not None and is_done(obj))
+
+
+def _convert_frame(key: typing.Any, obj: typing.Any
+                   ) -> typing.List[typing.Any]:
+    """Make a frame of the stack to walk ``obj`` in :func:`_convert_iter`.
 
-    :return: Mapping object
+    :return: [key, object, iterator, is_mapping, index, results or None]
     """
-    return type(obj)(make_fn(v, **options) for v in obj)
+    is_map = utils.is_dict_like(obj)
+    return [key, obj, iter(obj.items() if is_map else obj), is_map, 0, None]
+
+
+def _convert_add(frame: typing.List[typing.Any], item: typing.Any,
+                 changed: bool) -> None:
+    """Add an ``item`` processed to ``frame``.
+
+    Items processed so far are copied into the results only if ``item`` was
+    converted, that is, ``changed`` is True, at first.
+    """
+    if changed and frame[5] is None:
+        frame[5] = list(itertools.islice(
+            frame[1].items() if frame[3] else frame[1], frame[4]
+        ))
+    if frame[5] is not None:
+        frame[5].append(item)
+    frame[4] += 1
+
+
+def _convert_finish(frame: typing.List[typing.Any], factory: typing.Callable,
+                    seq_factory: typing.Optional[typing.Callable] = None
+                    ) -> typing.Any:
+    """Make the object converted from ``frame`` walked."""
+    (obj, is_map, results) = (frame[1], frame[3], frame[5])
+    if is_map:
+        if results is None:
+            # Not its sub classes.
+            if type(obj) is factory:  # pylint: disable=unidiomatic-typecheck
+                return obj
+            results = obj.items()
+        return factory(results)
+
+    if seq_factory is not None:
+        return seq_factory(obj, results)
+
+    return obj if results is None else type(obj)(results)
+
+
+def _convert_iter(obj: typing.Any, factory: typing.Callable,
+                  seq_factory: typing.Optional[typing.Callable] = None,
+                  is_done: typing.Optional[typing.Callable] = None
+                  ) -> typing.Any:
+    """Convert mapping objects in ``obj`` to objects made by ``factory``.
+
+    It walks the tree with an explicit stack and copies only the containers
+    need to be converted, that is, mapping objects not of the type
+    ``factory`` and containers have such ones in them. Others are kept as
+    they are.
+
+    :param obj: A mapping or list-like object
+    :param factory: Callable to make mapping objects
+    :param seq_factory:
+        Callable to convert list-like objects or None to convert them only if
+        items in them were converted. It's called with the original object
+        and a list of converted items or None if nothing was converted.
+    :param is_done:
+        Callable to test if an object was converted already and it's not
+        needed to walk into it
+    :return: ``obj`` itself if nothing needs to be converted or a copy of it
+    """
+    if _is_converted(obj, is_done):
+        return obj
+
+    stack = [_convert_frame(None, obj)]
+    while True:
+        frame = stack[-1]
+        for item in frame[2]:
+            val = item[1] if frame[3] else item
+            if not _is_converted(val, is_done):
+                stack.append(_convert_frame(item[0] if frame[3] else None,
+                                            val))
+                break
+
+            _convert_add(frame, item, False)
+        else:
+            stack.pop()
+            res = _convert_finish(frame, factory, seq_factory)
+            if not stack:
+                return res
+
+            parent = stack[-1]
+            _convert_add(parent, (frame[0], res) if parent[3] else res,
+                         res is not frame[1])
 
 
 def convert_to(obj: typing.Any, ac_ordered: bool = False,
                ac_dict: typing.Optional[typing.Callable] = None,
-               **options) -> DictT:
+               **_options) -> DictT:
     """Convert a mapping objects to a dict or object of 'to_type' recursively.
 
     Borrowed basic idea and implementation from bunch.unbunchify. (bunch is
     distributed under MIT license same as this.)
 
+    .. versionchanged:: 0.14.1
+       ``obj`` or its subtrees are returned as they are if they don't need to
+       be converted, and it walks the tree without recursive calls. Nested
+       mapping objects are converted with 'ac_dict' also.
+
     :param obj: A mapping objects or other primitive object
     :param ac_ordered: Use OrderedDict instead of dict to keep order of items
     :param ac_dict: Callable to convert 'obj' to mapping object
@@ -341,12 +1828,311 @@ def convert_to(obj: typing.Any, ac_ordered: bool = False,
 
     :return: A dict or OrderedDict or object of 'cls'
     """
-    options.update(ac_ordered=ac_ordered, ac_dict=ac_dict)
-    if utils.is_dict_like(obj):
-        return _make_recur(obj, convert_to, **options)
-    if utils.is_list_like(obj):
-        return _make_iter(obj, convert_to, **options)
+    if ac_dict is None:
+        ac_dict = collections.OrderedDict if ac_ordered else dict
 
-    return obj
+    return _convert_iter(obj, ac_dict)
+
+
+def _hash_items(data: DictT) -> typing.Optional[int]:
+    """Compute the hash of items in ``data`` or None if it's unhashable."""
+    try:
+        return hash(frozenset(data.items()))
+    except TypeError:
+        return None
+
+
+class FrozenConfig(collections.abc.Mapping):
+    """An immutable and hashable mapping object holds configurations.
+
+    Values in it are frozen also on instantiation, that is, mapping objects
+    are converted to :class:`FrozenConfig` objects, lists and other list-like
+    objects to tuples, and sets to frozensets, by :func:`freeze`.
+
+    The hash of it is computed only once on instantiation so that it can be
+    used as a key of dicts and :func:`functools.lru_cache` cheaply. Copies and
+    snapshots of it, e.g. ``copy.deepcopy(obj)`` and ``freeze(obj)``, are the
+    object itself.
+
+    .. versionadded:: 0.14.1
+    """
+
+    __slots__ = ('_data', '_hash')
+
+    def __init__(self, items: UpdatesT = ()) -> None:
+        """Initialize with a mapping object or an iterable of pairs."""
+        frozen = freeze(_to_dict(items))
+        (self._data, self._hash) = (frozen._data, frozen._hash)
+
+    @classmethod
+    def _make(cls, items: typing.Iterable[typing.Tuple[str, typing.Any]]
+              ) -> 'FrozenConfig':
+        """Make an object from ``items`` of which values were frozen."""
+        self = cls.__new__(cls)
+        self._data = dict(items)
+        self._hash = _hash_items(self._data)
+        return self
+
+    def __getitem__(self, key: str) -> typing.Any:
+        """Get the value of ``key``."""
+        return self._data[key]
+
+    def __iter__(self) -> typing.Iterator[str]:
+        """Iterate keys."""
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Get the number of items."""
+        return len(self._data)
+
+    def __hash__(self) -> int:
+        """Get the hash computed on instantiation."""
+        if self._hash is None:
+            raise TypeError(f'Some values of {self!r} are unhashable')
+
+        return self._hash
+
+    def __eq__(self, other: typing.Any) -> bool:
+        """Test the equality with ``other`` in O(1) if possible."""
+        if self is other:
+            return True
+
+        if isinstance(other, FrozenConfig):
+            if None not in (self._hash, other._hash) and \
+                    self._hash != other._hash:
+                return False
+            return self._data == other._data
+
+        if utils.is_dict_like(other):
+            return self == freeze(other)
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Get the representation of this object."""
+        return f'{type(self).__name__}({self._data!r})'
+
+    def __reduce__(self):
+        """Make it picklable."""
+        return (type(self), (self._data, ))
+
+    def __copy__(self) -> 'FrozenConfig':
+        """Return itself as it's immutable."""
+        return self
+
+    def __deepcopy__(self, memo: typing.Any) -> 'FrozenConfig':
+        """Return itself as it and values in it are immutable."""
+        return self
+
+    def thaw(self) -> DictT:
+        """Make a mutable copy of this object. See :func:`thaw` also."""
+        return thaw(self)
+
+
+def _freeze_seq(obj: typing.Any, items: typing.Optional[typing.List]
+                ) -> typing.Any:
+    """Freeze a list-like object ``obj`` with ``items`` frozen or None."""
+    if items is None and type(obj) in (tuple, frozenset):
+        return obj
+    if isinstance(obj, collections.abc.Set):
+        return frozenset(obj if items is None else items)
+
+    return tuple(obj if items is None else items)
+
+
+def _thaw_seq(obj: typing.Any, items: typing.Optional[typing.List]
+              ) -> typing.Any:
+    """Thaw a list-like object ``obj`` with ``items`` thawed or None."""
+    if items is None and type(obj) in (list, set):
+        return obj
+    if isinstance(obj, collections.abc.Set):
+        return set(obj if items is None else items)
+
+    return list(obj if items is None else items)
+
+
+def freeze(obj: typing.Any) -> typing.Any:
+    """Make an immutable and hashable copy of ``obj`` recursively.
+
+    Mapping objects in ``obj`` are converted to :class:`FrozenConfig` objects,
+    lists and other list-like objects to tuples, and sets to frozensets.
+    Objects frozen already are not copied.
+
+    .. versionadded:: 0.14.1
+
+    :param obj: A mapping or list-like object or other primitive object
+    :return: An object frozen
+    """
+    # pylint: disable=protected-access
+    return _convert_iter(obj, FrozenConfig._make, seq_factory=_freeze_seq,
+                         is_done=lambda x: isinstance(x, FrozenConfig))
+
+
+def thaw(obj: typing.Any) -> typing.Any:
+    """Make a mutable copy of ``obj`` frozen by :func:`freeze` recursively.
+
+    Mapping objects are converted to dicts, tuples to lists and frozensets to
+    sets. Mutable objects are not copied.
+
+    .. versionadded:: 0.14.1
+
+    :param obj: A mapping or list-like object or other primitive object
+    :return: An mutable object
+    """
+    return _convert_iter(obj, dict, seq_factory=_thaw_seq)
+
+
+_INTERNED_TYPES: typing.FrozenSet[type] = frozenset((str, bytes, int, float))
+
+
+class Interner:
+    """A table of keys and scalar values shared among loaded objects.
+
+    Mapping objects interned with the same table share key strings and other
+    scalar values equal to each other instead of holding their own copies of
+    them. It helps to reduce memory usage if many similar configurations
+    sharing the same vocabulary of keys are kept in memory.
+
+    Objects in the table are kept until :meth:`clear` is called, so please
+    make a table for each group of data loaded together and do not keep
+    using one table for ever.
+
+    .. versionadded:: 0.14.1
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self._tables: typing.Dict[type, typing.Dict[typing.Any, typing.Any]
+                                  ] = {}
+        self._nobjs: int = 0
+        self._nshared: int = 0
+        self._saved: int = 0
+
+    def __call__(self, obj: typing.Any) -> typing.Any:
+        """Get the object equal to a scalar ``obj`` from the table.
+
+        :return: The object in the table or ``obj`` added to it newly
+        """
+        otype = type(obj)
+        if otype not in _INTERNED_TYPES or (otype is float and obj != obj):
+            return obj  # Containers, None, bools and NaNs are not interned.
+
+        table = self._tables.get(otype)
+        if table is None:
+            table = self._tables.setdefault(otype, {})
+
+        # -0.0 == 0.0 but they must not be replaced with each other.
+        key = (obj, math.copysign(1.0, obj)) if otype is float else obj
+
+        self._nobjs += 1
+        res = table.get(key)
+        if res is None:
+            res = table.setdefault(
+                key, sys.intern(obj) if otype is str else obj
+            )
+        if res is not obj:
+            self._nshared += 1
+            self._saved += sys.getsizeof(obj)
+
+        return res
+
+    def intern(self, obj: typing.Any, values: bool = False) -> typing.Any:
+        """Intern keys, and scalar values also optionally, in ``obj``.
+
+        Mutable mapping and list objects in ``obj`` are updated in place.
+        Keys of immutable mapping objects and items of tuples are kept as
+        they are.
+
+        :param obj: A mapping or list-like object or other primitive object
+        :param values: Intern scalar values also if True
+        :return: ``obj`` interned
+        """
+        if _is_leaf(obj):
+            return self(obj) if values else obj
+
+        (stack, seen) = ([obj], set())
+        while stack:
+            cobj = stack.pop()
+            if id(cobj) in seen:  # Shared or recursive objects, e.g. YAML.
+                continue
+            seen.add(id(cobj))
+
+            if utils.is_dict_like(cobj):
+                items = [(self(key), self._value(val, values, stack))
+                         for key, val in cobj.items()]
+                if isinstance(cobj, collections.abc.MutableMapping) and \
+                        any(a[0] is not b[0] or a[1] is not b[1]
+                            for a, b in zip(items, cobj.items())):
+                    cobj.clear()  # Keep the order of items.
+                    cobj.update(items)
+            elif isinstance(cobj, collections.abc.MutableSequence):
+                for idx, val in enumerate(cobj):
+                    res = self._value(val, values, stack)
+                    if res is not val:
+                        cobj[idx] = res
+            else:
+                for val in cobj:
+                    self._value(val, False, stack)
+
+        return obj
+
+    def _value(self, val: typing.Any, values: bool,
+               stack: typing.List[typing.Any]) -> typing.Any:
+        """Intern ``val`` or push it to ``stack`` if it's a container."""
+        if _is_leaf(val):
+            return self(val) if values else val
+
+        stack.append(val)
+        return val
+
+    def report(self) -> typing.Dict[str, int]:
+        """Get the report of memory usage saved by the table.
+
+        :return:
+            A dict with the number of objects looked up ('objects'), objects
+            replaced with ones in the table ('shared'), objects in the table
+            ('unique'), the estimated size of objects released in bytes
+            ('bytes_saved') and the size of the table itself ('table_bytes')
+        """
+        return {
+            'objects': self._nobjs,
+            'shared': self._nshared,
+            'unique': sum(len(t) for t in self._tables.values()),
+            'bytes_saved': self._saved,
+            'table_bytes': sum(sys.getsizeof(t)
+                               for t in self._tables.values()),
+        }
+
+    def clear(self) -> None:
+        """Clear the table and the statistics."""
+        self._tables.clear()
+        (self._nobjs, self._nshared, self._saved) = (0, 0, 0)
+
+
+def intern(obj: typing.Any, interner: typing.Optional[Interner] = None,
+           values: bool = False) -> typing.Any:
+    """Intern keys, and scalar values also optionally, in ``obj`` in place.
+
+    .. versionadded:: 0.14.1
+
+    :param obj: A mapping or list-like object or other primitive object
+    :param interner:
+        An :class:`Interner` object shared with other objects or None to use
+        a new one only for ``obj``
+    :param values: Intern scalar values also if True
+    :return: ``obj`` interned
+    """
+    return (Interner() if interner is None else interner).intern(obj, values)
+
+
+def memory_report(interner: Interner) -> typing.Dict[str, int]:
+    """Get the report of memory saved by an :class:`Interner` object.
+
+    .. versionadded:: 0.14.1
+
+    :param interner: An :class:`Interner` object
+    :return: See :meth:`Interner.report`
+    """
+    return interner.report()
 
 # vim:sw=4:ts=4:et:
@@ -4,12 +4,20 @@
 #
 """Abstract processor module.
 
+.. versionchanged:: 0.14.1
+
+   - Add :class:`LazyProcessor` to hold only metadata of processor classes and
+     import them on demand.
+
 .. versionadded:: 0.9.5
 
    - Add to abstract processors such like Parsers (loaders and dumpers).
 """
+import importlib
 import typing
 
+from ..utils import is_module_available
+
 
 class Processor:
     """Abstract processor class to provide basic implementation.
@@ -60,4 +68,70 @@ class Processor:
             f'prio={self.priority()}, extensions={self.extensions()!r}'
         )
 
+
+class LazyProcessor:
+    """A stand-in of a processor class holding only its metadata.
+
+    The module defines the processor class is not imported until :meth:`load`
+    is called, so that heavy modules the processor depends on are not imported
+    until it's needed actually.
+
+    - cid, type, priority and extensions: Same as the ones of the processor
+      class, see :class:`Processor`
+    - module: Name of the module defines the processor class
+    - name: Name of the processor class in the module
+    - requires:
+        A list of groups of module names the processor depends on. Each group
+        is satisfied if any of the modules in it is available, e.g.
+        [('tomllib', 'tomli'), ('tomli_w', )]
+    """
+
+    def __init__(self, cid: str, type_: str, extensions: typing.List[str],
+                 module: str, name: str = 'Parser', priority: int = 0,
+                 requires: typing.Iterable[typing.Iterable[str]] = ()
+                 ) -> None:
+        """Initialize with the metadata of the processor class."""
+        self._cid = cid
+        self._type = type_
+        self._extensions = extensions
+        self._priority = priority
+        self._module = module
+        self._name = name
+        self._requires = [tuple(group) for group in requires]
+
+    def cid(self) -> str:
+        """Processor class ID."""
+        return self._cid
+
+    def type(self) -> str:
+        """Processors' type."""
+        return self._type
+
+    def priority(self) -> int:
+        """Processors's priority."""
+        return self._priority
+
+    def extensions(self) -> typing.List[str]:
+        """Get the list of file extensions of files it can process."""
+        return self._extensions
+
+    def available(self) -> bool:
+        """Test if all of the modules the processor depends on are found."""
+        return all(any(is_module_available(m) for m in group)
+                   for group in self._requires)
+
+    def load(self) -> typing.Type[Processor]:
+        """Import the module and return the processor class.
+
+        :raises: ImportError
+        """
+        return getattr(importlib.import_module(self._module), self._name)
+
+    def __repr__(self) -> str:
+        """Provide a string representation."""
+        return (
+            f'<LazyProcessor cid={self.cid()}, type={self.type()}, '
+            f'prio={self.priority()}, module={self._module}>'
+        )
+
 # vim:sw=4:ts=4:et:
@@ -13,13 +13,15 @@
    - Add to abstract processors such like Parsers (loaders and dumpers).
 """
 from .utils import (
-    load_plugins, list_types, list_by_cid, list_by_type, list_by_extension,
+    load_plugins, reload_plugins,
+    list_types, list_by_cid, list_by_type, list_by_extension,
     findall, find, MaybeParserT
 )
 
 __all__ = [
-    'load_plugins', 'list_types', 'list_by_cid', 'list_by_type',
-    'list_by_extension', 'findall', 'find', 'MaybeParserT'
+    'load_plugins', 'reload_plugins',
+    'list_types', 'list_by_cid', 'list_by_type', 'list_by_extension',
+    'findall', 'find', 'MaybeParserT'
 ]
 
 # vim:sw=4:ts=4:et:
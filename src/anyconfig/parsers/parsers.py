@@ -4,10 +4,18 @@
 #
 # Suppress import positions after some global variables are defined
 # pylint: disable=wrong-import-position
-"""Provide config parser objects aggregated."""
+"""Provide config parser objects aggregated.
+
+.. versionchanged:: 0.14.1
+
+   - The registry of parsers is built only once per process and it is not
+     re-built on every instantiation of :class:`Parsers` any more. Call
+     :meth:`Parsers.reset` to drop and re-build it explicitly.
+"""
+import threading
 import typing
 
-from ..backend import ParserClssT, PARSERS
+from ..backend import ParserClssT, LAZY_PARSERS
 from ..processors import Processors
 from ..singleton import Singleton
 
@@ -16,13 +24,42 @@ class Parsers(Processors, Singleton):
     """Manager class for parsers."""
 
     _pgroup: str = 'anyconfig_backends'
+    _initialized: bool = False
+    _init_lock = threading.RLock()
 
     def __init__(self, prcs: typing.Optional[ParserClssT] = None
                  ) -> None:
-        """Initialize with PARSERS."""
-        if prcs is None:
-            prcs = PARSERS
+        """Initialize with LAZY_PARSERS.
+
+        .. note::
+           As this class is a singleton, :meth:`__init__` is called every time
+           an instance is requested, e.g. ``Parsers()``. The registry of
+           parsers is built only at the first time, however.
+        """
+        if self._initialized:
+            return
+
+        with self._init_lock:
+            if not self._initialized:  # Another thread may have done it.
+                self._build(prcs)
+
+    def _build(self, prcs: typing.Optional[ParserClssT] = None) -> None:
+        """Build the registry of parsers."""
+        super().__init__(LAZY_PARSERS if prcs is None else prcs)
+        self._initialized = True
+
+    def reset(self, prcs: typing.Optional[ParserClssT] = None) -> None:
+        """Drop the registry of parsers and re-build it from scratch.
+
+        Plugins are re-loaded from the entry points also.
 
-        super().__init__(prcs)
+        :param prcs:
+            A list of parser classes or None (LAZY_PARSERS will be used)
+        """
+        with self._init_lock:
+            if self._initialized:
+                self._rebuild(LAZY_PARSERS if prcs is None else prcs)
+            else:
+                self._build(prcs)
 
 # vim:sw=4:ts=4:et:
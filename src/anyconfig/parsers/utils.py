@@ -24,6 +24,11 @@ def load_plugins() -> None:
     Parsers().load_plugins()
 
 
+def reload_plugins() -> None:
+    """Drop the registry of processors and re-build it with plugins."""
+    Parsers().reset()
+
+
 def list_types() -> typing.List[str]:
     """List supported processor types."""
     return sorted(Parsers().list_x('type'))
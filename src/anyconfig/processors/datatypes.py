@@ -15,4 +15,7 @@ ProcClssT = typing.List[ProcClsT]
 
 MaybeProcT = typing.Optional[typing.Union[str, ProcT, ProcClsT]]
 
+LazyProcT = processor.LazyProcessor
+ProcClsOrLazyT = typing.Union[ProcClsT, LazyProcT]
+
 # vim:sw=4:ts=4:et:
@@ -6,11 +6,14 @@
 # mypy: disable-error-code=type-var
 """A collection of models.processor.Processor and children classes."""
 import operator
+import threading
 import typing
+import warnings
 
+from .. import common
 from . import utils
 from .datatypes import (
-    ProcT, ProcsT, ProcClsT, ProcClssT, MaybeProcT
+    ProcT, ProcsT, ProcClssT, MaybeProcT, LazyProcT, ProcClsOrLazyT
 )
 
 if typing.TYPE_CHECKING:
@@ -18,29 +21,145 @@ if typing.TYPE_CHECKING:
 
 
 class Processors:
-    """An abstract class of which instance holding processors."""
+    """An abstract class of which instance holding processors.
+
+    .. versionchanged:: 0.14.1
+
+       - Keep indexes of processors by file extensions, types and IDs sorted
+         by priority, and update them on :meth:`register` to find processors
+         with dict lookups instead of scanning all of them every time.
+       - Allow to register :class:`anyconfig.models.processor.LazyProcessor`
+         objects instead of processor classes. These are replaced with the
+         instances of the processor classes when they are found and needed
+         actually.
+    """
 
     _pgroup: str = ''  # processor group name to load plugins
 
-    def __init__(self, processors: typing.Optional[ProcClssT] = None) -> None:
+    def __init__(self,
+                 processors: typing.Optional[
+                     typing.Iterable[ProcClsOrLazyT]
+                 ] = None) -> None:
         """Initialize with ``processors``.
 
         :param processors:
             A list of :class:`anyconfig.models.processor.Processor` or its
-            children class objects to initialize this, or None
+            children class objects or
+            :class:`anyconfig.models.processor.LazyProcessor` objects to
+            initialize this, or None
         """
         # {<processor_class_id>: <processor_instance>}
         self._processors: typing.Dict[str, ProcT] = {}  # type: ignore
+
+        # Indexes, {<key>: [<processor_instance>]} sorted by priority:
+        self._by_ext: typing.Dict[str, ProcsT] = {}
+        self._by_type: typing.Dict[str, ProcsT] = {}
+        self._by_type_or_id: typing.Dict[str, ProcsT] = {}
+
+        # It guards lazy processors not to be loaded twice by threads.
+        self._lock = threading.RLock()
+
         if processors is not None:
             for pcls in processors:
                 self.register(pcls)
 
         self.load_plugins()
 
-    def register(self, pcls: ProcClsT) -> None:
-        """Register processor or its children class objects."""
-        if pcls.cid() not in self._processors:
-            self._processors[pcls.cid()] = pcls()
+    def _indexes_of(self, proc: ProcT
+                    ) -> typing.Iterator[typing.Tuple[
+                        typing.Dict[str, ProcsT], str
+                    ]]:
+        """Yield pairs of the index and the key ``proc`` is indexed with."""
+        for ext in proc.extensions():
+            yield (self._by_ext, ext)
+
+        yield (self._by_type, proc.type())
+        for key in dict.fromkeys((proc.cid(), proc.type())):
+            yield (self._by_type_or_id, key)
+
+    def register(self, pcls: ProcClsOrLazyT) -> None:
+        """Register processor or its children class objects.
+
+        :param pcls:
+            :class:`anyconfig.models.processor.Processor` or its children class
+            object or :class:`anyconfig.models.processor.LazyProcessor` object
+        """
+        cid = pcls.cid()
+        if cid in self._processors:
+            return
+
+        proc = pcls if isinstance(pcls, LazyProcT) else pcls()
+        self._processors[cid] = proc  # type: ignore
+
+        for index, key in self._indexes_of(proc):  # type: ignore
+            utils.add_to_index(index, key, proc)
+
+    def _unregister(self, proc: ProcT) -> None:
+        """Unregister a processor ``proc``."""
+        del self._processors[proc.cid()]
+
+        for index, key in self._indexes_of(proc):
+            procs = [p for p in index[key] if p is not proc]
+            if procs:
+                index[key] = procs
+            else:
+                del index[key]
+
+    def _maybe_load(self, proc: ProcT) -> typing.Optional[ProcT]:
+        """Get the processor instance replaced with ``proc`` if it's lazy one.
+
+        :return:
+            An instance of processor class or None if it failed to load the
+            processor class and it was unregistered
+        """
+        if not isinstance(proc, LazyProcT):
+            return proc
+
+        with self._lock:
+            current = self._processors.get(proc.cid())
+            if current is not proc:  # Another thread loaded it already.
+                return None if current is None else self._maybe_load(current)
+
+            try:
+                loaded = proc.load()()
+            except ImportError as exc:
+                self._unregister(proc)
+                warnings.warn(f'Failed to load {proc!r}, exc={exc!s}',
+                              stacklevel=2)
+                return None
+
+            self._processors[proc.cid()] = loaded
+            for index, key in self._indexes_of(proc):
+                index[key] = [loaded if p is proc else p for p in index[key]]
+
+        return loaded
+
+    def _load_all(self) -> None:
+        """Replace all of the lazy processors with processor instances."""
+        for proc in list(self._processors.values()):
+            self._maybe_load(proc)
+
+    def _rebuild(self,
+                 processors: typing.Optional[
+                     typing.Iterable[ProcClsOrLazyT]
+                 ] = None) -> None:
+        """Re-build the registry and the indexes and swap them atomically.
+
+        They are built into another object and replaced under the lock, so
+        that threads loading lazy processors keep using the same lock and
+        never see or update registries and indexes partially built.
+
+        :param processors: See the description of :meth:`__init__`
+        """
+        # pylint: disable=protected-access
+        new = Processors.__new__(Processors)
+        new._pgroup = self._pgroup
+        Processors.__init__(new, processors)
+
+        with self._lock:
+            (self._processors, self._by_ext, self._by_type,
+             self._by_type_or_id) = (new._processors, new._by_ext,
+                                     new._by_type, new._by_type_or_id)
 
     def load_plugins(self) -> None:
         """Load and register pluggable processor classes internally."""
@@ -54,6 +173,7 @@ class Processors:
         :param sort: Result will be sorted if it's True
         :return: A list of :class:`Processor` or its children classes
         """
+        self._load_all()
         prs = self._processors.values()
         if sort:
             return sorted(prs, key=operator.methodcaller('cid'))
@@ -67,6 +187,7 @@ class Processors:
             A list of :class:`Processor` or its children classes grouped by
             each cid, [(cid, [:class:`Processor`)]]
         """
+        self._load_all()
         prs = self._processors
         return sorted(((cid, [prs[cid]]) for cid in sorted(prs.keys())),
                       key=operator.itemgetter(0))
@@ -78,7 +199,7 @@ class Processors:
             A list of :class:`Processor` or its children classes grouped by
             each type, [(type, [:class:`Processor`)]]
         """
-        return utils.list_by_x(self.list(), 'type')  # type: ignore
+        return self.list_by_x('type')
 
     def list_by_x(self, item: typing.Optional[str] = None
                   ) -> typing.List[typing.Tuple[str, ProcsT]]:
@@ -89,18 +210,22 @@ class Processors:
             A list of :class:`Processor` or its children classes grouped by
             given 'item', [(cid, [:class:`Processor`)]] by default
         """
+        self._load_all()
         prs = self._processors
 
         if item is None or item == 'cid':  # Default.
-            res = [(cid, [prs[cid]]) for cid in sorted(prs.keys())]
+            return [(cid, [prs[cid]]) for cid in sorted(prs.keys())]
 
-        elif item in ('type', 'extensions'):
-            res = utils.list_by_x(prs.values(), typing.cast(str, item))
+        if item == 'type':
+            index = self._by_type
+        elif item == 'extensions':
+            index = self._by_ext
         else:
             raise ValueError("keyword argument 'item' must be one of "
                              "None, 'cid', 'type' and 'extensions' "
                              f"but it was '{item}'")
-        return res
+
+        return [(key, list(index[key])) for key in sorted(index.keys())]
 
     def list_x(self, key: typing.Optional[str] = None) -> typing.List[str]:
         """List the factor 'x' of processors.
@@ -108,16 +233,46 @@ class Processors:
         :param key: Which of key to return from 'cid', 'type', and 'extention'
         :return: A list of x 'key'
         """
-        if key in ('cid', 'type'):
-            return sorted(set(operator.methodcaller(key)(p)
-                              for p in self._processors.values()))
+        if key == 'cid':
+            return sorted(self._processors.keys())
+        if key == 'type':
+            return sorted(self._by_type.keys())
         if key == 'extension':
-            return sorted(k for k, _v in self.list_by_x('extensions'))
+            return sorted(self._by_ext.keys())
 
         raise ValueError("keyword argument 'key' must be one of "
                          "None, 'cid', 'type' and 'extension' "
                          f"but it was '{key}'")
 
+    def _find_by_fileext(self, fileext: str) -> ProcsT:
+        """Find processors by file extension ``fileext`` from the index.
+
+        :raises: common.UnknownFileTypeError
+        """
+        try:
+            return self._by_ext[fileext]
+        except KeyError:
+            raise common.UnknownFileTypeError(
+                f'file extension={fileext}'
+            ) from None
+
+    def _find_by_type_or_id(self, type_or_id: str) -> ProcsT:
+        """Find processors by type or ID ``type_or_id`` from the index.
+
+        :raises: common.UnknownProcessorTypeError
+        """
+        try:
+            return self._by_type_or_id[type_or_id]
+        except KeyError:
+            raise common.UnknownProcessorTypeError(type_or_id) from None
+
+    def _findall(self, obj: typing.Optional['ioinfo.PathOrIOInfoT'],
+                 forced_type: typing.Optional[str] = None) -> ProcsT:
+        """Find processors from the indexes without copying results."""
+        return utils.findall_with_fns(obj, self._find_by_fileext,
+                                      self._find_by_type_or_id,
+                                      forced_type=forced_type)
+
     def findall(self, obj: typing.Optional['ioinfo.PathOrIOInfoT'],
                 forced_type: typing.Optional[str] = None
                 ) -> typing.List[ProcT]:
@@ -131,7 +286,14 @@ class Processors:
         :return: A list of instances of processor classes to process 'obj'
         :raises: ValueError, UnknownProcessorTypeError, UnknownFileTypeError
         """
-        return utils.findall(obj, self.list(), forced_type=forced_type)
+        procs = [proc for proc
+                 in (self._maybe_load(p)
+                     for p in self._findall(obj, forced_type=forced_type))
+                 if proc is not None]
+        if not procs:  # All of them failed to load and were unregistered.
+            return self.findall(obj, forced_type=forced_type)
+
+        return procs
 
     def find(self, obj: typing.Optional['ioinfo.PathOrIOInfoT'],
              forced_type: MaybeProcT = None) -> ProcT:
@@ -147,6 +309,17 @@ class Processors:
         :return: an instance of processor class to process 'obj'
         :raises: ValueError, UnknownProcessorTypeError, UnknownFileTypeError
         """
-        return utils.find(obj, self.list(), forced_type=forced_type)
+        proc = utils.find_forced(forced_type)
+        if proc is not None:
+            return proc
+
+        for proc in self._findall(obj,
+                                  forced_type=typing.cast(str, forced_type)):
+            loaded = self._maybe_load(proc)
+            if loaded is not None:
+                return loaded
+
+        # All of them failed to load and were unregistered.
+        return self.find(obj, forced_type=forced_type)
 
 # vim:sw=4:ts=4:et:
@@ -7,12 +7,11 @@
 # FIXME:
 # mypy: disable-error-code=type-var
 """Utility functions for anyconfig.processors."""
+import functools
 import operator
 import typing
 import warnings
 
-import importlib.metadata
-
 from .. import common, ioinfo, models, utils
 from .datatypes import (
     ProcT, ProcsT, ProcClsT, MaybeProcT
@@ -28,6 +27,17 @@ def sort_by_prio(prs: typing.Iterable[ProcT]) -> ProcsT:
     return sorted(prs, key=operator.methodcaller('priority'), reverse=True)
 
 
+def add_to_index(index: typing.Dict[str, ProcsT], key: str, proc: ProcT
+                 ) -> None:
+    """Add a processor ``proc`` to ``index[key]`` keeping it sorted.
+
+    :param index: A mapping object of keys and lists of processors
+    :param key: Key of the index, e.g. file extension
+    :param proc: An instance of :class:`anyconfig.models.processor.Processor`
+    """
+    index[key] = sort_by_prio([*index.get(key, []), proc])
+
+
 def select_by_key(
     items: typing.Iterable[
         typing.Tuple[typing.List[str], typing.Any]],
@@ -166,15 +176,22 @@ def find_by_maybe_file(obj: ioinfo.PathOrIOInfoT, prs: ProcsT) -> ProcsT:
     return find_by_fileext(ioinfo.make(obj).extension, prs)
 
 
-def findall(obj: typing.Optional[ioinfo.PathOrIOInfoT], prs: ProcsT,
-            forced_type: typing.Optional[str] = None,
-            ) -> ProcsT:
-    """Find all of the processors match with the conditions.
+def findall_with_fns(obj: typing.Optional[ioinfo.PathOrIOInfoT],
+                     by_fileext: typing.Callable[[str], ProcsT],
+                     by_type_or_id: typing.Callable[[str], ProcsT],
+                     forced_type: typing.Optional[str] = None,
+                     ) -> ProcsT:
+    """Find all of the processors match with the conditions using finders.
 
     :param obj:
         a file path, file, file-like object, pathlib.Path object or an
         'anyconfig.ioinfo.IOInfo` (namedtuple) object
-    :param prs: A list of :class:`anyconfig.models.processor.Processor` classes
+    :param by_fileext:
+        Callable to find processors by file extension, it must raise
+        common.UnknownFileTypeError if nothing was found
+    :param by_type_or_id:
+        Callable to find processors by type or ID, it must raise
+        common.UnknownProcessorTypeError if nothing was found
     :param forced_type:
         Forced processor type of the data to process or ID of the processor
         class or None
@@ -191,12 +208,61 @@ def findall(obj: typing.Optional[ioinfo.PathOrIOInfoT], prs: ProcsT,
         )
 
     if forced_type is None:
-        pclss = find_by_maybe_file(typing.cast(ioinfo.PathOrIOInfoT, obj),
-                                   prs)  # :: [Processor], never []
-    else:
-        pclss = find_by_type_or_id(forced_type, prs)  # Do.
+        # :: [Processor], never []
+        return by_fileext(ioinfo.make(obj).extension)
 
-    return pclss
+    return by_type_or_id(forced_type)
+
+
+def findall(obj: typing.Optional[ioinfo.PathOrIOInfoT], prs: ProcsT,
+            forced_type: typing.Optional[str] = None,
+            ) -> ProcsT:
+    """Find all of the processors match with the conditions.
+
+    :param obj:
+        a file path, file, file-like object, pathlib.Path object or an
+        'anyconfig.ioinfo.IOInfo` (namedtuple) object
+    :param prs: A list of :class:`anyconfig.models.processor.Processor` classes
+    :param forced_type:
+        Forced processor type of the data to process or ID of the processor
+        class or None
+
+    :return: A list of instances of processor classes to process 'obj' data
+    :raises:
+        ValueError, common.UnknownProcessorTypeError,
+        common.UnknownFileTypeError
+    """
+    return findall_with_fns(
+        obj, functools.partial(find_by_fileext, prs=prs),
+        functools.partial(find_by_type_or_id, prs=prs),
+        forced_type=forced_type
+    )
+
+
+def find_forced(forced_type: MaybeProcT = None) -> typing.Optional[ProcT]:
+    """Get the processor instance if ``forced_type`` is a processor or class.
+
+    :param forced_type:
+        Forced processor type of the data to process or ID of the processor
+        class or :class:`anyconfig.models.processor.Processor` class object or
+        its instance itself
+
+    :return:
+        an instance of processor class or None if 'forced_type' is a str or
+        None
+    :raises: ValueError
+    """
+    if forced_type is None or isinstance(forced_type, str):
+        return None
+
+    proc = maybe_processor(
+        typing.cast(typing.Union[ProcT, ProcClsT], forced_type)
+    )
+    if proc is None:
+        raise ValueError('Wrong processor class or instance '
+                         f'was given: {forced_type!r}')
+
+    return proc
 
 
 def find(obj: typing.Optional[ioinfo.PathOrIOInfoT], prs: ProcsT,
@@ -219,14 +285,8 @@ def find(obj: typing.Optional[ioinfo.PathOrIOInfoT], prs: ProcsT,
         ValueError, common.UnknownProcessorTypeError,
         common.UnknownFileTypeError
     """
-    if forced_type is not None and not isinstance(forced_type, str):
-        proc = maybe_processor(
-            typing.cast(typing.Union[ProcT, ProcClsT], forced_type)
-        )
-        if proc is None:
-            raise ValueError('Wrong processor class or instance '
-                             f'was given: {forced_type!r}')
-
+    proc = find_forced(forced_type)
+    if proc is not None:
         return proc
 
     procs = findall(obj, prs, forced_type=typing.cast(str, forced_type))
@@ -241,6 +301,9 @@ def load_plugins(pgroup: str) -> typing.Iterator[ProcClsT]:
 
     :param pgroup: A string represents plugin type, e.g. anyconfig_backends
     """
+    # It's not imported at the top level as it takes not a little time.
+    import importlib.metadata  # pylint: disable=import-outside-toplevel
+
     eps = importlib.metadata.entry_points()
     for res in (eps.get(pgroup, []) if isinstance(eps, dict)
                 else eps.select(group=pgroup)):
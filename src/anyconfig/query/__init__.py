@@ -2,17 +2,56 @@
 # Copyright (C) 2021 Satoru SATOH <satoru.satoh@gmail.com>
 # SPDX-License-Identifier: MIT
 #
-"""Public API to query data with JMESPath expression."""
-try:
-    from .query import try_query
-    SUPPORTED = True
-except ImportError:
-    from .default import try_query
-    SUPPORTED = False  # type: ignore
+"""Public API to query data with JMESPath expression.
+
+.. versionchanged:: 0.14.1
+
+   - The implementation module and jmespath are imported on demand.
+   - Added new API :func:`query_many` to query data with multiple JMESPath
+     expressions at once.
+"""
+import functools
+import types
+import typing
+
+from ..common import InDataExT
+from ..utils import is_module_available
+from .datatypes import MaybeJexp
+
+
+SUPPORTED: bool = is_module_available('jmespath')
+
+
+@functools.lru_cache(None)
+def _impl() -> types.ModuleType:
+    """Import and return the module implements the APIs."""
+    try:
+        from . import query as impl
+    except ImportError:
+        from . import default as impl  # type: ignore
+
+    return impl
+
+
+def try_query(data: InDataExT, jexp: MaybeJexp = None, **options) -> InDataExT:
+    """Try to query data with JMESPath expression `jexp`."""
+    if jexp is None or not jexp:
+        return data
+
+    return _impl().try_query(data, jexp, **options)
+
+
+def query_many(data: InDataExT, jexps: typing.Iterable[MaybeJexp],
+               **options) -> typing.List[InDataExT]:
+    """Query data with multiple JMESPath expressions ``jexps``.
+
+    :return: A list of query results in the order of ``jexps``
+    """
+    return _impl().query_many(data, jexps, **options)
 
 
 __all__ = [
-    'try_query',
+    'try_query', 'query_many',
 ]
 
 # vim:sw=4:ts=4:et:
@@ -4,6 +4,8 @@
 #
 # pylint: disable=unused-argument
 """Provide dummy implementation of anyconfig.query.*."""
+import typing
+
 from ..common import InDataExT
 from .datatypes import MaybeJexp
 
@@ -12,4 +14,10 @@ def try_query(data: InDataExT, jexp: MaybeJexp = None, **options) -> InDataExT:
     """Provide a dummy implementation of :func:`anyconfig.query.try_query`."""
     return data
 
+
+def query_many(data: InDataExT, jexps: typing.Iterable[MaybeJexp],
+               **options) -> typing.List[InDataExT]:
+    """Provide a dummy implementation of :func:`anyconfig.query.query_many`."""
+    return [data for _jexp in jexps]
+
 # vim:sw=4:ts=4:et:
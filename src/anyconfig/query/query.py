@@ -7,10 +7,18 @@
 
 Changelog:
 
+.. versionchanged:: 0.14.1
+
+   - Compiled JMESPath expressions are cached in a LRU cache.
+   - Added :func:`query_many` to query data with multiple expressions.
+   - :class:`anyconfig.dicts.FrozenConfig` objects can be queried and the
+     results are frozen also.
+
 .. versionadded:: 0.8.3
 
    - Added to query config data with JMESPath expression, http://jmespath.org
 """
+import functools
 import typing
 import warnings
 
@@ -19,21 +27,44 @@ import jmespath
 from ..common import (
     InDataExT, InDataT
 )
+from ..dicts import FrozenConfig, freeze
 from ..utils import is_dict_like
 from .datatypes import MaybeJexp
 
 
+COMPILED_MAXSIZE: int = 256
+
+
+@functools.lru_cache(COMPILED_MAXSIZE)
+def compile_jexp(jexp: str) -> typing.Any:
+    """Compile JMESPath expression ``jexp`` and cache the result.
+
+    :return: A parsed result object of jmespath
+    :raises: ValueError (jmespath.exceptions.*Error) if ``jexp`` is invalid
+    """
+    return jmespath.compile(jexp)
+
+
+def _is_queryable(data: InDataExT) -> bool:
+    """Test if ``data`` can be queried and warn if not."""
+    if is_dict_like(data):
+        return True
+
+    # Some primitive types like int, str.
+    warnings.warn(
+        'Could not query because given data is not '
+        f'a mapping object (type? {type(data)}',
+        stacklevel=3
+    )
+    return False
+
+
 def try_query(data: InDataExT, jexp: MaybeJexp = None, **options) -> InDataExT:
     """Try to query data with JMESPath expression `jexp`."""
     if jexp is None or not jexp:
         return data
 
-    if not is_dict_like(data):  # Some primitive types like int, str.
-        warnings.warn(
-            'Could not query because given data is not '
-            f'a mapping object (type? {type(data)}',
-            stacklevel=2
-        )
+    if not _is_queryable(data):
         return data
 
     (odata, exc) = query(
@@ -45,6 +76,32 @@ def try_query(data: InDataExT, jexp: MaybeJexp = None, **options) -> InDataExT:
     return odata  # type: ignore
 
 
+def query_many(data: InDataExT, jexps: typing.Iterable[MaybeJexp],
+               **options) -> typing.List[InDataExT]:
+    """Query data with multiple JMESPath expressions ``jexps``.
+
+    :param data: Target object (a dict or a dict-like object) to query
+    :param jexps: An iterable yields JMESPath expressions
+    :param options: Keyword options
+
+    :return: A list of query results in the order of ``jexps``
+    :raises: ValueError (jmespath.exceptions.*Error) if any of ``jexps`` is
+        invalid
+    """
+    jexps = list(jexps)
+    if not _is_queryable(data):
+        return [data for _jexp in jexps]
+
+    if isinstance(data, FrozenConfig):  # jmespath expects dicts and lists.
+        return [freeze(res) for res in query_many(data.thaw(), jexps)]
+
+    return [
+        data if jexp is None or not jexp
+        else compile_jexp(typing.cast(str, jexp)).search(data)
+        for jexp in jexps
+    ]
+
+
 def query(data: InDataT, jexp: str, **_options
           ) -> typing.Tuple[typing.Optional[InDataT],
                             typing.Optional[Exception]]:
@@ -58,9 +115,13 @@ def query(data: InDataT, jexp: str, **_options
 
     :return: A tuple of query result and maybe exception if failed
     """
+    if isinstance(data, FrozenConfig):  # jmespath expects dicts and lists.
+        (res, err) = query(data.thaw(), jexp)
+        return (data if err and res is not None else freeze(res), err)
+
     exc: typing.Optional[Exception] = None
     try:
-        pexp = jmespath.compile(jexp)
+        pexp = compile_jexp(jexp)
         return (pexp.search(data), exc)
 
     except ValueError as exc:  # jmespath.exceptions.*Error inherit from it.
@@ -2,17 +2,72 @@
 # Copyright (C) 2021 Satoru SATOH <satoru.satoh@gmail.com>
 # SPDX-License-Identifier: MIT
 #
-"""Misc global constants, variables, classes and so on."""
-try:
-    from .jsonschema import validate, is_valid, gen_schema
-    SUPPORTED: bool = True
-except ImportError:
-    from .default import validate, is_valid, gen_schema
-    SUPPORTED = False  # type: ignore
+"""Misc global constants, variables, classes and so on.
+
+.. versionchanged:: 0.14.1
+
+   - The implementation module and jsonschema are imported on demand.
+   - Added new API :func:`validate_many` to validate multiple objects with a
+     schema object.
+"""
+import functools
+import types
+import typing
+
+from ..common import (
+    InDataT, InDataExT
+)
+from ..utils import is_module_available
+from .datatypes import ResultT
+
+
+SUPPORTED: bool = is_module_available('jsonschema')
+
+
+@functools.lru_cache(None)
+def _impl() -> types.ModuleType:
+    """Import and return the module implements the APIs."""
+    try:
+        from . import jsonschema as impl
+    except ImportError:
+        from . import default as impl  # type: ignore
+
+    return impl
+
+
+def validate(data: InDataExT, schema: InDataT, ac_schema_safe: bool = True,
+             ac_schema_errors: bool = False, **options: typing.Any
+             ) -> ResultT:
+    """Validate target object with given schema object."""
+    return _impl().validate(data, schema, ac_schema_safe=ac_schema_safe,
+                            ac_schema_errors=ac_schema_errors, **options)
+
+
+def validate_many(datas: typing.Iterable[InDataExT], schema: InDataT,
+                  ac_schema_safe: bool = True, ac_schema_errors: bool = False,
+                  **options: typing.Any) -> typing.List[ResultT]:
+    """Validate target objects with given schema object."""
+    return _impl().validate_many(datas, schema, ac_schema_safe=ac_schema_safe,
+                                 ac_schema_errors=ac_schema_errors, **options)
+
+
+def is_valid(data: InDataExT, schema: InDataT, ac_schema_safe: bool = True,
+             ac_schema_errors: bool = False, **options) -> bool:
+    """Raise ValidationError if ``data`` was invalidated by schema `schema`."""
+    if schema is None or not schema:
+        return True
+
+    return _impl().is_valid(data, schema, ac_schema_safe=ac_schema_safe,
+                            ac_schema_errors=ac_schema_errors, **options)
+
+
+def gen_schema(data: InDataExT, **options) -> InDataT:
+    """Generate a JSON schema object validates ``data``."""
+    return _impl().gen_schema(data, **options)
 
 
 __all__ = [
-    'validate', 'is_valid', 'gen_schema', 'SUPPORTED'
+    'validate', 'validate_many', 'is_valid', 'gen_schema', 'SUPPORTED'
 ]
 
 # vim:sw=4:ts=4:et:
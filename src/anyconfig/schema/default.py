@@ -19,6 +19,13 @@ def validate(data: InDataExT, schema: InDataT, ac_schema_safe: bool = True,
     return (True, 'Validation module (jsonschema) is not available')
 
 
+def validate_many(datas: typing.Iterable[InDataExT], schema: InDataT,
+                  ac_schema_safe: bool = True, ac_schema_errors: bool = False,
+                  **options: typing.Any) -> typing.List[ResultT]:
+    """Provide a dummy function does not validate at all in actual."""
+    return [validate(data, schema) for data in datas]
+
+
 def is_valid(data: InDataExT, schema: InDataT, ac_schema_safe: bool = True,
              ac_schema_errors: bool = False, **options) -> bool:
     """Provide a dummy function never raise exceptions."""
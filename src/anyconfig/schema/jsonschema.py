@@ -10,10 +10,28 @@
            **options) -> typing.Tuple[bool, str]:
   validate with schema
 
+- validate_many(datas: typing.Iterable[typing.Dict[str, typing.Any]],
+                schema: typing.Dict[str, typing.Any],
+                ac_schema_safe: bool = True, ac_schema_errors: bool = False,
+                **options) -> typing.List[typing.Tuple[bool, str]]:
+  validate multiple objects with a schema
+
 - gen_schema(data: typing.Dict[str, typing.Any],
              **options) -> typing.Dict[str, typing.Any]:
   Generate an object represents a schema
+
+.. versionchanged:: 0.14.1
+
+   - Validators compiled from schema objects are cached and re-used. Schema
+     objects are checked with check_schema before validation as
+     jsonschema.validate does, but not if ac_schema_errors is True as before.
+   - :class:`anyconfig.dicts.FrozenConfig` objects can be validated.
 """
+import collections
+import copy
+import hashlib
+import json
+import threading
 import typing
 import warnings
 
@@ -22,12 +40,106 @@ import jsonschema
 from ..common import (
     ValidationError, InDataExT, InDataT
 )
+from ..dicts import FrozenConfig
 from ..utils import (
     filter_options, is_dict_like, is_list_like
 )
 from .datatypes import ResultT
 
 
+ValidatorT = typing.Any  # jsonschema.protocols.Validator
+
+VALIDATORS_MAXSIZE: int = 128
+
+_VALIDATORS: typing.Dict[
+    typing.Tuple[typing.Any, ...], ValidatorT
+] = collections.OrderedDict()
+_VALIDATORS_LOCK = threading.Lock()
+
+_FORMAT_CHECKER = getattr(jsonschema.Draft7Validator, 'FORMAT_CHECKER',
+                          None) or jsonschema.draft7_format_checker
+
+
+def _schema_key(schema: InDataT) -> typing.Any:
+    """Make a key of ``schema`` to find its validator.
+
+    Frozen schema objects such as the ones loaded from files given as
+    ac_schema are hashable and keyed on themselves, and the others are keyed
+    on the digest of their content so that validators compiled from the
+    schema objects modified later are not re-used.
+    """
+    if isinstance(schema, FrozenConfig):
+        return schema
+
+    try:
+        content = json.dumps(schema, sort_keys=True, separators=(',', ':'),
+                             default=repr)
+    except (TypeError, ValueError):  # e.g. keys of different types.
+        content = repr(schema)
+
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def compile_validator(schema: InDataT, cls: typing.Any = None,
+                      format_checker: typing.Any = None,
+                      check_schema: bool = True) -> ValidatorT:
+    """Get the validator compiled from ``schema`` or compile and cache it.
+
+    Validators are cached in a LRU cache keyed on ``schema`` (see
+    :func:`_schema_key`), ``cls``, ``format_checker`` and ``check_schema``.
+    Validators are compiled from copies of schema objects not frozen as
+    they may be modified later.
+
+    :param schema: Schema object
+    :param cls: Validator class or None to select it from ``schema``
+    :param format_checker: Format checker object or None
+    :param check_schema: Check ``schema`` before compiling it if True
+
+    :return: A validator object
+    :raises: jsonschema.SchemaError if ``schema`` is invalid
+    """
+    key = (cls, format_checker, check_schema, _schema_key(schema))
+    with _VALIDATORS_LOCK:
+        entry = _VALIDATORS.get(key)
+        if entry is not None:
+            _VALIDATORS.move_to_end(key)  # type: ignore
+            return entry
+
+    raw = schema.thaw() if isinstance(schema, FrozenConfig) else \
+        copy.deepcopy(schema)
+    if cls is None:
+        cls = jsonschema.validators.validator_for(raw)
+
+    if check_schema:
+        cls.check_schema(raw)
+    vldtr = cls(raw, format_checker=format_checker)
+
+    with _VALIDATORS_LOCK:
+        _VALIDATORS[key] = vldtr
+        while len(_VALIDATORS) > VALIDATORS_MAXSIZE:
+            _VALIDATORS.popitem(last=False)  # type: ignore
+
+    return vldtr
+
+
+def clear_validators() -> None:
+    """Clear the cache of validators."""
+    with _VALIDATORS_LOCK:
+        _VALIDATORS.clear()
+
+
+def _thaw(data: InDataExT) -> InDataExT:
+    """Thaw ``data`` if it's frozen as jsonschema expects dicts and lists."""
+    return data.thaw() if isinstance(data, FrozenConfig) else data
+
+
+def _validate_all_with(vldtr: ValidatorT, data: InDataExT) -> ResultT:
+    """Do all of the validation checks with the validator ``vldtr``."""
+    errors = list(vldtr.iter_errors(_thaw(data)))
+
+    return (not errors, [err.message for err in errors])
+
+
 def _validate_all(data: InDataExT, schema: InDataT, **_options) -> ResultT:
     """Do all of the validation checks.
 
@@ -37,10 +149,27 @@ def _validate_all(data: InDataExT, schema: InDataT, **_options) -> ResultT:
     :seealso: https://python-jsonschema.readthedocs.io/en/latest/validate/,
     a section of 'iter_errors' especially
     """
-    vldtr = jsonschema.Draft7Validator(schema)  # :raises: SchemaError, ...
-    errors = list(vldtr.iter_errors(data))
+    # :raises: SchemaError, ...
+    vldtr = compile_validator(schema, cls=jsonschema.Draft7Validator,
+                              check_schema=False)
+    return _validate_all_with(vldtr, data)
 
-    return (not errors, [err.message for err in errors])
+
+def _validate_with(vldtr: ValidatorT, data: InDataExT,
+                   ac_schema_safe: bool = True) -> ResultT:
+    """Validate ``data`` with the validator ``vldtr``."""
+    try:
+        error = jsonschema.exceptions.best_match(
+            vldtr.iter_errors(_thaw(data))
+        )
+        if error is not None:
+            raise error
+    except Exception as exc:  # pylint: disable=broad-except
+        if ac_schema_safe:
+            return (False, str(exc))  # Validation was failed.
+        raise
+
+    return (True, '')
 
 
 def _validate(data: InDataExT, schema: InDataT, ac_schema_safe: bool = True,
@@ -53,17 +182,14 @@ def _validate(data: InDataExT, schema: InDataT, ac_schema_safe: bool = True,
     Validate target object 'data' with given schema object.
     """
     try:
-        jsonschema.validate(
-            data, schema, format_checker=jsonschema.draft7_format_checker,
-            **options
-        )
-    except (jsonschema.ValidationError, jsonschema.SchemaError,
-            Exception) as exc:
+        vldtr = compile_validator(schema, cls=options.get('cls'),
+                                  format_checker=_FORMAT_CHECKER)
+    except Exception as exc:  # pylint: disable=broad-except
         if ac_schema_safe:
-            return (False, str(exc))  # Validation was failed.
+            return (False, str(exc))
         raise
 
-    return (True, '')
+    return _validate_with(vldtr, data, ac_schema_safe)
 
 
 def validate(data: InDataExT, schema: InDataT, ac_schema_safe: bool = True,
@@ -95,6 +221,37 @@ def validate(data: InDataExT, schema: InDataT, ac_schema_safe: bool = True,
     return _validate(data, schema, ac_schema_safe, **options)
 
 
+def validate_many(datas: typing.Iterable[InDataExT], schema: InDataT,
+                  ac_schema_safe: bool = True, ac_schema_errors: bool = False,
+                  **options: typing.Any) -> typing.List[ResultT]:
+    """Validate target objects with given schema object.
+
+    The validator is compiled from ``schema`` only once and it's re-used to
+    validate each of ``datas``.
+
+    :param datas: An iterable yields target objects to validate
+    :param schema: Schema object
+    :param options: See the description of :func:`validate`
+
+    :return: A list of the results of :func:`validate` for each object
+    """
+    options = filter_options(('cls', ), options)
+    if ac_schema_errors:
+        vldtr = compile_validator(schema, cls=jsonschema.Draft7Validator,
+                                  check_schema=False)
+        return [_validate_all_with(vldtr, data) for data in datas]
+
+    try:
+        vldtr = compile_validator(schema, cls=options.get('cls'),
+                                  format_checker=_FORMAT_CHECKER)
+    except Exception as exc:  # pylint: disable=broad-except
+        if ac_schema_safe:
+            return [(False, str(exc)) for _data in datas]
+        raise
+
+    return [_validate_with(vldtr, data, ac_schema_safe) for data in datas]
+
+
 def is_valid(data: InDataExT, schema: InDataT, ac_schema_safe: bool = True,
              ac_schema_errors: bool = False, **options) -> bool:
     """Raise ValidationError if ``data`` was invalidated by schema `schema`."""
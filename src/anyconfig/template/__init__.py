@@ -2,16 +2,45 @@
 # Copyright (C) 2021 Satoru SATOH <satoru.satoh@gmail.com>
 # SPDX-License-Identifier: MIT
 #
-"""Misc global constants, variables, classes and so on."""
-try:
-    from .jinja2 import try_render
-    SUPPORTED: bool = True
-except ImportError:  # jinja2 may not be available.
-    SUPPORTED = False  # type: ignore
-
-    def try_render(*_args, **_kwargs) -> None:  # type: ignore
-        """Provide a dummy function does nothing but returns None."""
-        return None
+"""Misc global constants, variables, classes and so on.
+
+.. versionchanged:: 0.14.1
+
+   - The implementation module and jinja2 are imported on demand.
+"""
+import functools
+import typing
+
+from ..utils import is_module_available
+
+
+SUPPORTED: bool = is_module_available('jinja2')
+
+
+@functools.lru_cache(None)
+def _try_render_fn() -> typing.Callable[..., typing.Optional[str]]:
+    """Import and return the function to render templates."""
+    try:
+        from .jinja2 import try_render as fnc
+    except ImportError:  # jinja2 may not be available.
+        def fnc(*_args, **_kwargs) -> None:  # type: ignore
+            """Provide a dummy function does nothing but returns None."""
+            return None
+
+    return fnc
+
+
+def try_render(filepath: typing.Optional[str] = None,
+               content: typing.Optional[str] = None,
+               **options) -> typing.Optional[str]:
+    """Compile and render template and return the result as a string.
+
+    :param filepath: Absolute or relative path to the template file
+    :param content: Template content (str)
+    :param options: Keyword options passed to the renderer
+    :return: Compiled result (str) or None
+    """
+    return _try_render_fn()(filepath=filepath, content=content, **options)
 
 
 __all__ = [
@@ -8,10 +8,19 @@
 """anyconfig.template.jinja2_ module.
 
 Template rendering module for jinja2-based template config files.
+
+.. versionchanged:: 0.14.1
+
+   - Template environments are pooled by search paths and filters and re-used.
+     Compiled templates are also cached on disk if $ANYCONFIG_CACHE_DIR is
+     set.
+   - Fixed :func:`render_s` discarded the filters given.
 """
+import collections
 import locale
 import pathlib
 import os
+import threading
 import typing
 import warnings
 
@@ -19,6 +28,7 @@ import jinja2
 import jinja2.exceptions
 
 from .. import utils
+from ..cache.disk import CACHE_DIR_ENV
 
 
 # .. seealso:: jinja2.loaders.FileSystemLoader.__init__
@@ -31,19 +41,112 @@ RENDER_S_OPTS: typing.List[str] = ['ctx', 'paths', 'filters']
 RENDER_OPTS = RENDER_S_OPTS + ['ask']
 
 
-def tmpl_env(paths: MaybePathsT = None) -> jinja2.Environment:
+ENV_POOL_MAXSIZE: int = 32
+
+_ENV_POOL: typing.Dict[typing.Tuple[typing.Any, ...], jinja2.Environment] = (
+    collections.OrderedDict()
+)
+_ENV_POOL_LOCK = threading.Lock()
+
+
+def make_bytecode_cache() -> typing.Optional[jinja2.BytecodeCache]:
+    """Make a bytecode cache object shared among processes if it's enabled.
+
+    Compiled templates are cached in $ANYCONFIG_CACHE_DIR/jinja2 only if
+    $ANYCONFIG_CACHE_DIR is set, and nothing is written to disk otherwise.
+
+    :return: A bytecode cache object or None if it's not enabled or available
+    """
+    cdir = os.environ.get(CACHE_DIR_ENV)
+    if not cdir:
+        return None
+
+    try:
+        bcdir = pathlib.Path(cdir) / 'jinja2'
+        bcdir.mkdir(parents=True, exist_ok=True)
+        return jinja2.FileSystemBytecodeCache(str(bcdir))
+    except (OSError, RuntimeError):
+        return None
+
+
+def tmpl_env(paths: MaybePathsT = None,
+             bytecode_cache: typing.Optional[jinja2.BytecodeCache] = None
+             ) -> jinja2.Environment:
     """Get the template environment object from given ``paths``.
 
     :param paths: A list of template search paths
+    :param bytecode_cache: A bytecode cache object or None
     """
     if paths is None:
         paths = []
 
     return jinja2.Environment(
-        loader=jinja2.FileSystemLoader([str(p) for p in paths])
+        loader=jinja2.FileSystemLoader([str(p) for p in paths]),
+        bytecode_cache=bytecode_cache
     )
 
 
+def _filters_key(filters: MaybeFiltersT = None
+                 ) -> typing.Optional[typing.Tuple[typing.Any, ...]]:
+    """Make a key of filters to find the template environment.
+
+    :return: A tuple of filters or None if it cannot be made
+    """
+    if filters is None:
+        return ()
+
+    try:
+        items = (filters.items() if utils.is_dict_like(filters)  # type: ignore
+                 else filters)
+        key = tuple(sorted(items, key=lambda item: item[0]))
+        hash(key)
+    except (TypeError, ValueError, IndexError, KeyError):
+        return None
+
+    return key
+
+
+def get_env(paths: MaybePathsT = None, filters: MaybeFiltersT = None
+            ) -> jinja2.Environment:
+    """Get the template environment object from the pool or make it.
+
+    Template environments are pooled by ``paths`` and ``filters`` so that the
+    templates compiled are re-used. The bytecode cache is enabled in them also
+    to re-use compiled templates among processes if $ANYCONFIG_CACHE_DIR is
+    set, see :func:`make_bytecode_cache`.
+
+    :param paths: A list of template search paths
+    :param filters: Custom filters to add into template engine
+    """
+    fkey = _filters_key(filters)
+    key = (tuple(str(p) for p in paths or []), fkey)
+
+    if fkey is not None:
+        with _ENV_POOL_LOCK:
+            env = _ENV_POOL.get(key)
+            if env is not None:
+                _ENV_POOL.move_to_end(key)  # type: ignore
+                return env
+
+    env = tmpl_env(paths, bytecode_cache=make_bytecode_cache())
+    if filters is not None:
+        env.filters.update(filters)
+
+    if fkey is not None:
+        with _ENV_POOL_LOCK:
+            env = _ENV_POOL.setdefault(key, env)
+            while len(_ENV_POOL) > ENV_POOL_MAXSIZE:
+                _ENV_POOL.popitem(last=False)  # type: ignore
+
+    return env
+
+
+def clear_envs() -> None:
+    """Clear the pool of template environments."""
+    with _ENV_POOL_LOCK:
+        _ENV_POOL.clear()
+
+
 def make_template_paths(template_file: pathlib.Path,
                         paths: MaybePathsT = None
                         ) -> typing.List[pathlib.Path]:
@@ -88,7 +191,7 @@ def render_s(tmpl_s: str, ctx: MaybeContextT = None,
 
     # .. seealso:: jinja2.environment._environment_sanity_check
     try:
-        env = tmpl_env(paths)
+        env = get_env(paths, filters)
     except AssertionError as exc:
         warnings.warn(
             f'Something went wrong with: paths={paths!r}, exc={exc!s}',
@@ -96,14 +199,10 @@ def render_s(tmpl_s: str, ctx: MaybeContextT = None,
         )
         return tmpl_s
 
-    if filters is not None:
-        env.filters.update(filters)
-
     if ctx is None:
         ctx = {}
 
-    return typing.cast(jinja2.Environment, tmpl_env(paths)
-                       ).from_string(tmpl_s).render(**ctx)
+    return env.from_string(tmpl_s).render(**ctx)
 
 
 _ENCODING: str = (locale.getpreferredencoding() or 'utf-8').lower()
@@ -119,14 +218,12 @@ def render_impl(template_file: pathlib.Path, ctx: MaybeContextT = None,
     :param filters: Custom filters to add into template engine
     :return: Compiled result (str)
     """
-    env = tmpl_env(make_template_paths(template_file, paths))  # type: ignore
+    env = get_env(make_template_paths(template_file, paths),  # type: ignore
+                  filters)
 
     if env is None:
         return open(template_file, encoding=_ENCODING).read()
 
-    if filters is not None:
-        env.filters.update(filters)
-
     if ctx is None:
         ctx = {}
 
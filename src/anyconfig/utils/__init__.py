@@ -13,7 +13,7 @@
    - Add to abstract processors such like Parsers (loaders and dumpers).
 """
 from .detectors import (
-    is_iterable, is_dict_like, is_list_like
+    is_iterable, is_dict_like, is_list_like, is_module_available
 )
 from .files import get_path_from_stream
 from .lists import (
@@ -25,7 +25,7 @@ from .utils import (
 
 
 __all__ = [
-    'is_iterable', 'is_dict_like', 'is_list_like',
+    'is_iterable', 'is_dict_like', 'is_list_like', 'is_module_available',
     'get_path_from_stream',
     'groupby', 'concat',
     'filter_options', 'noop',
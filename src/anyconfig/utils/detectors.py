@@ -4,6 +4,7 @@
 #
 """Functions to detect something."""
 import collections.abc
+import importlib.util
 import types
 import typing
 
@@ -28,4 +29,12 @@ def is_list_like(obj: typing.Any) -> bool:
     return isinstance(obj, _LIST_LIKE_TYPES) and \
         not (isinstance(obj, str) or is_dict_like(obj))
 
+
+def is_module_available(name: str) -> bool:
+    """Test if the module ``name`` can be imported without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):  # e.g. Its parent package is missing.
+        return False
+
 # vim:sw=4:ts=4:et:
@@ -5,6 +5,8 @@
 # pylint: disable=missing-docstring
 import collections
 
+import anyconfig.dicts
+
 from ... import base
 from . import common
 
@@ -43,6 +45,15 @@ class TestCase(common.TestCase):
             with self.assertRaises(ValueError):
                 self.target_fn(tdata.inputs, ac_merge='wrong_merge_strategy')
 
+    def test_multi_load_with_merge_rules(self):
+        for tdata in self.each_data():
+            opts = tdata.opts.copy()
+            strategy = opts.pop('ac_merge', anyconfig.dicts.MS_DICTS)
+            self.assertEqual(
+                self.target_fn(tdata.inputs, ac_merge={'': strategy}, **opts),
+                tdata.exp, tdata
+            )
+
     def test_multi_load_with_ignore_missing_option(self):
         paths = [
             'file_not_exist_0.json',
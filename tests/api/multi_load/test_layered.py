@@ -0,0 +1,53 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring
+import anyconfig.dicts
+
+from . import common, test_query, test_schema
+
+
+def multi_load(*args, **kwargs):
+    return common.TT.multi_load(*args, ac_layered=True, **kwargs)
+
+
+class TestCase(common.TestCase):
+
+    @staticmethod
+    def target_fn(*args, **kwargs):
+        return multi_load(*args, **kwargs)
+
+    def test_multi_load_returns_a_view(self):
+        for tdata in self.each_data():
+            res = self.target_fn(tdata.inputs, **tdata.opts)
+            self.assertTrue(isinstance(res, anyconfig.dicts.LayeredConfig))
+            self.assertEqual(len(res.layers), len(tdata.inputs))
+            self.assertEqual(res.materialize(), tdata.exp, tdata)
+
+    def test_multi_load_does_not_modify_data_loaded(self):
+        for tdata in self.each_data():
+            res = self.target_fn(tdata.inputs, **tdata.opts)
+            layers = [common.TT.single_load(i) for i in tdata.inputs]
+            self.assertEqual(list(res.layers), layers)
+
+
+class MultiTypesTestCase(TestCase):
+    kind = 'multi_types'
+    pattern = '*.*'
+
+
+class QueryTestCase(test_query.TestCase):
+
+    @staticmethod
+    def target_fn(*args, **kwargs):
+        return multi_load(*args, **kwargs)
+
+
+class SchemaTestCase(test_schema.TestCase):
+
+    @staticmethod
+    def target_fn(*args, **kwargs):
+        return multi_load(*args, **kwargs)
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,86 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring
+import concurrent.futures
+import unittest
+import unittest.mock
+
+import anyconfig.api._load
+import anyconfig.template
+
+from . import common
+
+
+class TestCase(common.TestCase):
+
+    @staticmethod
+    def target_fn(*args, **kwargs):
+        return common.TT.multi_load(*args, ac_parallel=4, **kwargs)
+
+    def test_multi_load_with_ac_parallel_true(self):
+        for tdata in self.each_data():
+            self.assertEqual(
+                common.TT.multi_load(tdata.inputs, ac_parallel=True,
+                                     **tdata.opts),
+                tdata.exp,
+                tdata
+            )
+
+    def test_multi_load_with_executor(self):
+        with concurrent.futures.ProcessPoolExecutor(2) as executor:
+            for tdata in self.each_data():
+                self.assertEqual(
+                    common.TT.multi_load(tdata.inputs, ac_parallel=executor,
+                                         **tdata.opts),
+                    tdata.exp,
+                    tdata
+                )
+
+    def test_multi_load_with_wrong_ac_parallel(self):
+        for tdata in self.each_data():
+            with self.assertRaises(ValueError):
+                common.TT.multi_load(tdata.inputs, ac_parallel='wrong')
+
+    def test_multi_load_does_not_pass_ac_parallel(self):
+        orig = anyconfig.api._load._single_load
+        for tdata in self.each_data():
+            with unittest.mock.patch.object(
+                anyconfig.api._load, '_single_load', wraps=orig
+            ) as single_load:
+                common.TT.multi_load(tdata.inputs, ac_parallel=2,
+                                     **tdata.opts)
+
+            self.assertTrue(single_load.call_args_list, tdata)
+            for call in single_load.call_args_list:
+                self.assertNotIn('ac_parallel', call.kwargs, tdata)
+
+
+class MultiTypesTestCase(TestCase):
+    kind = 'multi_types'
+    pattern = '*.*'
+
+
+@unittest.skipIf(not anyconfig.template.SUPPORTED,
+                 'jinja2 template lib is not available')
+class TemplateTestCase(common.TestCase):
+    """Inputs are loaded sequentially if ac_template is True."""
+
+    kind = 'template'
+
+    def test_multi_load(self):
+        for tdata in self.each_data():
+            self.assertEqual(
+                common.TT.multi_load(
+                    tdata.inputs, ac_context=tdata.ctx, ac_parallel=4,
+                    **tdata.opts
+                ),
+                tdata.exp,
+                tdata
+            )
+
+    def test_multi_load_failures(self):
+        pass
+
+# vim:sw=4:ts=4:et:
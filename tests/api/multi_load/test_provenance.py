@@ -0,0 +1,74 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring,redefined-outer-name
+import asyncio
+
+import pytest
+
+import anyconfig
+import anyconfig.api._async
+import anyconfig.api._load as TT
+
+
+@pytest.fixture
+def paths(tmp_path):
+    res = []
+    for idx, data in enumerate(({'a': {'b': 0, 'c': 0}, 'd': [0]},
+                                {'a': {'b': 1}},
+                                {},
+                                {'d': [3], 'e': 3})):
+        path = tmp_path / f'{idx}.json'
+        anyconfig.dump(data, path)
+        res.append(path)
+
+    return res
+
+
+def _check(cnf, prov, paths):
+    assert cnf == TT.multi_load(paths)
+    assert prov.get('a/b')[0] == 1
+    assert prov.get('a/b')[1].path == str(paths[1])
+    assert prov.get('a/c')[0] == 0
+    assert prov.get('d/0')[0] == 3
+    assert prov.get('e')[0] == 3
+
+
+def test_multi_load_with_ac_provenance(paths):
+    (cnf, prov) = TT.multi_load(paths, ac_provenance=True)
+    _check(cnf, prov, paths)
+
+    prov = anyconfig.Provenance()
+    _check(TT.multi_load(paths, ac_provenance=prov), prov, paths)
+
+
+def test_load_with_ac_provenance(paths):
+    (cnf, prov) = TT.load(paths, ac_provenance=True)
+    _check(cnf, prov, paths)
+
+    (cnf, prov) = TT.load(paths[0], ac_provenance=True)
+    assert cnf == TT.load(paths[0])
+    assert prov.get('a/b')[0] == 0
+
+
+def test_amulti_load_with_ac_provenance(paths):
+    (cnf, prov) = asyncio.run(
+        anyconfig.api._async.amulti_load(paths, ac_provenance=True)
+    )
+    _check(cnf, prov, paths)
+
+
+def test_multi_load_with_ac_provenance_and_ac_schema(paths, tmp_path):
+    scm = tmp_path / 'schema.json'
+    anyconfig.dump({'type': 'object', 'required': ['a']}, scm)
+
+    (cnf, prov) = TT.multi_load(paths, ac_provenance=True, ac_schema=scm)
+    _check(cnf, prov, paths)
+
+
+def test_multi_load_with_ac_provenance_and_ac_layered(paths):
+    with pytest.raises(ValueError):
+        TT.multi_load(paths, ac_provenance=True, ac_layered=True)
+
+# vim:sw=4:ts=4:et:
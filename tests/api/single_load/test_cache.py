@@ -0,0 +1,116 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring
+import collections
+import os
+
+import pytest
+
+import anyconfig.api._load as TT
+import anyconfig.cache
+import anyconfig.schema
+
+
+@pytest.fixture
+def json_path(tmp_path):
+    path = tmp_path / 'a.json'
+    path.write_text('{"a": 1, "b": {"c": [1, 2]}}')
+    return path
+
+
+def test_single_load_with_ac_cache(json_path):
+    cache = anyconfig.cache.Cache()
+    res = TT.single_load(json_path, ac_cache=cache)
+    assert res == {'a': 1, 'b': {'c': [1, 2]}}
+    assert cache.info()[:2] == (0, 1)
+
+    res['b']['c'].append(3)  # It must not corrupt the cache.
+    assert TT.single_load(json_path, ac_cache=cache) == {
+        'a': 1, 'b': {'c': [1, 2]}
+    }
+    assert cache.info()[:2] == (1, 1)
+
+
+def test_single_load_with_ac_cache_file_modified(json_path):
+    cache = anyconfig.cache.Cache()
+    TT.single_load(json_path, ac_cache=cache)
+
+    json_path.write_text('{"a": 2}')
+    stat = json_path.stat()
+    os.utime(json_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    assert TT.single_load(json_path, ac_cache=cache) == {'a': 2}
+    assert cache.info()[:2] == (0, 2)
+
+
+def test_single_load_with_ac_cache_different_options(json_path):
+    cache = anyconfig.cache.Cache()
+    TT.single_load(json_path, ac_cache=cache)
+    res = TT.single_load(json_path, ac_cache=cache, ac_ordered=True)
+
+    assert isinstance(res, collections.OrderedDict)
+    assert cache.info() == (0, 2, anyconfig.cache.memory.DEFAULT_MAXSIZE, 2)
+
+
+def test_single_load_with_ac_cache_and_ac_query(json_path):
+    cache = anyconfig.cache.Cache()
+    TT.single_load(json_path, ac_cache=cache)
+    assert TT.single_load(json_path, ac_cache=cache, ac_query='a') == 1
+    assert cache.info()[:2] == (1, 1)
+
+
+def test_single_load_with_the_default_cache(json_path):
+    anyconfig.cache.clear()
+    try:
+        TT.single_load(json_path, ac_cache=True)
+        TT.multi_load([json_path], ac_cache=True)
+        assert anyconfig.cache.info()[:2] == (1, 1)
+    finally:
+        anyconfig.cache.clear()
+
+
+def test_single_load_without_cache(json_path):
+    anyconfig.cache.clear()
+    TT.single_load(json_path)
+    TT.single_load(json_path, ac_cache=False)
+    assert anyconfig.cache.info()[:2] == (0, 0)
+
+
+def test_single_load_with_wrong_cache(json_path):
+    with pytest.raises(ValueError):
+        TT.single_load(json_path, ac_cache='wrong')
+
+
+def test_single_load_with_disk_cache(json_path, tmp_path):
+    cache = anyconfig.cache.DiskCache(tmp_path / 'cache')
+    exp = {'a': 1, 'b': {'c': [1, 2]}}
+
+    assert TT.single_load(json_path, ac_cache=cache) == exp
+    assert len(cache) == 1
+
+    cache_2 = anyconfig.cache.DiskCache(tmp_path / 'cache')
+    assert TT.single_load(json_path, ac_cache=cache_2) == exp
+    assert cache_2.info()[:2] == (1, 0)
+
+
+@pytest.mark.skipif(not anyconfig.schema.SUPPORTED,
+                    reason='jsonschema lib is not available')
+def test_single_load_with_ac_schema_cached(json_path, tmp_path):
+    scm = tmp_path / 'scm.json'
+    scm.write_text('{"type": "object", "required": ["a"]}')
+
+    TT.SCHEMA_CACHE.clear()
+    for _idx in range(3):
+        assert TT.single_load(json_path, ac_schema=scm)
+
+    assert TT.SCHEMA_CACHE.info()[:2] == (2, 1)
+
+    scm.write_text('{"type": "object", "required": ["x"]}')
+    stat = scm.stat()
+    os.utime(scm, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    with pytest.warns(UserWarning):
+        assert TT.single_load(json_path, ac_schema=scm) is None
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,101 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring,redefined-outer-name
+import pytest
+
+import anyconfig
+import anyconfig.api._load as TT
+import anyconfig.cache
+import anyconfig.query
+import anyconfig.schema
+
+
+DATA = {'a': 1, 'b': {'c': [1, {'d': 2}]}}
+
+
+@pytest.fixture(params=('json', 'ini'))
+def path(request, tmp_path):
+    if request.param == 'ini':
+        path = tmp_path / 'a.ini'
+        path.write_text('[b]\nc = 1\n')
+    else:
+        path = tmp_path / 'a.json'
+        anyconfig.dump(DATA, path)
+    return path
+
+
+def _frozen_all(obj):
+    if anyconfig.utils.is_dict_like(obj):
+        return isinstance(obj, anyconfig.FrozenConfig) and all(
+            _frozen_all(val) for val in obj.values()
+        )
+    if anyconfig.utils.is_list_like(obj):
+        return isinstance(obj, tuple) and all(_frozen_all(x) for x in obj)
+    return True
+
+
+def test_single_load_with_ac_frozen(path):
+    res = TT.single_load(path, ac_frozen=True)
+    assert _frozen_all(res)
+    assert res == TT.single_load(path)
+    assert hash(res) == hash(TT.single_load(path, ac_frozen=True))
+
+
+def test_single_load_with_ac_frozen_and_ac_cache(path):
+    cache = anyconfig.cache.Cache()
+    res = TT.single_load(path, ac_frozen=True, ac_cache=cache)
+    assert TT.single_load(path, ac_frozen=True, ac_cache=cache) is res
+    assert not isinstance(TT.single_load(path, ac_cache=cache),
+                          anyconfig.FrozenConfig)
+
+
+def test_loads_with_ac_frozen():
+    res = TT.loads('{"a": [1, {"b": 2}]}', ac_parser='json', ac_frozen=True)
+    assert _frozen_all(res)
+    assert TT.loads('', ac_parser='json', ac_frozen=True) == {}
+
+
+def test_multi_load_with_ac_frozen(tmp_path):
+    paths = [tmp_path / 'a.json', tmp_path / 'b.json']
+    anyconfig.dump(DATA, paths[0])
+    anyconfig.dump({'b': {'e': 3}}, paths[1])
+
+    res = TT.multi_load(paths, ac_frozen=True)
+    assert _frozen_all(res)
+    assert res == {'a': 1, 'b': {'c': [1, {'d': 2}], 'e': 3}}
+
+    res = TT.multi_load(paths, ac_frozen=True, ac_layered=True)
+    assert isinstance(res, anyconfig.FrozenConfig)
+
+
+@pytest.mark.skipif(not anyconfig.schema.SUPPORTED,
+                    reason='jsonschema lib is not available')
+def test_single_load_with_ac_frozen_and_ac_schema(tmp_path):
+    path = tmp_path / 'a.json'
+    anyconfig.dump(DATA, path)
+    scm = tmp_path / 'scm.json'
+    anyconfig.dump(anyconfig.gen_schema({'a': 1}), scm)
+
+    res = TT.single_load(path, ac_frozen=True, ac_schema=scm)
+    assert isinstance(res, anyconfig.FrozenConfig)
+    assert res == DATA
+
+
+@pytest.mark.skipif(not anyconfig.query.SUPPORTED,
+                    reason='jmespath lib is not available')
+def test_single_load_with_ac_frozen_and_ac_query(tmp_path):
+    path = tmp_path / 'a.json'
+    anyconfig.dump(DATA, path)
+
+    res = TT.single_load(path, ac_frozen=True, ac_query='b.c[*]')
+    assert res == (1, anyconfig.FrozenConfig({'d': 2}))
+
+
+def test_dumps_frozen_config():
+    res = anyconfig.freeze(DATA)
+    assert anyconfig.loads(anyconfig.dumps(res, ac_parser='json'),
+                           ac_parser='json') == DATA
+
+# vim:sw=4:ts=4:et:
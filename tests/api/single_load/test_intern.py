@@ -0,0 +1,59 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring
+import math
+
+import pytest
+
+import anyconfig
+import anyconfig.api._load as TT
+
+
+DATA = {'name': 'a' * 20, 'b': {'c': ['d' * 20]}}
+
+
+@pytest.mark.parametrize('ext', ('json', 'ini'))
+def test_single_load_with_ac_intern(ext, tmp_path):
+    paths = [tmp_path / f'{i}.{ext}' for i in range(2)]
+    for path in paths:
+        anyconfig.dump(DATA if ext == 'json' else {'b': DATA['b']}, path)
+
+    interner = anyconfig.Interner()
+    (res_0, res_1) = [TT.single_load(p, ac_intern=interner,
+                                     ac_intern_values=True)
+                      for p in paths]
+    assert res_0 == res_1 == TT.single_load(paths[0])
+    assert [k for k in res_0['b']][0] is [k for k in res_1['b']][0]
+    assert anyconfig.memory_report(interner)['shared'] > 0
+
+
+def test_loads_with_ac_intern_and_ac_frozen():
+    content = anyconfig.dumps(DATA, ac_parser='json')
+    interner = anyconfig.Interner()
+    (res_0, res_1) = [TT.loads(content, ac_parser='json', ac_intern=interner,
+                               ac_intern_values=True, ac_frozen=True)
+                      for _ in range(2)]
+    assert isinstance(res_0, anyconfig.FrozenConfig)
+    assert res_0 == DATA
+    assert res_0['b']['c'][0] is res_1['b']['c'][0]
+
+
+def test_loads_with_ac_intern_true():
+    (res_0, res_1) = [TT.loads('{"a": [0.5, 0.5]}', ac_parser='json',
+                               ac_intern=True, ac_intern_values=True)
+                      for _ in range(2)]
+    assert res_0 == res_1 == {'a': [0.5, 0.5]}
+    assert res_0['a'][0] is res_0['a'][1]
+    assert res_0['a'][0] is not res_1['a'][0]  # Not shared among calls.
+
+
+def test_loads_with_ac_intern_values_keeps_signed_zeros():
+    for _ in range(2):
+        res = TT.loads('{"x": 0.0, "y": -0.0}', ac_parser='json',
+                       ac_intern=True, ac_intern_values=True)
+        assert math.copysign(1.0, res['x']) == 1.0
+        assert math.copysign(1.0, res['y']) == -1.0
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,114 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring,redefined-outer-name
+import asyncio
+import collections
+import concurrent.futures
+import threading
+
+import pytest
+
+import anyconfig.api._async as TT
+import anyconfig.api._load
+import anyconfig.template
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    paths = []
+    for idx in range(5):
+        path = tmp_path / f'{idx}.json'
+        path.write_text(f'{{"a": {idx}, "b": {{"b{idx}": [{idx}]}}}}')
+        paths.append(path)
+
+    return paths
+
+
+def test_aload_single_input(inputs):
+    assert asyncio.run(TT.aload(inputs[0])) == {'a': 0, 'b': {'b0': [0]}}
+
+
+def test_aload_multi_inputs(inputs):
+    exp = anyconfig.api._load.load(inputs)
+    assert asyncio.run(TT.aload(inputs)) == exp
+    assert exp['a'] == 4  # Merged in order.
+
+
+def test_aload_glob_pattern(inputs, tmp_path):
+    res = asyncio.run(TT.aload(str(tmp_path / '*.json'), ac_ordered=True))
+    assert res == anyconfig.api._load.load(inputs)
+    assert isinstance(res, collections.OrderedDict)
+
+
+def test_aload_with_invalid_input():
+    with pytest.raises(ValueError):
+        asyncio.run(TT.aload([]))
+
+
+def test_amulti_load_with_executor(inputs):
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        res = asyncio.run(TT.amulti_load(inputs, ac_executor=executor,
+                                         ac_query='b'))
+
+    assert res == {f'b{i}': [i] for i in range(5)}
+
+
+def test_amulti_load_merges_in_executor(inputs, monkeypatch):
+    threads = []
+
+    def _finish(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return anyconfig.api._load.finish_multi_load(*args, **kwargs)
+
+    monkeypatch.setattr(TT, 'finish_multi_load', _finish)
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        res = asyncio.run(TT.amulti_load(inputs, ac_executor=executor))
+
+    assert res == anyconfig.api._load.multi_load(inputs)
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_amulti_load_with_process_pool_executor(inputs):
+    with concurrent.futures.ProcessPoolExecutor(2) as executor:
+        res = asyncio.run(TT.amulti_load(inputs, ac_executor=executor))
+
+    assert res == anyconfig.api._load.multi_load(inputs)
+
+    with concurrent.futures.ProcessPoolExecutor(2) as executor:
+        (res, prov) = asyncio.run(TT.amulti_load(inputs, ac_executor=executor,
+                                                 ac_provenance=True))
+
+    assert res == anyconfig.api._load.multi_load(inputs)
+    assert prov.get('a')[1].path == str(inputs[-1])
+
+
+@pytest.mark.skipif(not anyconfig.template.SUPPORTED,
+                    reason='jinja2 template lib is not available')
+def test_amulti_load_with_ac_template(tmp_path):
+    (tmp_path / '0.yml').write_text('a: 1\n')
+    (tmp_path / '1.yml').write_text('b: {{ a + 1 }}\n')
+
+    res = asyncio.run(TT.amulti_load(str(tmp_path / '*.yml'),
+                                     ac_template=True))
+    assert res == {'a': 1, 'b': 2}
+
+
+def test_aloads():
+    assert asyncio.run(TT.aloads('{"a": 1}', ac_parser='json')) == {'a': 1}
+
+
+def test_adump(tmp_path):
+    out = tmp_path / 'out.json'
+    asyncio.run(TT.adump({'a': 1}, out))
+    assert anyconfig.api._load.load(out) == {'a': 1}
+
+
+def test_gather_in_a_loop(inputs):
+    async def main():
+        return await asyncio.gather(*(TT.aload(p) for p in inputs))
+
+    assert [r['a'] for r in asyncio.run(main())] == list(range(5))
+
+# vim:sw=4:ts=4:et:
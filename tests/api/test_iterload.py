@@ -0,0 +1,74 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring
+import collections
+import io
+
+import pytest
+
+import anyconfig.api._dump
+import anyconfig.api._iterload as TT
+import anyconfig.api._load
+
+
+DATA = {'name': 'a', 'items': [{'id': 0, 'tags': ['x']}, {'id': 1}]}
+
+
+@pytest.fixture(params=('json', 'yml', 'ini'))
+def path(request, tmp_path):
+    data = DATA
+    if request.param == 'ini':
+        data = {'sect': {'name': 'a'}, 'items': {'id': '0'}}
+
+    path = tmp_path / f'a.{request.param}'
+    anyconfig.api._dump.dump(data, path)
+    return path
+
+
+def test_iterload__leaves(path):
+    res = anyconfig.api._load.load(path)
+    for key_path, val in TT.iterload(path):
+        obj = res
+        for key in key_path:
+            obj = obj[key]
+        assert obj == val
+
+
+def test_iterload__prefix(path):
+    res = anyconfig.api._load.load(path)
+    items = list(TT.iterload(path, prefix='/items'))
+    assert [val for _, val in items] == list(
+        res['items'].values() if isinstance(res['items'], dict)
+        else res['items']
+    )
+
+
+@pytest.mark.parametrize('prefix', ('/', '', ()))
+def test_iterload__root(path, prefix):
+    res = anyconfig.api._load.load(path)
+    assert dict(TT.iterload(path, prefix=prefix)) == {
+        (key, ): val for key, val in res.items()
+    }
+
+
+def test_iterload__stream():
+    strm = io.StringIO('{"items": [{"a": 1}, {"a": 2}]}')
+    res = TT.iterload(strm, prefix=('items', ), ac_parser='json',
+                      ac_dict=collections.OrderedDict)
+    res = list(res)
+    assert res == [(('items', 0), {'a': 1}), (('items', 1), {'a': 2})]
+    assert isinstance(res[0][1], collections.OrderedDict)
+
+
+def test_iterload__generator_is_lazy(tmp_path):
+    path = tmp_path / 'a.json'
+    path.write_text('[1, 2, ')  # Broken at the end.
+    items = TT.iterload(path, prefix=())
+    assert next(items) == ((0, ), 1)
+    assert next(items) == ((1, ), 2)
+    with pytest.raises(ValueError):
+        next(items)
+
+# vim:sw=4:ts=4:et:
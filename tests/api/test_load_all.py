@@ -0,0 +1,102 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring,redefined-outer-name
+import collections
+import io
+
+import pytest
+
+import anyconfig.api._iterload as TT
+import anyconfig.api._load
+import anyconfig.parsers
+
+
+CONTENT = """\
+a: 1
+b: {c: 1}
+---
+b: {d: 2}
+---
+- x
+"""
+DOCS = [{'a': 1, 'b': {'c': 1}}, {'b': {'d': 2}}, ['x']]
+
+YAML_PARSERS = [
+    cid for cid, _psrs in anyconfig.parsers.list_by_cid()
+    if cid.startswith('yaml.')
+]
+
+if not YAML_PARSERS:
+    pytest.skip("skipping tests as yaml is not available.",
+                allow_module_level=True)
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / 'a.yml'
+    path.write_text(CONTENT)
+    return path
+
+
+@pytest.mark.parametrize('cid', YAML_PARSERS)
+def test_load_all(path, cid):
+    docs = TT.load_all(path, ac_parser=cid)
+    assert not isinstance(docs, list)  # It's lazy.
+    assert list(docs) == DOCS
+
+
+@pytest.mark.parametrize('cid', YAML_PARSERS)
+def test_load_all__empty_docs(path, cid):
+    path.write_text(f'---\n{CONTENT}---\n---\n')
+    assert list(TT.load_all(path, ac_parser=cid)) == DOCS
+
+
+def test_load_all__stream():
+    docs = TT.load_all(io.StringIO(CONTENT), ac_parser='yaml',
+                       ac_dict=collections.OrderedDict)
+    assert isinstance(next(docs), collections.OrderedDict)
+
+
+def test_load_all__frozen(path):
+    docs = list(TT.load_all(path, ac_frozen=True))
+    assert hash(docs[0]) == hash(anyconfig.dicts.freeze(DOCS[0]))
+    assert docs[2] == ('x', )
+
+
+def test_load_all__single_doc(tmp_path):
+    path = tmp_path / 'a.json'
+    path.write_text('{"a": 1}')
+    assert list(TT.load_all(path)) == [{'a': 1}]
+
+
+def test_load_all__ignore_missing(tmp_path):
+    path = tmp_path / 'not_exist.yml'
+    assert not list(TT.load_all(path, ac_ignore_missing=True))
+
+
+@pytest.mark.parametrize('cid', YAML_PARSERS)
+def test_load_multi_docs(path, cid):
+    path.write_text(CONTENT.rsplit('---', 1)[0])
+    res = anyconfig.api._load.load(path, ac_parser=cid, ac_multi_docs=True)
+    assert res == {'a': 1, 'b': {'c': 1, 'd': 2}}
+
+
+def test_load_multi_docs__strategy(path):
+    path.write_text(CONTENT.rsplit('---', 1)[0])
+    res = anyconfig.api._load.load(path, ac_multi_docs=True,
+                                   ac_merge='replace')
+    assert res == {'a': 1, 'b': {'d': 2}}
+
+
+def test_load_multi_docs__primitive(path):
+    assert anyconfig.api._load.load(path, ac_multi_docs=True) == ['x']
+
+
+def test_loads_multi_docs():
+    res = anyconfig.api._load.loads(CONTENT.rsplit('---', 1)[0],
+                                    ac_parser='yaml', ac_multi_docs=True)
+    assert res == {'a': 1, 'b': {'c': 1, 'd': 2}}
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,97 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring
+import collections
+
+import pytest
+
+import anyconfig.backend.base.events as TT
+
+
+DATA = {'a': {'b': [1, {'c': 2}, []], 'd': {}}, 'e': 'x'}
+
+
+def items(obj, prefix=None, container=dict):
+    return list(TT.iter_items(TT.iter_events(obj), prefix, container))
+
+
+@pytest.mark.parametrize(
+    ('prefix', 'exp'),
+    ((None, None),
+     ('/a/b', ('a', 'b')),
+     ('a.b', ('a', 'b')),
+     (['a', 0], ('a', 0)),
+     ('', ()),
+     ),
+)
+def test_to_prefix(prefix, exp):
+    assert TT.to_prefix(prefix) == exp
+
+
+@pytest.mark.parametrize(
+    ('path', 'prefix', 'exp'),
+    ((['a', 0], ('a', '0'), True),
+     (['a', 0], ('a', 0), True),
+     (['a', 'b'], ('*', 'b'), True),
+     (['a', 'b'], ('a', 'c'), False),
+     ),
+)
+def test_match_prefix(path, prefix, exp):
+    assert TT.match_prefix(path, prefix) == exp
+
+
+@pytest.mark.parametrize('obj', (DATA, [], {}, 1, None, [[[]], {'a': []}]))
+def test_build(obj):
+    events = TT.iter_events(obj)
+    assert TT.build(next(events), events) == obj
+
+
+def test_build__container():
+    events = TT.iter_events(DATA)
+    res = TT.build(next(events), events, collections.OrderedDict)
+    assert res == DATA
+    assert isinstance(res['a'], collections.OrderedDict)
+
+
+def test_build__unexpected_end():
+    events = iter(list(TT.iter_events(DATA))[:-1])
+    with pytest.raises(ValueError):
+        TT.build(next(events), events)
+
+
+def test_iter_items__leaves():
+    assert items(DATA) == [
+        (('a', 'b', 0), 1), (('a', 'b', 1, 'c'), 2), (('a', 'b', 2), []),
+        (('a', 'd'), {}), (('e', ), 'x'),
+    ]
+
+
+@pytest.mark.parametrize(
+    ('prefix', 'exp'),
+    (((), [(('a', ), DATA['a']), (('e', ), 'x')]),
+     (('a', 'b'), [(('a', 'b', 0), 1), (('a', 'b', 1), {'c': 2}),
+                   (('a', 'b', 2), [])]),
+     (('a', 'b', '1'), [(('a', 'b', 1, 'c'), 2)]),
+     (('e', ), [(('e', ), 'x')]),  # Primitive object at the prefix.
+     (('a', 'd'), []),
+     (('x', ), []),
+     (('*', ), [(('a', 'b'), DATA['a']['b']), (('a', 'd'), {}),
+                (('e', ), 'x')]),
+     ),
+)
+def test_iter_items__prefix(prefix, exp):
+    assert items(DATA, prefix) == exp
+
+
+@pytest.mark.parametrize('obj', (1, 'a', None))
+def test_iter_items__primitive(obj):
+    assert items(obj) == items(obj, ()) == [((), obj)]
+
+
+def test_iter_items__container():
+    res = items(DATA, ('a', ), collections.OrderedDict)
+    assert isinstance(res[1][1], collections.OrderedDict)
+
+# vim:sw=4:ts=4:et:
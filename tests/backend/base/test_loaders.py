@@ -2,7 +2,9 @@
 # Copyright (C) 2021 Satoru SATOH <satoru.satoh@gmail.com>
 # License: MIT
 #
-# pylint: disable=missing-docstring, invalid-name
+# pylint: disable=missing-docstring, invalid-name, protected-access
+import pathlib
+import tempfile
 import unittest
 
 import anyconfig.backend.base.loaders as TT
@@ -18,6 +20,75 @@ class LoaderMixinTestCase(unittest.TestCase):
             self.assertEqual(fio.mode, 'r')
 
 
+class BufferLoader(TT.LoaderMixin):
+    _allow_buffer = True
+
+    def load_from_buffer(self, buf, container, **kwargs):
+        return container(content=buf.tobytes(), **kwargs)
+
+    def load_from_path(self, filepath, container, **kwargs):
+        return container(path=filepath, **kwargs)
+
+
+class LoaderMixinBufferTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.psr = BufferLoader()
+
+    def test_load_from_buffer__not_implemented(self):
+        with self.assertRaises(NotImplementedError):
+            TT.LoaderMixin().load_from_buffer(memoryview(b''), dict)
+
+    def test_load_from_mmap(self):
+        with tempfile.TemporaryDirectory() as tdir:
+            path = pathlib.Path(tdir) / 'a.dat'
+            path.write_bytes(b'abc')
+            res = self.psr.load_from_mmap(str(path), dict, x=1)
+            self.assertEqual(res, dict(content=b'abc', x=1))
+
+    def test_load_from_mmap__empty(self):
+        with tempfile.TemporaryDirectory() as tdir:
+            path = pathlib.Path(tdir) / 'a.dat'
+            path.write_bytes(b'')
+            self.assertEqual(self.psr.load_from_mmap(str(path), dict),
+                             dict(path=str(path)))
+
+    def test_decode_buffer(self):
+        self.assertEqual(self.psr.decode_buffer(memoryview(b'abc')), 'abc')
+
+    def test_use_mmap(self):
+        self.assertFalse(TT.LoaderMixin()._use_mmap(FILE_PATH, True))
+        self.assertFalse(self.psr._use_mmap(FILE_PATH))
+        self.assertFalse(self.psr._use_mmap(FILE_PATH, False))
+        self.assertTrue(self.psr._use_mmap(FILE_PATH, True))
+
+    def test_use_mmap__large_file(self):
+        with tempfile.TemporaryDirectory() as tdir:
+            path = pathlib.Path(tdir) / 'a.dat'
+            path.write_bytes(b'0' * TT.MMAP_THRESHOLD)
+            self.assertTrue(self.psr._use_mmap(str(path)))
+            self.assertFalse(self.psr._use_mmap(str(path), False))
+
+
+class MergeDocsTestCase(unittest.TestCase):
+
+    def test_merge_docs(self):
+        docs = [{'a': 1, 'b': {'c': 1}}, {'b': {'d': 2}}]
+        self.assertEqual(TT.merge_docs(iter(docs), dict),
+                         {'a': 1, 'b': {'c': 1, 'd': 2}})
+
+    def test_merge_docs__strategy(self):
+        docs = [{'a': 1, 'b': {'c': 1}}, {'b': {'d': 2}}]
+        self.assertEqual(TT.merge_docs(docs, dict, ac_merge='replace'),
+                         {'a': 1, 'b': {'d': 2}})
+
+    def test_merge_docs__primitives(self):
+        self.assertEqual(TT.merge_docs([{'a': 1}, [1], 2], dict), 2)
+
+    def test_merge_docs__empty(self):
+        self.assertEqual(TT.merge_docs([], dict), {})
+
+
 class BinaryLoaderMixinTestCase(unittest.TestCase):
 
     def test_ropen(self):
@@ -3,6 +3,8 @@
 # License: MIT
 #
 # pylint: disable=missing-docstring, invalid-name
+import collections
+import json
 import pathlib
 import unittest
 
@@ -35,4 +37,29 @@ class TestCase(unittest.TestCase):
         self.assertEqual(cnf, MZERO)
         self.assertTrue(isinstance(cnf, type(MZERO)))
 
+
+class LoadWithFnTestCase(unittest.TestCase):
+
+    def test_10_constructed_in_place(self):
+        ret = collections.OrderedDict(a=1)
+        res = TT.load_with_fn(lambda *_a, **_kw: ret, '',
+                              collections.OrderedDict)
+        self.assertTrue(res is ret)
+
+    def test_12_constructed_in_place__empty(self):
+        ret = {}
+        res = TT.load_with_fn(lambda *_a, **_kw: ret, '', dict)
+        self.assertTrue(res is ret)
+
+    def test_20_rewrapped(self):
+        res = TT.load_with_fn(json.loads, '{"a": 1}', collections.OrderedDict)
+        self.assertEqual(res, collections.OrderedDict(a=1))
+        self.assertTrue(isinstance(res, collections.OrderedDict))
+
+    def test_22_rewrapped__subclass(self):
+        ret = collections.OrderedDict(a=1)
+        res = TT.load_with_fn(lambda *_a, **_kw: ret, '', dict)
+        self.assertFalse(res is ret)
+        self.assertTrue(type(res) is dict)  # noqa: E721
+
 # vim:sw=4:ts=4:et:
@@ -0,0 +1,61 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring,redefined-outer-name
+"""Test cases for the JSON Lines dumper."""
+import io
+
+import pytest
+
+import anyconfig.backend.json.lines as TT
+import anyconfig.ioinfo
+
+
+@pytest.fixture
+def psr():
+    return TT.Parser()
+
+
+@pytest.mark.parametrize(
+    ('data', 'exp'),
+    (([{'a': 1}, [2], None], '{"a": 1}\n[2]\nnull\n'),
+     ({'a': 1}, '{"a": 1}\n'),
+     ('a', '"a"\n'),
+     ([], ''),
+     ),
+)
+def test_dumps(psr, data, exp):
+    assert psr.dumps(data) == exp
+
+
+def test_dumps__ignore_indent(psr):
+    assert psr.dumps([{'a': [1]}], indent=2, sort_keys=True) == \
+        '{"a": [1]}\n'
+
+
+def test_dump__records_generated(psr, tmp_path):
+    def gen():
+        for idx in range(3):
+            yield {'a': idx}
+
+    path = tmp_path / 'a.ndjson'
+    psr.dump(gen(), anyconfig.ioinfo.make(path))
+    assert psr.load(anyconfig.ioinfo.make(path)) == \
+        [{'a': 0}, {'a': 1}, {'a': 2}]
+
+
+def test_dump_to_stream__one_by_one(psr):
+    class Stream(io.StringIO):
+        sizes = []
+
+        def write(self, s):
+            self.sizes.append(len(s))
+            return super().write(s)
+
+    strm = Stream()
+    psr.dump(({'a': i} for i in range(3)), anyconfig.ioinfo.make(strm))
+    assert strm.getvalue() == '{"a": 0}\n{"a": 1}\n{"a": 2}\n'
+    assert max(strm.sizes) == len('{"a": 0}')
+
+# vim:sw=4:ts=4:et:
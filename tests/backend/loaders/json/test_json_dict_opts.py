@@ -0,0 +1,35 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring,protected-access
+"""Test cases for the dict factory options of JSON loaders."""
+import collections
+
+import pytest
+
+import anyconfig.backend.json.stdlib as TT
+
+
+@pytest.fixture
+def psr():
+    return TT.Parser()
+
+
+def test_load_options__dict(psr):
+    assert psr._load_options(dict, parse_int=int) == {"parse_int": int}
+
+
+def test_load_options__other_container(psr):
+    container = collections.OrderedDict
+    opts = psr._load_options(container)
+    assert opts["object_pairs_hook"] is container
+
+
+@pytest.mark.parametrize("container", (dict, collections.OrderedDict))
+def test_loads__constructed_in_place(psr, container):
+    cnf = psr.loads('{"a": {"b": 1}}', ac_dict=container)
+    assert type(cnf) is container  # noqa: E721
+    assert type(cnf["a"]) is container  # noqa: E721
+
+# vim:sw=4:ts=4:et:
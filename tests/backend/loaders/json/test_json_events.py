@@ -0,0 +1,72 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring
+import io
+import json
+import math
+
+import pytest
+
+import anyconfig.backend.base.events
+import anyconfig.backend.json.events as TT
+
+
+DATA = (
+    {'a': [1, 2.5, -3e2, None, True, False, 'x"y\\u00e9あ', {}, []],
+     'b': {'c': {'d': 'long' * 50}}},
+    [], {}, 0, -1.5e-3, 's', [[[]]], {'k': ''},
+)
+
+
+def load(stream, chunk_size=TT.CHUNK_SIZE):
+    events = TT.iterparse(stream, chunk_size)
+    return anyconfig.backend.base.events.build(next(events), events)
+
+
+@pytest.mark.parametrize('obj', DATA)
+@pytest.mark.parametrize('chunk_size', (1, 3, 7, TT.CHUNK_SIZE))
+@pytest.mark.parametrize('encoding', (None, 'utf-8', 'utf-16'))
+def test_iterparse(obj, chunk_size, encoding):
+    content = json.dumps(obj, ensure_ascii=False, indent=1)
+    stream = io.StringIO(content) if encoding is None else \
+        io.BytesIO(content.encode(encoding))
+    assert load(stream, chunk_size) == obj
+
+
+def test_iterparse__literals():
+    res = load(io.StringIO('[NaN, Infinity, -Infinity]'), 2)
+    assert math.isnan(res[0])
+    assert res[1:] == [float('inf'), float('-inf')]
+
+
+@pytest.mark.parametrize(
+    'content',
+    ('', '{"a" 1}', '[1,]', '{', '[1 2]', '1 2', '{"a": tru}', '["abc',
+     '{"a": 1,}', '{1: 2}', ']', '[1}', '{"a": 1]', '@'),
+)
+def test_iterparse__errors(content):
+    with pytest.raises(json.JSONDecodeError):
+        list(TT.iterparse(io.StringIO(content), 2))
+
+
+@pytest.mark.parametrize(
+    ('content', 'pos'),
+    (('[1, 2, 3, @]', 10), ('[1, 2, 3, 4}', 11), ('[1, 2, 3', 8),
+     ('[1, 2, "abc', 7), ('[1, 2, tru]', 7)),
+)
+def test_iterparse__error_positions(content, pos):
+    with pytest.raises(json.JSONDecodeError) as exc:
+        list(TT.iterparse(io.StringIO(content), 2))
+
+    assert exc.value.pos == pos
+
+
+def test_tokenize():
+    assert list(TT.tokenize(io.StringIO('{"a": [1]}'), 2)) == [
+        ('{', None, 0), ('s', 'a', 1), (':', None, 4), ('[', None, 6),
+        ('v', 1, 7), (']', None, 8), ('}', None, 9)
+    ]
+
+# vim:sw=4:ts=4:et:
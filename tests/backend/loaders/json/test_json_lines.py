@@ -0,0 +1,169 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring,redefined-outer-name
+"""Test cases for the JSON Lines loader."""
+import collections
+import concurrent.futures
+import io
+import json
+
+import pytest
+
+import anyconfig.backend.json.lines as TT
+import anyconfig.ioinfo
+
+
+RECORDS = [{'a': i, 'b': {'c': [i, 'x y']}} for i in range(20)]
+CONTENT = ''.join(json.dumps(r) + '\n' for r in RECORDS)
+
+
+@pytest.fixture
+def psr():
+    return TT.Parser()
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / 'a.jsonl'
+    path.write_text(CONTENT, encoding='utf-8')
+    return path
+
+
+def test_loads(psr):
+    assert psr.loads(CONTENT) == RECORDS
+
+
+def test_loads__blank_lines_and_primitives(psr):
+    assert psr.loads('1\n\n  \n"a"\r\n[null]') == [1, 'a', [None]]
+
+
+@pytest.mark.parametrize('content', ('', '\n'))
+def test_loads__no_records(psr, content):
+    assert psr.loads(content) == []
+
+
+def test_loads__ordered(psr):
+    res = psr.loads('{"b": 1, "a": 2}\n', ac_ordered=True)
+    assert isinstance(res[0], collections.OrderedDict)
+    assert list(res[0]) == ['b', 'a']
+
+
+def test_loads__error(psr):
+    with pytest.raises(json.JSONDecodeError):
+        psr.loads('{"a": 1}\n{"a": \n')
+
+
+def test_load(psr, path):
+    assert psr.load(anyconfig.ioinfo.make(path)) == RECORDS
+
+
+def test_load__empty_file(psr, tmp_path):
+    path = tmp_path / 'e.jsonl'
+    path.write_text('')
+    assert psr.load(anyconfig.ioinfo.make(path)) == []
+
+
+def test_load__ignore_missing(psr, tmp_path):
+    ioi = anyconfig.ioinfo.make(tmp_path / 'not_exist.jsonl')
+    assert psr.load(ioi, ac_ignore_missing=True) == []
+
+
+def test_load__stream(psr):
+    ioi = anyconfig.ioinfo.make(io.StringIO(CONTENT))
+    assert psr.load(ioi) == RECORDS
+
+
+def test_split_file(path):
+    ranges = TT.split_file(str(path), 100)
+    assert len(ranges) > 1
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(CONTENT.encode('utf-8'))
+    assert all(r1[1] == r2[0] for r1, r2 in zip(ranges, ranges[1:]))
+
+    lines = CONTENT.encode('utf-8').splitlines(keepends=True)
+    offsets = {sum(len(x) for x in lines[:i]) for i in range(len(lines) + 1)}
+    assert all(start in offsets for start, _end in ranges)
+
+
+@pytest.mark.parametrize('workers', (2, True))
+def test_load__in_parallel(psr, path, monkeypatch, workers):
+    monkeypatch.setattr(TT, 'MIN_CHUNK_SIZE', 100)
+    monkeypatch.setattr(TT.os, 'cpu_count', lambda: 2)
+    ioi = anyconfig.ioinfo.make(path)
+
+    assert psr.load(ioi, ac_jsonl_workers=workers) == RECORDS
+
+    res = psr.load(ioi, ac_jsonl_workers=workers, ac_ordered=True)
+    assert res == RECORDS
+    assert all(isinstance(r, collections.OrderedDict) for r in res)
+
+
+def test_load__in_parallel_with_executor(psr, path, monkeypatch):
+    monkeypatch.setattr(TT, 'MIN_CHUNK_SIZE', 100)
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        res = psr.load(anyconfig.ioinfo.make(path), ac_jsonl_workers=executor)
+
+    assert res == RECORDS
+
+
+def test_load__not_in_parallel(psr, path, monkeypatch):
+    def _fail(*_args, **_kwargs):
+        raise AssertionError('It must not be called')
+
+    monkeypatch.setattr(TT, '_load_chunk', _fail)
+    monkeypatch.setattr(TT, 'MIN_CHUNK_SIZE', 100)
+    ioi = anyconfig.ioinfo.make(path)
+
+    assert psr.load(ioi) == RECORDS  # It's opt-in.
+    assert psr.load(ioi, ac_jsonl_workers=False) == RECORDS
+    assert psr.load(ioi, ac_jsonl_workers=1) == RECORDS
+
+    # Options cannot be passed to other processes.
+    res = psr.load(ioi, ac_jsonl_workers=2,
+                   ac_dict=lambda *args: dict(*args))
+    assert res == RECORDS
+
+
+def test_load__in_parallel_empty_file(psr, tmp_path):
+    path = tmp_path / 'e.jsonl'
+    path.write_text('')
+    assert psr.load(anyconfig.ioinfo.make(path), ac_jsonl_workers=2) == []
+
+
+def test_iterload__records(psr):
+    ioi = anyconfig.ioinfo.make(io.StringIO(CONTENT))
+    items = psr.iterload(ioi, prefix='')
+    assert next(items) == ((0, ), RECORDS[0])
+    assert list(items) == [((i, ), r) for i, r in enumerate(RECORDS)][1:]
+
+
+def test_iterload__lazily(psr):
+    ioi = anyconfig.ioinfo.make(io.StringIO('{"a": 1}\n{"a": \n'))
+    items = psr.iterload(ioi, prefix=())
+    assert next(items) == ((0, ), {'a': 1})
+    with pytest.raises(json.JSONDecodeError):
+        next(items)
+
+
+@pytest.mark.parametrize(
+    ('prefix', 'exp'),
+    ((None, [((0, 'a'), 1), ((0, 'b'), {}), ((1, ), [])]),
+     ('/*/a', [((0, 'a'), 1)]),
+     ('/1', []),
+     ('/0/a', [((0, 'a'), 1)]),
+     ),
+)
+def test_iterload__prefix(psr, prefix, exp):
+    ioi = anyconfig.ioinfo.make(io.StringIO('{"a": 1, "b": {}}\n[]\n'))
+    assert list(psr.iterload(ioi, prefix=prefix)) == exp
+
+
+def test_iterload__empty(psr):
+    ioi = anyconfig.ioinfo.make(io.StringIO(''))
+    assert list(psr.iterload(ioi)) == [((), [])]
+    assert not list(psr.iterload(anyconfig.ioinfo.make(io.StringIO('')),
+                                 prefix=''))
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,40 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring,redefined-outer-name
+"""Test cases to load JSON data from memory-mapped buffers."""
+import json
+
+import pytest
+
+import anyconfig.backend.json.stdlib as TT
+import anyconfig.ioinfo
+
+
+@pytest.fixture
+def psr():
+    return TT.Parser()
+
+
+def test_load__mmap(psr, tmp_path):
+    path = tmp_path / 'a.json'
+    path.write_text('{"a": "あ"}', encoding='utf-8')
+    ioi = anyconfig.ioinfo.make(path)
+
+    assert psr.load(ioi, ac_mmap=True) == psr.load(ioi, ac_mmap=False)
+
+
+@pytest.mark.parametrize(
+    'content', (b'', b'\xef\xbb\xbf{"a": 1}'), ids=('empty', 'bom'),
+)
+def test_load__mmap_same_errors(psr, tmp_path, content):
+    path = tmp_path / 'a.json'
+    path.write_bytes(content)
+    ioi = anyconfig.ioinfo.make(path)
+
+    for ac_mmap in (False, True):
+        with pytest.raises(json.JSONDecodeError):
+            psr.load(ioi, ac_mmap=ac_mmap)
+
+# vim:sw=4:ts=4:et:
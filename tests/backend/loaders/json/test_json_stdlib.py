@@ -48,3 +48,11 @@ class TestCase(tests.common.loader.TestCase):
         self, ipath: pathlib.Path, aux: typing.Dict[str, typing.Any]
     ):
         self._assert_load(ipath, aux)
+
+    @pytest.mark.parametrize(
+        ("ipath", "aux"), DATA, ids=DATA_IDS,
+    )
+    def test_load_mmap(
+        self, ipath: pathlib.Path, aux: typing.Dict[str, typing.Any]
+    ):
+        self._assert_load_mmap(ipath, aux)
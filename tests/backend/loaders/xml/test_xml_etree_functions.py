@@ -46,6 +46,16 @@ class Test_00(unittest.TestCase):
         xmlfile = io.StringIO(XML_WITH_NS_0)
         self.assertEqual(TT._namespaces_from_file(xmlfile), ref)
 
+    def test_12__parse_buffer(self):
+        ref = {"http://example.com/ns/config": '',
+               "http://example.com/ns/config/val": "val"}
+        buf = memoryview(to_bytes(XML_WITH_NS_0))
+        for chunk_size in (3, len(buf)):
+            (root, nspaces) = TT._parse_buffer(buf, chunk_size=chunk_size)
+            self.assertEqual(nspaces, ref)
+            self.assertEqual(root.tag, "{http://example.com/ns/config}a")
+            self.assertEqual(len(root), 2)
+
     def test_20__process_elem_text__whitespaces(self):
         (elem, dic, subdic) = (TT.ET.XML("<a> </a>"), {}, {})
         TT._process_elem_text(elem, dic, subdic)
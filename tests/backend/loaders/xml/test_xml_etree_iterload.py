@@ -0,0 +1,71 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring
+import io
+
+import pytest
+
+import anyconfig.backend.xml.etree as TT
+
+
+CONTENT = b"""\
+<config xmlns:v="urn:v">
+  <items>
+    <item id="1">A</item>
+    <item><n>B</n><m/></item>
+  </items>
+  <v:x>1</v:x>
+</config>
+"""
+
+
+def test_iterload__leaves():
+    assert list(TT.iterload(io.BytesIO(CONTENT))) == [
+        (('config', 'items', 'item', '@attrs', 'id'), '1'),
+        (('config', 'items', 'item', '@text'), 'A'),
+        (('config', 'items', 'item', 'n'), 'B'),
+        (('config', 'items', 'item', 'm'), None),
+        (('config', 'v:x'), '1'),
+    ]
+
+
+def test_iterload__leaves_with_options():
+    res = list(TT.iterload(io.BytesIO(CONTENT), ac_parse_value=True,
+                           tags={'attrs': '_a'}))
+    assert res[0] == (('config', 'items', 'item', '_a', 'id'), 1)
+    assert res[-1] == (('config', 'v:x'), 1)
+
+
+@pytest.mark.parametrize(
+    ('prefix', 'exp'),
+    ((('config', 'items'),
+      [(('config', 'items', 'item'),
+        {'item': {'@text': 'A', '@attrs': {'id': '1'}}}),
+       (('config', 'items', 'item'), {'item': {'n': 'B', 'm': None}})]),
+     (('*', 'items'),
+      [(('config', 'items', 'item'),
+        {'item': {'@text': 'A', '@attrs': {'id': '1'}}}),
+       (('config', 'items', 'item'), {'item': {'n': 'B', 'm': None}})]),
+     (('config', ),
+      [(('config', 'items'),
+        {'items': [{'item': {'@text': 'A', '@attrs': {'id': '1'}}},
+                   {'item': {'n': 'B', 'm': None}}]}),
+       (('config', 'v:x'), {'v:x': '1'})]),
+     (('x', ), []),
+     ),
+)
+def test_iterload__prefix(prefix, exp):
+    assert list(TT.iterload(io.BytesIO(CONTENT), prefix=prefix)) == exp
+
+
+def test_iterload__elements_are_cleared():
+    items = TT.iterload(io.BytesIO(CONTENT), prefix=('config', 'items'))
+    next(items)
+    next(items)
+    # pylint: disable=protected-access
+    root = items.gi_frame.f_locals['stack'][0][0]
+    assert len(root.find('items')) == 1  # Only the one yielded last.
+
+# vim:sw=4:ts=4:et:
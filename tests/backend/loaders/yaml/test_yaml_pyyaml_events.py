@@ -0,0 +1,56 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring
+import io
+
+import pytest
+
+import anyconfig.backend.base.events
+
+try:
+    import yaml
+    import anyconfig.backend.yaml.pyyaml as TT
+except ImportError:
+    pytest.skip("skipping tests as yaml is not available.",
+                allow_module_level=True)
+
+
+CONTENT = """\
+a: 1
+b: [x, 2.5, null, true, {c: d}]
+e: {}
+f:
+  - []
+  - g: h
+"1": 2
+3: 4
+"""
+
+
+def test_yml_iterparse():
+    events = TT.yml_iterparse(io.StringIO(CONTENT))
+    res = anyconfig.backend.base.events.build(next(events), events)
+    assert res == yaml.safe_load(CONTENT)
+
+
+def test_yml_iterparse__first_document_only():
+    events = list(TT.yml_iterparse(io.StringIO('--- 1\n--- 2\n')))
+    assert events == [(anyconfig.backend.base.events.VALUE, 1)]
+
+
+@pytest.mark.parametrize(
+    'content', ('a: &x 1\nb: *x\n', '? [a]\n: 1\n', '? {a: b}\n: 1\n'),
+)
+def test_yml_iterparse__errors(content):
+    with pytest.raises(ValueError):
+        list(TT.yml_iterparse(io.StringIO(content)))
+
+
+def test_iterload_from_stream():
+    res = list(TT.Parser().iterload_from_stream(io.StringIO(CONTENT), dict,
+                                                ('f', )))
+    assert res == [(('f', 0), []), (('f', 1), {'g': 'h'})]
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,46 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring
+"""Test cases for anyconfig.backend.
+"""
+import pytest
+
+import anyconfig.backend as TT
+
+
+@pytest.mark.parametrize(
+    'lazy', TT.LAZY_PARSERS, ids=[p.cid() for p in TT.LAZY_PARSERS],
+)
+def test_parsers_metadata(lazy):
+    pcls = lazy.load()
+    assert lazy.cid() == pcls.cid()
+    assert lazy.type() == pcls.type()
+    assert lazy.priority() == pcls.priority()
+    assert lazy.extensions() == pcls.extensions()
+
+
+def test_lazy_parsers_are_subset_of_builtin_parsers():
+    assert TT.LAZY_PARSERS
+    assert all(p in TT.BUILTIN_PARSERS for p in TT.LAZY_PARSERS)
+
+
+def test_parsers_are_parser_classes():
+    assert [p.cid() for p in TT.PARSERS] == [
+        p.cid() for p in TT.LAZY_PARSERS
+    ]
+    assert all(isinstance(p, type) and p.cid() for p in TT.PARSERS)
+
+
+@pytest.mark.parametrize(
+    'package', ('json', 'yaml', 'toml'),
+)
+def test_parsers_of_subpackages(package):
+    mod = getattr(__import__(f'anyconfig.backend.{package}'), 'backend')
+    psrs = getattr(mod, package).PARSERS
+    assert [p.cid() for p in psrs] == [
+        p.cid() for p in TT.LAZY_PARSERS if p.type() == package
+    ]
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,9 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Micro benchmarks.
+
+These are not test cases collected by pytest. Run each of them as a module,
+e.g. ``PYTHONPATH=src python -m tests.benchmarks.bench_parsers``.
+"""
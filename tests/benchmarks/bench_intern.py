@@ -0,0 +1,84 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Compare RSS to keep many similar configs loaded w/ and w/o interning.
+
+Each case runs in a fresh process to measure the RSS increased by loading
+the files and keeping the data loaded in memory.
+"""
+import gc
+import multiprocessing
+import os
+import pathlib
+import resource
+import tempfile
+
+import anyconfig
+
+
+def make_tenant(idx: int, size: int = 50) -> dict:
+    """Make a config of a tenant shares keys and many values with others."""
+    return {
+        'tenant': f'tenant_{idx}',
+        'services': {
+            f'service_{i}': {'enabled': True, 'region': 'us-east-1',
+                             'endpoint': f'https://svc{i}.example.com/api',
+                             'replicas': 3, 'owner': f'team-{idx % 10}',
+                             'limits': {'cpu': '500m', 'memory': '1Gi'}}
+            for i in range(size)
+        },
+    }
+
+
+def get_rss() -> int:
+    """Get the current RSS of this process in bytes."""
+    try:
+        with open('/proc/self/statm', encoding='utf-8') as inp:
+            return int(inp.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:  # Not linux; use the peak RSS instead.
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def load_all(args) -> int:
+    """Load all files and get the RSS increased to keep the data."""
+    (paths, options) = args
+    anyconfig.load(paths[0])  # Import the backend module before measuring.
+    gc.collect()
+    rss = get_rss()
+    data = [anyconfig.load(path, **options) for path in paths]
+    gc.collect()
+    res = get_rss() - rss
+    del data
+    return res
+
+
+def main(ntenants: int = 1000) -> None:
+    """Entrypoint."""
+    ctx = multiprocessing.get_context('spawn')
+    exts = ['json'] + (['yml'] if 'yaml' in anyconfig.list_types() else [])
+    cases = (('no interning', {}),
+             ('ac_intern', {'ac_intern': True}),
+             ('ac_intern (shared)', {'ac_intern': anyconfig.Interner()}),
+             ('ac_intern (shared) + ac_intern_values',
+              {'ac_intern': anyconfig.Interner(), 'ac_intern_values': True}))
+
+    with tempfile.TemporaryDirectory() as tdir:
+        print(f'# RSS increased to keep {ntenants} similar configs')
+        for ext in exts:
+            paths = [str(pathlib.Path(tdir) / f'{i}.{ext}')
+                     for i in range(ntenants)]
+            for idx, path in enumerate(paths):
+                anyconfig.dump(make_tenant(idx), path)
+
+            for name, options in cases:
+                with ctx.Pool(1) as pool:
+                    rss = pool.apply(load_all, ((paths, options), ))
+                print(f'{ext + ": " + name:<40s} {rss / 1024 / 1024:12.2f} '
+                      'MiB')
+
+
+if __name__ == '__main__':
+    main()
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,50 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Compare the cost to load wide top-level documents with and without copies.
+
+Run as ``python -m tests.benchmarks.bench_load_with_fn``.
+"""
+import collections
+import json
+
+import anyconfig.backend.json.stdlib
+
+from .common import measure, report
+
+
+def make_content(width: int) -> str:
+    """Make a JSON document has ``width`` keys at the top level."""
+    return json.dumps({f'key_{i}': i for i in range(width)})
+
+
+def rewrap(content: str, container):
+    """Emulate the old behavior re-wrapping the result loaded always."""
+    return container(json.loads(content, object_pairs_hook=container))
+
+
+def main(number: int = 10, width: int = 100000) -> None:
+    """Entrypoint."""
+    content = make_content(width)
+    psr = anyconfig.backend.json.stdlib.Parser()
+    odict = collections.OrderedDict
+
+    report(
+        f'Per-call cost to load a JSON document has {width} top-level keys',
+        [('old: hook + re-wrap (dict)',
+          measure(lambda: rewrap(content, dict), number)),
+         ('new: loads (dict)',
+          measure(lambda: psr.loads(content), number)),
+         ('old: hook + re-wrap (OrderedDict)',
+          measure(lambda: rewrap(content, odict), number)),
+         ('new: loads (OrderedDict)',
+          measure(lambda: psr.loads(content, ac_dict=odict), number)),
+         ]
+    )
+
+
+if __name__ == '__main__':
+    main()
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,124 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Compare the cost to merge wide and deep trees with each merge strategy.
+
+Merging the same data again and again into a target is idempotent with any
+strategies, so that the target is not re-created on every call.
+
+'lists (linear scan)' emulates the old behavior to merge lists, that is, it
+tests the membership of items by scanning the list linearly. 'merge and patch
+by hand' emulates the way to use different strategies per path without merge
+rules, that is, merge everything and then fix up some paths.
+"""
+import copy
+
+import anyconfig.dicts
+
+from .common import measure, report
+
+
+def make_wide(size: int = 100000) -> dict:
+    """Make a flat but wide data."""
+    return {f'key_{i}': i for i in range(size)}
+
+
+def make_deep(depth: int = 10, fanout: int = 3) -> dict:
+    """Make a deep tree of which nodes have ``fanout`` children."""
+    if depth <= 0:
+        return {'value': 0, 'tags': ['a', 'b']}
+
+    return {f'node_{i}': make_deep(depth - 1, fanout) for i in range(fanout)}
+
+
+def main(number: int = 5, size: int = 100000, depth: int = 10,
+         nitems: int = 20000) -> None:
+    """Entrypoint."""
+    for name, factory in (('wide', lambda: make_wide(size)),
+                          ('deep', lambda: make_deep(depth))):
+        results = []
+        for strategy in anyconfig.dicts.MERGE_STRATEGIES:
+            (self, other) = (factory(), factory())
+            results.append(
+                (strategy,
+                 measure(lambda s=self, o=other, ms=strategy:
+                         anyconfig.dicts.merge(s, o, ac_merge=ms),
+                         number))
+            )
+        report(f'Per-call cost to merge {name} trees', results)
+
+    bench_lists(number, nitems)
+    bench_rules(number, size // 10)
+
+
+def bench_lists(number: int = 5, nitems: int = 20000) -> None:
+    """Compare the cost to merge lists of hostnames and container specs."""
+    hosts = [f'host-{i}.example.com' for i in range(nitems)]
+    (self, other) = ({'hosts': hosts[::2]}, {'hosts': hosts[1::2]})
+    specs = [{'name': f'c{i}', 'image': 'nginx', 'ports': [80]}
+             for i in range(nitems // 10)]
+    ospecs = {'specs': copy.deepcopy(specs)}
+
+    def merge_lists_linearly():
+        dst = self['hosts'].copy()
+        dst += [x for x in other['hosts'] if x not in dst]
+
+    report(
+        f'Per-call cost to merge lists of {nitems // 2} items',
+        [('lists (linear scan)', measure(merge_lists_linearly, 1, repeat=1)),
+         ('lists (indexed)',
+          measure(lambda: anyconfig.dicts.merge(
+              {'hosts': self['hosts'].copy()}, other,
+              ac_merge=anyconfig.dicts.MS_DICTS_AND_LISTS), number)),
+         (f'lists of {len(specs)} dicts by name',
+          measure(lambda: anyconfig.dicts.merge(
+              {'specs': specs}, ospecs,
+              ac_merge=anyconfig.dicts.MS_DICTS_AND_LISTS,
+              merge_lists_by='name'), number)),
+         ]
+    )
+
+
+def make_sections(size: int = 10000) -> dict:
+    """Make a data has sections need different strategies to merge."""
+    return {
+        'secrets': {f's{i}': {'key': f'k{i}'} for i in range(size)},
+        'plugins': [{'name': f'p{i}', 'opts': [i]} for i in range(size)],
+        'defaults': {f'd{i}': i for i in range(size)},
+        'others': make_deep(6),
+    }
+
+
+def bench_rules(number: int = 5, size: int = 10000) -> None:
+    """Compare the cost to merge with different strategies per path."""
+    (self, other) = (make_sections(size), make_sections(size))
+    rules = anyconfig.dicts.MergeRules(
+        {'secrets/*': anyconfig.dicts.MS_REPLACE,
+         'plugins': anyconfig.dicts.MS_DICTS_AND_LISTS,
+         'defaults': anyconfig.dicts.MS_NO_REPLACE}
+    )
+
+    def merge_and_patch():
+        defaults = copy.deepcopy(self['defaults'])
+        anyconfig.dicts.merge(self, other)
+        for key, val in other['secrets'].items():
+            self['secrets'][key] = val
+        anyconfig.dicts.merge(self, {'plugins': other['plugins']},
+                              ac_merge=anyconfig.dicts.MS_DICTS_AND_LISTS)
+        self['defaults'] = defaults
+
+    report(
+        f'Per-call cost to merge trees with {size} items per section',
+        [('merge and patch by hand', measure(merge_and_patch, number)),
+         ('merge rules',
+          measure(lambda: anyconfig.dicts.merge(self, other, ac_merge=rules),
+                  number)),
+         ]
+    )
+
+
+if __name__ == '__main__':
+    main()
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,44 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Compare the cost to find parsers w/ and w/o re-building the registry.
+
+'rebuilt' emulates the old behavior, that the registry of parsers was re-built
+and entry points were scanned on every lookup.
+"""
+import anyconfig
+import anyconfig.parsers.parsers
+
+from .common import measure, report
+
+
+def main(number: int = 1000) -> None:
+    """Entrypoint."""
+    psrs = anyconfig.parsers.parsers.Parsers()
+
+    def find_rebuilt():
+        psrs.reset()
+        return psrs.find(None, forced_type='json')
+
+    def loads_rebuilt():
+        psrs.reset()
+        return anyconfig.loads('{"a": 1}', ac_parser='json')
+
+    report(
+        'Per-call cost to find a parser',
+        [('find (rebuilt)', measure(find_rebuilt, number)),
+         ('find (cached)',
+          measure(lambda: anyconfig.find(None, forced_type='json'), number)),
+         ('loads (rebuilt)', measure(loads_rebuilt, number)),
+         ('loads (cached)',
+          measure(lambda: anyconfig.loads('{"a": 1}', ac_parser='json'),
+                  number)),
+         ]
+    )
+
+
+if __name__ == '__main__':
+    main()
+
+# vim:sw=4:ts=4:et:
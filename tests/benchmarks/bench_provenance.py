@@ -0,0 +1,73 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Compare the cost to merge many overlays w/ and w/o provenance."""
+import copy
+import random
+import tracemalloc
+
+import anyconfig.dicts
+
+from .common import measure, report
+
+
+def make_base(size: int = 100000, width: int = 10) -> dict:
+    """Make a base data has ``size`` x ``width`` leaves."""
+    return {f's{i}': {f'k{j}': j for j in range(width)} for i in range(size)}
+
+
+def make_overlays(size: int, width: int = 10, noverlays: int = 300,
+                  nleaves: int = 100) -> list:
+    """Make overlays update ``nleaves`` leaves of the base data each."""
+    rand = random.Random(0)
+    return [
+        {f's{rand.randrange(size)}': {f'k{rand.randrange(width)}': -1}
+         for _ in range(nleaves)}
+        for _ in range(noverlays)
+    ]
+
+
+def merge_all(base: dict, overlays: list, prov=None) -> dict:
+    """Merge overlays into a copy of the base data."""
+    data = copy.copy(base)  # Nested dicts are updated but it's idempotent.
+    if prov is not None:
+        prov.add_source('base')
+    for idx, overlay in enumerate(overlays):
+        if prov is None:
+            anyconfig.dicts.merge(data, overlay)
+        else:
+            prov.add_source(f'overlay-{idx}')
+            anyconfig.dicts.merge(data, overlay, ac_provenance=prov)
+
+    return data
+
+
+def main(number: int = 5, size: int = 100000, noverlays: int = 300) -> None:
+    """Entrypoint."""
+    (base, overlays) = (make_base(size),
+                        make_overlays(size, noverlays=noverlays))
+    report(
+        f'Per-call cost to merge {noverlays} overlays into {size * 10} leaves',
+        [('w/o provenance', measure(lambda: merge_all(base, overlays),
+                                    number)),
+         ('w/ provenance',
+          measure(lambda: merge_all(base, overlays,
+                                    anyconfig.dicts.Provenance()), number)),
+         ]
+    )
+
+    tracemalloc.start()
+    prov = anyconfig.dicts.Provenance()
+    merge_all(base, overlays, prov)
+    size_ = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f'{"leaves of the data":<40s} {size * 10:12d}')
+    print(f'{"entries of the table":<40s} {len(prov):12d}')
+    print(f'{"memory of the table":<40s} {size_ / 1024 / 1024:12.2f} MiB')
+
+
+if __name__ == '__main__':
+    main()
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,24 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Common utility functions for micro benchmarks."""
+import timeit
+import typing
+
+
+def measure(fn: typing.Callable[[], typing.Any], number: int = 1000,
+            repeat: int = 5) -> float:
+    """Measure the best per-call cost of ``fn`` in micro seconds."""
+    timer = timeit.Timer(fn)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def report(title: str, results: typing.Iterable[typing.Tuple[str, float]]
+           ) -> None:
+    """Print out the results of a benchmark."""
+    print(f'# {title}')
+    for name, usec in results:
+        print(f'{name:<40s} {usec:12.2f} usec/call')
+
+# vim:sw=4:ts=4:et:
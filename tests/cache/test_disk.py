@@ -0,0 +1,180 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring,redefined-outer-name
+import os
+import pathlib
+import time
+
+import pytest
+
+import anyconfig.cache.disk as TT
+
+
+STAMP = (1, 2, 3, 4)
+
+
+@pytest.fixture
+def src(tmp_path):
+    path = tmp_path / 'a.yml'
+    path.write_text('a: 1\n')
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return TT.DiskCache(tmp_path / 'cache')
+
+
+def _key(path, options=()):
+    return (str(path), 'yaml.pyyaml', options)
+
+
+def test_get_default_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv(TT.CACHE_DIR_ENV, str(tmp_path))
+    assert TT.get_default_cache_dir() == tmp_path
+
+    monkeypatch.delenv(TT.CACHE_DIR_ENV)
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    assert TT.get_default_cache_dir() == tmp_path / 'anyconfig'
+
+
+def test_content_hash(src, tmp_path):
+    other = tmp_path / 'b.yml'
+    other.write_text(src.read_text())
+    assert TT.content_hash(str(src)) == TT.content_hash(str(other))
+
+    other.write_text('a: 2\n')
+    assert TT.content_hash(str(src)) != TT.content_hash(str(other))
+
+
+def test_get_and_set(cache, src):
+    key = _key(src)
+    assert cache.get(key, STAMP) is None
+    assert not cache.list_entries()
+
+    cache.set(key, STAMP, {'a': [1]})
+    assert len(cache) == 1
+    assert not list(cache.cache_dir.glob('*.tmp'))
+
+    assert cache.get(key, STAMP) == {'a': [1]}
+    assert cache.info()[:2] == (1, 1)
+
+    # Shared among cache objects, that is, processes.
+    assert TT.DiskCache(cache.cache_dir).get(key, STAMP) == {'a': [1]}
+
+
+def test_get_content_changed(cache, src):
+    key = _key(src)
+    cache.set(key, STAMP, {'a': 1})
+
+    src.write_text('a: 2\n')
+    assert cache.get(key, STAMP, default=False) is False
+
+
+def test_get_with_different_options(cache, src):
+    cache.set(_key(src), STAMP, {'a': 1})
+    assert cache.get(_key(src, (('ac_ordered', True), )), STAMP) is None
+
+
+def test_get_broken_entry(cache, src):
+    key = _key(src)
+    cache.set(key, STAMP, {'a': 1})
+    cache.entry_path(key).write_bytes(b'broken')
+
+    assert cache.get(key, STAMP) is None
+    assert not cache.entry_path(key).exists()
+
+
+def test_get_expired_entry(cache, src):
+    cache.max_age = 60
+    key = _key(src)
+    cache.set(key, STAMP, {'a': 1})
+
+    path = cache.entry_path(key)
+    old = time.time() - 120
+    os.utime(path, (old, old))
+
+    assert cache.get(key, STAMP) is None
+    assert not path.exists()
+
+
+def test_set_not_serializable_data(cache, src):
+    cache.set(_key(src), STAMP, {'a': lambda: 1})
+    assert not cache.list_entries()
+
+
+def test_set_missing_file(cache, tmp_path):
+    cache.set(_key(tmp_path / 'not_exist.yml'), STAMP, {'a': 1})
+    assert not cache.list_entries()
+
+
+def test_get_or_load(cache, src, monkeypatch):
+    hashed = []
+    content_hash = TT.content_hash
+
+    def _content_hash(path):
+        hashed.append(path)
+        return content_hash(path)
+
+    monkeypatch.setattr(TT, 'content_hash', _content_hash)
+    (key, stamp) = (_key(src), TT.get_stamp(str(src)))
+
+    assert cache.get_or_load(key, stamp, lambda: {'a': 1}) == {'a': 1}
+    assert len(hashed) == 1  # Only once on miss.
+    assert cache.get_or_load(key, stamp, lambda: {'a': 2}) == {'a': 1}
+    assert cache.info()[:2] == (1, 1)
+
+
+def test_get_or_load_file_modified_while_loading(cache, src):
+    (key, stamp) = (_key(src), TT.get_stamp(str(src)))
+
+    def load_fn():
+        src.write_text('a: 2, b: 3\n')
+        return {'a': 1}
+
+    assert cache.get_or_load(key, stamp, load_fn) == {'a': 1}
+    assert not cache.list_entries()
+
+
+def test_clear(cache, src):
+    cache.set(_key(src), STAMP, {'a': 1})
+    cache.clear()
+    assert not cache.list_entries()
+    assert cache.info()[:2] == (0, 0)
+
+
+def _make_entries(cache, tmp_path, num=3):
+    paths = []
+    for idx in range(num):
+        src = tmp_path / f'{idx}.yml'
+        src.write_text(f'a: {idx}\n')
+        cache.set(_key(src), STAMP, {'a': idx})
+
+        path = cache.entry_path(_key(src))
+        mtime = time.time() - 100 * (num - idx)  # The older, the less idx.
+        os.utime(path, (mtime, mtime))
+        paths.append(path)
+
+    return paths
+
+
+def test_prune_by_age(cache, tmp_path):
+    paths = _make_entries(cache, tmp_path)
+    assert cache.prune(max_age=150) == 2
+    assert [p.exists() for p in paths] == [False, False, True]
+
+
+def test_prune_by_size(cache, tmp_path):
+    paths = _make_entries(cache, tmp_path)
+    size = paths[0].stat().st_size
+    assert cache.prune(max_size=size * 2) == 1
+    assert [p.exists() for p in paths] == [False, True, True]
+
+
+def test_prune_nothing(tmp_path):
+    cache = TT.DiskCache(pathlib.Path(tmp_path) / 'not_exist')
+    assert cache.prune(max_age=0, max_size=0) == 0
+
+# vim:sw=4:ts=4:et:
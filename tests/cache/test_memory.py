@@ -0,0 +1,110 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring
+import pickle
+
+import pytest
+
+import anyconfig.cache.memory as TT
+
+
+KEY = ('/a/b.json', 'json.stdlib', ())
+STAMP = (1, 2, 3, 4)
+
+
+def test_cache_init_ng():
+    with pytest.raises(ValueError):
+        TT.Cache(-1)
+
+
+def test_cache_get_and_set():
+    cache = TT.Cache()
+    assert cache.get(KEY, STAMP) is None
+    assert cache.info() == (0, 1, TT.DEFAULT_MAXSIZE, 0)
+
+    data = {'a': [1, 2]}
+    cache.set(KEY, STAMP, data)
+    assert KEY in cache
+    assert len(cache) == 1
+
+    res = cache.get(KEY, STAMP)
+    assert res == data
+    assert cache.info() == (1, 1, TT.DEFAULT_MAXSIZE, 1)
+
+
+def test_cache_returns_copies():
+    cache = TT.Cache()
+    data = {'a': [1, 2]}
+    cache.set(KEY, STAMP, data)
+    data['a'].append(3)  # It does not affect the cached one.
+
+    res = cache.get(KEY, STAMP)
+    assert res == {'a': [1, 2]}
+
+    res['a'].append(3)  # Neither does it.
+    assert cache.get(KEY, STAMP) == {'a': [1, 2]}
+
+
+def test_cache_get_with_different_stamp():
+    cache = TT.Cache()
+    cache.set(KEY, STAMP, {'a': 1})
+
+    assert cache.get(KEY, (5, 6, 7, 8), default=False) is False
+    assert KEY not in cache
+    assert cache.info().misses == 1
+
+
+def test_cache_lru_eviction():
+    cache = TT.Cache(maxsize=2)
+    keys = [(f'/a/{i}.json', 'json.stdlib', ()) for i in range(3)]
+
+    cache.set(keys[0], STAMP, 0)
+    cache.set(keys[1], STAMP, 1)
+    assert cache.get(keys[0], STAMP) == 0  # keys[1] is the LRU one now.
+
+    cache.set(keys[2], STAMP, 2)
+    assert len(cache) == 2
+    assert keys[1] not in cache
+    assert keys[0] in cache
+    assert keys[2] in cache
+
+
+def test_cache_maxsize_zero():
+    cache = TT.Cache(maxsize=0)
+    cache.set(KEY, STAMP, {'a': 1})
+    assert not cache
+
+
+def test_cache_clear():
+    cache = TT.Cache()
+    cache.set(KEY, STAMP, {'a': 1})
+    cache.get(KEY, STAMP)
+    cache.clear()
+
+    assert cache.info() == (0, 0, TT.DEFAULT_MAXSIZE, 0)
+
+
+def test_cache_get_or_load():
+    cache = TT.Cache()
+    calls = []
+
+    def load_fn():
+        calls.append(1)
+        return None  # None should be cached also.
+
+    assert cache.get_or_load(KEY, STAMP, load_fn) is None
+    assert cache.get_or_load(KEY, STAMP, load_fn) is None
+    assert len(calls) == 1
+    assert cache.info()[:2] == (1, 1)
+
+
+def test_cache_pickle():
+    cache = TT.Cache()
+    cache.set(KEY, STAMP, {'a': 1})
+
+    cache_2 = pickle.loads(pickle.dumps(cache))
+    assert cache_2.get(KEY, STAMP) == {'a': 1}
+
+# vim:sw=4:ts=4:et:
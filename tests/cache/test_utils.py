@@ -0,0 +1,74 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring
+import collections
+import io
+
+import pytest
+
+import anyconfig.cache.utils as TT
+import anyconfig.ioinfo
+import anyconfig.parsers
+
+
+@pytest.mark.parametrize(
+    'inp,exp',
+    ((1, 1),
+     ('a', 'a'),
+     ([1, [2]], (1, (2, ))),
+     ({'b': 1, 'a': [2]}, (('a', (2, )), ('b', 1))),
+     (collections.OrderedDict(b=1, a=2), (('a', 2), ('b', 1))),
+     ),
+)
+def test_freeze(inp, exp):
+    assert TT.freeze(inp) == exp
+
+
+def test_normalize_options():
+    assert TT.normalize_options(
+        ac_query='a', ac_ordered=True, indent=2, ac_cache=True
+    ) == (('ac_ordered', True), ('indent', 2))
+
+
+def test_normalize_options__ac_multi_docs():
+    assert TT.normalize_options(ac_merge='replace') == ()
+    assert TT.normalize_options(ac_merge='replace', ac_multi_docs=True) == (
+        ('ac_merge', 'replace'), ('ac_multi_docs', True)
+    )
+
+
+def test_get_stamp(tmp_path):
+    path = tmp_path / 'a.json'
+    assert TT.get_stamp(str(path)) is None
+
+    path.write_text('{}')
+    stamp = TT.get_stamp(str(path))
+    assert stamp is not None
+    assert stamp[1] == 2  # size
+
+
+def test_make_key(tmp_path):
+    path = tmp_path / 'a.json'
+    path.write_text('{"a": 1}')
+
+    ioi = anyconfig.ioinfo.make(path)
+    psr = anyconfig.parsers.find(ioi)
+
+    (key, stamp) = TT.make_key(ioi, psr, ac_ordered=True, ac_query='a')
+    assert key == (str(path), psr.cid(), (('ac_ordered', True), ))
+    assert stamp == TT.get_stamp(str(path))
+
+    path.write_text('{"a": 1, "b": 2}')
+    assert TT.make_key(ioi, psr, ac_ordered=True)[1] != stamp
+
+
+def test_make_key_not_cacheable(tmp_path):
+    psr = anyconfig.parsers.find(None, 'json')
+    assert TT.make_key(anyconfig.ioinfo.make(io.StringIO('{}')), psr) is None
+
+    ioi = anyconfig.ioinfo.make(tmp_path / 'not_exist.json')
+    assert TT.make_key(ioi, psr) is None
+
+# vim:sw=4:ts=4:et:
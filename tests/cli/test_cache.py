@@ -0,0 +1,66 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring,redefined-outer-name
+import pytest
+
+import anyconfig.cache
+import anyconfig.cli as TT
+
+
+@pytest.fixture
+def inp(tmp_path):
+    path = tmp_path / 'a.json'
+    path.write_text('{"a": 1}')
+    return path
+
+
+def test_cache_prewarm(inp, tmp_path):
+    cdir = tmp_path / 'cache'
+    with pytest.raises(SystemExit) as exc:
+        TT.main(['anyconfig_cli', '--cache-prewarm', '--cache-dir',
+                 str(cdir), str(inp)])
+
+    assert exc.value.code == 0
+    assert len(anyconfig.cache.DiskCache(cdir)) == 1
+
+
+def test_cache_dir(inp, tmp_path):
+    cdir = tmp_path / 'cache'
+    out = tmp_path / 'out.json'
+    TT.main(['anyconfig_cli', '--cache-dir', str(cdir), str(inp),
+             '-o', str(out)])
+
+    assert len(anyconfig.cache.DiskCache(cdir)) == 1
+    assert anyconfig.load(out) == {'a': 1}
+
+
+def test_cache_clear(inp, tmp_path):
+    cdir = tmp_path / 'cache'
+    anyconfig.load(inp, ac_cache=anyconfig.cache.DiskCache(cdir))
+    with pytest.raises(SystemExit) as exc:
+        TT.main(['anyconfig_cli', '--cache-clear', '--cache-dir', str(cdir)])
+
+    assert exc.value.code == 0
+    assert not anyconfig.cache.DiskCache(cdir).list_entries()
+
+
+def test_cache_default_dir(inp, tmp_path, monkeypatch):
+    cdir = tmp_path / 'default'
+    monkeypatch.setenv(anyconfig.cache.disk.CACHE_DIR_ENV, str(cdir))
+    with pytest.raises(SystemExit):
+        TT.main(['anyconfig_cli', '--cache-prewarm', str(inp)])
+
+    assert len(anyconfig.cache.DiskCache()) == 1
+
+
+def test_cache_max_size(inp, tmp_path):
+    cdir = tmp_path / 'cache'
+    with pytest.raises(SystemExit):
+        TT.main(['anyconfig_cli', '--cache-prewarm', '--cache-max-size', '0',
+                 '--cache-dir', str(cdir), str(inp)])
+
+    assert not anyconfig.cache.DiskCache(cdir).list_entries()
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,58 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring
+import pytest
+
+import anyconfig
+import anyconfig.cli as TT
+
+
+DATA_0 = {'a': {'b': [1, 2]}, 'c': 'C'}
+DATA_1 = {'a': {'b': [1, 2, 3]}, 'd': 'D'}
+
+
+def test_diff_and_patch(tmp_path):
+    (inp_0, inp_1) = (tmp_path / 'a.json', tmp_path / 'b.json')
+    anyconfig.dump(DATA_0, inp_0)
+    anyconfig.dump(DATA_1, inp_1)
+
+    patch = tmp_path / 'patch.json'
+    TT.main(['anyconfig_cli', '--diff', str(inp_0), str(inp_1),
+             '-o', str(patch)])
+    assert anyconfig.load(patch) == anyconfig.diff(DATA_0, DATA_1)
+
+    out = tmp_path / 'out.json'
+    TT.main(['anyconfig_cli', '--patch', str(patch), str(inp_0),
+             '-o', str(out)])
+    assert anyconfig.load(out) == DATA_1
+
+
+def test_diff_outputs_json_by_default(tmp_path, capsys):
+    (inp_0, inp_1) = (tmp_path / 'a.toml', tmp_path / 'b.toml')
+    inp_0.write_text('a = 1\n')
+    inp_1.write_text('a = 2\n')
+
+    TT.main(['anyconfig_cli', '--diff', str(inp_0), str(inp_1)])
+    assert anyconfig.loads(capsys.readouterr().out, ac_parser='json') == \
+        [{'op': 'replace', 'path': '/a', 'value': 2}]
+
+
+def test_diff_requires_two_inputs(tmp_path):
+    inp = tmp_path / 'a.json'
+    anyconfig.dump(DATA_0, inp)
+
+    with pytest.raises(SystemExit):
+        TT.main(['anyconfig_cli', '--diff', str(inp)])
+
+
+def test_patch_failures(tmp_path):
+    (inp, patch) = (tmp_path / 'a.json', tmp_path / 'patch.json')
+    anyconfig.dump(DATA_0, inp)
+    anyconfig.dump([{'op': 'remove', 'path': '/x'}], patch)
+
+    with pytest.raises(SystemExit):
+        TT.main(['anyconfig_cli', '--patch', str(patch), str(inp)])
+
+# vim:sw=4:ts=4:et:
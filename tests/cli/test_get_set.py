@@ -0,0 +1,43 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring,redefined-outer-name
+import pytest
+
+import anyconfig
+import anyconfig.cli as TT
+
+
+@pytest.fixture
+def inp(tmp_path):
+    path = tmp_path / 'a.json'
+    path.write_text('{"a": {"b": [{"c": 1}, {"c": 2}]}, "d": "x=y"}')
+    return path
+
+
+def test_get_an_item_in_arrays(inp, tmp_path):
+    out = tmp_path / 'out.json'
+    TT.main(['anyconfig_cli', '--get', '/a/b/1', str(inp), '-o', str(out)])
+    assert anyconfig.load(out) == {'c': 2}
+
+
+def test_set_multiple_items(inp, tmp_path):
+    out = tmp_path / 'out.json'
+    TT.main(['anyconfig_cli', '--set', 'a.b.0.c=3', '--set', 'e.f=1',
+             '--set', 'd=a=b', str(inp), '-o', str(out)])
+    assert anyconfig.load(out) == {
+        'a': {'b': [{'c': 3}, {'c': 2}]}, 'd': 'a=b', 'e': {'f': 1}
+    }
+
+
+@pytest.mark.parametrize('item', ('a', '=1'))
+def test_set_invalid_items(inp, tmp_path, item):
+    out = tmp_path / 'out.json'
+    with pytest.raises(SystemExit):
+        TT.main(['anyconfig_cli', '--set', 'e.f=1', '--set', item, str(inp),
+                 '-o', str(out)])
+
+    assert not out.exists()
+
+# vim:sw=4:ts=4:et:
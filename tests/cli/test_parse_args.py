@@ -20,10 +20,13 @@ class TestCase(unittest.TestCase):
 
         # ref = TT.DEFAULTS.copy()
         ref = dict(
-            args=None, atype=None, env=False, extra_opts=None,
+            args=None, atype=None, cache_clear=False, cache_dir=None,
+            cache_max_age=None, cache_max_size=None, cache_prewarm=False,
+            diff=False, env=False, extra_opts=None,
             gen_schema=False, get=None, ignore_missing=False, inputs=[],
             itype=None, list=False, loglevel=0, merge='merge_dicts',
-            otype=None, output=None, query=None, schema=None, set=None,
+            otype=None, output=None, patch=None, query=None, schema=None,
+            set=None,
             template=False, validate=False
         )
         self.assertEqual(
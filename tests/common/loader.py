@@ -54,3 +54,10 @@ class TestCase:
         (exp, opts, psr, ioi) = self._get_all(ipath, aux)
         res = psr.load(ioi, **opts)
         assert res == exp, f"'{res!r}' vs. '{exp!r}'"
+
+    def _assert_load_mmap(
+        self, ipath: pathlib.Path, aux: typing.Dict[str, typing.Any]
+    ):
+        (exp, opts, psr, ioi) = self._get_all(ipath, aux)
+        res = psr.load(ioi, ac_mmap=True, **opts)
+        assert res == exp, f"'{res!r}' vs. '{exp!r}'"
@@ -0,0 +1,152 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring
+import copy
+import random
+
+import pytest
+
+import anyconfig.dicts as TT
+
+
+@pytest.mark.parametrize(
+    ('obj', 'other', 'exp'),
+    (({'a': 1}, {'a': 1}, []),
+     ({'a': 1}, {'a': 2},
+      [{'op': 'replace', 'path': '/a', 'value': 2}]),
+     ({'a': 1}, {'a': True},
+      [{'op': 'replace', 'path': '/a', 'value': True}]),
+     ({'a': 1, 'b': 2}, {'a': 1},
+      [{'op': 'remove', 'path': '/b'}]),
+     ({}, {'a/b': {'c~': 1}},
+      [{'op': 'add', 'path': '/a~1b', 'value': {'c~': 1}}]),
+     ({'a': {'b': [1, 2, 3]}}, {'a': {'b': [1, 3]}},
+      [{'op': 'remove', 'path': '/a/b/1'}]),
+     ({'a': [1, 2]}, {'a': [0, 1, 2, 3]},
+      [{'op': 'add', 'path': '/a/0', 'value': 0},
+       {'op': 'add', 'path': '/a/3', 'value': 3}]),
+     ({'a': [{'b': 1}, {'c': 2}]}, {'a': [{'b': 1}, {'c': 3}]},
+      [{'op': 'replace', 'path': '/a/1/c', 'value': 3}]),
+     ({'a': 1}, [1],
+      [{'op': 'replace', 'path': '', 'value': [1]}]),
+     )
+)
+def test_diff(obj, other, exp):
+    assert TT.diff(obj, other) == exp
+
+
+def _random_data(rand, depth=0):
+    val = rand.random()
+    if depth < 4 and val < 0.3:
+        return {rand.choice('abcdef'): _random_data(rand, depth + 1)
+                for _ in range(rand.randint(0, 4))}
+    if depth < 4 and val < 0.5:
+        return [_random_data(rand, depth + 1)
+                for _ in range(rand.randint(0, 5))]
+    return rand.choice((0, 1, 2, 'a', 'b', None, True, 1.5))
+
+
+def test_diff_and_apply_patch_random_data():
+    rand = random.Random(0)
+    for _ in range(500):
+        (obj, other) = (_random_data(rand), _random_data(rand))
+        patch = TT.diff(obj, other)
+        assert TT.apply_patch(copy.deepcopy(obj), patch) == other
+
+
+def _random_data_with_empty_keys(rand, depth=0):
+    val = rand.random()
+    if depth < 4 and val < 0.4:
+        return {rand.choice(('', 'a', 'b', '~', '/')):
+                _random_data_with_empty_keys(rand, depth + 1)
+                for _ in range(rand.randint(0, 3))}
+    return rand.choice((0, 1, 'a', None))
+
+
+def test_diff_and_apply_patch_with_empty_keys():
+    rand = random.Random(0)
+    for _ in range(3000):
+        obj = _random_data_with_empty_keys(rand)
+        other = _random_data_with_empty_keys(rand)
+        patch = TT.diff(obj, other)
+        assert TT.apply_patch(copy.deepcopy(obj), patch) == other
+
+
+@pytest.mark.parametrize(
+    ('obj', 'other'),
+    (({1: 'a', 2: {'b': 1}}, {1: 'b', 2: {'b': 2}}),
+     ({1: 'a', 2: 'b'}, {1: 'a'}),
+     ({1: 'a'}, {1: 'a', 2: 'b'}),
+     ({1: 'a', '1': 'b'}, {1: 'a', '1': 'c'}),
+     ({'a': {True: 1, None: [1]}}, {'a': {True: 2, None: [1, 2]}}),
+     )
+)
+def test_diff_and_apply_patch_with_non_str_keys(obj, other):
+    patch = TT.diff(obj, other)
+    assert TT.apply_patch(copy.deepcopy(obj), patch) == other
+
+
+def test_diff_with_non_str_keys_added():
+    assert TT.diff({'a': {1: 'a'}}, {'a': {1: 'a', 2: 'b'}}) == [
+        {'op': 'replace', 'path': '/a', 'value': {1: 'a', 2: 'b'}}
+    ]
+
+
+def test_apply_patch_with_empty_keys():
+    obj = {'': {'a': 1}, 'a': 2}
+    assert TT.apply_patch(obj, [{'op': 'replace', 'path': '//a',
+                                 'value': 3}]) == {'': {'a': 3}, 'a': 2}
+    assert TT.apply_patch(obj, [{'op': 'remove', 'path': '/'}]) == {'a': 2}
+
+
+def test_diff_a_large_tree_with_a_small_change():
+    obj = {f's{i}': {'a': [i, {'b': str(i)}]} for i in range(1000)}
+    other = copy.deepcopy(obj)
+    other['s500']['a'][1]['b'] = 'x'
+
+    assert TT.diff(obj, other) == [
+        {'op': 'replace', 'path': '/s500/a/1/b', 'value': 'x'}
+    ]
+
+
+def test_apply_patch_in_place():
+    obj = {'a': {'b': [1, 2]}, 'c': 'C'}
+    patch = [{'op': 'add', 'path': '/a/b/-', 'value': 3},
+             {'op': 'add', 'path': '/a/b/0', 'value': 0},
+             {'op': 'copy', 'from': '/a', 'path': '/d'},
+             {'op': 'move', 'from': '/c', 'path': '/e'},
+             {'op': 'replace', 'path': '/a/b/1', 'value': 'x'},
+             {'op': 'remove', 'path': '/d/b/0'},
+             {'op': 'test', 'path': '/e', 'value': 'C'}]
+
+    assert TT.apply_patch(obj, patch) is obj
+    assert obj == {'a': {'b': [0, 'x', 2, 3]}, 'd': {'b': [1, 2, 3]},
+                   'e': 'C'}
+
+
+def test_apply_patch_to_the_root():
+    assert TT.apply_patch({'a': 1},
+                          [{'op': 'replace', 'path': '', 'value': [1]}]
+                          ) == [1]
+
+
+@pytest.mark.parametrize(
+    'oper',
+    ({'op': 'remove', 'path': '/x'},
+     {'op': 'replace', 'path': '/x', 'value': 1},
+     {'op': 'add', 'path': '/a/5', 'value': 1},
+     {'op': 'add', 'path': '/x/y', 'value': 1},
+     {'op': 'move', 'from': '/x', 'path': '/y'},
+     {'op': 'test', 'path': '/a/0', 'value': 2},
+     {'op': 'unknown', 'path': '/a'},
+     {'op': 'remove', 'path': 'a'},
+     {'op': 'replace', 'path': '/a/01', 'value': 1},
+     )
+)
+def test_apply_patch_failures(oper):
+    with pytest.raises(ValueError):
+        TT.apply_patch({'a': [1]}, [oper])
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,105 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring
+import collections
+import copy
+import functools
+import pickle
+
+import pytest
+
+import anyconfig.dicts as TT
+
+
+DATA = {'a': {'b': [1, {'c': 2}], 's': {1, 2}}, 'd': 'D', 'e': None}
+
+
+def test_freeze():
+    res = TT.freeze(DATA)
+    assert isinstance(res, TT.FrozenConfig)
+    assert isinstance(res['a'], TT.FrozenConfig)
+    assert res['a']['b'] == (1, TT.FrozenConfig({'c': 2}))
+    assert res['a']['s'] == frozenset((1, 2))
+    assert res == DATA
+    assert DATA == res
+    assert res != {'a': 1}
+    assert TT.freeze(res) is res
+    assert TT.freeze(1) == 1
+
+
+def test_frozen_config_is_immutable():
+    res = TT.FrozenConfig(DATA)
+    with pytest.raises(TypeError):
+        res['d'] = 1  # type: ignore
+    with pytest.raises(AttributeError):
+        res.update(d=1)  # type: ignore
+    with pytest.raises(TypeError):
+        TT.merge(res, {'d': 1})
+
+
+def test_frozen_config_from_pairs():
+    res = TT.FrozenConfig([('a', [1]), ('b', collections.OrderedDict(c=2))])
+    assert res == {'a': [1], 'b': {'c': 2}}
+    assert list(res) == ['a', 'b']
+    assert len(res) == 2
+
+
+def test_frozen_config_hash():
+    (res_0, res_1) = (TT.FrozenConfig(DATA), TT.FrozenConfig(DATA))
+    assert res_0 is not res_1
+    assert res_0 == res_1
+    assert hash(res_0) == hash(res_1)
+    assert len({res_0, res_1}) == 1
+
+    @functools.lru_cache(maxsize=None)
+    def fun(cnf):
+        return cnf['d']
+
+    assert fun(res_0) == fun(res_1) == 'D'
+    assert fun.cache_info().hits == 1
+
+
+def test_frozen_config_with_unhashable_values():
+    res = TT.FrozenConfig({'a': bytearray(b'a')})
+    assert res == {'a': bytearray(b'a')}
+    with pytest.raises(TypeError):
+        hash(res)
+
+
+def test_frozen_config_copies():
+    res = TT.FrozenConfig(DATA)
+    assert copy.copy(res) is res
+    assert copy.deepcopy(res) is res
+    assert copy.deepcopy({'x': res})['x'] is res
+    assert pickle.loads(pickle.dumps(res)) == res
+
+
+def test_thaw():
+    res = TT.thaw(TT.freeze(DATA))
+    assert res == DATA
+    assert type(res) is dict  # noqa: E721
+    assert type(res['a']['b']) is list  # noqa: E721
+    assert type(res['a']['b'][1]) is dict  # noqa: E721
+    assert type(res['a']['s']) is set  # noqa: E721
+    assert TT.FrozenConfig(DATA).thaw() == res
+
+
+def test_freeze_deep_objects():
+    depth = 5000  # Deeper than the default recursion limit.
+    obj = leaf = {}
+    for _ in range(depth):
+        leaf['a'] = [{}]
+        leaf = leaf['a'][0]
+
+    res = TT.freeze(obj)
+    hash(res)
+
+    res = TT.thaw(res)
+    for _ in range(depth):
+        assert isinstance(res['a'], list)
+        res = res['a'][0]
+    assert res == {}
+
+# vim:sw=4:ts=4:et:
@@ -52,6 +52,97 @@ def test_set_(args, exp):
     assert args[0] == exp
 
 
+@pytest.mark.parametrize(
+    'path,keys',
+    (('', ()),
+     ('/', ('', )),
+     ('/a~1b/m~0n', ('a/b', 'm~n')),
+     ('a.b.0', ('a', 'b', '0')),
+     ),
+)
+def test_compile_path(path, keys):
+    acc = TT.compile_path(path)
+    assert acc.keys == keys
+    assert TT.compile_path(path) is acc  # Cached.
+
+
+DATA_0 = {'a': {'b': [{'c': 1}, [10, 11]]}, 'd': 0, '1': 'x'}
+
+
+@pytest.mark.parametrize(
+    'path,exp',
+    (('', DATA_0),
+     ('/a/b/0/c', 1),
+     ('a.b.1.0', 10),
+     ('/1', 'x'),
+     ('/a/b/2', None),
+     ('/a/b/-', None),
+     ('/a/b/x', None),
+     ('/d/e', None),
+     ),
+)
+def test_compile_path_get(path, exp):
+    (res, err) = TT.compile_path(path).get(DATA_0)
+    assert res == exp
+    assert bool(err) == (exp is None)
+
+
+@pytest.mark.parametrize(
+    'path,val,exp',
+    (('/a/b/0/c', 2, {'a': {'b': [{'c': 2}, [10, 11]]}}),
+     ('/a/b/1/-', 12, {'a': {'b': [{'c': 1}, [10, 11, 12]]}}),
+     ('/a/b/2', 3, {'a': {'b': [{'c': 1}, [10, 11], 3]}}),
+     ('/a/b/-/e', 3, {'a': {'b': [{'c': 1}, [10, 11], {'e': 3}]}}),
+     ('/a/b/1/0/f', 4, {'a': {'b': [{'c': 1}, [{'f': 4}, 11]]}}),
+     ('/x/y', 5, {'a': {'b': [{'c': 1}, [10, 11]]}, 'x': {'y': 5}}),
+     ),
+)
+def test_compile_path_set(path, val, exp):
+    data = {'a': {'b': [{'c': 1}, [10, 11]]}}
+    TT.compile_path(path).set(data, val)
+    assert data == exp
+
+
+@pytest.mark.parametrize(
+    'path,exc',
+    (('', ValueError),
+     ('/a/b/x', TypeError),
+     ('/a/b/3', IndexError),
+     ('/a/b/3/c', IndexError),
+     ),
+)
+def test_compile_path_set_failures(path, exc):
+    with pytest.raises(exc):
+        TT.compile_path(path).set({'a': {'b': [1]}}, 0)
+
+
+def test_get_many():
+    assert TT.get_many(DATA_0, ['d', '/a/b/0/c', 'x']) == [
+        (0, ''), (1, ''), (None, "'x'")
+    ]
+
+
+@pytest.mark.parametrize(
+    'items',
+    ({'a.b': 1, 'a.c': 2, '/l/-': 3},
+     [('a.b', 1), ('a.c', 2), ('/l/-', 3)],
+     ),
+)
+def test_set_many(items):
+    data = {'a': {'b': 0, 'd': {'e': 4}}, 'l': []}
+    TT.set_many(data, items)
+    assert data == {'a': {'b': 1, 'c': 2, 'd': {'e': 4}}, 'l': [3]}
+
+
+def test_set_merges_mapping_objects():
+    data = {'a': {'b': {'c': 1}}}
+    TT.set_(data, 'a.b', {'d': 2})
+    assert data == {'a': {'b': {'c': 1, 'd': 2}}}
+
+    TT.set_(data, '', {'x': 2})  # Nothing to do.
+    assert data == {'a': {'b': {'c': 1, 'd': 2}}}
+
+
 OD = collections.OrderedDict
 
 
@@ -67,6 +158,46 @@ def test_convert_to(args, exp):
     assert TT.convert_to(*args) == exp
 
 
+def test_convert_to_returns_obj_as_it_is():
+    obj = {'a': {'b': [1, {'c': (2, 3)}]}, 'd': [], 'e': b'e', 'f': None}
+    assert TT.convert_to(obj) is obj
+    assert TT.convert_to(obj['a']['b']) is obj['a']['b']
+
+
+def test_convert_to_copies_only_subtrees_to_convert():
+    obj = {'a': {'b': [1, OD(c=2)], 'd': [4]}, 'e': {'f': 5}, 't': (OD(), )}
+    res = TT.convert_to(obj)
+
+    assert res == obj
+    assert res is not obj
+    assert res['a'] is not obj['a']
+    assert res['a']['b'] is not obj['a']['b']
+    assert type(res['a']['b'][1]) is dict  # noqa: E721
+    assert type(res['t']) is tuple  # noqa: E721
+    assert res['a']['d'] is obj['a']['d']
+    assert res['e'] is obj['e']
+
+
+def test_convert_to_converts_nested_objects_with_ac_dict():
+    res = TT.convert_to({'a': {'b': [{'c': 1}]}}, ac_ordered=True)
+    assert isinstance(res, OD)
+    assert isinstance(res['a'], OD)
+    assert isinstance(res['a']['b'][0], OD)
+
+
+def test_convert_to_deep_objects():
+    depth = 5000  # Deeper than the default recursion limit.
+    obj = leaf = OD()
+    for _ in range(depth):
+        leaf['a'] = [OD()]
+        leaf = leaf['a'][0]
+
+    res = TT.convert_to(obj)
+    for _ in range(depth):
+        assert type(res) is dict  # noqa: E721
+        res = res['a'][0]
+
+
 @pytest.mark.parametrize(
     'objs,exp',
     ((([], (), [x for x in range(10)], (x for x in range(4))), True),
@@ -0,0 +1,120 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring
+import collections
+import json
+import math
+
+import anyconfig.dicts as TT
+
+
+def _load(obj):
+    """Make copies of keys and values not shared with ``obj``."""
+    return json.loads(json.dumps(obj))
+
+
+def _keys(obj):
+    return list(obj.keys())
+
+
+DATA = {'name': 'a' * 20, 'items': [{'value': 'b' * 20, 'ratio': 0.5}]}
+
+
+def test_interner_call():
+    interner = TT.Interner()
+    (val_0, val_1) = (''.join(['x'] * 20), ''.join(['x'] * 20))
+    assert val_0 is not val_1
+
+    assert interner(val_0) is val_0
+    assert interner(val_1) is val_0
+    assert interner(1.5) == 1.5
+    assert interner(True) is True
+    assert interner(None) is None
+
+    nan = float('nan')
+    assert interner(nan) is nan
+    assert interner.report()['unique'] == 2
+
+
+def test_interner_keeps_types():
+    interner = TT.Interner()
+    assert interner(1) is 1  # noqa: F632
+    assert type(interner(1.0)) is float  # noqa: E721
+    assert interner(True) is True
+
+
+def test_interner_keeps_signed_zeros():
+    interner = TT.Interner()
+    assert interner(0.0) == 0.0
+    assert math.copysign(1.0, interner(-0.0)) == -1.0
+    assert math.copysign(1.0, interner(0.0)) == 1.0
+    assert interner.report()['unique'] == 2
+
+
+def test_intern_without_interner():
+    (obj_0, obj_1) = (_load(DATA), _load(DATA))
+    TT.intern(obj_0, values=True)
+    TT.intern(obj_1, values=True)
+    assert obj_0 == obj_1 == DATA
+    # Not shared among calls.
+    assert obj_0['items'][0]['ratio'] is not obj_1['items'][0]['ratio']
+
+
+def test_intern_keys():
+    interner = TT.Interner()
+    (obj_0, obj_1) = (_load(DATA), _load(DATA))
+
+    assert TT.intern(obj_0, interner) is obj_0
+    assert TT.intern(obj_1, interner) is obj_1
+    assert obj_0 == obj_1 == DATA
+    assert all(a is b for a, b in zip(_keys(obj_0), _keys(obj_1)))
+    assert all(a is b for a, b in zip(_keys(obj_0['items'][0]),
+                                      _keys(obj_1['items'][0])))
+    assert obj_0['name'] is not obj_1['name']  # Values are not interned.
+
+
+def test_intern_values():
+    interner = TT.Interner()
+    (obj_0, obj_1) = (_load(DATA), _load(DATA))
+
+    TT.intern(obj_0, interner, values=True)
+    TT.intern(obj_1, interner, values=True)
+    assert obj_0['name'] is obj_1['name']
+    assert obj_0['items'][0]['value'] is obj_1['items'][0]['value']
+
+
+def test_intern_keeps_order_and_types():
+    obj = collections.OrderedDict((('z', 1), ('a', [2, {'b': 3}])))
+    res = TT.intern(obj, TT.Interner())
+    assert isinstance(res, collections.OrderedDict)
+    assert list(res) == ['z', 'a']
+
+
+def test_intern_shared_and_recursive_objects():
+    shared = {'a': 1}
+    obj = {'b': shared, 'c': shared, 'd': []}
+    obj['d'].append(obj)
+
+    res = TT.intern(obj, TT.Interner())
+    assert res['b'] is res['c']
+    assert res['d'][0] is res
+
+
+def test_memory_report():
+    interner = TT.Interner()
+    for _ in range(3):
+        TT.intern(_load(DATA), interner, values=True)
+
+    res = TT.memory_report(interner)
+    assert res['objects'] == 21  # 4 keys and 3 values x 3
+    assert res['unique'] == 7
+    assert res['shared'] > 0
+    assert res['bytes_saved'] > 0
+    assert res['table_bytes'] > 0
+
+    interner.clear()
+    assert TT.memory_report(interner)['objects'] == 0
+
+# vim:sw=4:ts=4:et:
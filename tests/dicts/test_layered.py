@@ -0,0 +1,113 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring
+import copy
+
+import pytest
+
+import anyconfig.dicts as TT
+
+
+LAYERS = [
+    {'a': {'b': 1, 'l': [1], 'd': {'e': 1}}, 'x': 1, 'n': None,
+     'cs': [{'name': 'a', 'x': 1}]},
+    {'a': {'c': 2, 'l': [2], 'd': {'f': 2}}, 'x': None, 'y': 3,
+     'cs': [{'name': 'a', 'y': 2}, {'name': 'b'}]},
+    [('a', {'b': 5, 'l': [1, 3]}), ('z', {'q': 1})],
+]
+
+
+def _merge(layers, **options):
+    layers = copy.deepcopy(layers)
+    ret = layers[0]
+    for layer in layers[1:]:
+        TT.merge(ret, layer, **options)
+
+    return ret
+
+
+@pytest.mark.parametrize(
+    'options',
+    ([dict(ac_merge=ms) for ms in TT.MERGE_STRATEGIES]
+     + [dict(ac_merge=TT.MS_DICTS, merge_lists=True),
+        dict(ac_merge=TT.MS_DICTS_AND_LISTS, merge_lists_by='name')]),
+)
+def test_layered_config(options):
+    layers = copy.deepcopy(LAYERS)
+    view = TT.LayeredConfig(layers, **options)
+    exp = _merge(LAYERS, **options)
+
+    assert view == exp
+    assert view.materialize() == exp
+    assert list(view) == list(exp)
+    assert len(view) == len(exp)
+    assert layers == LAYERS  # Layers are not modified.
+
+
+def test_layered_config_returns_nested_views():
+    view = TT.LayeredConfig(copy.deepcopy(LAYERS))
+    assert isinstance(view['a'], TT.LayeredConfig)
+    assert view['a'] is view['a']
+    assert isinstance(view.materialize()['a'], dict)
+    assert view.materialize(ac_dict=TT.collections.OrderedDict)['a'] == \
+        _merge(LAYERS)['a']
+
+
+def test_layered_config_copy_on_write():
+    layers = copy.deepcopy(LAYERS)
+    view = TT.LayeredConfig(layers)
+    view['a']['d']['g'] = 3
+    view['w'] = 0
+    del view['x']
+    del view['a']['b']
+
+    assert layers == LAYERS
+    assert 'x' not in view
+    assert 'b' not in view['a']
+    assert view['a']['d'] == {'e': 1, 'f': 2, 'g': 3}
+    assert view.materialize()['w'] == 0
+
+    with pytest.raises(KeyError):
+        del view['x']
+    with pytest.raises(KeyError):
+        view['not_exist']  # pylint: disable=pointless-statement
+
+    view['x'] = 1
+    assert view['x'] == 1
+
+
+def test_layered_config_add_layer():
+    view = TT.LayeredConfig()
+    assert view == {}
+    assert not view.layers
+
+    for layer in copy.deepcopy(LAYERS):
+        view.add_layer(layer)
+
+    assert view == _merge(LAYERS)
+    assert len(view.layers) == len(LAYERS)
+
+
+def test_layered_config_deep_layers():
+    depth = 5000  # Deeper than the default recursion limit.
+    layers = [{}, {}]
+    for layer, leaf in zip(layers, ('a', 'b')):
+        cur = layer
+        for _ in range(depth):
+            cur = cur.setdefault('k', {})
+        cur[leaf] = 1
+
+    res = TT.LayeredConfig(layers).materialize()
+    for _ in range(depth):
+        res = res['k']
+
+    assert res == {'a': 1, 'b': 1}
+
+
+def test_layered_config_with_wrong_merge_strategy():
+    with pytest.raises(ValueError):
+        TT.LayeredConfig([{}], ac_merge='wrong')
+
+# vim:sw=4:ts=4:et:
@@ -4,6 +4,10 @@
 # Copyright (C) 2011 - 2021 Satoru SATOH <satoru.satoh@gmail.com>
 #
 # pylint: disable=missing-docstring,invalid-name
+import copy
+import tracemalloc
+import unittest
+
 import anyconfig.dicts as TT
 
 from .. import base
@@ -35,4 +39,192 @@ class TestCase(common.TestCase):
         with self.assertRaises((ValueError, TypeError)):
             TT.merge(dict(a=1), 1)
 
+
+def _make_deep_dict(depth, leaf):
+    ret = leaf
+    for idx in reversed(range(depth)):
+        ret = {f'k{idx}': ret}
+    return ret
+
+
+class IterativeMergeTestCase(unittest.TestCase):
+    depth = 5000  # Deeper than the default recursion limit.
+
+    def test_merge_deep_dicts(self):
+        for strategy, exp in ((TT.MS_DICTS, [2]),
+                              (TT.MS_DICTS_AND_LISTS, [1, 2])):
+            inp = _make_deep_dict(self.depth, {'a': 1, 'l': [1]})
+            TT.merge(inp, _make_deep_dict(self.depth, {'b': 2, 'l': [2]}),
+                     ac_merge=strategy)
+            leaf = inp
+            for idx in range(self.depth):
+                leaf = leaf[f'k{idx}']
+
+            self.assertEqual(leaf, {'a': 1, 'b': 2, 'l': exp}, strategy)
+
+    def test_merge_with_pairs(self):
+        for inp, upd, exp in (
+            ({'a': {'b': 1}}, [('a', {'c': 2}), ('d', 3)],
+             {'a': {'b': 1, 'c': 2}, 'd': 3}),
+            ({'a': {'b': 1}}, (x for x in [('a', {'c': 2})]),
+             {'a': {'b': 1, 'c': 2}}),
+            ({'a': {'b': 1}}, {'a': [('c', 2)]},  # Nested pairs.
+             {'a': {'b': 1, 'c': 2}}),
+            ({'a': 1}, [('a', None), ('a', 2)], {'a': 2}),
+        ):
+            TT.merge(inp, upd)
+            self.assertEqual(inp, exp)
+
+    def test_merge_keeps_the_order_of_updates(self):
+        shared = {'x': 0}
+        inp = {'a': shared, 'b': shared}  # e.g. YAML anchors and aliases.
+        TT.merge(inp, {'a': {'x': 1}, 'b': {'x': 2}})
+        self.assertEqual(shared, {'x': 2})
+
+    def test_merge_does_not_copy_sources(self):
+        upd = {f'k{i}': {'a': i} for i in range(50000)}
+        for ac_merge in (TT.MS_DICTS, {'': TT.MS_DICTS}):
+            inp = {k: {'a': 0} for k in upd}
+            tracemalloc.start()
+            try:
+                TT.merge(inp, upd, ac_merge=ac_merge)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+            self.assertEqual(inp, upd)
+            self.assertLess(peak, 100 * 1024, ac_merge)  # Much less than it.
+
+    def test_merge_with_invalid_nested_data(self):
+        for inp, upd in (({'a': {'b': 1}}, {'a': None}),
+                         ({'a': {'b': 1}}, {'a': 1}),
+                         ({'a': 1}, [1, 2])):
+            with self.assertRaises((ValueError, TypeError)):
+                TT.merge(inp, upd)
+
+    def test_merge_with_a_callable_strategy(self):
+        def update_fn(self, other, key, val=None, **_options):
+            self[key] = (other[key] if val is None else val) * 2
+
+        inp = {'a': 1}
+        TT.merge(inp, {'a': 2, 'b': 3}, ac_merge=update_fn)
+        self.assertEqual(inp, {'a': 4, 'b': 6})
+
+        TT.merge(inp, [('c', 1)], ac_merge=update_fn)
+        self.assertEqual(inp['c'], 2)
+
+
+class MergeListsTestCase(unittest.TestCase):
+
+    def _merge(self, inp, upd, **options):
+        options.setdefault('ac_merge', TT.MS_DICTS_AND_LISTS)
+        TT.merge(inp, upd, **options)
+        return inp
+
+    def test_merge_lists(self):
+        for lst0, lst1, exp in (
+            ([1, 2, 2], [2, 4, 4], [1, 2, 2, 4, 4]),
+            ([{'a': 1}, [1]], [{'a': 1}, [1], (1, ), {'a': 2}],
+             [{'a': 1}, [1], (1, ), {'a': 2}]),
+            ([{'a': {1}}, (1, [2])], [{'a': {1}}, (1, [2]), [1, [2]]],
+             [{'a': {1}}, (1, [2]), [1, [2]]]),
+            ([object], [object, 1], [object, 1]),
+        ):
+            self.assertEqual(
+                self._merge({'l': lst0}, {'l': lst1}), {'l': exp}
+            )
+
+    def test_merge_lists_keeps_the_order(self):
+        size = 1000
+        res = self._merge({'l': [f'h{i}' for i in range(0, size, 2)]},
+                          {'l': [f'h{i}' for i in range(size)]})
+        self.assertEqual(res['l'],
+                         [f'h{i}' for i in range(0, size, 2)]
+                         + [f'h{i}' for i in range(1, size, 2)])
+
+    def test_merge_lists_by(self):
+        inp = {'cs': [{'name': 'a', 'ports': [80], 'env': {'X': 1}},
+                      {'name': 'b'}, 'x']}
+        upd = {'cs': [{'name': 'a', 'ports': [443], 'env': {'Y': 2}},
+                      {'name': 'c'}, {'name': [1]}, 'x', 'y']}
+        exp = {'cs': [{'name': 'a', 'ports': [80, 443],
+                       'env': {'X': 1, 'Y': 2}},
+                      {'name': 'b'}, 'x', {'name': 'c'}, {'name': [1]},
+                      'y']}
+        res = self._merge(copy.deepcopy(inp), upd, merge_lists_by='name')
+        self.assertEqual(res, exp)
+
+        res = copy.deepcopy(inp)
+        TT._update_with_merge_lists(res, upd, 'cs', merge_lists_by='name')
+        self.assertEqual(res, exp)
+
+    def test_merge_lists_by_wo_merging_lists(self):
+        inp = {'cs': [{'name': 'a'}]}
+        self._merge(inp, {'cs': [{'name': 'a', 'x': 1}]},
+                    ac_merge=TT.MS_DICTS, merge_lists_by='name')
+        self.assertEqual(inp, {'cs': [{'name': 'a', 'x': 1}]})
+
+    def test_merge_itself(self):
+        inp = {'cs': [{'name': 'a', 'x': 1}, {'name': 'a', 'x': 2}]}
+        exp = copy.deepcopy(inp)
+        self._merge(inp, inp, merge_lists_by='name')
+        self.assertEqual(inp, exp)
+
+
+class MergeRulesTestCase(unittest.TestCase):
+
+    inp = {'secrets': {'a': {'key': 'A', 'old': 1}, 'b': {'key': 'B'}},
+           'plugins': [{'name': 'x', 'opts': [1]}],
+           'defaults': {'port': 80},
+           'misc': {'lst': [1], 'sub': {'x': 1}}}
+    upd = {'secrets': {'a': {'key': 'AA'}},
+           'plugins': [{'name': 'x', 'opts': [2]}, {'name': 'y'}],
+           'defaults': {'port': 8080, 'host': 'h'},
+           'misc': {'lst': [2], 'sub': {'y': 2}}}
+    rules = {'secrets/*': TT.MS_REPLACE,
+             'plugins': TT.MS_DICTS_AND_LISTS,
+             'defaults': TT.MS_NO_REPLACE}
+    exp = {'secrets': {'a': {'key': 'AA'}, 'b': {'key': 'B'}},
+           'plugins': [{'name': 'x', 'opts': [1, 2]}, {'name': 'y'}],
+           'defaults': {'port': 80},
+           'misc': {'lst': [2], 'sub': {'x': 1, 'y': 2}}}
+
+    def test_merge_with_rules(self):
+        for rules in (self.rules, TT.MergeRules(self.rules)):
+            res = copy.deepcopy(self.inp)
+            TT.merge(res, self.upd, ac_merge=rules, merge_lists_by='name')
+            self.assertEqual(res, self.exp)
+
+    def test_merge_with_rules_wo_merge_lists_by(self):
+        res = copy.deepcopy(self.inp)
+        TT.merge(res, self.upd, ac_merge=self.rules)
+        self.assertEqual(res['plugins'],
+                         [{'name': 'x', 'opts': [1]},
+                          {'name': 'x', 'opts': [2]}, {'name': 'y'}])
+
+    def test_merge_with_the_root_rule(self):
+        for strategy in (TT.MS_REPLACE, TT.MS_NO_REPLACE,
+                         TT.MS_DICTS_AND_LISTS):
+            (res, exp) = (copy.deepcopy(self.inp), copy.deepcopy(self.inp))
+            TT.merge(res, self.upd, ac_merge={'': strategy})
+            TT.merge(exp, self.upd, ac_merge=strategy)
+            self.assertEqual(res, exp)
+
+    def test_merge_with_rules_literal_keys_take_precedence(self):
+        res = {'a': {'b': {'x': 1}, 'c': {'x': 1}}}
+        TT.merge(res, {'a': {'b': {'y': 2}, 'c': {'y': 2}}},
+                 ac_merge={'a/*': TT.MS_REPLACE, 'a/b': TT.MS_DICTS})
+        self.assertEqual(res, {'a': {'b': {'x': 1, 'y': 2},
+                                     'c': {'y': 2}}})
+
+    def test_merge_with_rules_inherited(self):
+        res = {'a': {'b': {'c': [1]}}, 'd': {'e': [1]}}
+        TT.merge(res, {'a': {'b': {'c': [2]}}, 'd': {'e': [2]}},
+                 ac_merge={'a': TT.MS_DICTS_AND_LISTS})
+        self.assertEqual(res, {'a': {'b': {'c': [1, 2]}}, 'd': {'e': [2]}})
+
+    def test_merge_with_wrong_rules(self):
+        with self.assertRaises(ValueError):
+            TT.merge({}, {}, ac_merge={'a': 'wrong_strategy'})
+
 # vim:sw=4:ts=4:et:
@@ -0,0 +1,79 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring
+import copy
+import pickle
+
+import pytest
+
+import anyconfig.dicts as TT
+
+
+BASE = {'a': {'b': 1, 'c': [1]}, 'd': {'e': {'f': 1}}}
+UPDATES = (('B', {'a': {'b': 2}, 'g': 1}),
+           ('C', {'a': {'c': [2]}, 'd': {'e': {'x': 1}}}))
+
+
+def _merge(ac_merge=TT.MS_DICTS):
+    (data, prov) = (copy.deepcopy(BASE), TT.Provenance())
+    prov.add_source('A')
+    for source, upd in UPDATES:
+        prov.add_source(source)
+        TT.merge(data, upd, ac_merge=ac_merge, ac_provenance=prov)
+
+    return (data, prov)
+
+
+@pytest.mark.parametrize(
+    ('path', 'exp'),
+    (('', (0, 'A')),
+     ('a/b', (1, 'B')),
+     ('a/c', (2, 'C')),
+     ('a/c/0', (2, 'C')),
+     ('d', (0, 'A')),
+     ('d/e/f', (0, 'A')),
+     ('d.e.x', (2, 'C')),
+     ('g', (1, 'B')),
+     )
+)
+def test_provenance_get(path, exp):
+    assert _merge()[1].get(path) == exp
+
+
+def test_provenance_does_not_change_results():
+    for strategy in TT.MERGE_STRATEGIES:
+        exp = copy.deepcopy(BASE)
+        for _, upd in UPDATES:
+            TT.merge(exp, upd, ac_merge=strategy)
+
+        assert _merge(strategy)[0] == exp
+
+
+def test_provenance_with_noreplace():
+    prov = _merge(TT.MS_NO_REPLACE)[1]
+    assert prov.get('a/b') == (0, 'A')
+    assert prov.get('g') == (1, 'B')
+
+
+def test_provenance_is_compact():
+    prov = _merge()[1]
+    assert len(prov) == len(list(prov.items())) == 8
+    assert ((), (0, 'A')) in list(prov.items())
+    assert (('a', 'b'), (1, 'B')) in list(prov.items())
+
+    prov = TT.Provenance()
+    assert prov.get('a') is None
+    assert not list(prov.items())
+    assert prov.add_source('A', 3) == 0
+    assert prov.get('a') == (3, 'A')
+
+
+def test_provenance_pickled():
+    prov = _merge()[1]
+    res = pickle.loads(pickle.dumps(prov))
+    assert res.get('a/b') == prov.get('a/b') == (1, 'B')
+    assert list(res.items()) == list(prov.items())
+
+# vim:sw=4:ts=4:et:
@@ -5,6 +5,7 @@
 # pylint: disable=missing-docstring, invalid-name
 
 import pathlib
+import threading
 import unittest
 
 import anyconfig.backend.json
@@ -67,4 +68,39 @@ class Test(unittest.TestCase):
         psr = self.psrs.find(inp)
         self.assertTrue(isinstance(psr, anyconfig.backend.json.Parser))
 
+    def test_40_init_only_once(self):
+        procs = self.psrs._processors
+        self.assertTrue(TT.Parsers()._processors is procs)
+
+    def test_42_reset(self):
+        procs = self.psrs._processors
+        self.psrs.reset()
+        self.assertFalse(TT.Parsers()._processors is procs)
+        self.assertEqual(sorted(TT.Parsers()._processors), sorted(procs))
+
+    def test_43_reset_keeps_the_lock(self):
+        lock = self.psrs._lock
+        self.psrs.reset()
+        self.assertTrue(TT.Parsers()._lock is lock)
+
+    def test_44_reset_with_parsers(self):
+        try:
+            self.psrs.reset([JSON.Parser])
+            self.assertEqual(self.psrs.list_x('cid'), [JSON.Parser.cid()])
+        finally:
+            self.psrs.reset()
+
+        self.assertTrue(len(self.psrs.list()) > 1)
+
+    def test_46_init_in_threads(self):
+        res = []
+        thrs = [threading.Thread(target=lambda: res.append(TT.Parsers()))
+                for _ in range(8)]
+        for thr in thrs:
+            thr.start()
+        for thr in thrs:
+            thr.join()
+
+        self.assertTrue(all(psrs is self.psrs for psrs in res))
+
 # vim:sw=4:ts=4:et:
@@ -28,6 +28,11 @@ class TestCase(unittest.TestCase):
         TT.load_plugins()
         self.assertTrue(PSRS)
 
+    def test_reload_plugins(self):
+        TT.reload_plugins()
+        self.assertEqual(sorted(Parsers().list_x('cid')),
+                         sorted(p.cid() for p in PSRS))
+
     def test_list_types(self):
         res = TT.list_types()
         self.assertTrue(bool(res))
@@ -37,4 +37,14 @@ class C(anyconfig.models.processor.Processor):
 
 PRS = [A, A2, A3, B, C]
 
+LAZY_A3 = anyconfig.models.processor.LazyProcessor(
+    'A3', 'json', ['json', 'jsn', 'js'], __name__, name='A3', priority=99
+)
+LAZY_B = anyconfig.models.processor.LazyProcessor(
+    'B', 'yaml', ['yaml', 'yml'], __name__, name='B', priority=99
+)
+LAZY_NG = anyconfig.models.processor.LazyProcessor(
+    'NG', 'yaml', ['yaml', 'yml'], f'{__name__}_not_exist', priority=99
+)
+
 # vim:sw=4:ts=4:et:
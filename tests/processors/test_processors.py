@@ -3,12 +3,16 @@
 # SPDX-License-Identifier: MIT
 #
 # pylint: disable=missing-docstring, invalid-name
+import concurrent.futures
 import operator
 import unittest
 
 import anyconfig.processors.processors as TT
 
-from .common import A, A2, B, C, PRS
+from anyconfig.common import (
+    UnknownFileTypeError, UnknownProcessorTypeError
+)
+from .common import A, A2, A3, B, C, PRS, LAZY_A3, LAZY_B, LAZY_NG
 
 
 class Test_10_Processor(unittest.TestCase):
@@ -48,4 +52,106 @@ class Test_40_Processors(unittest.TestCase):
         res = sorted(set(A.extensions() + B.extensions() + C.extensions()))
         self.assertEqual(prcs.list_x('extension'), res)
 
+    def test_30_list_by_x(self):
+        prcs = TT.Processors(PRS)
+        (a, a2, a3, b, c) = (A(), A2(), A3(), B(), C())
+        ies = (('type', [(a.type(), [a3, a2, a]), (b.type(), [b, c])]),
+               ('extensions',
+                [('js', [a3, a2, a]), ('jsn', [a3, a2, a]),
+                 ('json', [a3, a2, a]), ('yaml', [b, c]), ('yml', [b, c])]),
+               )
+        for item, exp in ies:
+            self.assertEqual(prcs.list_by_x(item), exp)
+
+        self.assertRaises(ValueError, prcs.list_by_x, 'undef')
+
+    def test_40_findall(self):
+        prcs = TT.Processors(PRS)
+        (a, a2, a3, b, c) = (A(), A2(), A3(), B(), C())
+        ies = ((('/path/to/a.jsn', None), [a3, a2, a]),
+               (('b.yml', None), [b, c]),
+               ((None, 'json'), [a3, a2, a]),
+               ((None, 'yaml'), [b, c]),
+               ((None, 'dummy'), [c]),
+               )
+        for args, exp in ies:
+            self.assertEqual(prcs.findall(*args), exp)
+
+    def test_42_findall_ng_cases(self):
+        prcs = TT.Processors(PRS)
+        ies = (((None, None), ValueError),
+               (('/tmp/x.xyz', None), UnknownFileTypeError),
+               ((None, 'xyz'), UnknownProcessorTypeError),
+               )
+        for args, exc in ies:
+            with self.assertRaises(exc):
+                prcs.findall(*args)
+
+    def test_44_findall_does_not_return_index(self):
+        prcs = TT.Processors(PRS)
+        prcs.findall(None, 'json').clear()
+        self.assertTrue(prcs.findall(None, 'json'))
+
+    def test_50_find(self):
+        prcs = TT.Processors(PRS)
+        self.assertEqual(prcs.find('a.json'), A3())
+        self.assertEqual(prcs.find(None, 'yaml'), B())
+        self.assertEqual(prcs.find(None, C), C())
+        self.assertRaises(ValueError, prcs.find, None, 1)
+
+    def test_60_register_updates_indexes(self):
+        prcs = TT.Processors([A, B])
+        self.assertEqual(prcs.findall(None, 'json'), [A()])
+
+        prcs.register(A3)
+        self.assertEqual(prcs.findall('a.js'), [A3(), A()])
+        self.assertEqual(prcs.find(None, 'A3'), A3())
+
+    def test_70_register_lazy_processors(self):
+        prcs = TT.Processors([A, LAZY_A3, LAZY_B, C])
+        self.assertTrue(prcs._processors['A3'] is LAZY_A3)
+        self.assertEqual(prcs.list_x('type'), ['json', 'yaml'])
+
+        psr = prcs.find('a.json')
+        self.assertTrue(isinstance(psr, A3))
+        self.assertTrue(prcs._processors['A3'] is psr)
+        self.assertTrue(prcs._by_ext['json'][0] is psr)
+        self.assertTrue(prcs._processors['B'] is LAZY_B)  # Not loaded yet.
+
+        self.assertEqual(prcs.findall(None, 'yaml'), [B(), C()])
+        self.assertTrue(isinstance(prcs._processors['B'], B))
+
+    def test_72_list_loads_lazy_processors(self):
+        prcs = TT.Processors([A, LAZY_A3, LAZY_B, C])
+        self.assertTrue(all(isinstance(p, (A, B, C)) for p in prcs.list()))
+
+    def test_74_lazy_processors_failed_to_load(self):
+        prcs = TT.Processors([LAZY_NG, C])
+        with self.assertWarns(UserWarning):
+            self.assertEqual(prcs.find('a.yml'), C())
+
+        self.assertFalse('NG' in prcs._processors)
+        self.assertEqual(prcs.findall(None, 'yaml'), [C()])
+
+    def test_76_lazy_processors_failed_to_load_only(self):
+        prcs = TT.Processors([LAZY_NG])
+        with self.assertWarns(UserWarning):
+            with self.assertRaises(UnknownFileTypeError):
+                prcs.findall('a.yml')
+
+        self.assertFalse(prcs.list())
+
+    def test_78_lazy_processors_loaded_once(self):
+        prcs = TT.Processors([LAZY_A3, LAZY_B])
+        psr = prcs._maybe_load(LAZY_A3)
+        self.assertTrue(prcs._processors['A3'] is psr)
+
+        # Lazy one found before it was replaced by another thread.
+        self.assertTrue(prcs._maybe_load(LAZY_A3) is psr)
+
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            res = list(executor.map(lambda _: prcs.find('a.yml'), range(32)))
+
+        self.assertTrue(all(p is prcs._processors['B'] for p in res))
+
 # vim:sw=4:ts=4:et:
@@ -41,4 +41,54 @@ class Test_00_Functions(unittest.TestCase):
         self._assert_query([(data, None, data),
                             (data, '', data)])
 
+
+class Test_10_Compiled_Cache(unittest.TestCase):
+
+    def setUp(self):
+        TT.compile_jexp.cache_clear()
+
+    def test_10_compile_jexp(self):
+        pexp = TT.compile_jexp('a.b')
+        self.assertTrue(pexp is TT.compile_jexp('a.b'))
+        self.assertEqual(TT.compile_jexp.cache_info().hits, 1)
+
+    def test_12_compile_jexp__invalid(self):
+        with self.assertRaises(ValueError):
+            TT.compile_jexp('b.')
+
+    def test_14_query_uses_cache(self):
+        for _ in range(3):
+            self.assertEqual(TT.query({"a": {"b": 2}}, "a.b")[0], 2)
+
+        self.assertEqual(TT.compile_jexp.cache_info()[:2], (2, 1))
+
+
+class Test_20_QueryMany(unittest.TestCase):
+
+    data = {"a": {"b": 2, "c": [1, 2]}, "d": "D"}
+
+    def test_10_query_many(self):
+        self.assertEqual(
+            TT.query_many(self.data, ["a.b", "a.c[-1]", "d", "e"]),
+            [2, 2, "D", None]
+        )
+
+    def test_12_query_many__empty_exprs(self):
+        self.assertEqual(TT.query_many(self.data, []), [])
+        self.assertEqual(TT.query_many(self.data, [None, '', 'd']),
+                         [self.data, self.data, 'D'])
+
+    def test_14_query_many__invalid_expr(self):
+        with self.assertRaises(ValueError):
+            TT.query_many(self.data, ["a.b", "b."])
+
+    def test_16_query_many__not_mapping_data(self):
+        with self.assertWarns(UserWarning):
+            self.assertEqual(TT.query_many(1, ["a", "b"]), [1, 1])
+
+    def test_18_query_many__generator(self):
+        self.assertEqual(
+            TT.query_many(self.data, (e for e in ["a.b", "d"])), [2, "D"]
+        )
+
 # vim:sw=4:ts=4:et:
@@ -94,6 +94,91 @@ class Test_12_Validation_Errors(Test_00_Base):
         self.assertFalse(ret)
 
 
+@unittest.skipIf(not SUPPORTED, "json schema lib is not available")
+class Test_14_Validator_Cache(Test_00_Base):
+
+    obj_ng = dict(a='aaa')
+
+    def setUp(self):
+        TT.clear_validators()
+
+    def test_10_compile_validator(self):
+        vldtr = TT.compile_validator(self.schema)
+        self.assertTrue(vldtr is TT.compile_validator(self.schema))
+
+        # Keyed on the content of schema objects unless they're frozen.
+        self.assertTrue(vldtr is TT.compile_validator(dict(self.schema)))
+
+        scm = TT.FrozenConfig(self.schema)
+        vldtr = TT.compile_validator(scm)
+        self.assertTrue(
+            vldtr is TT.compile_validator(TT.FrozenConfig(self.schema))
+        )
+
+    def test_12_compile_validator__different_args(self):
+        vldtr = TT.compile_validator(self.schema)
+        self.assertFalse(
+            vldtr is TT.compile_validator(self.schema,
+                                          cls=TT.jsonschema.Draft7Validator)
+        )
+        self.assertFalse(
+            vldtr is TT.compile_validator({"type": "object"})
+        )
+
+    def test_14_compile_validator__lru(self):
+        for idx in range(TT.VALIDATORS_MAXSIZE + 1):
+            TT.compile_validator({"type": "object", "title": str(idx)})
+
+        self.assertEqual(len(TT._VALIDATORS), TT.VALIDATORS_MAXSIZE)
+
+    def test_16_compile_validator__invalid_schema(self):
+        with self.assertRaises(TT.jsonschema.SchemaError):
+            TT.compile_validator({"type": 0})
+
+        self.assertFalse(TT._VALIDATORS)
+
+    def test_18_compile_validator__not_check_schema(self):
+        vldtr = TT.compile_validator({"type": 0}, check_schema=False)
+        self.assertTrue(vldtr is not None)
+
+    def test_19_compile_validator__modified_schema(self):
+        scm = {"type": "object"}
+        vldtr = TT.compile_validator(scm)
+        scm["type"] = 0
+
+        with self.assertRaises(TT.jsonschema.SchemaError):
+            TT.compile_validator(scm)
+
+        scm["type"] = "object"
+        self.assertTrue(vldtr is TT.compile_validator(scm))
+        self.assertEqual(vldtr.schema, {"type": "object"})
+
+    def test_20_validate_many(self):
+        res = TT.validate_many([self.obj, self.obj_ng], self.schema)
+        self.assertEqual([r[0] for r in res], [True, False])
+        self.assertTrue(res[1][1])
+        self.assertEqual(len(TT._VALIDATORS), 1)
+
+    def test_22_validate_many__errors(self):
+        res = TT.validate_many([self.obj, self.obj_ng], self.schema,
+                               ac_schema_errors=True)
+        self.assertEqual(res[0], (True, []))
+        self.assertFalse(res[1][0])
+        self.assertEqual(len(res[1][1]), 1)
+
+    def test_24_validate_many__invalid_schema(self):
+        res = TT.validate_many([self.obj], {"type": 0})
+        self.assertFalse(res[0][0])
+
+        with self.assertRaises(TT.jsonschema.SchemaError):
+            TT.validate_many([self.obj], {"type": 0}, ac_schema_safe=False)
+
+    def test_26_validate_many__no_safe(self):
+        with self.assertRaises(TT.jsonschema.ValidationError):
+            TT.validate_many([self.obj, self.obj_ng], self.schema,
+                             ac_schema_safe=False)
+
+
 class Test_20_GenSchema(Test_00_Base):
 
     def test_40_gen_schema__primitive_types(self):
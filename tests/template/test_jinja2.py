@@ -124,4 +124,67 @@ class TestCase(unittest.TestCase):
                 TT.render(inp, filters={'negate': negate}), exp
             )
 
+
+class EnvPoolTestCase(unittest.TestCase):
+
+    def setUp(self):
+        TT.clear_envs()
+
+    def test_get_env(self):
+        env = TT.get_env(['/tmp'])
+        self.assertTrue(env is TT.get_env([pathlib.Path('/tmp')]))
+        self.assertFalse(env is TT.get_env(['/tmp', '/var']))
+
+    def test_get_env_with_filters(self):
+        env = TT.get_env(['/tmp'], filters={'negate': negate})
+        self.assertTrue('negate' in env.filters)
+        self.assertTrue(
+            env is TT.get_env(['/tmp'], filters={'negate': negate})
+        )
+        self.assertFalse(env is TT.get_env(['/tmp']))
+        self.assertFalse('negate' in TT.get_env(['/tmp']).filters)
+
+    def test_get_env_with_unhashable_filters(self):
+        filters = [('negate', negate), ('x', [])]  # Not hashable.
+        env = TT.get_env(['/tmp'], filters=filters)
+        self.assertFalse(env is TT.get_env(['/tmp'], filters=filters))
+
+    def test_get_env_lru(self):
+        for idx in range(TT.ENV_POOL_MAXSIZE + 1):
+            TT.get_env([f'/tmp/{idx}'])
+
+        self.assertEqual(len(TT._ENV_POOL), TT.ENV_POOL_MAXSIZE)
+
+    def test_make_bytecode_cache_with_cache_dir(self):
+        with tempfile.TemporaryDirectory() as tdir:
+            with unittest.mock.patch.dict(
+                os.environ, {TT.CACHE_DIR_ENV: tdir}
+            ):
+                bcc = TT.make_bytecode_cache()
+
+            self.assertEqual(bcc.directory, str(pathlib.Path(tdir) / 'jinja2'))
+
+    def test_make_bytecode_cache_without_cache_dir(self):
+        with unittest.mock.patch.dict(os.environ, {TT.CACHE_DIR_ENV: ''}):
+            self.assertTrue(TT.make_bytecode_cache() is None)
+            self.assertTrue(TT.get_env(['/tmp']).bytecode_cache is None)
+
+    def test_render_s_with_filters(self):
+        self.assertEqual(
+            TT.render_s('{{ a | negate }}', {'a': 1},
+                        filters={'negate': negate}),
+            '-1'
+        )
+
+    def test_render_impl_reuses_templates(self):
+        with tempfile.TemporaryDirectory() as tdir:
+            tmpl = pathlib.Path(tdir) / 'a.j2'
+            tmpl.write_text('a: {{ a }}')
+
+            self.assertEqual(TT.render_impl(tmpl, {'a': 1}), 'a: 1')
+            env = TT.get_env(TT.make_template_paths(tmpl))
+            self.assertTrue(env.cache)  # The template was cached.
+
+            self.assertEqual(TT.render_impl(tmpl, {'a': 2}), 'a: 2')
+
 # vim:sw=4:ts=4:et:
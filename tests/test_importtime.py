@@ -0,0 +1,56 @@
+#
+# Copyright (C) 2024 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring
+"""Regression tests of the time and modules to import anyconfig."""
+import re
+import subprocess
+import sys
+
+import pytest
+
+
+# Modules must not be imported only by 'import anyconfig'.
+HEAVY_MODULES = (
+    'yaml', 'ruamel.yaml', 'toml', 'tomli', 'tomli_w', 'tomlkit', 'tomllib',
+    'simplejson', 'jinja2', 'jsonschema', 'jmespath',
+    'xml.etree.ElementTree', 'importlib.metadata',
+    'asyncio', 'concurrent.futures', 'pickle', 'tempfile',
+)
+
+# Budget of the cumulative time to import anyconfig [us]. It's generous
+# enough not to fail in slow CI environments.
+BUDGET = 300000
+
+_IMPORTTIME_REG = re.compile(
+    r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(\S.*)$'
+)
+
+
+@pytest.fixture(scope='module')
+def importtimes():
+    """Get a map of module names and cumulative import times [us]."""
+    cmd = [sys.executable, '-X', 'importtime', '-c', 'import anyconfig']
+    proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    if proc.returncode != 0:
+        pytest.skip(f'Failed to import anyconfig: {proc.stderr}')
+
+    return {
+        mobj.group(3).strip(): int(mobj.group(2))
+        for mobj in (_IMPORTTIME_REG.match(line)
+                     for line in proc.stderr.splitlines())
+        if mobj
+    }
+
+
+@pytest.mark.parametrize('name', HEAVY_MODULES)
+def test_heavy_modules_are_not_imported(importtimes, name):
+    assert name not in importtimes
+
+
+def test_import_time_is_in_budget(importtimes):
+    assert 'anyconfig' in importtimes
+    assert importtimes['anyconfig'] < BUDGET
+
+# vim:sw=4:ts=4:et:
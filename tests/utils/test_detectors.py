@@ -54,4 +54,16 @@ def test_is_list_like(inp, exp):
 def test_is_dict_like(inp, exp):
     assert TT.is_dict_like(inp) == exp
 
+
+@pytest.mark.parametrize(
+    'inp,exp',
+    (('json', True),
+     ('xml.etree', True),
+     ('_not_existing_module_', False),
+     ('_not_existing_module_.child', False),
+     ),
+)
+def test_is_module_available(inp, exp):
+    assert TT.is_module_available(inp) == exp
+
 # vim:sw=4:ts=4:et: